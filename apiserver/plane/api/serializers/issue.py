@@ -32,6 +32,44 @@ from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 
 
+class IssueBulkCreateSerializer(serializers.ListSerializer):
+    def create(self, validated_data):
+        project_id = self.context["project_id"]
+        default_assignee_id = self.context["default_assignee_id"]
+
+        # Get default issue type
+        default_issue_type = None
+        if any(not data.get("type") for data in validated_data):
+            default_issue_type = IssueType.objects.filter(
+                project_issue_types__project_id=project_id, is_default=True
+            ).first()
+
+        issues = []
+        assignee_ids = []
+        label_ids = []
+        for data in validated_data:
+            assignees = data.pop("assignees", None)
+            labels = data.pop("labels", None)
+            data["type"] = data.get("type") or default_issue_type
+            issues.append(Issue(**data))
+            if assignees:
+                assignee_ids.append(list(assignees))
+            else:
+                # Then assign it to default assignee
+                assignee_ids.append(
+                    [default_assignee_id] if default_assignee_id is not None else []
+                )
+            label_ids.append(list(labels or []))
+
+        return Issue.create_in_bulk(
+            project_id=project_id,
+            workspace_id=self.context["workspace_id"],
+            issues=issues,
+            assignee_ids=assignee_ids,
+            label_ids=label_ids,
+        )
+
+
 class IssueSerializer(BaseSerializer):
     assignees = serializers.ListField(
         child=serializers.PrimaryKeyRelatedField(
@@ -56,6 +94,7 @@ class IssueSerializer(BaseSerializer):
         model = Issue
         read_only_fields = ["id", "workspace", "project", "updated_by", "updated_at"]
         exclude = ["description", "description_stripped"]
+        list_serializer_class = IssueBulkCreateSerializer
 
     def validate(self, data):
         if (
@@ -11,13 +11,10 @@ from django.db.models import (
     CharField,
     Exists,
     F,
-    Func,
     Max,
-    OuterRef,
     Q,
     Value,
     When,
-    Subquery,
 )
 from django.utils import timezone
 from django.conf import settings
@@ -40,7 +37,7 @@ from plane.app.permissions import (
     ProjectLitePermission,
     ProjectMemberPermission,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import issue_activity, issues_created_activity
 from plane.db.models import (
     Issue,
     IssueActivity,
@@ -50,11 +47,11 @@ from plane.db.models import (
     Label,
     Project,
     ProjectMember,
-    CycleIssue,
     Workspace,
 )
 from plane.settings.storage import S3Storage
 from plane.bgtasks.storage_metadata_task import get_asset_object_metadata
+from plane.utils.paginator import PAGINATOR_COUNT_CACHE_TIMEOUT
 from .base import BaseAPIView
 
 
@@ -75,13 +72,7 @@ class WorkspaceIssueAPIEndpoint(BaseAPIView):
 
     def get_queryset(self):
         return (
-            Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .filter(workspace__slug=self.kwargs.get("slug"))
+            Issue.issue_objects.filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project__identifier=self.kwargs.get("project__identifier"))
             .select_related("project")
             .select_related("workspace")
@@ -94,12 +85,7 @@ class WorkspaceIssueAPIEndpoint(BaseAPIView):
 
     def get(self, request, slug, project__identifier=None, issue__identifier=None):
         if issue__identifier and project__identifier:
-            issue = Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            ).get(
+            issue = Issue.issue_objects.get(
                 workspace__slug=slug,
                 project__identifier=project__identifier,
                 sequence_id=issue__identifier,
@@ -124,13 +110,7 @@ class IssueAPIEndpoint(BaseAPIView):
 
     def get_queryset(self):
         return (
-            Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .filter(project_id=self.kwargs.get("project_id"))
+            Issue.issue_objects.filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("project")
             .select_related("workspace")
@@ -158,12 +138,9 @@ class IssueAPIEndpoint(BaseAPIView):
             )
 
         if pk:
-            issue = Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            ).get(workspace__slug=slug, project_id=project_id, pk=pk)
+            issue = Issue.issue_objects.get(
+                workspace__slug=slug, project_id=project_id, pk=pk
+            )
             return Response(
                 IssueSerializer(issue, fields=self.fields, expand=self.expand).data,
                 status=status.HTTP_200_OK,
@@ -177,28 +154,7 @@ class IssueAPIEndpoint(BaseAPIView):
 
         issue_queryset = (
             self.get_queryset()
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
         )
 
         # Priority Ordering
@@ -215,6 +171,7 @@ class IssueAPIEndpoint(BaseAPIView):
                     output_field=CharField(),
                 )
             ).order_by("priority_order")
+            order_by_key = "priority_order"
 
         # State Ordering
         elif order_by_param in [
@@ -238,6 +195,7 @@ class IssueAPIEndpoint(BaseAPIView):
                     output_field=CharField(),
                 )
             ).order_by("state_order")
+            order_by_key = "state_order"
         # assignee and label ordering
         elif order_by_param in [
             "labels__name",
@@ -254,20 +212,88 @@ class IssueAPIEndpoint(BaseAPIView):
             ).order_by(
                 "-max_values" if order_by_param.startswith("-") else "max_values"
             )
+            order_by_key = (
+                "-max_values" if order_by_param.startswith("-") else "max_values"
+            )
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
+            order_by_key = order_by_param
 
         return self.paginate(
             request=request,
+            order_by=order_by_key,
             queryset=(issue_queryset),
             on_results=lambda issues: IssueSerializer(
                 issues, many=True, fields=self.fields, expand=self.expand
             ).data,
+            keyset=True,
+            count_cache_timeout=PAGINATOR_COUNT_CACHE_TIMEOUT,
         )
 
+    def create_in_bulk(self, request, slug, project):
+        if len(request.data) > settings.ISSUE_BULK_CREATE_MAX_SIZE:
+            return Response(
+                {
+                    "error": f"At most {settings.ISSUE_BULK_CREATE_MAX_SIZE} issues can be created at once"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = IssueSerializer(
+            data=request.data,
+            many=True,
+            context={
+                "project_id": project.id,
+                "workspace_id": project.workspace_id,
+                "default_assignee_id": project.default_assignee_id,
+            },
+        )
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        # Check every external id and source pair in a single query
+        external_ids = Q()
+        for data in request.data:
+            if data.get("external_id") and data.get("external_source"):
+                external_ids |= Q(
+                    external_id=data.get("external_id"),
+                    external_source=data.get("external_source"),
+                )
+        if external_ids:
+            issue = Issue.objects.filter(
+                external_ids, workspace__slug=slug, project_id=project.id
+            ).first()
+            if issue is not None:
+                return Response(
+                    {
+                        "error": "Issue with the same external id and external source already exists",
+                        "id": str(issue.id),
+                    },
+                    status=status.HTTP_409_CONFLICT,
+                )
+
+        issues = serializer.save()
+        for issue, data in zip(issues, request.data):
+            issue.created_at = data.get("created_at", issue.created_at)
+            issue.created_by_id = data.get("created_by", request.user.id)
+        Issue.objects.bulk_update(issues, ["created_at", "created_by"], batch_size=500)
+
+        # Track the issues
+        issues_created_activity.delay(
+            issue_ids=[str(issue.id) for issue in issues],
+            project_id=str(project.id),
+            actor_id=str(request.user.id),
+            epoch=int(timezone.now().timestamp()),
+        )
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
     def post(self, request, slug, project_id):
         project = Project.objects.get(pk=project_id)
 
+        # A list of issues is created in bulk
+        if isinstance(request.data, list):
+            return self.create_in_bulk(request, slug, project)
+
         serializer = IssueSerializer(
             data=request.data,
             context={
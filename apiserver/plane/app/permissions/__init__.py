@@ -13,3 +13,9 @@ from .project import (
     ProjectLitePermission,
 )
 from .base import allow_permission, ROLE
+from .member_roles import (
+    get_guest_visibility_filter,
+    get_project_role,
+    get_workspace_role,
+    is_project_member_in_workspace,
+)
@@ -1,10 +1,11 @@
-from plane.db.models import WorkspaceMember, ProjectMember
 from functools import wraps
 from rest_framework.response import Response
 from rest_framework import status
 
 from enum import Enum
 
+from .member_roles import get_project_role, get_workspace_role
+
 
 class ROLE(Enum):
     ADMIN = 20
@@ -31,22 +32,11 @@ def allow_permission(allowed_roles, level="PROJECT", creator=False, model=None):
 
             # Check role permissions
             if level == "WORKSPACE":
-                if WorkspaceMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
-                    return view_func(instance, request, *args, **kwargs)
+                role = get_workspace_role(request, kwargs["slug"])
             else:
-                if ProjectMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    project_id=kwargs["project_id"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
-                    return view_func(instance, request, *args, **kwargs)
+                role = get_project_role(request, kwargs["slug"], kwargs["project_id"])
+            if role in allowed_role_values:
+                return view_func(instance, request, *args, **kwargs)
 
             # Return permission denied if no conditions are met
             return Response(
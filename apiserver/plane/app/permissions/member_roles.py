@@ -0,0 +1,97 @@
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+# Module imports
+from plane.db.models import ProjectMember, WorkspaceMember
+from plane.db.models.workspace import get_member_roles_cache_key
+
+
+def load_member_roles(member_id):
+    """Return the active workspace and project roles of a member"""
+    return {
+        "workspaces": {
+            slug: role
+            for slug, role in WorkspaceMember.objects.filter(
+                member_id=member_id, is_active=True
+            ).values_list("workspace__slug", "role")
+        },
+        "projects": {
+            str(project_id): (slug, role)
+            for project_id, slug, role in ProjectMember.objects.filter(
+                member_id=member_id, is_active=True
+            ).values_list("project_id", "workspace__slug", "role")
+        },
+    }
+
+
+def get_member_roles(request):
+    """
+    Return the roles of the requesting user, cached on the request and in redis
+    until a membership of the user changes
+    """
+    member_roles = getattr(request, "_member_roles", None)
+    if member_roles is None:
+        key = get_member_roles_cache_key(request.user.id)
+        member_roles = cache.get(key)
+        if member_roles is None:
+            member_roles = load_member_roles(request.user.id)
+            cache.set(key, member_roles, settings.MEMBER_ROLES_CACHE_TIMEOUT)
+        request._member_roles = member_roles
+    return member_roles
+
+
+def get_workspace_role(request, slug):
+    """Return the role of the user in the workspace, None if not a member"""
+    if request.user.is_anonymous:
+        return None
+    return get_member_roles(request)["workspaces"].get(slug)
+
+
+def get_project_role(request, slug, project_id):
+    """Return the role of the user in the project, None if not a member"""
+    if request.user.is_anonymous:
+        return None
+    project = get_member_roles(request)["projects"].get(str(project_id))
+    if project is None or project[0] != slug:
+        return None
+    return project[1]
+
+
+def is_project_member_in_workspace(request, slug):
+    """Return whether the user is a member of any project of the workspace"""
+    if request.user.is_anonymous:
+        return False
+    return any(
+        project_slug == slug
+        for project_slug, _ in get_member_roles(request)["projects"].values()
+    )
+
+
+def get_guest_visibility_filter(request, slug):
+    """
+    Return the filter on the issues of the workspace visible to the user, guests
+    only see their own issues unless the project allows them to view all
+    """
+    guest_project_ids = []
+    project_ids = []
+    for project_id, (project_slug, role) in get_member_roles(request)[
+        "projects"
+    ].items():
+        if project_slug != slug:
+            continue
+        if role == 5:
+            guest_project_ids.append(project_id)
+        else:
+            project_ids.append(project_id)
+
+    return (
+        Q(project_id__in=project_ids)
+        | Q(project_id__in=guest_project_ids, project__guest_view_all_features=True)
+        | Q(
+            project_id__in=guest_project_ids,
+            project__guest_view_all_features=False,
+            created_by=request.user,
+        )
+    )
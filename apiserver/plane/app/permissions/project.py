@@ -2,7 +2,13 @@
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 
 # Module import
-from plane.db.models import ProjectMember, WorkspaceMember
+from plane.db.models import ProjectMember
+
+from .member_roles import (
+    get_project_role,
+    get_workspace_role,
+    is_project_member_in_workspace,
+)
 
 # Permission Mappings
 Admin = 20
@@ -17,27 +23,14 @@ class ProjectBasePermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return get_workspace_role(request, view.workspace_slug) is not None
 
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-                is_active=True,
-            ).exists()
+            return get_workspace_role(request, view.workspace_slug) in [Admin, Member]
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role=Admin,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return get_project_role(request, view.workspace_slug, view.project_id) == Admin
 
 
 class ProjectMemberPermission(BasePermission):
@@ -47,26 +40,16 @@ class ProjectMemberPermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return is_project_member_in_workspace(request, view.workspace_slug)
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-                is_active=True,
-            ).exists()
+            return get_workspace_role(request, view.workspace_slug) in [Admin, Member]
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return get_project_role(request, view.workspace_slug, view.project_id) in [
+            Admin,
+            Member,
+        ]
 
 
 class ProjectEntityPermission(BasePermission):
@@ -86,21 +69,16 @@ class ProjectEntityPermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                project_id=view.project_id,
-                is_active=True,
-            ).exists()
+            return (
+                get_project_role(request, view.workspace_slug, view.project_id)
+                is not None
+            )
 
         ## Only project members or admins can create and edit the project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return get_project_role(request, view.workspace_slug, view.project_id) in [
+            Admin,
+            Member,
+        ]
 
 
 class ProjectLitePermission(BasePermission):
@@ -108,9 +86,6 @@ class ProjectLitePermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return (
+            get_project_role(request, view.workspace_slug, view.project_id) is not None
+        )
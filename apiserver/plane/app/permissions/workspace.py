@@ -2,7 +2,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Module imports
-from plane.db.models import WorkspaceMember
+from .member_roles import get_workspace_role
 
 
 # Permission Mappings
@@ -27,21 +27,11 @@ class WorkSpaceBasePermission(BasePermission):
 
         # allow only admins and owners to update the workspace settings
         if request.method in ["PUT", "PATCH"]:
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role__in=[Admin, Member],
-                is_active=True,
-            ).exists()
+            return get_workspace_role(request, view.workspace_slug) in [Admin, Member]
 
         # allow only owner to delete the workspace
         if request.method == "DELETE":
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role=Admin,
-                is_active=True,
-            ).exists()
+            return get_workspace_role(request, view.workspace_slug) == Admin
 
 
 class WorkspaceOwnerPermission(BasePermission):
@@ -49,9 +39,7 @@ class WorkspaceOwnerPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            workspace__slug=view.workspace_slug, member=request.user, role=Admin
-        ).exists()
+        return get_workspace_role(request, view.workspace_slug) == Admin
 
 
 class WorkSpaceAdminPermission(BasePermission):
@@ -59,12 +47,7 @@ class WorkSpaceAdminPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Admin, Member],
-            is_active=True,
-        ).exists()
+        return get_workspace_role(request, view.workspace_slug) in [Admin, Member]
 
 
 class WorkspaceEntityPermission(BasePermission):
@@ -74,16 +57,9 @@ class WorkspaceEntityPermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return get_workspace_role(request, view.workspace_slug) is not None
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Admin, Member],
-            is_active=True,
-        ).exists()
+        return get_workspace_role(request, view.workspace_slug) in [Admin, Member]
 
 
 class WorkspaceViewerPermission(BasePermission):
@@ -91,9 +67,7 @@ class WorkspaceViewerPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user, workspace__slug=view.workspace_slug, is_active=True
-        ).exists()
+        return get_workspace_role(request, view.workspace_slug) is not None
 
 
 class WorkspaceUserPermission(BasePermission):
@@ -101,6 +75,4 @@ class WorkspaceUserPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user, workspace__slug=view.workspace_slug, is_active=True
-        ).exists()
+        return get_workspace_role(request, view.workspace_slug) is not None
@@ -16,6 +16,8 @@ class ExporterHistorySerializer(BaseSerializer):
             "project",
             "provider",
             "status",
+            "total_issues",
+            "processed_issues",
             "url",
             "initiated_by",
             "initiated_by_detail",
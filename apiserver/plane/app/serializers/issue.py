@@ -66,6 +66,35 @@ class IssueProjectLiteSerializer(BaseSerializer):
 
 ##TODO: Find a better way to write this serializer
 ## Find a better approach to save manytomany?
+class IssueBulkCreateSerializer(serializers.ListSerializer):
+    def create(self, validated_data):
+        default_assignee_id = self.context["default_assignee_id"]
+
+        issues = []
+        assignee_ids = []
+        label_ids = []
+        for data in validated_data:
+            assignees = data.pop("assignee_ids", None)
+            labels = data.pop("label_ids", None)
+            issues.append(Issue(**data))
+            if assignees:
+                assignee_ids.append([user.id for user in assignees])
+            else:
+                # Then assign it to default assignee
+                assignee_ids.append(
+                    [default_assignee_id] if default_assignee_id is not None else []
+                )
+            label_ids.append([label.id for label in labels or []])
+
+        return Issue.create_in_bulk(
+            project_id=self.context["project_id"],
+            workspace_id=self.context["workspace_id"],
+            issues=issues,
+            assignee_ids=assignee_ids,
+            label_ids=label_ids,
+        )
+
+
 class IssueCreateSerializer(BaseSerializer):
     # ids
     state_id = serializers.PrimaryKeyRelatedField(
@@ -98,6 +127,7 @@ class IssueCreateSerializer(BaseSerializer):
             "created_at",
             "updated_at",
         ]
+        list_serializer_class = IssueBulkCreateSerializer
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
@@ -14,6 +14,7 @@ from plane.app.views import (
     IssueListEndpoint,
     IssueReactionViewSet,
     IssueRelationViewSet,
+    ProjectIssueRelationEndpoint,
     IssueSubscriberViewSet,
     IssueUserDisplayPropertyEndpoint,
     IssueViewSet,
@@ -245,6 +246,11 @@ urlpatterns = [
         IssueRelationViewSet.as_view({"post": "remove_relation"}),
         name="issue-relation",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issue-relations/",
+        ProjectIssueRelationEndpoint.as_view(),
+        name="project-issue-relations",
+    ),
     ## End Issue Relation
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/deleted-issues/",
@@ -133,7 +133,7 @@ from .issue.label import LabelViewSet, BulkCreateIssueLabelsEndpoint
 
 from .issue.link import IssueLinkViewSet
 
-from .issue.relation import IssueRelationViewSet
+from .issue.relation import IssueRelationViewSet, ProjectIssueRelationEndpoint
 
 from .issue.reaction import IssueReactionViewSet
 
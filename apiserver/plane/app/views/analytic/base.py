@@ -17,6 +17,7 @@ from plane.app.views.base import BaseAPIView, BaseViewSet
 from plane.bgtasks.analytic_plot_export import analytic_export_task
 from plane.db.models import AnalyticView, Issue, Workspace
 from plane.utils.analytics_plot import build_graph_plot
+from plane.utils.analytics_rollup import get_rollup_details, get_rollup_plot
 from plane.utils.issue_filters import issue_filters
 from plane.app.permissions import allow_permission, ROLE
 
@@ -71,6 +72,19 @@ class AnalyticsEndpoint(BaseAPIView):
         # Additional filters that need to be applied
         filters = issue_filters(request.GET, "GET")
 
+        # Answer from the rollups unless the filters need the live queries
+        rollup = get_rollup_plot(slug, x_axis, y_axis, segment, filters)
+        if rollup is not None:
+            total_issues, distribution = rollup
+            return Response(
+                {
+                    "total": total_issues,
+                    "distribution": distribution,
+                    "extras": get_rollup_details(distribution, x_axis, segment),
+                },
+                status=status.HTTP_200_OK,
+            )
+
         # Get the issues for the workspace with the additional filters applied
         queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
 
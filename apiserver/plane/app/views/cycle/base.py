@@ -14,7 +14,6 @@ from django.db.models import (
     F,
     Func,
     OuterRef,
-    Prefetch,
     Q,
     UUIDField,
     Value,
@@ -40,11 +39,10 @@ from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Cycle,
     CycleIssue,
+    CycleStats,
     UserFavorite,
     CycleUserProperties,
     Issue,
-    Label,
-    User,
     Project,
     ProjectMember,
 )
@@ -94,54 +92,15 @@ class CycleViewSet(BaseViewSet):
             )
             .filter(project__archived_at__isnull=True)
             .select_related("project", "workspace", "owned_by")
-            .prefetch_related(
-                Prefetch(
-                    "issue_cycle__issue__assignees",
-                    queryset=User.objects.only(
-                        "avatar_asset", "first_name", "id"
-                    ).distinct(),
-                )
-            )
-            .prefetch_related(
-                Prefetch(
-                    "issue_cycle__issue__labels",
-                    queryset=Label.objects.only("name", "color", "id").distinct(),
-                )
-            )
             .annotate(is_favorite=Exists(favorite_subquery))
+            # Progress is read from the stats maintained by CycleStats.refresh
+            .annotate(**CycleStats.annotations("total_issues", "completed_issues"))
             .annotate(
-                total_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__state__group="completed",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                pending_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__state__group__in=["backlog", "unstarted", "started"],
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__deleted_at__isnull=True,
-                    ),
+                pending_issues=Coalesce(
+                    F("stats__backlog_issues")
+                    + F("stats__unstarted_issues")
+                    + F("stats__started_issues"),
+                    0,
                 )
             )
             .annotate(
@@ -641,81 +600,9 @@ class TransferCycleIssueEndpoint(BaseAPIView):
             workspace__slug=slug, project_id=project_id, pk=new_cycle_id
         ).first()
 
-        old_cycle = (
-            Cycle.objects.filter(
-                workspace__slug=slug, project_id=project_id, pk=cycle_id
-            )
-            .annotate(
-                total_issues=Count(
-                    "issue_cycle",
-                    filter=Q(
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="completed",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__issue__deleted_at__isnull=True,
-                        issue_cycle__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="cancelled",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__issue__deleted_at__isnull=True,
-                        issue_cycle__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="started",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__issue__deleted_at__isnull=True,
-                        issue_cycle__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="unstarted",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__issue__deleted_at__isnull=True,
-                        issue_cycle__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="backlog",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__issue__deleted_at__isnull=True,
-                        issue_cycle__deleted_at__isnull=True,
-                    ),
-                )
-            )
-        )
+        old_cycle = Cycle.objects.filter(
+            workspace__slug=slug, project_id=project_id, pk=cycle_id
+        ).annotate(**CycleStats.annotations())
 
         estimate_type = Project.objects.filter(
             workspace__slug=slug,
@@ -1047,6 +934,9 @@ class TransferCycleIssueEndpoint(BaseAPIView):
         cycle_issues = CycleIssue.objects.bulk_update(
             updated_cycles, ["cycle_id"], batch_size=100
         )
+        # Bulk operations skip the signals keeping the current cycle of the issues
+        Issue.update_counters([cycle_issue.issue_id for cycle_issue in updated_cycles])
+        CycleStats.refresh([cycle_id, new_cycle_id])
 
         # Capture Issue Activity
         issue_activity.delay(
@@ -1106,129 +996,27 @@ class CycleUserPropertiesEndpoint(BaseAPIView):
 class CycleProgressEndpoint(BaseAPIView):
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
     def get(self, request, slug, project_id, cycle_id):
-        aggregate_estimates = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-            )
-            .annotate(value_as_float=Cast("estimate_point__value", FloatField()))
-            .aggregate(
-                backlog_estimate_point=Sum(
-                    Case(
-                        When(state__group="backlog", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                unstarted_estimate_point=Sum(
-                    Case(
-                        When(state__group="unstarted", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                started_estimate_point=Sum(
-                    Case(
-                        When(state__group="started", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                cancelled_estimate_point=Sum(
-                    Case(
-                        When(state__group="cancelled", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                completed_estimate_points=Sum(
-                    Case(
-                        When(state__group="completed", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                total_estimate_points=Sum(
-                    "value_as_float", default=Value(0), output_field=FloatField()
-                ),
-            )
-        )
-
-        backlog_issues = Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-            state__group="backlog",
-        ).count()
-
-        unstarted_issues = Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-            state__group="unstarted",
-        ).count()
-
-        started_issues = Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-            state__group="started",
-        ).count()
-
-        cancelled_issues = Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-            state__group="cancelled",
-        ).count()
-
-        completed_issues = Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-            state__group="completed",
-        ).count()
-
-        total_issues = Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-        ).count()
-
+        stats = CycleStats.objects.filter(
+            workspace__slug=slug, project_id=project_id, cycle_id=cycle_id
+        ).first()
+        # Cycles without issues never had their stats computed
         return Response(
             {
-                "backlog_estimate_points": aggregate_estimates["backlog_estimate_point"]
-                or 0,
-                "unstarted_estimate_points": aggregate_estimates[
-                    "unstarted_estimate_point"
-                ]
-                or 0,
-                "started_estimate_points": aggregate_estimates["started_estimate_point"]
-                or 0,
-                "cancelled_estimate_points": aggregate_estimates[
-                    "cancelled_estimate_point"
-                ]
-                or 0,
-                "completed_estimate_points": aggregate_estimates[
-                    "completed_estimate_points"
+                field: getattr(stats, field, 0)
+                for field in [
+                    "backlog_estimate_points",
+                    "unstarted_estimate_points",
+                    "started_estimate_points",
+                    "cancelled_estimate_points",
+                    "completed_estimate_points",
+                    "total_estimate_points",
+                    "backlog_issues",
+                    "total_issues",
+                    "completed_issues",
+                    "cancelled_issues",
+                    "started_issues",
+                    "unstarted_issues",
                 ]
-                or 0,
-                "total_estimate_points": aggregate_estimates["total_estimate_points"],
-                "backlog_issues": backlog_issues,
-                "total_issues": total_issues,
-                "completed_issues": completed_issues,
-                "cancelled_issues": cancelled_issues,
-                "started_issues": started_issues,
-                "unstarted_issues": unstarted_issues,
             },
             status=status.HTTP_200_OK,
         )
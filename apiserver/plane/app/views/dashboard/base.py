@@ -7,7 +7,6 @@ from django.db.models import (
     Count,
     Exists,
     F,
-    Func,
     IntegerField,
     JSONField,
     OuterRef,
@@ -36,13 +35,15 @@ from plane.db.models import (
     DeprecatedDashboardWidget,
     Issue,
     IssueActivity,
-    FileAsset,
-    IssueLink,
     IssueRelation,
     Project,
     DeprecatedWidget,
     WorkspaceMember,
-    CycleIssue,
+)
+from plane.app.permissions import (
+    get_guest_visibility_filter,
+    get_workspace_role,
+    ROLE,
 )
 from plane.utils.issue_filters import issue_filters
 
@@ -54,26 +55,9 @@ def dashboard_overview_stats(self, request, slug):
     assigned_issues = (
         Issue.issue_objects.filter(
             (Q(assignees__in=[request.user]) & Q(issue_assignee__deleted_at__isnull=True)),
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
             workspace__slug=slug,
         )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
+        .filter(get_guest_visibility_filter(request, slug))
         .count()
     )
 
@@ -81,53 +65,19 @@ def dashboard_overview_stats(self, request, slug):
         Issue.issue_objects.filter(
             ~Q(state__group__in=["completed", "cancelled"]),
             target_date__lt=timezone.now().date(),
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
             workspace__slug=slug,
             assignees__in=[request.user],
         )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
+        .filter(get_guest_visibility_filter(request, slug))
         .count()
     )
 
     created_issues_count = (
         Issue.issue_objects.filter(
             workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
             created_by_id=request.user.id,
         )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
+        .filter(get_guest_visibility_filter(request, slug))
         .count()
     )
 
@@ -138,26 +88,9 @@ def dashboard_overview_stats(self, request, slug):
                 & Q(issue_assignee__deleted_at__isnull=True)
             ),
             workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
             state__group="completed",
         )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
+        .filter(get_guest_visibility_filter(request, slug))
         .count()
     )
 
@@ -198,34 +131,7 @@ def dashboard_assigned_issues(self, request, slug):
                 ).select_related("issue"),
             )
         )
-        .annotate(
-            cycle_id=Subquery(
-                CycleIssue.objects.filter(
-                    issue=OuterRef("id"), deleted_at__isnull=True
-                ).values("cycle_id")[:1]
-            )
-        )
-        .annotate(
-            link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
-        .annotate(
-            attachment_count=FileAsset.objects.filter(
-                issue_id=OuterRef("id"),
-                entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-            )
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
-        .annotate(
-            sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
+        .annotate(cycle_id=F("current_cycle_id"))
         .annotate(
             label_ids=Coalesce(
                 ArrayAgg(
@@ -265,9 +171,7 @@ def dashboard_assigned_issues(self, request, slug):
         )
     )
 
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug, member=request.user, role=5, is_active=True
-    ).exists():
+    if get_workspace_role(request, slug) == ROLE.GUEST.value:
         assigned_issues = assigned_issues.filter(created_by=request.user)
 
     # Priority Ordering
@@ -370,34 +274,7 @@ def dashboard_created_issues(self, request, slug):
         .filter(**filters)
         .select_related("workspace", "project", "state", "parent")
         .prefetch_related("assignees", "labels", "issue_module__module")
-        .annotate(
-            cycle_id=Subquery(
-                CycleIssue.objects.filter(
-                    issue=OuterRef("id"), deleted_at__isnull=True
-                ).values("cycle_id")[:1]
-            )
-        )
-        .annotate(
-            link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
-        .annotate(
-            attachment_count=FileAsset.objects.filter(
-                issue_id=OuterRef("id"),
-                entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-            )
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
-        .annotate(
-            sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
+        .annotate(cycle_id=F("current_cycle_id"))
         .annotate(
             label_ids=Coalesce(
                 ArrayAgg(
@@ -522,9 +399,7 @@ def dashboard_issues_by_state_groups(self, request, slug):
     state_order = ["backlog", "unstarted", "started", "completed", "cancelled"]
     extra_filters = {}
 
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug, member=request.user, role=5, is_active=True
-    ).exists():
+    if get_workspace_role(request, slug) == ROLE.GUEST.value:
         extra_filters = {"created_by": request.user}
 
     issues_by_state_groups = (
@@ -559,9 +434,7 @@ def dashboard_issues_by_priority(self, request, slug):
     priority_order = ["urgent", "high", "medium", "low", "none"]
     extra_filters = {}
 
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug, member=request.user, role=5, is_active=True
-    ).exists():
+    if get_workspace_role(request, slug) == ROLE.GUEST.value:
         extra_filters = {"created_by": request.user}
 
     issues_by_priority = (
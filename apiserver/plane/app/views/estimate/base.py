@@ -12,7 +12,14 @@ from rest_framework import status
 # Module imports
 from ..base import BaseViewSet, BaseAPIView
 from plane.app.permissions import ProjectEntityPermission, allow_permission, ROLE
-from plane.db.models import Project, Estimate, EstimatePoint, Issue
+from plane.db.models import (
+    CycleStats,
+    Estimate,
+    EstimatePoint,
+    Issue,
+    ModuleStats,
+    Project,
+)
 from plane.app.serializers import (
     EstimateSerializer,
     EstimatePointSerializer,
@@ -155,6 +162,9 @@ class BulkEstimatePointEndpoint(BaseViewSet):
         EstimatePoint.objects.bulk_update(
             updated_estimate_points, ["key", "value"], batch_size=10
         )
+        # The type and the point values weigh the estimate points of the stats
+        CycleStats.refresh_projects([project_id])
+        ModuleStats.refresh_projects([project_id])
 
         estimate_serializer = EstimateReadSerializer(estimate)
         return Response(estimate_serializer.data, status=status.HTTP_200_OK)
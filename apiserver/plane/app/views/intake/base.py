@@ -3,7 +3,7 @@ import json
 
 # Django import
 from django.utils import timezone
-from django.db.models import Q, Count, OuterRef, Func, F, Prefetch, Subquery
+from django.db.models import Q, Count, F, Prefetch
 from django.core.serializers.json import DjangoJSONEncoder
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
@@ -16,17 +16,14 @@ from rest_framework.response import Response
 
 # Module imports
 from ..base import BaseViewSet
-from plane.app.permissions import allow_permission, ROLE
+from plane.app.permissions import allow_permission, get_project_role, ROLE
 from plane.db.models import (
     Intake,
     IntakeIssue,
     Issue,
     State,
-    IssueLink,
-    FileAsset,
     Project,
     ProjectMember,
-    CycleIssue,
 )
 from plane.app.serializers import (
     IssueCreateSerializer,
@@ -105,34 +102,7 @@ class IntakeIssueViewSet(BaseViewSet):
                     ),
                 )
             )
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
@@ -209,13 +179,7 @@ class IntakeIssueViewSet(BaseViewSet):
             intake_issue = intake_issue.filter(status__in=intake_status)
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_project_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
         ):
             intake_issue = intake_issue.filter(created_by=request.user)
@@ -540,13 +504,7 @@ class IntakeIssueViewSet(BaseViewSet):
             .get(intake_id=intake_id.id, issue_id=pk, project_id=project_id)
         )
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_project_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
             and not intake_issue.created_by == request.user
         ):
@@ -3,7 +3,7 @@ import json
 
 # Django imports
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import F, Func, OuterRef, Q, Prefetch, Exists, Subquery
+from django.db.models import F, OuterRef, Q, Prefetch, Exists
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -18,15 +18,14 @@ from plane.app.serializers import (
     IssueSerializer,
     IssueDetailSerializer,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import bulk_issue_activity, issue_activity
 from plane.db.models import (
     Issue,
-    FileAsset,
     IssueLink,
     IssueSubscriber,
     IssueReaction,
-    CycleIssue,
 )
+from plane.db.models.progress_stats import refresh_issue_progress
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
@@ -48,46 +47,13 @@ class IssueArchiveViewSet(BaseViewSet):
 
     def get_queryset(self):
         return (
-            Issue.objects.annotate(
-                sub_issues_count=Issue.objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .filter(deleted_at__isnull=True)
+            Issue.objects.filter(deleted_at__isnull=True)
             .filter(archived_at__isnull=False)
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
         )
 
     @method_decorator(gzip_page)
@@ -311,6 +277,7 @@ class BulkArchiveIssuesEndpoint(BaseAPIView):
             workspace__slug=slug, project_id=project_id, pk__in=issue_ids
         ).select_related("state")
         bulk_archive_issues = []
+        changes = []
         for issue in issues:
             if issue.state.group not in ["completed", "cancelled"]:
                 return Response(
@@ -320,24 +287,29 @@ class BulkArchiveIssuesEndpoint(BaseAPIView):
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            issue_activity.delay(
-                type="issue.activity.updated",
-                requested_data=json.dumps(
-                    {"archived_at": str(timezone.now().date()), "automation": False}
-                ),
-                actor_id=str(request.user.id),
-                issue_id=str(issue.id),
-                project_id=str(project_id),
-                current_instance=json.dumps(
-                    IssueSerializer(issue).data, cls=DjangoJSONEncoder
-                ),
-                epoch=int(timezone.now().timestamp()),
-                notification=True,
-                origin=request.META.get("HTTP_ORIGIN"),
+            changes.append(
+                (
+                    str(issue.id),
+                    json.dumps(
+                        {"archived_at": str(timezone.now().date()), "automation": False}
+                    ),
+                    json.dumps(IssueSerializer(issue).data, cls=DjangoJSONEncoder),
+                )
             )
             issue.archived_at = timezone.now().date()
             bulk_archive_issues.append(issue)
         Issue.objects.bulk_update(bulk_archive_issues, ["archived_at"])
+        Issue.update_counters({issue.parent_id for issue in bulk_archive_issues})
+        refresh_issue_progress([issue.id for issue in bulk_archive_issues])
+        bulk_issue_activity.delay(
+            type="issue.activity.updated",
+            changes=changes,
+            actor_id=str(request.user.id),
+            project_id=str(project_id),
+            epoch=int(timezone.now().timestamp()),
+            notification=True,
+            origin=request.META.get("HTTP_ORIGIN"),
+        )
 
         return Response(
             {"archived_at": str(timezone.now().date())}, status=status.HTTP_200_OK
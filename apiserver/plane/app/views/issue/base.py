@@ -2,19 +2,18 @@
 import json
 
 # Django imports
+from django.conf import settings
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import (
     Exists,
     F,
-    Func,
     OuterRef,
     Prefetch,
     Q,
     UUIDField,
     Value,
-    Subquery,
 )
 from django.db.models.functions import Coalesce
 from django.utils import timezone
@@ -26,25 +25,27 @@ from rest_framework import status
 from rest_framework.response import Response
 
 # Module imports
-from plane.app.permissions import allow_permission, ROLE
+from plane.app.permissions import allow_permission, get_project_role, ROLE
 from plane.app.serializers import (
     IssueCreateSerializer,
     IssueDetailSerializer,
     IssueUserPropertySerializer,
     IssueSerializer,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import (
+    bulk_issue_activity,
+    issue_activity,
+    issues_created_activity,
+)
 from plane.db.models import (
     Issue,
-    FileAsset,
     IssueLink,
     IssueUserProperty,
     IssueReaction,
     IssueSubscriber,
     Project,
-    ProjectMember,
-    CycleIssue,
 )
+from plane.db.models.progress_stats import refresh_issue_progress
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
@@ -52,11 +53,15 @@ from plane.utils.grouper import (
 )
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
-from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
+from plane.utils.paginator import (
+    GroupedOffsetPaginator,
+    SubGroupedOffsetPaginator,
+    PAGINATOR_COUNT_CACHE_TIMEOUT,
+)
 from .. import BaseAPIView, BaseViewSet
 from plane.utils.timezone_converter import user_timezone_converter
 from plane.bgtasks.recent_visited_task import recent_visited_task
-from plane.utils.global_paginator import paginate
+from plane.utils.global_paginator import paginate, paginate_changes
 from plane.bgtasks.webhook_task import model_activity
 from plane.bgtasks.issue_description_version_task import issue_description_version_task
 
@@ -80,34 +85,7 @@ class IssueListEndpoint(BaseAPIView):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
         ).distinct()
 
         filters = issue_filters(request.query_params, "GET")
@@ -197,34 +175,7 @@ class IssueViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
         ).distinct()
 
     @method_decorator(gzip_page)
@@ -263,13 +214,7 @@ class IssueViewSet(BaseViewSet):
             user_id=request.user.id,
         )
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_project_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
         ):
             issue_queryset = issue_queryset.filter(created_by=request.user)
@@ -349,12 +294,90 @@ class IssueViewSet(BaseViewSet):
                 on_results=lambda issues: issue_on_results(
                     group_by=group_by, issues=issues, sub_group_by=sub_group_by
                 ),
+                keyset=True,
+                count_cache_timeout=PAGINATOR_COUNT_CACHE_TIMEOUT,
             )
 
+    def get_created_issues(self, issue_ids):
+        return issue_queryset_grouper(
+            queryset=self.get_queryset().filter(pk__in=issue_ids),
+            group_by=None,
+            sub_group_by=None,
+        ).values(
+            "id",
+            "name",
+            "state_id",
+            "sort_order",
+            "completed_at",
+            "estimate_point",
+            "priority",
+            "start_date",
+            "target_date",
+            "sequence_id",
+            "project_id",
+            "parent_id",
+            "cycle_id",
+            "module_ids",
+            "label_ids",
+            "assignee_ids",
+            "sub_issues_count",
+            "created_at",
+            "updated_at",
+            "created_by",
+            "updated_by",
+            "attachment_count",
+            "link_count",
+            "is_draft",
+            "archived_at",
+            "deleted_at",
+        )
+
+    def create_in_bulk(self, request, slug, project):
+        if len(request.data) > settings.ISSUE_BULK_CREATE_MAX_SIZE:
+            return Response(
+                {
+                    "error": f"At most {settings.ISSUE_BULK_CREATE_MAX_SIZE} issues can be created at once"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = IssueCreateSerializer(
+            data=request.data,
+            many=True,
+            context={
+                "project_id": project.id,
+                "workspace_id": project.workspace_id,
+                "default_assignee_id": project.default_assignee_id,
+            },
+        )
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        issue_ids = [str(issue.id) for issue in serializer.save()]
+
+        # Track the issues
+        issues_created_activity.delay(
+            issue_ids=issue_ids,
+            project_id=str(project.id),
+            actor_id=str(request.user.id),
+            epoch=int(timezone.now().timestamp()),
+            origin=request.META.get("HTTP_ORIGIN"),
+        )
+        issues = user_timezone_converter(
+            self.get_created_issues(issue_ids),
+            ["created_at", "updated_at"],
+            request.user.user_timezone,
+        )
+        return Response(issues, status=status.HTTP_201_CREATED)
+
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
     def create(self, request, slug, project_id):
         project = Project.objects.get(pk=project_id)
 
+        # A list of issues is created in bulk
+        if isinstance(request.data, list):
+            return self.create_in_bulk(request, slug, project)
+
         serializer = IssueCreateSerializer(
             data=request.data,
             context={
@@ -379,42 +402,7 @@ class IssueViewSet(BaseViewSet):
                 notification=True,
                 origin=request.META.get("HTTP_ORIGIN"),
             )
-            issue = (
-                issue_queryset_grouper(
-                    queryset=self.get_queryset().filter(pk=serializer.data["id"]),
-                    group_by=None,
-                    sub_group_by=None,
-                )
-                .values(
-                    "id",
-                    "name",
-                    "state_id",
-                    "sort_order",
-                    "completed_at",
-                    "estimate_point",
-                    "priority",
-                    "start_date",
-                    "target_date",
-                    "sequence_id",
-                    "project_id",
-                    "parent_id",
-                    "cycle_id",
-                    "module_ids",
-                    "label_ids",
-                    "assignee_ids",
-                    "sub_issues_count",
-                    "created_at",
-                    "updated_at",
-                    "created_by",
-                    "updated_by",
-                    "attachment_count",
-                    "link_count",
-                    "is_draft",
-                    "archived_at",
-                    "deleted_at",
-                )
-                .first()
-            )
+            issue = self.get_created_issues([serializer.data["id"]]).first()
             datetime_fields = ["created_at", "updated_at"]
             issue = user_timezone_converter(
                 issue, datetime_fields, request.user.user_timezone
@@ -450,34 +438,7 @@ class IssueViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[
-                        :1
-                    ]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
             .filter(pk=pk)
             .annotate(
                 label_ids=Coalesce(
@@ -551,13 +512,7 @@ class IssueViewSet(BaseViewSet):
         """
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_project_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
             and not issue.created_by == request.user
         ):
@@ -727,8 +682,12 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
         )
 
         total_issues = len(issues)
+        parent_ids = {issue.parent_id for issue in issues}
 
         issues.delete()
+        # The queryset delete skips the signals keeping the parent counters
+        Issue.update_counters(parent_ids)
+        refresh_issue_progress(issue_ids)
 
         return Response(
             {"message": f"{total_issues} issues were deleted"},
@@ -764,34 +723,7 @@ class IssuePaginatedViewSet(BaseViewSet):
         return (
             issue_queryset.select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
         ).distinct()
 
     def process_paginated_result(self, fields, results, timezone):
@@ -810,6 +742,7 @@ class IssuePaginatedViewSet(BaseViewSet):
         cursor = request.GET.get("cursor", None)
         is_description_required = request.GET.get("description", "false")
         updated_at = request.GET.get("updated_at__gt", None)
+        changes_after = request.GET.get("changes_after", None)
 
         # required fields
         required_fields = [
@@ -851,22 +784,23 @@ class IssuePaginatedViewSet(BaseViewSet):
 
         base_queryset = base_queryset.order_by("updated_at")
         queryset = self.get_queryset().order_by("updated_at")
+        # Deleted, archived and drafted issues are returned as deleted
+        changed_queryset = Issue.all_objects.filter(
+            workspace__slug=slug, project_id=project_id
+        )
 
         # validation for guest user
         project = Project.objects.get(pk=project_id, workspace__slug=slug)
-        project_member = ProjectMember.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            member=request.user,
-            role=5,
-            is_active=True,
-        )
-        if project_member.exists() and not project.guest_view_all_features:
+        if (
+            get_project_role(request, slug, project_id) == ROLE.GUEST.value
+            and not project.guest_view_all_features
+        ):
             base_queryset = base_queryset.filter(created_by=request.user)
             queryset = queryset.filter(created_by=request.user)
+            changed_queryset = changed_queryset.filter(created_by=request.user)
 
         # filtering issues by greater then updated_at given by the user
-        if updated_at:
+        if updated_at and changes_after is None:
             base_queryset = base_queryset.filter(updated_at__gt=updated_at)
             queryset = queryset.filter(updated_at__gt=updated_at)
 
@@ -908,6 +842,24 @@ class IssuePaginatedViewSet(BaseViewSet):
             ),
         )
 
+        if changes_after is not None:
+            # Changes and removals after the change cursor given by the user
+            try:
+                paginated_data = paginate_changes(
+                    base_queryset=changed_queryset,
+                    queryset=queryset,
+                    cursor=changes_after,
+                    on_result=lambda results: self.process_paginated_result(
+                        required_fields, results, request.user.user_timezone
+                    ),
+                )
+            except ValueError:
+                return Response(
+                    {"error": "Invalid change cursor"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            return Response(paginated_data, status=status.HTTP_200_OK)
+
         paginated_data = paginate(
             base_queryset=base_queryset,
             queryset=queryset,
@@ -928,13 +880,7 @@ class IssueDetailEndpoint(BaseAPIView):
             Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id)
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
@@ -972,27 +918,6 @@ class IssueDetailEndpoint(BaseAPIView):
                     Value([], output_field=ArrayField(UUIDField())),
                 ),
             )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
         )
         issue = issue.filter(**filters)
         order_by_param = request.GET.get("order_by", "-created_at")
@@ -1033,6 +958,7 @@ class IssueBulkUpdateDateEndpoint(BaseAPIView):
         issues = list(Issue.objects.filter(id__in=issue_ids))
         issues_dict = {str(issue.id): issue for issue in issues}
         issues_to_update = []
+        changes = []
 
         for update in updates:
             issue_id = update["id"]
@@ -1053,37 +979,36 @@ class IssueBulkUpdateDateEndpoint(BaseAPIView):
                 )
 
             if start_date:
-                issue_activity.delay(
-                    type="issue.activity.updated",
-                    requested_data=json.dumps({"start_date": update.get("start_date")}),
-                    current_instance=json.dumps({"start_date": str(issue.start_date)}),
-                    issue_id=str(issue_id),
-                    actor_id=str(request.user.id),
-                    project_id=str(project_id),
-                    epoch=epoch,
+                changes.append(
+                    (
+                        str(issue_id),
+                        json.dumps({"start_date": update.get("start_date")}),
+                        json.dumps({"start_date": str(issue.start_date)}),
+                    )
                 )
                 issue.start_date = start_date
                 issues_to_update.append(issue)
 
             if target_date:
-                issue_activity.delay(
-                    type="issue.activity.updated",
-                    requested_data=json.dumps(
-                        {"target_date": update.get("target_date")}
-                    ),
-                    current_instance=json.dumps(
-                        {"target_date": str(issue.target_date)}
-                    ),
-                    issue_id=str(issue_id),
-                    actor_id=str(request.user.id),
-                    project_id=str(project_id),
-                    epoch=epoch,
+                changes.append(
+                    (
+                        str(issue_id),
+                        json.dumps({"target_date": update.get("target_date")}),
+                        json.dumps({"target_date": str(issue.target_date)}),
+                    )
                 )
                 issue.target_date = target_date
                 issues_to_update.append(issue)
 
         # Bulk update issues
         Issue.objects.bulk_update(issues_to_update, ["start_date", "target_date"])
+        bulk_issue_activity.delay(
+            type="issue.activity.updated",
+            changes=changes,
+            actor_id=str(request.user.id),
+            project_id=str(project_id),
+            epoch=epoch,
+        )
 
         return Response(
             {"message": "Issues updated successfully"}, status=status.HTTP_200_OK
@@ -3,7 +3,7 @@ import json
 
 # Django imports
 from django.utils import timezone
-from django.db.models import Q, OuterRef, F, Func, UUIDField, Value, CharField, Subquery
+from django.db.models import Q, UUIDField, Value
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models.functions import Coalesce
 from django.contrib.postgres.aggregates import ArrayAgg
@@ -14,19 +14,70 @@ from rest_framework.response import Response
 from rest_framework import status
 
 # Module imports
-from .. import BaseViewSet
+from .. import BaseAPIView, BaseViewSet
 from plane.app.serializers import IssueRelationSerializer, RelatedIssueSerializer
 from plane.app.permissions import ProjectEntityPermission
 from plane.db.models import (
     Project,
     IssueRelation,
     Issue,
-    FileAsset,
-    IssueLink,
-    CycleIssue,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
-from plane.utils.issue_relation_mapper import get_actual_relation
+from plane.utils.issue_relation_mapper import (
+    RELATION_NAMES,
+    get_actual_relation,
+    get_relation_graph,
+)
+
+
+# Fields of the related issues listed with the relations of an issue
+RELATED_ISSUE_FIELDS = [
+    "id",
+    "name",
+    "state_id",
+    "sort_order",
+    "priority",
+    "sequence_id",
+    "project_id",
+    "label_ids",
+    "assignee_ids",
+    "created_at",
+    "updated_at",
+    "created_by",
+    "updated_by",
+]
+
+
+def get_related_issue_queryset(slug):
+    return (
+        Issue.issue_objects.filter(workspace__slug=slug)
+        .annotate(
+            label_ids=Coalesce(
+                ArrayAgg(
+                    "labels__id",
+                    distinct=True,
+                    filter=Q(
+                        ~Q(labels__id__isnull=True)
+                        & (Q(label_issue__deleted_at__isnull=True))
+                    ),
+                ),
+                Value([], output_field=ArrayField(UUIDField())),
+            ),
+            assignee_ids=Coalesce(
+                ArrayAgg(
+                    "assignees__id",
+                    distinct=True,
+                    filter=Q(
+                        ~Q(assignees__id__isnull=True)
+                        & Q(assignees__member_project__is_active=True)
+                        & Q(issue_assignee__deleted_at__isnull=True)
+                    ),
+                ),
+                Value([], output_field=ArrayField(UUIDField())),
+            ),
+        )
+        .order_by()
+    )
 
 
 class IssueRelationViewSet(BaseViewSet):
@@ -35,175 +86,37 @@ class IssueRelationViewSet(BaseViewSet):
     permission_classes = [ProjectEntityPermission]
 
     def list(self, request, slug, project_id, issue_id):
-        issue_relations = (
+        # All the relations of the issue, from both sides, in a single query
+        relations = (
             IssueRelation.objects.filter(
-                Q(issue_id=issue_id) | Q(related_issue=issue_id)
+                Q(issue_id=issue_id) | Q(related_issue_id=issue_id),
+                workspace__slug=slug,
             )
-            .filter(workspace__slug=self.kwargs.get("slug"))
-            .select_related("project")
-            .select_related("workspace")
-            .select_related("issue")
             .order_by("-created_at")
-            .distinct()
+            .values_list("issue_id", "related_issue_id", "relation_type")
         )
-        # get all blocking issues
-        blocking_issues = issue_relations.filter(
-            relation_type="blocked_by", related_issue_id=issue_id
-        ).values_list("issue_id", flat=True)
-
-        # get all blocked by issues
-        blocked_by_issues = issue_relations.filter(
-            relation_type="blocked_by", issue_id=issue_id
-        ).values_list("related_issue_id", flat=True)
-
-        # get all duplicate issues
-        duplicate_issues = issue_relations.filter(
-            issue_id=issue_id, relation_type="duplicate"
-        ).values_list("related_issue_id", flat=True)
-
-        # get all relates to issues
-        duplicate_issues_related = issue_relations.filter(
-            related_issue_id=issue_id, relation_type="duplicate"
-        ).values_list("issue_id", flat=True)
-
-        # get all relates to issues
-        relates_to_issues = issue_relations.filter(
-            issue_id=issue_id, relation_type="relates_to"
-        ).values_list("related_issue_id", flat=True)
-
-        # get all relates to issues
-        relates_to_issues_related = issue_relations.filter(
-            related_issue_id=issue_id, relation_type="relates_to"
-        ).values_list("issue_id", flat=True)
-
-        # get all start after issues
-        start_after_issues = issue_relations.filter(
-            relation_type="start_before", related_issue_id=issue_id
-        ).values_list("issue_id", flat=True)
-
-        # get all start_before issues
-        start_before_issues = issue_relations.filter(
-            relation_type="start_before", issue_id=issue_id
-        ).values_list("related_issue_id", flat=True)
-
-        # get all finish after issues
-        finish_after_issues = issue_relations.filter(
-            relation_type="finish_before", related_issue_id=issue_id
-        ).values_list("issue_id", flat=True)
-
-        # get all finish before issues
-        finish_before_issues = issue_relations.filter(
-            relation_type="finish_before", issue_id=issue_id
-        ).values_list("related_issue_id", flat=True)
-
-        queryset = (
-            Issue.issue_objects.filter(workspace__slug=slug)
-            .select_related("workspace", "project", "state", "parent")
-            .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                label_ids=Coalesce(
-                    ArrayAgg(
-                        "labels__id",
-                        distinct=True,
-                        filter=Q(
-                            ~Q(labels__id__isnull=True)
-                            & (Q(label_issue__deleted_at__isnull=True))
-                        ),
-                    ),
-                    Value([], output_field=ArrayField(UUIDField())),
-                ),
-                assignee_ids=Coalesce(
-                    ArrayAgg(
-                        "assignees__id",
-                        distinct=True,
-                        filter=Q(
-                            ~Q(assignees__id__isnull=True)
-                            & Q(assignees__member_project__is_active=True)
-                            & Q(issue_assignee__deleted_at__isnull=True)
-                        ),
-                    ),
-                    Value([], output_field=ArrayField(UUIDField())),
-                ),
-            )
-        ).distinct()
+        graph = get_relation_graph([issue_id], relations)[str(issue_id)]
 
-        # Fields
-        fields = [
-            "id",
-            "name",
-            "state_id",
-            "sort_order",
-            "priority",
-            "sequence_id",
-            "project_id",
-            "label_ids",
-            "assignee_ids",
-            "created_at",
-            "updated_at",
-            "created_by",
-            "updated_by",
-            "relation_type",
-        ]
+        # The related issues of every relation, read once
+        related_issue_ids = {
+            related_issue_id
+            for related_issue_ids in graph.values()
+            for related_issue_id in related_issue_ids
+        }
+        issues = {
+            str(issue["id"]): issue
+            for issue in get_related_issue_queryset(slug)
+            .filter(pk__in=related_issue_ids)
+            .values(*RELATED_ISSUE_FIELDS)
+        }
 
         response_data = {
-            "blocking": queryset.filter(pk__in=blocking_issues)
-            .annotate(relation_type=Value("blocking", output_field=CharField()))
-            .values(*fields),
-            "blocked_by": queryset.filter(pk__in=blocked_by_issues)
-            .annotate(relation_type=Value("blocked_by", output_field=CharField()))
-            .values(*fields),
-            "duplicate": queryset.filter(pk__in=duplicate_issues)
-            .annotate(relation_type=Value("duplicate", output_field=CharField()))
-            .values(*fields)
-            | queryset.filter(pk__in=duplicate_issues_related)
-            .annotate(relation_type=Value("duplicate", output_field=CharField()))
-            .values(*fields),
-            "relates_to": queryset.filter(pk__in=relates_to_issues)
-            .annotate(relation_type=Value("relates_to", output_field=CharField()))
-            .values(*fields)
-            | queryset.filter(pk__in=relates_to_issues_related)
-            .annotate(relation_type=Value("relates_to", output_field=CharField()))
-            .values(*fields),
-            "start_after": queryset.filter(pk__in=start_after_issues)
-            .annotate(relation_type=Value("start_after", output_field=CharField()))
-            .values(*fields),
-            "start_before": queryset.filter(pk__in=start_before_issues)
-            .annotate(relation_type=Value("start_before", output_field=CharField()))
-            .values(*fields),
-            "finish_after": queryset.filter(pk__in=finish_after_issues)
-            .annotate(relation_type=Value("finish_after", output_field=CharField()))
-            .values(*fields),
-            "finish_before": queryset.filter(pk__in=finish_before_issues)
-            .annotate(relation_type=Value("finish_before", output_field=CharField()))
-            .values(*fields),
+            relation_name: [
+                {**issues[related_issue_id], "relation_type": relation_name}
+                for related_issue_id in graph.get(relation_name, [])
+                if related_issue_id in issues
+            ]
+            for relation_name in RELATION_NAMES
         }
 
         return Response(response_data, status=status.HTTP_200_OK)
@@ -294,3 +207,39 @@ class IssueRelationViewSet(BaseViewSet):
             origin=request.META.get("HTTP_ORIGIN"),
         )
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ProjectIssueRelationEndpoint(BaseAPIView):
+    permission_classes = [ProjectEntityPermission]
+
+    def get(self, request, slug, project_id):
+        """
+        Relations of the issues of the project, or of the issue_ids given, as
+        the related issue ids per relation name of every issue
+        """
+        issue_ids = [
+            issue_id
+            for issue_id in request.GET.get("issue_ids", "").split(",")
+            if issue_id
+        ]
+        issues = Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id)
+        if issue_ids:
+            issues = issues.filter(pk__in=issue_ids)
+
+        # Relations from or to the issues, the issues read as a subquery
+        relations = (
+            IssueRelation.objects.filter(
+                Q(issue_id__in=issues.values("id"))
+                | Q(related_issue_id__in=issues.values("id")),
+                workspace__slug=slug,
+                issue__deleted_at__isnull=True,
+                related_issue__deleted_at__isnull=True,
+            )
+            .order_by("-created_at")
+            .values_list("issue_id", "related_issue_id", "relation_type")
+        )
+
+        return Response(
+            get_relation_graph(issues.values_list("id", flat=True), relations),
+            status=status.HTTP_200_OK,
+        )
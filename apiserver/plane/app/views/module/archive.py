@@ -5,11 +5,9 @@ from django.db.models import (
     Exists,
     F,
     Func,
-    IntegerField,
     OuterRef,
     Prefetch,
     Q,
-    Subquery,
     UUIDField,
     Value,
     Sum,
@@ -26,7 +24,14 @@ from rest_framework import status
 from rest_framework.response import Response
 from plane.app.permissions import ProjectEntityPermission
 from plane.app.serializers import ModuleDetailSerializer
-from plane.db.models import Issue, Module, ModuleLink, UserFavorite, Project
+from plane.db.models import (
+    Issue,
+    Module,
+    ModuleLink,
+    ModuleStats,
+    UserFavorite,
+    Project,
+)
 from plane.utils.analytics_plot import burndown_plot
 from plane.utils.timezone_converter import user_timezone_converter
 
@@ -46,149 +51,6 @@ class ModuleArchiveUnarchiveEndpoint(BaseAPIView):
             project_id=self.kwargs.get("project_id"),
             workspace__slug=self.kwargs.get("slug"),
         )
-        cancelled_issues = (
-            Issue.issue_objects.filter(
-                state__group="cancelled",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        completed_issues = (
-            Issue.issue_objects.filter(
-                state__group="completed",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        started_issues = (
-            Issue.issue_objects.filter(
-                state__group="started",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        unstarted_issues = (
-            Issue.issue_objects.filter(
-                state__group="unstarted",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        backlog_issues = (
-            Issue.issue_objects.filter(
-                state__group="backlog",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        total_issues = (
-            Issue.issue_objects.filter(
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        completed_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="completed",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(
-                completed_estimate_points=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("completed_estimate_points")[:1]
-        )
-
-        total_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(
-                total_estimate_points=Sum(Cast("estimate_point__value", FloatField()))
-            )
-            .values("total_estimate_points")[:1]
-        )
-        backlog_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="backlog",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(
-                backlog_estimate_point=Sum(Cast("estimate_point__value", FloatField()))
-            )
-            .values("backlog_estimate_point")[:1]
-        )
-        unstarted_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="unstarted",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(
-                unstarted_estimate_point=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("unstarted_estimate_point")[:1]
-        )
-        started_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="started",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(
-                started_estimate_point=Sum(Cast("estimate_point__value", FloatField()))
-            )
-            .values("started_estimate_point")[:1]
-        )
-        cancelled_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="cancelled",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(
-                cancelled_estimate_point=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("cancelled_estimate_point")[:1]
-        )
         return (
             Module.objects.filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
@@ -202,74 +64,7 @@ class ModuleArchiveUnarchiveEndpoint(BaseAPIView):
                     queryset=ModuleLink.objects.select_related("module", "created_by"),
                 )
             )
-            .annotate(
-                completed_issues=Coalesce(
-                    Subquery(completed_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(
-                cancelled_issues=Coalesce(
-                    Subquery(cancelled_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(
-                started_issues=Coalesce(
-                    Subquery(started_issues[:1]), Value(0, output_field=IntegerField())
-                )
-            )
-            .annotate(
-                unstarted_issues=Coalesce(
-                    Subquery(unstarted_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(
-                backlog_issues=Coalesce(
-                    Subquery(backlog_issues[:1]), Value(0, output_field=IntegerField())
-                )
-            )
-            .annotate(
-                total_issues=Coalesce(
-                    Subquery(total_issues[:1]), Value(0, output_field=IntegerField())
-                )
-            )
-            .annotate(
-                backlog_estimate_points=Coalesce(
-                    Subquery(backlog_estimate_point),
-                    Value(0, output_field=FloatField()),
-                )
-            )
-            .annotate(
-                unstarted_estimate_points=Coalesce(
-                    Subquery(unstarted_estimate_point),
-                    Value(0, output_field=FloatField()),
-                )
-            )
-            .annotate(
-                started_estimate_points=Coalesce(
-                    Subquery(started_estimate_point),
-                    Value(0, output_field=FloatField()),
-                )
-            )
-            .annotate(
-                cancelled_estimate_points=Coalesce(
-                    Subquery(cancelled_estimate_point),
-                    Value(0, output_field=FloatField()),
-                )
-            )
-            .annotate(
-                completed_estimate_points=Coalesce(
-                    Subquery(completed_estimate_point),
-                    Value(0, output_field=FloatField()),
-                )
-            )
-            .annotate(
-                total_estimate_points=Coalesce(
-                    Subquery(total_estimate_point), Value(0, output_field=FloatField())
-                )
-            )
+            .annotate(**ModuleStats.annotations())
             .annotate(
                 member_ids=Coalesce(
                     ArrayAgg(
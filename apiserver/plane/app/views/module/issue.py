@@ -1,7 +1,7 @@
 # Python imports
 import json
 
-from django.db.models import F, Func, OuterRef, Q, Subquery
+from django.db.models import F, Q
 
 # Django Imports
 from django.utils import timezone
@@ -17,11 +17,9 @@ from plane.app.serializers import ModuleIssueSerializer
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Issue,
-    FileAsset,
-    IssueLink,
     ModuleIssue,
+    ModuleStats,
     Project,
-    CycleIssue,
 )
 from plane.utils.grouper import (
     issue_group_values,
@@ -54,34 +52,7 @@ class ModuleIssueViewSet(BaseViewSet):
             )
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
         ).distinct()
 
     @method_decorator(gzip_page)
@@ -210,6 +181,8 @@ class ModuleIssueViewSet(BaseViewSet):
             batch_size=10,
             ignore_conflicts=True,
         )
+        # Bulk operations skip the signals keeping the module stats
+        ModuleStats.refresh([module_id])
         # Bulk Update the activity
         _ = [
             issue_activity.delay(
@@ -288,6 +261,8 @@ class ModuleIssueViewSet(BaseViewSet):
             )
             module_issue.delete()
 
+        # Bulk operations skip the signals keeping the module stats
+        ModuleStats.refresh(modules + removed_modules)
         return Response({"message": "success"}, status=status.HTTP_201_CREATED)
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
@@ -312,4 +287,5 @@ class ModuleIssueViewSet(BaseViewSet):
             origin=request.META.get("HTTP_ORIGIN"),
         )
         module_issue.delete()
+        ModuleStats.refresh([module_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -19,7 +19,7 @@ from rest_framework import status
 from rest_framework.response import Response
 
 # Module imports
-from plane.app.permissions import allow_permission, ROLE
+from plane.app.permissions import allow_permission, get_project_role, ROLE
 from plane.app.serializers import (
     PageLogSerializer,
     PageSerializer,
@@ -202,13 +202,7 @@ class PageViewSet(BaseViewSet):
         """
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_project_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
             and not page.owned_by == request.user
         ):
@@ -285,13 +279,7 @@ class PageViewSet(BaseViewSet):
         queryset = self.get_queryset()
         project = Project.objects.get(pk=project_id)
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_project_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
         ):
             queryset = queryset.filter(owned_by=request.user)
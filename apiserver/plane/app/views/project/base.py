@@ -22,7 +22,12 @@ from plane.app.serializers import (
     DeployBoardSerializer,
 )
 
-from plane.app.permissions import ProjectMemberPermission, allow_permission, ROLE
+from plane.app.permissions import (
+    ProjectMemberPermission,
+    allow_permission,
+    get_workspace_role,
+    ROLE,
+)
 from plane.db.models import (
     UserFavorite,
     Cycle,
@@ -136,17 +141,14 @@ class ProjectViewSet(BaseViewSet):
     def list(self, request, slug):
         fields = [field for field in request.GET.get("fields", "").split(",") if field]
         projects = self.get_queryset().order_by("sort_order", "name")
-        if WorkspaceMember.objects.filter(
-            member=request.user, workspace__slug=slug, is_active=True, role=5
-        ).exists():
+        workspace_role = get_workspace_role(request, slug)
+        if workspace_role == ROLE.GUEST.value:
             projects = projects.filter(
                 project_projectmember__member=self.request.user,
                 project_projectmember__is_active=True,
             )
 
-        if WorkspaceMember.objects.filter(
-            member=request.user, workspace__slug=slug, is_active=True, role=15
-        ).exists():
+        if workspace_role == ROLE.MEMBER.value:
             projects = projects.filter(
                 Q(
                     project_projectmember__member=self.request.user,
@@ -27,6 +27,7 @@ from plane.db.models import (
     WorkspaceMember,
     IssueUserProperty,
 )
+from plane.db.models.workspace import invalidate_member_roles
 
 
 class ProjectInvitationsViewset(BaseViewSet):
@@ -163,6 +164,7 @@ class UserProjectInvitationsViewset(BaseViewSet):
             ],
             ignore_conflicts=True,
         )
+        invalidate_member_roles([request.user.id])
 
         IssueUserProperty.objects.bulk_create(
             [
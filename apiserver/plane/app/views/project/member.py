@@ -17,6 +17,7 @@ from plane.app.permissions import (
 )
 
 from plane.db.models import Project, ProjectMember, IssueUserProperty, WorkspaceMember
+from plane.db.models.workspace import invalidate_member_roles
 from plane.bgtasks.project_add_user_email_task import project_add_user_email
 from plane.utils.host import base_host
 from plane.app.permissions.base import allow_permission, ROLE
@@ -153,6 +154,7 @@ class ProjectMemberViewSet(BaseViewSet):
         _ = IssueUserProperty.objects.bulk_create(
             bulk_issue_props, batch_size=10, ignore_conflicts=True
         )
+        invalidate_member_roles([member.get("member_id") for member in members])
 
         project_members = ProjectMember.objects.filter(
             project_id=project_id,
@@ -24,6 +24,7 @@ from rest_framework.response import Response
 
 # Module imports
 from plane.app.views.base import BaseAPIView
+from plane.utils.issue_search import search_ranked
 from plane.db.models import (
     Workspace,
     Project,
@@ -72,19 +73,13 @@ class GlobalSearchEndpoint(BaseAPIView):
         )
 
     def filter_issues(self, query, slug, project_id, workspace_search):
-        fields = ["name", "sequence_id", "project__identifier"]
-        q = Q()
-        for field in fields:
-            if field == "sequence_id":
-                # Match whole integers only (exclude decimal numbers)
-                sequences = re.findall(r"\b\d+\b", query)
-                for sequence_id in sequences:
-                    q |= Q(**{"sequence_id": sequence_id})
-            else:
-                q |= Q(**{f"{field}__icontains": query})
+        q = Q(project__identifier__icontains=query)
+        # Match whole integers only (exclude decimal numbers)
+        sequences = re.findall(r"\b\d+\b", query)
+        for sequence_id in sequences:
+            q |= Q(**{"sequence_id": sequence_id})
 
         issues = Issue.issue_objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -94,6 +89,9 @@ class GlobalSearchEndpoint(BaseAPIView):
         if workspace_search == "false" and project_id:
             issues = issues.filter(project_id=project_id)
 
+        # Ranked on the full-text index, the name also matches any substring
+        issues = search_ranked(query, issues, q)
+
         return issues.distinct().values(
             "name",
             "id",
@@ -146,14 +144,8 @@ class GlobalSearchEndpoint(BaseAPIView):
         )
 
     def filter_pages(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         pages = (
             Page.objects.filter(
-                q,
                 projects__project_projectmember__member=self.request.user,
                 projects__project_projectmember__is_active=True,
                 projects__archived_at__isnull=True,
@@ -188,9 +180,12 @@ class GlobalSearchEndpoint(BaseAPIView):
                 project_id=project_id
             )
 
+        # Ranked on the full-text index over the name and content
+        pages = search_ranked(query, pages)
+
         return pages.distinct().values(
             "name", "id", "project_ids", "project_identifiers", "workspace__slug"
-        )
+        )[:100]
 
     def filter_views(self, query, slug, project_id, workspace_search):
         fields = ["name"]
@@ -7,7 +7,8 @@ from rest_framework.response import Response
 
 # Module imports
 from .base import BaseAPIView
-from plane.db.models import Issue, ProjectMember, IssueRelation
+from plane.app.permissions import get_project_role, ROLE
+from plane.db.models import Issue, IssueRelation
 from plane.utils.issue_search import search_issues
 
 
@@ -79,9 +80,7 @@ class IssueSearchEndpoint(BaseAPIView):
         if target_date == "none":
             issues = issues.filter(target_date__isnull=True)
 
-        if ProjectMember.objects.filter(
-            project_id=project_id, member=self.request.user, is_active=True, role=5
-        ).exists():
+        if get_project_role(request, slug, project_id) == ROLE.GUEST.value:
             issues = issues.filter(created_by=self.request.user)
 
         return Response(
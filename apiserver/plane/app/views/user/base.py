@@ -31,6 +31,7 @@ from plane.db.models import (
     WorkspaceMemberInvite,
     Session,
 )
+from plane.db.models.workspace import invalidate_member_roles
 from plane.license.models import Instance, InstanceAdmin
 from plane.utils.paginator import BasePaginator
 from plane.authentication.utils.host import user_ip
@@ -143,6 +144,7 @@ class UserEndpoint(BaseViewSet):
         WorkspaceMember.objects.bulk_update(
             workspaces_to_deactivate, ["is_active"], batch_size=100
         )
+        invalidate_member_roles([user.id])
 
         # Delete all workspace invites
         WorkspaceMemberInvite.objects.filter(email=user.email).delete()
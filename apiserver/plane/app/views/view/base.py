@@ -1,7 +1,7 @@
 # Django imports
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
-from django.db.models import Exists, F, Func, OuterRef, Q, UUIDField, Value, Subquery
+from django.db.models import Exists, F, OuterRef, Q, UUIDField, Value
 from django.db.models.functions import Coalesce
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -12,18 +12,21 @@ from rest_framework import status
 from rest_framework.response import Response
 
 # Module imports
-from plane.app.permissions import allow_permission, ROLE
+from plane.app.permissions import (
+    allow_permission,
+    get_guest_visibility_filter,
+    get_project_role,
+    get_workspace_role,
+    ROLE,
+)
 from plane.app.serializers import IssueViewSerializer
 from plane.db.models import (
     Issue,
-    FileAsset,
-    IssueLink,
     IssueView,
     Workspace,
     WorkspaceMember,
     ProjectMember,
     Project,
-    CycleIssue,
 )
 from plane.utils.grouper import (
     issue_group_values,
@@ -64,9 +67,7 @@ class WorkspaceViewViewSet(BaseViewSet):
     def list(self, request, slug):
         queryset = self.get_queryset()
         fields = [field for field in request.GET.get("fields", "").split(",") if field]
-        if WorkspaceMember.objects.filter(
-            workspace__slug=slug, member=request.user, role=5, is_active=True
-        ).exists():
+        if get_workspace_role(request, slug) == ROLE.GUEST.value:
             queryset = queryset.filter(owned_by=request.user)
         views = IssueViewSerializer(
             queryset, many=True, fields=fields if fields else None
@@ -144,47 +145,14 @@ class WorkspaceViewViewSet(BaseViewSet):
 class WorkspaceViewIssuesViewSet(BaseViewSet):
     def get_queryset(self):
         return (
-            Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .filter(workspace__slug=self.kwargs.get("slug"))
+            Issue.issue_objects.filter(workspace__slug=self.kwargs.get("slug"))
             .filter(
                 project__project_projectmember__member=self.request.user,
                 project__project_projectmember__is_active=True,
             )
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
@@ -235,33 +203,12 @@ class WorkspaceViewIssuesViewSet(BaseViewSet):
         issue_queryset = (
             self.get_queryset()
             .filter(**filters)
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
         )
 
         # check for the project member role, if the role is 5 then check for the guest_view_all_features if it is true then show all the issues else show only the issues created by the user
 
-        issue_queryset = issue_queryset.filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
+        issue_queryset = issue_queryset.filter(get_guest_visibility_filter(request, slug))
 
         # Issue queryset
         issue_queryset, order_by_param = order_issue_queryset(
@@ -393,13 +340,7 @@ class IssueViewViewSet(BaseViewSet):
         queryset = self.get_queryset()
         project = Project.objects.get(id=project_id)
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_project_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
         ):
             queryset = queryset.filter(owned_by=request.user)
@@ -419,13 +360,7 @@ class IssueViewViewSet(BaseViewSet):
         """
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_project_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
             and not issue_view.owned_by == request.user
         ):
@@ -29,6 +29,7 @@ from plane.db.models import (
     DraftIssue,
     CycleIssue,
     ModuleIssue,
+    ModuleStats,
     DraftIssueCycle,
     Workspace,
     FileAsset,
@@ -289,6 +290,8 @@ class WorkspaceDraftIssueViewSet(BaseViewSet):
                     ],
                     batch_size=10,
                 )
+                # Bulk operations skip the signals keeping the module stats
+                ModuleStats.refresh(request.data.get("module_ids", []))
                 # Update the activity
                 _ = [
                     issue_activity.delay(
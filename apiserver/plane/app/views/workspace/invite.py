@@ -25,6 +25,7 @@ from plane.app.views.base import BaseAPIView
 from plane.bgtasks.event_tracking_task import workspace_invite_event
 from plane.bgtasks.workspace_invitation_task import workspace_invitation
 from plane.db.models import User, Workspace, WorkspaceMember, WorkspaceMemberInvite
+from plane.db.models.workspace import invalidate_member_roles
 from plane.utils.cache import invalidate_cache, invalidate_cache_directly
 
 from .. import BaseViewSet
@@ -289,6 +290,7 @@ class UserWorkspaceInvitationsViewSet(BaseViewSet):
             ],
             ignore_conflicts=True,
         )
+        invalidate_member_roles([request.user.id])
 
         # Delete joined workspace invites
         workspace_invitations.delete()
@@ -17,6 +17,7 @@ from plane.app.serializers import (
 )
 from plane.app.views.base import BaseAPIView
 from plane.db.models import Project, ProjectMember, WorkspaceMember, DraftIssue
+from plane.db.models.workspace import invalidate_member_roles
 from plane.utils.cache import invalidate_cache
 
 from .. import BaseViewSet
@@ -72,6 +73,7 @@ class WorkSpaceMemberViewSet(BaseViewSet):
             _ = ProjectMember.objects.filter(
                 workspace__slug=slug, member_id=workspace_member.member_id
             ).update(role=int(request.data.get("role")))
+            invalidate_member_roles([workspace_member.member_id])
 
         serializer = WorkSpaceMemberSerializer(
             workspace_member, data=request.data, partial=True
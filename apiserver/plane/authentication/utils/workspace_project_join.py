@@ -4,6 +4,7 @@ from plane.db.models import (
     WorkspaceMember,
     WorkspaceMemberInvite,
 )
+from plane.db.models.workspace import invalidate_member_roles
 from plane.utils.cache import invalidate_cache_directly
 
 
@@ -78,6 +79,8 @@ def process_workspace_project_invitations(user):
         ignore_conflicts=True,
     )
 
+    invalidate_member_roles([user.id])
+
     # Delete all the invites
     workspace_member_invites.delete()
     project_member_invites.delete()
@@ -0,0 +1,27 @@
+# Third party imports
+from celery import shared_task
+
+# Django imports
+from django.conf import settings
+
+# Module imports
+from plane.utils.analytics_rollup import (
+    mark_rollups_stale,
+    pop_stale_projects,
+    rebuild_project_rollups,
+)
+from plane.utils.exception_logger import log_exception
+
+
+@shared_task
+def refresh_analytics_rollups():
+    """Rebuild the analytics rollups of the projects whose issues changed"""
+    project_ids = pop_stale_projects(settings.ANALYTICS_ROLLUP_BATCH_SIZE)
+    for index, project_id in enumerate(project_ids):
+        try:
+            rebuild_project_rollups(project_id)
+        except Exception as e:
+            # Keep the remaining projects queued for the next run
+            mark_rollups_stale(project_ids[index:])
+            log_exception(e)
+            return
@@ -1,15 +1,84 @@
+import json
+
+from django.conf import settings
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from datetime import timedelta
-from plane.db.models import APIActivityLog
+from plane.bgtasks.deletion_task import purge
+from plane.db.models import APIActivityLog, APIToken
+from plane.settings.redis import redis_instance
+from plane.utils.api_token import API_TOKEN_LAST_USED_KEY
+from plane.utils.exception_logger import log_exception
 from celery import shared_task
 
+API_LOG_BUFFER_KEY = "api_activity_log_buffer"
+
 
 @shared_task
-def delete_api_logs():
-    # Get the logs older than 30 days to delete
-    logs_to_delete = APIActivityLog.objects.filter(
-        created_at__lte=timezone.now() - timedelta(days=30)
+def flush_api_logs():
+    """Write the API logs buffered by APITokenLogMiddleware in bulk"""
+    ri = redis_instance()
+    batch_size = settings.API_LOG_FLUSH_BATCH_SIZE
+    while True:
+        # Pop a batch atomically so concurrent flushes never write a log twice
+        pipe = ri.pipeline()
+        pipe.lrange(API_LOG_BUFFER_KEY, 0, batch_size - 1)
+        pipe.ltrim(API_LOG_BUFFER_KEY, batch_size, -1)
+        records, _ = pipe.execute()
+        if not records:
+            return
+
+        logs = []
+        for record in records:
+            try:
+                logs.append(APIActivityLog(**json.loads(record)))
+            except (TypeError, ValueError) as e:
+                log_exception(e)
+        try:
+            APIActivityLog.objects.bulk_create(logs, batch_size=batch_size)
+        except Exception as e:
+            # Insert the logs one by one so a bad row only loses itself
+            log_exception(e)
+            for log in logs:
+                try:
+                    APIActivityLog.objects.bulk_create([log])
+                except Exception as e:
+                    log_exception(e)
+
+        if len(records) < batch_size:
+            return
+
+
+@shared_task
+def flush_api_token_last_used():
+    """Write the last use of the API tokens recorded in redis in bulk"""
+    ri = redis_instance()
+    # Read and clear atomically so uses recorded meanwhile are kept
+    pipe = ri.pipeline()
+    pipe.hgetall(API_TOKEN_LAST_USED_KEY)
+    pipe.delete(API_TOKEN_LAST_USED_KEY)
+    last_used, _ = pipe.execute()
+    if not last_used:
+        return
+
+    APIToken.objects.bulk_update(
+        [
+            APIToken(
+                id=token_id.decode("utf-8"),
+                last_used=parse_datetime(used_at.decode("utf-8")),
+            )
+            for token_id, used_at in last_used.items()
+        ],
+        ["last_used"],
+        batch_size=500,
     )
 
-    # Delete the logs
-    logs_to_delete._raw_delete(logs_to_delete.db)
+
+@shared_task
+def delete_api_logs():
+    # Delete the logs older than 30 days
+    return purge(
+        APIActivityLog.all_objects.filter(
+            created_at__lte=timezone.now() - timedelta(days=30)
+        )
+    )
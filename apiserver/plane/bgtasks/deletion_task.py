@@ -1,14 +1,129 @@
+# Python imports
+import logging
+import time
+from collections import defaultdict
+from functools import lru_cache
+
 # Django imports
 from django.utils import timezone
 from django.apps import apps
 from django.conf import settings
-from django.db import models
-from django.db.models.fields.related import OneToOneRel
+from django.db.models.deletion import Collector
+from django.db.models.signals import post_save
 
 
 # Third party imports
 from celery import shared_task
 
+# Module imports
+from plane.db.signals import post_bulk_soft_delete
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+# Last primary key purged per model by an interrupted hard delete
+PURGE_CHECKPOINT_KEY = "hard_delete_checkpoint"
+PURGE_CHECKPOINT_TIMEOUT = 60 * 60 * 24
+
+
+@lru_cache(maxsize=None)
+def get_cascade_relations(model):
+    """
+    Reverse relations followed by the soft delete of the model as (related
+    model, field name, on delete name), derived once per model
+    """
+    relations = []
+    for relation in model._meta.get_fields():
+        if not (
+            (relation.one_to_many or relation.one_to_one)
+            and relation.auto_created
+            and not relation.concrete
+        ):
+            continue
+        on_delete_name = getattr(relation.on_delete, "__name__", "")
+        if on_delete_name == "DO_NOTHING":
+            continue
+        relations.append((relation.related_model, relation.field.name, on_delete_name))
+    return tuple(relations)
+
+
+def get_chunks(ids, batch_size):
+    ids = list(ids)
+    for index in range(0, len(ids), batch_size):
+        yield ids[index : index + batch_size]
+
+
+def update_deleted_at(model, pks, deleted_at, using=None):
+    """
+    Soft delete the objects, or restore them when deleted_at is None, and
+    return the number of objects updated
+    """
+    objects = model._base_manager.using(using).filter(pk__in=pks)
+    # The post_save receivers of the model need every object
+    if post_save.has_listeners(model) and not post_bulk_soft_delete.has_listeners(
+        model
+    ):
+        updated = 0
+        for obj in objects:
+            obj.deleted_at = deleted_at
+            obj.save(update_fields=["deleted_at"])
+            updated += 1
+        return updated
+    updated = objects.update(deleted_at=deleted_at)
+    post_bulk_soft_delete.send(
+        sender=model, pks=pks, restored=deleted_at is None, using=using
+    )
+    return updated
+
+
+def cascade_deleted_at(model, pks, deleted_at, restore=False, using=None):
+    """
+    Soft delete the objects related to the given objects, or restore those
+    deleted along with them, level by level with one UPDATE per related model
+    and chunk of ids. Cascaded objects share the deleted_at of the root, which
+    tells them apart from the objects deleted on their own.
+    """
+    batch_size = settings.SOFT_DELETE_BATCH_SIZE
+    level = {model: set(pks)}
+    while level:
+        next_level = defaultdict(set)
+        for parent_model, parent_ids in level.items():
+            for related_model, field_name, on_delete_name in get_cascade_relations(
+                parent_model
+            ):
+                try:
+                    manager = related_model._base_manager.using(using)
+                    if on_delete_name == "SET_NULL":
+                        # Unlinked for good, a restore can not link them back
+                        if not restore:
+                            for chunk in get_chunks(parent_ids, batch_size):
+                                manager.filter(**{f"{field_name}__in": chunk}).update(
+                                    **{field_name: None}
+                                )
+                        continue
+
+                    if not hasattr(related_model, "deleted_at"):
+                        continue
+
+                    for chunk in get_chunks(parent_ids, batch_size):
+                        related = manager.filter(**{f"{field_name}__in": chunk})
+                        if restore:
+                            related = related.filter(deleted_at=deleted_at)
+                        else:
+                            related = related.filter(deleted_at__isnull=True)
+                        ids = list(related.values_list("pk", flat=True))
+                        for id_chunk in get_chunks(ids, batch_size):
+                            update_deleted_at(
+                                related_model,
+                                id_chunk,
+                                None if restore else deleted_at,
+                                using,
+                            )
+                        next_level[related_model].update(ids)
+                except Exception as e:
+                    log_exception(e)
+                    continue
+        level = next_level
+
 
 @shared_task
 def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
@@ -20,213 +135,142 @@ def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
 
     # Get the instance using all_objects to ensure we can get even if it's already soft deleted
     try:
-        instance = model_class.all_objects.get(pk=instance_pk)
+        instance = model_class.all_objects.using(using).get(pk=instance_pk)
     except model_class.DoesNotExist:
         return
 
-    # Get all related fields that are reverse relationships
-    all_related = [
-        f
-        for f in instance._meta.get_fields()
-        if (f.one_to_many or f.one_to_one) and f.auto_created and not f.concrete
-    ]
-
-    # Handle each related field
-    for relation in all_related:
-        related_name = relation.get_accessor_name()
+    deleted_at = instance.deleted_at or timezone.now()
+    cascade_deleted_at(model_class, [instance.pk], deleted_at, using=using)
 
-        # Skip if the relation doesn't exist
-        if not hasattr(instance, related_name):
-            continue
+    # Finally, soft delete the instance itself if it hasn't been deleted yet
+    if not instance.deleted_at:
+        update_deleted_at(model_class, [instance.pk], deleted_at, using)
 
-        # Get the on_delete behavior name
-        on_delete_name = (
-            relation.on_delete.__name__
-            if hasattr(relation.on_delete, "__name__")
-            else ""
-        )
 
-        if on_delete_name == "DO_NOTHING":
-            continue
+@shared_task
+def restore_related_objects(
+    app_label, model_name, instance_pk, using=None, deleted_at=None
+):
+    """
+    Restore the instance along with the related objects deleted with it,
+    deleted_at is required when the instance was already restored
+    """
+    model_class = apps.get_model(app_label, model_name)
+    try:
+        instance = model_class.all_objects.using(using).get(pk=instance_pk)
+    except model_class.DoesNotExist:
+        return
 
-        elif on_delete_name == "SET_NULL":
-            # Handle SET_NULL relationships
-            if isinstance(relation, OneToOneRel):
-                # For OneToOne relationships
-                related_obj = getattr(instance, related_name, None)
-                if related_obj and isinstance(related_obj, models.Model):
-                    setattr(related_obj, relation.remote_field.name, None)
-                    related_obj.save(update_fields=[relation.remote_field.name])
-            else:
-                # For other relationships
-                related_queryset = getattr(instance, related_name).all()
-                related_queryset.update(**{relation.remote_field.name: None})
-
-        else:
-            # Handle CASCADE and other delete behaviors
-            try:
-                if relation.one_to_one:
-                    # Handle OneToOne relationships
-                    related_obj = getattr(instance, related_name, None)
-                    if related_obj:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-                else:
-                    # Handle other relationships
-                    related_queryset = getattr(instance, related_name).all()
-                    for related_obj in related_queryset:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-            except Exception as e:
-                # Log the error or handle as needed
-                print(f"Error handling relation {related_name}: {str(e)}")
-                continue
+    deleted_at = deleted_at or instance.deleted_at
+    if deleted_at is None:
+        return
+    cascade_deleted_at(
+        model_class, [instance.pk], deleted_at, restore=True, using=using
+    )
 
-    # Finally, soft delete the instance itself if it hasn't been deleted yet
-    if hasattr(instance, "deleted_at") and not instance.deleted_at:
-        instance.deleted_at = timezone.now()
-        instance.save()
+    if instance.deleted_at:
+        update_deleted_at(model_class, [instance.pk], None, using)
 
 
-# @shared_task
-def restore_related_objects(app_label, model_name, instance_pk, using=None):
-    pass
+def get_purge_order(models):
+    """
+    Order the models so that every model comes after the models cascading
+    from it, the rows of a parent are then purged once its children are gone
+    """
+    models = set(models)
+    order = []
+    visited = set()
+
+    def visit(model):
+        if model in visited:
+            return
+        visited.add(model)
+        for related_model, _, on_delete_name in get_cascade_relations(model):
+            if on_delete_name == "CASCADE":
+                visit(related_model)
+        if model in models:
+            order.append(model)
+
+    for model in sorted(models, key=lambda model: model._meta.label):
+        visit(model)
+    return order
+
+
+def purge(queryset, checkpoint=None, soft=False, batch_size=None, delay=None):
+    """
+    Delete the rows of the queryset in batches of primary keys, one short
+    transaction per batch with a pause in between, and return the number of
+    rows deleted. Rows without signal receivers nor referencing rows are
+    deleted with a raw DELETE, the others through the collector of their
+    batch. The last primary key of every batch is stored in the checkpoint
+    hash so that an interrupted purge resumes after it.
+    """
+    model = queryset.model
+    using = queryset.db
+    label = model._meta.label
+    batch_size = batch_size or settings.HARD_DELETE_BATCH_SIZE
+    delay = settings.HARD_DELETE_BATCH_DELAY if delay is None else delay
+    fast = Collector(using=using, origin=queryset).can_fast_delete(model)
+
+    ri = redis_instance() if checkpoint else None
+    last_pk = ri.hget(checkpoint, label) if checkpoint else None
+    if last_pk is not None:
+        last_pk = last_pk.decode("utf-8")
+
+    purged = 0
+    while True:
+        batch = queryset.order_by("pk")
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        pks = list(batch.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return purged
+
+        objects = model._base_manager.using(using).filter(pk__in=pks)
+        try:
+            if soft:
+                purged += update_deleted_at(model, pks, timezone.now(), using)
+            elif fast:
+                purged += objects._raw_delete(using)
+            else:
+                _, counts = objects.delete()
+                purged += counts.get(label, 0)
+        except Exception as e:
+            # Skip the batch, the next run picks its rows up again
+            log_exception(e)
+
+        last_pk = str(pks[-1])
+        if checkpoint:
+            pipe = ri.pipeline()
+            pipe.hset(checkpoint, label, last_pk)
+            pipe.expire(checkpoint, PURGE_CHECKPOINT_TIMEOUT)
+            pipe.execute()
+        if len(pks) < batch_size:
+            return purged
+        time.sleep(delay)
 
 
 @shared_task
 def hard_delete():
-    from plane.db.models import (
-        Workspace,
-        Project,
-        Cycle,
-        Module,
-        Issue,
-        Page,
-        IssueView,
-        Label,
-        State,
-        IssueActivity,
-        IssueComment,
-        IssueLink,
-        IssueReaction,
-        UserFavorite,
-        ModuleIssue,
-        CycleIssue,
-        Estimate,
-        EstimatePoint,
-    )
-
-    days = settings.HARD_DELETE_AFTER_DAYS
-    # check delete workspace
-    _ = Workspace.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete project
-    _ = Project.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete cycle
-    _ = Cycle.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete module
-    _ = Module.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete issue
-    _ = Issue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete page
-    _ = Page.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete view
-    _ = IssueView.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete label
-    _ = Label.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete state
-    _ = State.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueActivity.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueComment.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueLink.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueReaction.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = UserFavorite.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = ModuleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = CycleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = Estimate.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = EstimatePoint.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # at last, check for every thing which ever is left and delete it
-    # Get all Django models
-    all_models = apps.get_models()
-
-    # Iterate through all models
-    for model in all_models:
-        # Check if the model has a 'deleted_at' field
-        if hasattr(model, "deleted_at"):
-            # Get all instances where 'deleted_at' is greater than 30 days ago
-            _ = model.all_objects.filter(
-                deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-            ).delete()
-
-    return
+    """
+    Purge the objects soft deleted more than HARD_DELETE_AFTER_DAYS ago, the
+    children before their parents, and return the rows purged per model
+    """
+    cutoff = timezone.now() - timezone.timedelta(days=settings.HARD_DELETE_AFTER_DAYS)
+    models = [model for model in apps.get_models() if hasattr(model, "deleted_at")]
+
+    purged = {}
+    for model in get_purge_order(models):
+        count = purge(
+            model._base_manager.filter(deleted_at__lt=cutoff),
+            checkpoint=PURGE_CHECKPOINT_KEY,
+        )
+        if count:
+            purged[model._meta.label] = count
+            logging.getLogger("plane").info(
+                f"Purged {count} {model._meta.verbose_name_plural}"
+            )
+
+    # Completed, the next run starts over
+    redis_instance().delete(PURGE_CHECKPOINT_KEY)
+    return purged
@@ -22,11 +22,14 @@ from plane.db.models import (
     Module,
     Issue,
     IssueSequence,
+    IssueSequenceCounter,
     IssueAssignee,
     IssueLabel,
     IssueActivity,
     CycleIssue,
+    CycleStats,
     ModuleIssue,
+    ModuleStats,
     Page,
     ProjectPage,
     PageLabel,
@@ -288,12 +291,8 @@ def create_issues(workspace, project, user_id, issue_count):
 
     issues = []
 
-    # Get the maximum sequence_id
-    last_id = IssueSequence.objects.filter(project=project).aggregate(
-        largest=Max("sequence")
-    )["largest"]
-
-    last_id = 1 if last_id is None else last_id + 1
+    # Reserve the sequence ids of all the issues at once
+    last_id = IssueSequenceCounter.allocate(project.id, issue_count)
 
     # Get the maximum sort order
     largest_sort_order = Issue.objects.filter(
@@ -497,6 +496,7 @@ def create_cycle_issues(workspace, project, user_id, issue_count):
     CycleIssue.objects.bulk_create(
         bulk_cycle_issues, batch_size=1000, ignore_conflicts=True
     )
+    CycleStats.refresh_projects([project.id])
 
 
 def create_module_issues(workspace, project, user_id, issue_count):
@@ -529,6 +529,7 @@ def create_module_issues(workspace, project, user_id, issue_count):
     ModuleIssue.objects.bulk_create(
         bulk_module_issues, batch_size=1000, ignore_conflicts=True
     )
+    ModuleStats.refresh_projects([project.id])
 
 
 @shared_task
@@ -1,6 +1,9 @@
 import logging
 import re
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+from uuid import UUID
 
 from bs4 import BeautifulSoup
 
@@ -10,6 +13,8 @@ from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 
 # Django imports
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from django.utils.html import strip_tags
 
@@ -39,62 +44,55 @@ def release_lock(lock_id):
     redis_client.delete(lock_id)
 
 
-@shared_task
-def stack_email_notification():
-    # get all email notifications
-    email_notifications = (
-        EmailNotificationLog.objects.filter(processed_at__isnull=True)
-        .order_by("receiver")
-        .values()
-    )
-
-    # Create the below format for each of the issues
-    # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
-
-    # Convert to unique receivers list
-    receivers = list(
-        set(
-            [
-                str(notification.get("receiver_id"))
-                for notification in email_notifications
-            ]
+def claim_email_digests(batch_size):
+    """
+    Mark up to batch_size pending logs as processed and return them grouped
+    per receiver as {"issue_id": {"notification_data": {"actor_id": [data]},
+    "email_notification_ids": []}}. Logs claimed by another worker are skipped.
+    """
+    digests = []
+    claimed = []
+    with transaction.atomic():
+        pending = (
+            EmailNotificationLog.objects.select_for_update(skip_locked=True)
+            .filter(processed_at__isnull=True)
+            .order_by("receiver_id", "created_at")
+            .values(
+                "id", "receiver_id", "entity_identifier", "triggered_by_id", "data"
+            )[:batch_size]
         )
-    )
-    processed_notifications = []
-    # Loop through all the issues to create the emails
-    for receiver_id in receivers:
-        # Notification triggered for the receiver
-        receiver_notifications = [
-            notification
-            for notification in email_notifications
-            if str(notification.get("receiver_id")) == receiver_id
-        ]
-        # create payload for all issues
-        payload = {}
-        email_notification_ids = []
-        for receiver_notification in receiver_notifications:
-            payload.setdefault(
-                receiver_notification.get("entity_identifier"), {}
-            ).setdefault(str(receiver_notification.get("triggered_by_id")), []).append(
-                receiver_notification.get("data")
-            )
-            # append processed notifications
-            processed_notifications.append(receiver_notification.get("id"))
-            email_notification_ids.append(receiver_notification.get("id"))
-
-        # Create emails for all the issues
-        for issue_id, notification_data in payload.items():
-            send_email_notification.delay(
-                issue_id=issue_id,
-                notification_data=notification_data,
-                receiver_id=receiver_id,
-                email_notification_ids=email_notification_ids,
-            )
+        # Ordered by receiver, so every receiver is grouped in a single pass
+        for receiver_id, notifications in groupby(
+            pending.iterator(chunk_size=500), key=itemgetter("receiver_id")
+        ):
+            digest = {}
+            for notification in notifications:
+                issue = digest.setdefault(
+                    str(notification["entity_identifier"]),
+                    {"notification_data": {}, "email_notification_ids": []},
+                )
+                issue["notification_data"].setdefault(
+                    str(notification["triggered_by_id"]), []
+                ).append(notification["data"])
+                issue["email_notification_ids"].append(str(notification["id"]))
+                claimed.append(notification["id"])
+            digests.append((str(receiver_id), digest))
+
+        EmailNotificationLog.objects.filter(pk__in=claimed).update(
+            processed_at=timezone.now()
+        )
+    return digests
 
-    # Update the email notification log
-    EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(
-        processed_at=timezone.now()
-    )
+
+@shared_task
+def stack_email_notification():
+    # Claim the pending logs batch by batch and send one digest per receiver
+    while True:
+        digests = claim_email_digests(settings.EMAIL_DIGEST_BATCH_SIZE)
+        if not digests:
+            return
+        for receiver_id, digest in digests:
+            send_email_digest.delay(receiver_id=receiver_id, digest=digest)
 
 
 def create_payload(notification_data):
@@ -168,169 +166,196 @@ def process_html_content(content):
     return processed_content_list
 
 
+def get_issue_email(issue_id, notification_data, receiver, email_from):
+    """Return the update email of the issue, None when its base api is unknown"""
+    # get the redis instance
+    ri = redis_instance()
+    base_api = ri.get(str(issue_id))
+    base_api = base_api.decode() if base_api else None
+
+    # Skip if base api is not present
+    if not base_api:
+        return None
+
+    data = create_payload(notification_data=notification_data)
+
+    issue = Issue.objects.select_related("project", "project__workspace").get(
+        pk=issue_id
+    )
+    actors = User.objects.in_bulk(list(data))
+    template_data = []
+    total_changes = 0
+    comments = []
+    actors_involved = []
+    for actor_id, changes in data.items():
+        actor = actors.get(UUID(actor_id))
+        if actor is None:
+            raise User.DoesNotExist
+        total_changes = total_changes + len(changes)
+        comment = changes.pop("comment", False)
+        mention = changes.pop("mention", False)
+        actors_involved.append(actor_id)
+        if comment:
+            comments.append(
+                {
+                    "actor_comments": comment,
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        if mention:
+            mention["new_value"] = process_html_content(mention.get("new_value"))
+            mention["old_value"] = process_html_content(mention.get("old_value"))
+            comments.append(
+                {
+                    "actor_comments": mention,
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        activity_time = changes.pop("activity_time")
+        # Parse the input string into a datetime object
+        formatted_time = datetime.strptime(activity_time, "%Y-%m-%d %H:%M:%S").strftime(
+            "%H:%M %p"
+        )
+
+        if changes:
+            template_data.append(
+                {
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                    "changes": changes,
+                    "issue_details": {
+                        "name": issue.name,
+                        "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
+                    },
+                    "activity_time": str(formatted_time),
+                }
+            )
+
+    summary = "Updates were made to the issue by"
+
+    # Send the mail
+    subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
+    context = {
+        "data": template_data,
+        "summary": summary,
+        "actors_involved": len(set(actors_involved)),
+        "issue": {
+            "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
+            "name": issue.name,
+            "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        },
+        "receiver": {"email": receiver.email},
+        "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
+        "workspace": str(issue.project.workspace.slug),
+        "project": str(issue.project.name),
+        "user_preference": f"{base_api}/profile/preferences/email",
+        "comments": comments,
+    }
+    html_content = render_to_string("emails/notifications/issue-updates.html", context)
+    text_content = strip_tags(html_content)
+
+    msg = EmailMultiAlternatives(
+        subject=subject, body=text_content, from_email=email_from, to=[receiver.email]
+    )
+    msg.attach_alternative(html_content, "text/html")
+    return msg
+
+
 @shared_task
-def send_email_notification(
-    issue_id, notification_data, receiver_id, email_notification_ids
-):
-    # Convert UUIDs to a sorted, concatenated string
-    sorted_ids = sorted(email_notification_ids)
-    ids_str = "_".join(str(id) for id in sorted_ids)
-    lock_id = f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
+def send_email_digest(receiver_id, digest):
+    """
+    Send the update emails of every issue of the digest to the receiver over a
+    single SMTP connection
+    """
+    try:
+        receiver = User.objects.get(pk=receiver_id)
+    except User.DoesNotExist:
+        return
 
-    # acquire the lock for sending emails
+    # Get email configurations
+    (
+        EMAIL_HOST,
+        EMAIL_HOST_USER,
+        EMAIL_HOST_PASSWORD,
+        EMAIL_PORT,
+        EMAIL_USE_TLS,
+        EMAIL_USE_SSL,
+        EMAIL_FROM,
+    ) = get_email_configuration()
+
+    connection = get_connection(
+        host=EMAIL_HOST,
+        port=int(EMAIL_PORT),
+        username=EMAIL_HOST_USER,
+        password=EMAIL_HOST_PASSWORD,
+        use_tls=EMAIL_USE_TLS == "1",
+        use_ssl=EMAIL_USE_SSL == "1",
+    )
     try:
-        if acquire_lock(lock_id=lock_id):
-            # get the redis instance
-            ri = redis_instance()
-            base_api = ri.get(str(issue_id)).decode() if ri.get(str(issue_id)) else None
-
-            # Skip if base api is not present
-            if not base_api:
-                return
-
-            data = create_payload(notification_data=notification_data)
-
-            # Get email configurations
-            (
-                EMAIL_HOST,
-                EMAIL_HOST_USER,
-                EMAIL_HOST_PASSWORD,
-                EMAIL_PORT,
-                EMAIL_USE_TLS,
-                EMAIL_USE_SSL,
-                EMAIL_FROM,
-            ) = get_email_configuration()
-
-            receiver = User.objects.get(pk=receiver_id)
-            issue = Issue.objects.get(pk=issue_id)
-            template_data = []
-            total_changes = 0
-            comments = []
-            actors_involved = []
-            for actor_id, changes in data.items():
-                actor = User.objects.get(pk=actor_id)
-                total_changes = total_changes + len(changes)
-                comment = changes.pop("comment", False)
-                mention = changes.pop("mention", False)
-                actors_involved.append(actor_id)
-                if comment:
-                    comments.append(
-                        {
-                            "actor_comments": comment,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                if mention:
-                    mention["new_value"] = process_html_content(
-                        mention.get("new_value")
-                    )
-                    mention["old_value"] = process_html_content(
-                        mention.get("old_value")
-                    )
-                    comments.append(
-                        {
-                            "actor_comments": mention,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                activity_time = changes.pop("activity_time")
-                # Parse the input string into a datetime object
-                formatted_time = datetime.strptime(
-                    activity_time, "%Y-%m-%d %H:%M:%S"
-                ).strftime("%H:%M %p")
-
-                if changes:
-                    template_data.append(
-                        {
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                            "changes": changes,
-                            "issue_details": {
-                                "name": issue.name,
-                                "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
-                            },
-                            "activity_time": str(formatted_time),
-                        }
-                    )
+        for issue_id, issue_digest in digest.items():
+            email_notification_ids = issue_digest["email_notification_ids"]
+            # Convert UUIDs to a sorted, concatenated string
+            ids_str = "_".join(str(id) for id in sorted(email_notification_ids))
+            lock_id = f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
 
-            summary = "Updates were made to the issue by"
-
-            # Send the mail
-            subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
-            context = {
-                "data": template_data,
-                "summary": summary,
-                "actors_involved": len(set(actors_involved)),
-                "issue": {
-                    "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
-                    "name": issue.name,
-                    "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                },
-                "receiver": {"email": receiver.email},
-                "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
-                "workspace": str(issue.project.workspace.slug),
-                "project": str(issue.project.name),
-                "user_preference": f"{base_api}/profile/preferences/email",
-                "comments": comments,
-            }
-            html_content = render_to_string(
-                "emails/notifications/issue-updates.html", context
-            )
-            text_content = strip_tags(html_content)
+            # acquire the lock for sending emails
+            if not acquire_lock(lock_id=lock_id):
+                logging.getLogger("plane").info("Duplicate email received skipping")
+                continue
 
             try:
-                connection = get_connection(
-                    host=EMAIL_HOST,
-                    port=int(EMAIL_PORT),
-                    username=EMAIL_HOST_USER,
-                    password=EMAIL_HOST_PASSWORD,
-                    use_tls=EMAIL_USE_TLS == "1",
-                    use_ssl=EMAIL_USE_SSL == "1",
+                msg = get_issue_email(
+                    issue_id=issue_id,
+                    notification_data=issue_digest["notification_data"],
+                    receiver=receiver,
+                    email_from=EMAIL_FROM,
                 )
+                if msg is None:
+                    continue
 
-                msg = EmailMultiAlternatives(
-                    subject=subject,
-                    body=text_content,
-                    from_email=EMAIL_FROM,
-                    to=[receiver.email],
-                    connection=connection,
-                )
-                msg.attach_alternative(html_content, "text/html")
-                msg.send()
+                # Opened on the first email and kept open for the next ones
+                connection.open()
+                connection.send_messages([msg])
                 logging.getLogger("plane").info("Email Sent Successfully")
 
                 # Update the logs
                 EmailNotificationLog.objects.filter(
                     pk__in=email_notification_ids
                 ).update(sent_at=timezone.now())
-
-                # release the lock
-                release_lock(lock_id=lock_id)
-                return
+            except (Issue.DoesNotExist, User.DoesNotExist):
+                continue
             except Exception as e:
                 log_exception(e)
+            finally:
                 # release the lock
                 release_lock(lock_id=lock_id)
-                return
-        else:
-            logging.getLogger("plane").info("Duplicate email received skipping")
-            return
-    except (Issue.DoesNotExist, User.DoesNotExist):
-        release_lock(lock_id=lock_id)
-        return
-    except Exception as e:
-        log_exception(e)
-        release_lock(lock_id=lock_id)
-        return
+    finally:
+        connection.close()
+
+
+@shared_task
+def send_email_notification(
+    issue_id, notification_data, receiver_id, email_notification_ids
+):
+    # Kept for the emails queued before the digests
+    send_email_digest(
+        receiver_id=receiver_id,
+        digest={
+            str(issue_id): {
+                "notification_data": notification_data,
+                "email_notification_ids": email_notification_ids,
+            }
+        },
+    )
@@ -2,9 +2,14 @@
 import csv
 import io
 import json
+import shutil
+import tempfile
 import zipfile
+from collections import defaultdict
+from uuid import UUID
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 
 # Third party imports
@@ -12,11 +17,20 @@ from celery import shared_task
 
 # Django imports
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
 from django.utils import timezone
 from openpyxl import Workbook
 
 # Module imports
-from plane.db.models import ExporterHistory, Issue
+from plane.db.models import (
+    CycleIssue,
+    ExporterHistory,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    ModuleIssue,
+)
 from plane.utils.exception_logger import log_exception
 
 
@@ -30,42 +44,85 @@ def dateConverter(time):
         return time.strftime("%a, %d %b %Y")
 
 
-def create_csv_file(data):
-    csv_buffer = io.StringIO()
-    csv_writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
-
-    for row in data:
+EXPORT_HEADER = [
+    "ID",
+    "Project",
+    "Name",
+    "Description",
+    "State",
+    "Start Date",
+    "Target Date",
+    "Priority",
+    "Created By",
+    "Assignee",
+    "Labels",
+    "Cycle Name",
+    "Cycle Start Date",
+    "Cycle End Date",
+    "Module Name",
+    "Module Start Date",
+    "Module Target Date",
+    "Created At",
+    "Updated At",
+    "Completed At",
+    "Archived At",
+]
+
+
+def write_csv_file(file, header, rows):
+    text_file = io.TextIOWrapper(file, encoding="utf-8", newline="")
+    csv_writer = csv.writer(text_file, delimiter=",", quoting=csv.QUOTE_ALL)
+    if header is not None:
+        csv_writer.writerow(header)
+    for row in rows:
         csv_writer.writerow(row)
-
-    csv_buffer.seek(0)
-    return csv_buffer.getvalue()
+    text_file.flush()
+    text_file.detach()
 
 
-def create_json_file(data):
-    return json.dumps(data)
+def write_json_rows(file, rows):
+    # Rows are written without the enclosing brackets so parts can be joined
+    for index, row in enumerate(rows):
+        if index:
+            file.write(b", ")
+        file.write(json.dumps(row).encode("utf-8"))
 
 
-def create_xlsx_file(data):
-    workbook = Workbook()
-    sheet = workbook.active
-
-    for row in data:
+def write_xlsx_file(file, header, rows):
+    # Write-only workbooks keep a single row in memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(header)
+    for row in rows:
         sheet.append(row)
+    workbook.save(file)
 
-    xlsx_buffer = io.BytesIO()
-    workbook.save(xlsx_buffer)
-    xlsx_buffer.seek(0)
-    return xlsx_buffer.getvalue()
 
+def get_s3_client():
+    # If endpoint url is present, use it
+    if settings.AWS_S3_ENDPOINT_URL:
+        return boto3.client(
+            "s3",
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            config=Config(signature_version="s3v4"),
+        )
+    return boto3.client(
+        "s3",
+        region_name=settings.AWS_REGION,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        config=Config(signature_version="s3v4"),
+    )
 
-def create_zip_file(files):
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for filename, file_content in files:
-            zipf.writestr(filename, file_content)
 
-    zip_buffer.seek(0)
-    return zip_buffer
+def get_transfer_config():
+    # Large files are uploaded in parts straight from the spooled file
+    return TransferConfig(
+        multipart_threshold=settings.EXPORT_UPLOAD_CHUNK_SIZE,
+        multipart_chunksize=settings.EXPORT_UPLOAD_CHUNK_SIZE,
+    )
 
 
 def upload_to_s3(zip_file, workspace_id, token_id, slug):
@@ -75,18 +132,13 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
     expires_in = 7 * 24 * 60 * 60
 
     if settings.USE_MINIO:
-        upload_s3 = boto3.client(
-            "s3",
-            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
-        )
+        upload_s3 = get_s3_client()
         upload_s3.upload_fileobj(
             zip_file,
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
+            Config=get_transfer_config(),
         )
 
         # Generate presigned url for the uploaded file with different base
@@ -104,23 +156,7 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             ExpiresIn=expires_in,
         )
     else:
-        # If endpoint url is present, use it
-        if settings.AWS_S3_ENDPOINT_URL:
-            s3 = boto3.client(
-                "s3",
-                endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
-            )
-        else:
-            s3 = boto3.client(
-                "s3",
-                region_name=settings.AWS_REGION,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
-            )
+        s3 = get_s3_client()
 
         # Upload the file to S3
         s3.upload_fileobj(
@@ -128,6 +164,7 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ContentType": "application/zip"},
+            Config=get_transfer_config(),
         )
 
         # Generate presigned url for the uploaded file
@@ -150,6 +187,70 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
     exporter_instance.save(update_fields=["status", "url", "key"])
 
 
+def get_issue_relations(issue_ids):
+    """
+    Return the assignees, labels, cycle and modules of the issues indexed by
+    issue id, one query per relation instead of a fan-out join
+    """
+    assignees = defaultdict(list)
+    for issue_id, first_name, last_name in IssueAssignee.objects.filter(
+        issue_id__in=issue_ids
+    ).values_list("issue_id", "assignee__first_name", "assignee__last_name"):
+        if first_name and last_name:
+            assignees[issue_id].append(f"{first_name} {last_name}")
+
+    labels = defaultdict(list)
+    for issue_id, name in IssueLabel.objects.filter(issue_id__in=issue_ids).values_list(
+        "issue_id", "label__name"
+    ):
+        labels[issue_id].append(name)
+
+    cycles = {}
+    for cycle_issue in CycleIssue.objects.filter(issue_id__in=issue_ids).values(
+        "issue_id", "cycle__name", "cycle__start_date", "cycle__end_date"
+    ):
+        cycles.setdefault(cycle_issue["issue_id"], cycle_issue)
+
+    modules = {}
+    for module_issue in ModuleIssue.objects.filter(issue_id__in=issue_ids).values(
+        "issue_id", "module__name", "module__start_date", "module__target_date"
+    ):
+        modules.setdefault(module_issue["issue_id"], module_issue)
+
+    return assignees, labels, cycles, modules
+
+
+def attach_relations(chunk):
+    assignees, labels, cycles, modules = get_issue_relations(
+        [issue["id"] for issue in chunk]
+    )
+    for issue in chunk:
+        yield {
+            **issue,
+            "assignees": assignees.get(issue["id"], []),
+            "labels": labels.get(issue["id"], []),
+            "cycle": cycles.get(issue["id"], {}),
+            "module": modules.get(issue["id"], {}),
+        }
+
+
+def iterate_issues(issues, on_progress):
+    """
+    Yield the issues with their relations, streaming them from the database in
+    chunks of EXPORT_CHUNK_SIZE issues
+    """
+    chunk = []
+    for issue in issues.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE):
+        chunk.append(issue)
+        if len(chunk) == settings.EXPORT_CHUNK_SIZE:
+            yield from attach_relations(chunk)
+            on_progress(len(chunk))
+            chunk = []
+    if chunk:
+        yield from attach_relations(chunk)
+        on_progress(len(chunk))
+
+
 def generate_table_row(issue):
     return [
         f"""{issue["project__identifier"]}-{issue["sequence_id"]}""",
@@ -165,18 +266,14 @@ def generate_table_row(issue):
             if issue["created_by__first_name"] and issue["created_by__last_name"]
             else ""
         ),
-        (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        issue["labels__name"] if issue["labels__name"] else "",
-        issue["issue_cycle__cycle__name"],
-        dateConverter(issue["issue_cycle__cycle__start_date"]),
-        dateConverter(issue["issue_cycle__cycle__end_date"]),
-        issue["issue_module__module__name"],
-        dateConverter(issue["issue_module__module__start_date"]),
-        dateConverter(issue["issue_module__module__target_date"]),
+        ", ".join(issue["assignees"]),
+        ", ".join(issue["labels"]),
+        issue["cycle"].get("cycle__name"),
+        dateConverter(issue["cycle"].get("cycle__start_date")),
+        dateConverter(issue["cycle"].get("cycle__end_date")),
+        issue["module"].get("module__name"),
+        dateConverter(issue["module"].get("module__start_date")),
+        dateConverter(issue["module"].get("module__target_date")),
         dateTimeConverter(issue["created_at"]),
         dateTimeConverter(issue["updated_at"]),
         dateTimeConverter(issue["completed_at"]),
@@ -184,219 +281,342 @@ def generate_table_row(issue):
     ]
 
 
-def generate_json_row(issue):
-    return {
-        "ID": f"""{issue["project__identifier"]}-{issue["sequence_id"]}""",
-        "Project": issue["project__name"],
-        "Name": issue["name"],
-        "Description": issue["description_stripped"],
-        "State": issue["state__name"],
-        "Start Date": dateConverter(issue["start_date"]),
-        "Target Date": dateConverter(issue["target_date"]),
-        "Priority": issue["priority"],
-        "Created By": (
-            f"{issue['created_by__first_name']} {issue['created_by__last_name']}"
-            if issue["created_by__first_name"] and issue["created_by__last_name"]
-            else ""
-        ),
-        "Assignee": (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        "Labels": issue["labels__name"] if issue["labels__name"] else "",
-        "Cycle Name": issue["issue_cycle__cycle__name"],
-        "Cycle Start Date": dateConverter(issue["issue_cycle__cycle__start_date"]),
-        "Cycle End Date": dateConverter(issue["issue_cycle__cycle__end_date"]),
-        "Module Name": issue["issue_module__module__name"],
-        "Module Start Date": dateConverter(issue["issue_module__module__start_date"]),
-        "Module Target Date": dateConverter(issue["issue_module__module__target_date"]),
-        "Created At": dateTimeConverter(issue["created_at"]),
-        "Updated At": dateTimeConverter(issue["updated_at"]),
-        "Completed At": dateTimeConverter(issue["completed_at"]),
-        "Archived At": dateTimeConverter(issue["archived_at"]),
-    }
-
-
-def update_json_row(rows, row):
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row["ID"] == row["ID"]
-        ),
-        None,
+def generate_json_row(header, issue):
+    return dict(zip(header, generate_table_row(issue)))
+
+
+def generate_csv(issues, file):
+    """
+    Generate CSV export for all the passed issues.
+    """
+    write_csv_file(file, None, (generate_table_row(issue) for issue in issues))
+
+
+def generate_json(issues, file):
+    write_json_rows(file, (generate_json_row(EXPORT_HEADER, issue) for issue in issues))
+
+
+def generate_xlsx(issues, file):
+    write_xlsx_file(
+        file, EXPORT_HEADER, (generate_table_row(issue) for issue in issues)
     )
 
-    if matched_index is not None:
-        existing_assignees, existing_labels = (
-            rows[matched_index]["Assignee"],
-            rows[matched_index]["Labels"],
-        )
-        assignee, label = row["Assignee"], row["Labels"]
-
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index]["Assignee"] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index]["Labels"] += f", {label}"
-    else:
-        rows.append(row)
 
+EXPORTER_MAPPER = {"csv": generate_csv, "json": generate_json, "xlsx": generate_xlsx}
+
+
+def assemble_export_file(provider, part_keys, file, s3):
+    """Write the parts of an export file, in order, into the file"""
+    if provider == "csv":
+        write_csv_file(file, EXPORT_HEADER, [])
+    elif provider == "json":
+        file.write(b"[")
 
-def update_table_row(rows, row):
-    matched_index = next(
-        (index for index, existing_row in enumerate(rows) if existing_row[0] == row[0]),
-        None,
+    written = False
+    for part_key in part_keys:
+        part = s3.get_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=part_key)
+        if not part["ContentLength"]:
+            continue
+        if provider == "json" and written:
+            file.write(b", ")
+        shutil.copyfileobj(part["Body"], file)
+        written = True
+
+    if provider == "json":
+        file.write(b"]")
+
+
+def get_export_issues(workspace_id, project_ids, member_id):
+    return Issue.objects.filter(
+        workspace__id=workspace_id,
+        project_id__in=project_ids,
+        project__project_projectmember__member=member_id,
+        project__project_projectmember__is_active=True,
+        project__archived_at__isnull=True,
     )
 
-    if matched_index is not None:
-        existing_assignees, existing_labels = rows[matched_index][7:9]
-        assignee, label = row[7:9]
-
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index][8] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index][8] += f", {label}"
+
+def plan_export_shards(exporter_instance, workspace_id, project_ids, multiple):
+    """
+    Split the export into shards, one per file or per EXPORT_SHARD_SIZE issues
+    of a file. xlsx files cannot be joined and are never split.
+    """
+    counts = dict(
+        get_export_issues(workspace_id, project_ids, exporter_instance.initiated_by_id)
+        .values("project_id")
+        .annotate(count=Count("id", distinct=True))
+        .values_list("project_id", "count")
+    )
+    if multiple:
+        files = [
+            (str(project_id), [str(project_id)], counts.get(UUID(str(project_id)), 0))
+            for project_id in project_ids
+        ]
     else:
-        rows.append(row)
+        files = [
+            (
+                str(workspace_id),
+                [str(project_id) for project_id in project_ids],
+                sum(counts.values()),
+            )
+        ]
 
+    shard_size = settings.EXPORT_SHARD_SIZE
+    shards = {}
+    for file_id, file_project_ids, count in files:
+        # Shards are ranges of (project identifier, sequence id), the key the
+        # issues are written in, so that issues created or deleted meanwhile
+        # never shift the rows of another shard
+        bounds = [None, None]
+        if exporter_instance.provider != "xlsx" and count > shard_size:
+            keys = (
+                get_export_issues(
+                    workspace_id, file_project_ids, exporter_instance.initiated_by_id
+                )
+                .order_by("project__identifier", "sequence_id")
+                .values_list("project__identifier", "sequence_id")
+                .distinct()
+            )
+            bounds = (
+                [None]
+                + [
+                    list(key)
+                    for index, key in enumerate(keys.iterator())
+                    if index and index % shard_size == 0
+                ]
+                + [None]
+            )
+        for start, end in zip(bounds, bounds[1:]):
+            shards[str(len(shards))] = {
+                "file": file_id,
+                "projects": file_project_ids,
+                "start": start,
+                "end": end,
+                "status": "queued",
+            }
+    return shards, sum(count for _, _, count in files)
+
+
+def get_shard_filter(shard):
+    """Issues from the start key of the shard, included, to its end, excluded"""
+    shard_filter = Q()
+    if shard.get("start"):
+        identifier, sequence_id = shard["start"]
+        shard_filter &= Q(project__identifier__gt=identifier) | Q(
+            project__identifier=identifier, sequence_id__gte=sequence_id
+        )
+    if shard.get("end"):
+        identifier, sequence_id = shard["end"]
+        shard_filter &= Q(project__identifier__lt=identifier) | Q(
+            project__identifier=identifier, sequence_id__lt=sequence_id
+        )
+    return shard_filter
+
+
+def get_part_key(exporter_instance, shard_id):
+    return (
+        f"{exporter_instance.workspace_id}/export-parts/"
+        f"{exporter_instance.token}/{shard_id}"
+    )
 
-def generate_csv(header, project_id, issues, files):
+
+def update_shard(token_id, shard_id, processed_issues=0, **fields):
     """
-    Generate CSV export for all the passed issues.
+    Update the shard and return whether every shard is now finished, the
+    export row lock makes a single shard see it
     """
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    csv_file = create_csv_file(rows)
-    files.append((f"{project_id}.csv", csv_file))
+    with transaction.atomic():
+        exporter_instance = ExporterHistory.objects.select_for_update().get(
+            token=token_id
+        )
+        exporter_instance.shards[shard_id].update(fields)
+        exporter_instance.processed_issues += processed_issues
+        exporter_instance.save(update_fields=["shards", "processed_issues"])
+        return all(
+            shard["status"] in ["completed", "failed"]
+            for shard in exporter_instance.shards.values()
+        )
 
 
-def generate_json(header, project_id, issues, files):
-    rows = []
-    for issue in issues:
-        row = generate_json_row(issue)
-        update_json_row(rows, row)
-    json_file = create_json_file(rows)
-    files.append((f"{project_id}.json", json_file))
+@shared_task(bind=True)
+def export_shard_task(self, token_id, shard_id, slug):
+    exporter_instance = ExporterHistory.objects.get(token=token_id)
+    shard = exporter_instance.shards[shard_id]
+    if shard["status"] == "completed":
+        return
 
+    try:
+        issues = (
+            get_export_issues(
+                exporter_instance.workspace_id,
+                shard["projects"],
+                exporter_instance.initiated_by_id,
+            )
+            .values(
+                "id",
+                "project__identifier",
+                "project__name",
+                "project__id",
+                "sequence_id",
+                "name",
+                "description_stripped",
+                "priority",
+                "start_date",
+                "target_date",
+                "state__name",
+                "created_at",
+                "updated_at",
+                "completed_at",
+                "archived_at",
+                "created_by__first_name",
+                "created_by__last_name",
+            )
+            .filter(get_shard_filter(shard))
+            .order_by("project__identifier", "sequence_id", "id")
+            .distinct()
+        )
+
+        processed = []
+        part_key = get_part_key(exporter_instance, shard_id)
+        with tempfile.SpooledTemporaryFile(
+            max_size=settings.EXPORT_SPOOL_MAX_SIZE
+        ) as part:
+            EXPORTER_MAPPER[exporter_instance.provider](
+                iterate_issues(issues, processed.append), part
+            )
+            part.seek(0)
+            get_s3_client().upload_fileobj(
+                part,
+                settings.AWS_STORAGE_BUCKET_NAME,
+                part_key,
+                Config=get_transfer_config(),
+            )
+
+        finished = update_shard(
+            token_id,
+            shard_id,
+            processed_issues=sum(processed),
+            status="completed",
+            key=part_key,
+        )
+    except Exception as e:
+        if self.request.retries < settings.EXPORT_SHARD_MAX_RETRIES:
+            raise self.retry(exc=e, countdown=2**self.request.retries * 10)
+        # The export is still assembled, which reports the failed shard
+        finished = update_shard(token_id, shard_id, status="failed", reason=str(e))
+        log_exception(e)
 
-def generate_xlsx(header, project_id, issues, files):
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    xlsx_file = create_xlsx_file(rows)
-    files.append((f"{project_id}.xlsx", xlsx_file))
+    # The last shard to finish assembles the archive
+    if finished:
+        assemble_export_task.delay(token_id, slug)
+
+
+@shared_task
+def assemble_export_task(token_id, slug):
+    try:
+        exporter_instance = ExporterHistory.objects.get(token=token_id)
+        shards = sorted(
+            exporter_instance.shards.items(), key=lambda shard: int(shard[0])
+        )
+        failed = [
+            shard_id for shard_id, shard in shards if shard["status"] != "completed"
+        ]
+        if failed:
+            exporter_instance.status = "failed"
+            exporter_instance.reason = (
+                f"{len(failed)} of {len(shards)} export shards failed"
+            )
+            exporter_instance.save(update_fields=["status", "reason"])
+            return
+
+        files = defaultdict(list)
+        for _, shard in shards:
+            files[shard["file"]].append(shard["key"])
+
+        s3 = get_s3_client()
+        # The archive is written to memory and spooled to disk once it grows
+        with tempfile.SpooledTemporaryFile(
+            max_size=settings.EXPORT_SPOOL_MAX_SIZE
+        ) as zip_buffer:
+            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                for file_id, part_keys in files.items():
+                    with zip_file.open(
+                        f"{file_id}.{exporter_instance.provider}", "w"
+                    ) as file:
+                        assemble_export_file(
+                            exporter_instance.provider, part_keys, file, s3
+                        )
+
+            zip_buffer.seek(0)
+            upload_to_s3(zip_buffer, exporter_instance.workspace_id, token_id, slug)
+
+        part_keys = [shard["key"] for _, shard in shards]
+        for index in range(0, len(part_keys), 1000):
+            s3.delete_objects(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                Delete={
+                    "Objects": [
+                        {"Key": part_key}
+                        for part_key in part_keys[index : index + 1000]
+                    ]
+                },
+            )
+
+    except Exception as e:
+        exporter_instance = ExporterHistory.objects.get(token=token_id)
+        exporter_instance.status = "failed"
+        exporter_instance.reason = str(e)
+        exporter_instance.save(update_fields=["status", "reason"])
+        log_exception(e)
+        return
 
 
 @shared_task
 def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, slug):
+    """
+    Export the issues as one shard per project, or per chunk of a large
+    project, the last shard to finish assembling the archive. Running the
+    task again for the same export only redoes the shards that did not
+    complete.
+    """
     try:
         exporter_instance = ExporterHistory.objects.get(token=token_id)
-        exporter_instance.status = "processing"
-        exporter_instance.save(update_fields=["status"])
+        if provider not in EXPORTER_MAPPER:
+            return
 
-        workspace_issues = (
-            (
-                Issue.objects.filter(
-                    workspace__id=workspace_id,
-                    project_id__in=project_ids,
-                    project__project_projectmember__member=exporter_instance.initiated_by_id,
-                    project__project_projectmember__is_active=True,
-                    project__archived_at__isnull=True,
-                )
-                .select_related("project", "workspace", "state", "parent", "created_by")
-                .prefetch_related(
-                    "assignees", "labels", "issue_cycle__cycle", "issue_module__module"
-                )
-                .values(
-                    "id",
-                    "project__identifier",
-                    "project__name",
-                    "project__id",
-                    "sequence_id",
-                    "name",
-                    "description_stripped",
-                    "priority",
-                    "start_date",
-                    "target_date",
-                    "state__name",
-                    "created_at",
-                    "updated_at",
-                    "completed_at",
-                    "archived_at",
-                    "issue_cycle__cycle__name",
-                    "issue_cycle__cycle__start_date",
-                    "issue_cycle__cycle__end_date",
-                    "issue_module__module__name",
-                    "issue_module__module__start_date",
-                    "issue_module__module__target_date",
-                    "created_by__first_name",
-                    "created_by__last_name",
-                    "assignees__first_name",
-                    "assignees__last_name",
-                    "labels__name",
-                )
+        if not exporter_instance.shards:
+            shards, total_issues = plan_export_shards(
+                exporter_instance, workspace_id, project_ids, multiple
             )
-            .order_by("project__identifier", "sequence_id")
-            .distinct()
-        )
-        # CSV header
-        header = [
-            "ID",
-            "Project",
-            "Name",
-            "Description",
-            "State",
-            "Start Date",
-            "Target Date",
-            "Priority",
-            "Created By",
-            "Assignee",
-            "Labels",
-            "Cycle Name",
-            "Cycle Start Date",
-            "Cycle End Date",
-            "Module Name",
-            "Module Start Date",
-            "Module Target Date",
-            "Created At",
-            "Updated At",
-            "Completed At",
-            "Archived At",
+            exporter_instance.shards = shards
+            exporter_instance.total_issues = total_issues
+            exporter_instance.processed_issues = 0
+        pending = [
+            shard_id
+            for shard_id, shard in exporter_instance.shards.items()
+            if shard["status"] != "completed"
         ]
+        # Failed shards are redone, the archive waits for them again
+        for shard_id in pending:
+            exporter_instance.shards[shard_id]["status"] = "queued"
+        exporter_instance.status = "processing"
+        exporter_instance.reason = ""
+        exporter_instance.save(
+            update_fields=[
+                "status",
+                "reason",
+                "shards",
+                "total_issues",
+                "processed_issues",
+            ]
+        )
 
-        EXPORTER_MAPPER = {
-            "csv": generate_csv,
-            "json": generate_json,
-            "xlsx": generate_xlsx,
-        }
+        if not pending:
+            assemble_export_task.delay(token_id, slug)
+            return
 
-        files = []
-        if multiple:
-            for project_id in project_ids:
-                issues = workspace_issues.filter(project__id=project_id)
-                exporter = EXPORTER_MAPPER.get(provider)
-                if exporter is not None:
-                    exporter(header, project_id, issues, files)
-
-        else:
-            exporter = EXPORTER_MAPPER.get(provider)
-            if exporter is not None:
-                exporter(header, workspace_id, workspace_issues, files)
-
-        zip_buffer = create_zip_file(files)
-        upload_to_s3(zip_buffer, workspace_id, token_id, slug)
+        for shard_id in pending:
+            export_shard_task.delay(token_id, shard_id, slug)
 
     except Exception as e:
         exporter_instance = ExporterHistory.objects.get(token=token_id)
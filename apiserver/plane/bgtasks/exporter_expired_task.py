@@ -47,3 +47,15 @@ def delete_old_s3_link():
                 s3.delete_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=file_name)
 
         ExporterHistory.objects.filter(id=exporter_id).update(url=None)
+
+    # Parts of failed exports are kept for a retry until they expire
+    failed_exporter_history = ExporterHistory.objects.filter(
+        status="failed", created_at__lte=timezone.now() - timedelta(days=8)
+    ).exclude(shards={})
+    for exporter_id, shards in failed_exporter_history.values_list("id", "shards"):
+        for shard in shards.values():
+            if shard.get("key"):
+                s3.delete_object(
+                    Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=shard["key"]
+                )
+        ExporterHistory.objects.filter(id=exporter_id).update(shards={})
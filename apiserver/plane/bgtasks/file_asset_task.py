@@ -10,16 +10,22 @@ from django.db.models import Q
 from celery import shared_task
 
 # Module imports
+from plane.bgtasks.deletion_task import purge
 from plane.db.models import FileAsset
 
 
 @shared_task
 def delete_unuploaded_file_asset():
     """This task deletes unuploaded file assets older than a certain number of days."""
-    FileAsset.objects.filter(
-        Q(
-            created_at__lt=timezone.now()
-            - timedelta(days=int(os.environ.get("UNUPLOADED_ASSET_DELETE_DAYS", "7")))
-        )
-        & Q(is_uploaded=False)
-    ).delete()
+    return purge(
+        FileAsset.objects.filter(
+            Q(
+                created_at__lt=timezone.now()
+                - timedelta(
+                    days=int(os.environ.get("UNUPLOADED_ASSET_DELETE_DAYS", "7"))
+                )
+            )
+            & Q(is_uploaded=False)
+        ),
+        soft=True,
+    )
@@ -10,7 +10,7 @@ from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 
 from plane.app.serializers import IssueActivitySerializer
-from plane.bgtasks.notification_task import notifications
+from plane.bgtasks.notification_task import notifications, notifications_batch
 
 # Module imports
 from plane.db.models import (
@@ -30,8 +30,10 @@ from plane.db.models import (
 )
 from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
-from plane.bgtasks.webhook_task import webhook_activity
+from plane.bgtasks.webhook_task import webhook_activity_batch
 from plane.utils.issue_relation_mapper import get_inverse_relation
+from plane.utils.analytics_plot import invalidate_burndown
+from plane.utils.analytics_rollup import mark_rollups_stale
 
 
 # Track Changes in name
@@ -1547,6 +1549,121 @@ def create_intake_activity(
         )
 
 
+# Tracker of every activity type
+ACTIVITY_MAPPER = {
+    "issue.activity.created": create_issue_activity,
+    "issue.activity.updated": update_issue_activity,
+    "issue.activity.deleted": delete_issue_activity,
+    "comment.activity.created": create_comment_activity,
+    "comment.activity.updated": update_comment_activity,
+    "comment.activity.deleted": delete_comment_activity,
+    "cycle.activity.created": create_cycle_issue_activity,
+    "cycle.activity.deleted": delete_cycle_issue_activity,
+    "module.activity.created": create_module_issue_activity,
+    "module.activity.deleted": delete_module_issue_activity,
+    "link.activity.created": create_link_activity,
+    "link.activity.updated": update_link_activity,
+    "link.activity.deleted": delete_link_activity,
+    "attachment.activity.created": create_attachment_activity,
+    "attachment.activity.deleted": delete_attachment_activity,
+    "issue_relation.activity.created": create_issue_relation_activity,
+    "issue_relation.activity.deleted": delete_issue_relation_activity,
+    "issue_reaction.activity.created": create_issue_reaction_activity,
+    "issue_reaction.activity.deleted": delete_issue_reaction_activity,
+    "comment_reaction.activity.created": create_comment_reaction_activity,
+    "comment_reaction.activity.deleted": delete_comment_reaction_activity,
+    "issue_vote.activity.created": create_issue_vote_activity,
+    "issue_vote.activity.deleted": delete_issue_vote_activity,
+    "issue_draft.activity.created": create_draft_issue_activity,
+    "issue_draft.activity.updated": update_draft_issue_activity,
+    "issue_draft.activity.deleted": delete_draft_issue_activity,
+    "intake.activity.created": create_intake_activity,
+}
+
+# Activities changing the values plotted by the analytics
+ROLLUP_ACTIVITY_TYPES = (
+    "issue.activity.",
+    "cycle.activity.",
+    "module.activity.",
+    "issue_draft.activity.",
+    "intake.activity.",
+)
+
+
+def get_webhook_activity(activity, intake=None):
+    return {
+        "event": (
+            "issue_comment"
+            if activity.field == "comment"
+            else "intake_issue"
+            if intake
+            else "issue"
+        ),
+        "event_id": str(
+            activity.issue_comment_id
+            if activity.field == "comment"
+            else intake
+            if intake
+            else activity.issue_id
+        ),
+        "verb": activity.verb,
+        "field": "description" if activity.field == "comment" else activity.field,
+        "old_value": activity.old_value if activity.old_value != "" else None,
+        "new_value": activity.new_value if activity.new_value != "" else None,
+        "actor_id": str(activity.actor_id),
+        "old_identifier": activity.old_identifier,
+        "new_identifier": activity.new_identifier,
+    }
+
+
+@shared_task
+def issues_created_activity(issue_ids, project_id, actor_id, epoch, origin=None):
+    """Track the creation of the issues created in bulk with a single insert"""
+    try:
+        project = Project.objects.select_related("workspace").get(pk=project_id)
+        issues = Issue.objects.filter(pk__in=issue_ids, project_id=project_id).values(
+            "id", "created_at", "created_by_id"
+        )
+        issue_activities_created = IssueActivity.objects.bulk_create(
+            [
+                IssueActivity(
+                    issue_id=issue["id"],
+                    project_id=project_id,
+                    workspace_id=project.workspace_id,
+                    comment="created the issue",
+                    verb="created",
+                    actor_id=issue["created_by_id"] or actor_id,
+                    epoch=epoch,
+                )
+                for issue in issues
+            ],
+            batch_size=500,
+        )
+        if not issue_activities_created:
+            return
+
+        # The activities are dated from the creation of their issue
+        created_at = {issue["id"]: issue["created_at"] for issue in issues}
+        for activity in issue_activities_created:
+            activity.created_at = created_at[activity.issue_id]
+        IssueActivity.objects.bulk_update(
+            issue_activities_created, ["created_at"], batch_size=500
+        )
+
+        mark_rollups_stale([project_id])
+        invalidate_burndown(project_id)
+        webhook_activity_batch.delay(
+            activities=[
+                get_webhook_activity(activity) for activity in issue_activities_created
+            ],
+            slug=project.workspace.slug,
+            current_site=origin,
+        )
+    except Exception as e:
+        log_exception(e)
+        return
+
+
 # Receive message from room group
 @shared_task
 def issue_activity(
@@ -1565,7 +1682,7 @@ def issue_activity(
     try:
         issue_activities = []
 
-        project = Project.objects.get(pk=project_id)
+        project = Project.objects.select_related("workspace").get(pk=project_id)
         workspace_id = project.workspace_id
 
         if issue_id is not None:
@@ -1581,36 +1698,6 @@ def issue_activity(
                 except Exception:
                     pass
 
-        ACTIVITY_MAPPER = {
-            "issue.activity.created": create_issue_activity,
-            "issue.activity.updated": update_issue_activity,
-            "issue.activity.deleted": delete_issue_activity,
-            "comment.activity.created": create_comment_activity,
-            "comment.activity.updated": update_comment_activity,
-            "comment.activity.deleted": delete_comment_activity,
-            "cycle.activity.created": create_cycle_issue_activity,
-            "cycle.activity.deleted": delete_cycle_issue_activity,
-            "module.activity.created": create_module_issue_activity,
-            "module.activity.deleted": delete_module_issue_activity,
-            "link.activity.created": create_link_activity,
-            "link.activity.updated": update_link_activity,
-            "link.activity.deleted": delete_link_activity,
-            "attachment.activity.created": create_attachment_activity,
-            "attachment.activity.deleted": delete_attachment_activity,
-            "issue_relation.activity.created": create_issue_relation_activity,
-            "issue_relation.activity.deleted": delete_issue_relation_activity,
-            "issue_reaction.activity.created": create_issue_reaction_activity,
-            "issue_reaction.activity.deleted": delete_issue_reaction_activity,
-            "comment_reaction.activity.created": create_comment_reaction_activity,
-            "comment_reaction.activity.deleted": delete_comment_reaction_activity,
-            "issue_vote.activity.created": create_issue_vote_activity,
-            "issue_vote.activity.deleted": delete_issue_vote_activity,
-            "issue_draft.activity.created": create_draft_issue_activity,
-            "issue_draft.activity.updated": update_draft_issue_activity,
-            "issue_draft.activity.deleted": delete_draft_issue_activity,
-            "intake.activity.created": create_intake_activity,
-        }
-
         func = ACTIVITY_MAPPER.get(type)
         if func is not None:
             func(
@@ -1626,40 +1713,21 @@ def issue_activity(
 
         # Save all the values to database
         issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
+        # Issue changes invalidate the analytics rollups and burndowns of the project
+        if len(issue_activities_created) and type.startswith(ROLLUP_ACTIVITY_TYPES):
+            mark_rollups_stale([project_id])
+            invalidate_burndown(project_id)
         # Post the updates to segway for integrations and webhooks
         if len(issue_activities_created):
-            for activity in issue_activities_created:
-                webhook_activity.delay(
-                    event=(
-                        "issue_comment"
-                        if activity.field == "comment"
-                        else "intake_issue"
-                        if intake
-                        else "issue"
-                    ),
-                    event_id=(
-                        activity.issue_comment_id
-                        if activity.field == "comment"
-                        else intake
-                        if intake
-                        else activity.issue_id
-                    ),
-                    verb=activity.verb,
-                    field=(
-                        "description" if activity.field == "comment" else activity.field
-                    ),
-                    old_value=(
-                        activity.old_value if activity.old_value != "" else None
-                    ),
-                    new_value=(
-                        activity.new_value if activity.new_value != "" else None
-                    ),
-                    actor_id=activity.actor_id,
-                    current_site=origin,
-                    slug=activity.workspace.slug,
-                    old_identifier=activity.old_identifier,
-                    new_identifier=activity.new_identifier,
-                )
+            # Fan out all the activities of the epoch in a single task
+            webhook_activity_batch.delay(
+                activities=[
+                    get_webhook_activity(activity, intake)
+                    for activity in issue_activities_created
+                ],
+                slug=project.workspace.slug,
+                current_site=origin,
+            )
 
         if notification:
             notifications.delay(
@@ -1680,3 +1748,101 @@ def issue_activity(
     except Exception as e:
         log_exception(e)
         return
+
+
+@shared_task
+def bulk_issue_activity(
+    type,
+    changes,
+    actor_id,
+    project_id,
+    epoch,
+    subscriber=True,
+    notification=False,
+    origin=None,
+):
+    """
+    Track the activities of many issues in a single task, changes being a list
+    of (issue_id, requested_data, current_instance) as given to issue_activity
+    """
+    try:
+        if not changes:
+            return
+
+        project = Project.objects.select_related("workspace").get(pk=project_id)
+        issue_ids = {str(issue_id) for issue_id, _, _ in changes}
+
+        if origin:
+            # set the request origin of every issue in redis
+            pipe = redis_instance().pipeline()
+            for issue_id in issue_ids:
+                pipe.set(issue_id, origin, ex=600)
+            pipe.execute()
+        Issue.objects.filter(pk__in=issue_ids).update(updated_at=timezone.now())
+
+        func = ACTIVITY_MAPPER.get(type)
+        if func is None:
+            return
+
+        # Activities of every change, slices[i] delimits those of changes[i]
+        issue_activities = []
+        slices = []
+        for issue_id, requested_data, current_instance in changes:
+            start = len(issue_activities)
+            func(
+                requested_data=requested_data,
+                current_instance=current_instance,
+                issue_id=issue_id,
+                project_id=project_id,
+                workspace_id=project.workspace_id,
+                actor_id=actor_id,
+                issue_activities=issue_activities,
+                epoch=epoch,
+            )
+            slices.append(slice(start, len(issue_activities)))
+
+        issue_activities_created = IssueActivity.objects.bulk_create(
+            issue_activities, batch_size=500
+        )
+        if not issue_activities_created:
+            return
+
+        if type.startswith(ROLLUP_ACTIVITY_TYPES):
+            mark_rollups_stale([project_id])
+            invalidate_burndown(project_id)
+        webhook_activity_batch.delay(
+            activities=[
+                get_webhook_activity(activity) for activity in issue_activities_created
+            ],
+            slug=project.workspace.slug,
+            current_site=origin,
+        )
+
+        if notification:
+            activities = IssueActivitySerializer(
+                issue_activities_created, many=True
+            ).data
+            issues = []
+            for index, (issue_id, requested_data, current_instance) in enumerate(
+                changes
+            ):
+                issues.append(
+                    {
+                        "issue_id": str(issue_id),
+                        "issue_activities_created": json.dumps(
+                            activities[slices[index]], cls=DjangoJSONEncoder
+                        ),
+                        "requested_data": requested_data,
+                        "current_instance": current_instance,
+                    }
+                )
+            notifications_batch.delay(
+                type=type,
+                project_id=project_id,
+                actor_id=actor_id,
+                subscriber=subscriber,
+                issues=issues,
+            )
+    except Exception as e:
+        log_exception(e)
+        return
@@ -10,8 +10,9 @@ from django.db.models import Q
 from django.utils import timezone
 
 # Module imports
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import bulk_issue_activity
 from plane.db.models import Issue, Project, State
+from plane.db.models.progress_stats import refresh_issue_progress
 from plane.utils.exception_logger import log_exception
 
 
@@ -70,22 +71,28 @@ def archive_old_issues():
                     Issue.objects.bulk_update(
                         issues_to_update, ["archived_at"], batch_size=100
                     )
-                    _ = [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps(
-                                {"archived_at": str(archive_at), "automation": True}
-                            ),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=json.dumps({"archived_at": None}),
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp()),
-                            notification=True,
-                        )
-                        for issue in issues_to_update
-                    ]
+                    Issue.update_counters(
+                        {issue.parent_id for issue in issues_to_update}
+                    )
+                    refresh_issue_progress([issue.id for issue in issues_to_update])
+                    bulk_issue_activity.delay(
+                        type="issue.activity.updated",
+                        changes=[
+                            (
+                                str(issue.id),
+                                json.dumps(
+                                    {"archived_at": str(archive_at), "automation": True}
+                                ),
+                                json.dumps({"archived_at": None}),
+                            )
+                            for issue in issues_to_update
+                        ],
+                        actor_id=str(project.created_by_id),
+                        project_id=str(project_id),
+                        subscriber=False,
+                        epoch=int(timezone.now().timestamp()),
+                        notification=True,
+                    )
         return
     except Exception as e:
         log_exception(e)
@@ -145,22 +152,23 @@ def close_old_issues():
                     Issue.objects.bulk_update(
                         issues_to_update, ["state"], batch_size=100
                     )
-                    [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps(
-                                {"closed_to": str(issue.state_id)}
-                            ),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=None,
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp()),
-                            notification=True,
-                        )
-                        for issue in issues_to_update
-                    ]
+                    refresh_issue_progress([issue.id for issue in issues_to_update])
+                    bulk_issue_activity.delay(
+                        type="issue.activity.updated",
+                        changes=[
+                            (
+                                str(issue.id),
+                                json.dumps({"closed_to": str(issue.state_id)}),
+                                None,
+                            )
+                            for issue in issues_to_update
+                        ],
+                        actor_id=str(project.created_by_id),
+                        project_id=str(project_id),
+                        subscriber=False,
+                        epoch=int(timezone.now().timestamp()),
+                        notification=True,
+                    )
         return
     except Exception as e:
         log_exception(e)
@@ -1,7 +1,5 @@
 # Python imports
 import json
-import uuid
-from uuid import UUID
 
 
 # Module imports
@@ -20,11 +18,10 @@ from plane.db.models import (
     UserNotificationPreference,
     ProjectMember,
 )
-from django.db.models import Subquery
+from plane.utils.html_processor import extract_components
 
 # Third Party imports
 from celery import shared_task
-from bs4 import BeautifulSoup
 
 
 # =========== Issue Description Html Parsing and notification Functions ======================
@@ -80,57 +77,113 @@ def get_removed_mentions(requested_instance, current_instance):
     return removed_mentions
 
 
+class IssueNotificationRecipients:
+    """
+    The active project members, subscribers, assignees and creator of an issue
+    along with the notification preferences of the users to notify, loaded in
+    a constant number of queries
+    """
+
+    def __init__(self, project_id, issue_id):
+        self.issue_id = issue_id
+        self.project = Project.objects.select_related("workspace").get(pk=project_id)
+        self.issue = (
+            Issue.objects.filter(pk=issue_id)
+            .select_related("state", "project", "project__workspace")
+            .first()
+        )
+        self.creator_id = (
+            str(self.issue.created_by_id)
+            if self.issue is not None and self.issue.created_by_id
+            else None
+        )
+        self.members = {
+            str(member_id)
+            for member_id in ProjectMember.objects.filter(
+                project_id=project_id, is_active=True
+            ).values_list("member_id", flat=True)
+        }
+        self.subscribers = {
+            str(subscriber_id)
+            for subscriber_id in IssueSubscriber.objects.filter(
+                project_id=project_id, issue_id=issue_id
+            ).values_list("subscriber_id", flat=True)
+        }
+        self.assignees = {
+            str(assignee_id)
+            for assignee_id in IssueAssignee.objects.filter(
+                project_id=project_id, issue_id=issue_id
+            ).values_list("assignee_id", flat=True)
+        }
+        self.preferences = {}
+
+    def load_preferences(self, user_ids):
+        """Fetch the notification preferences of the users in one query"""
+        user_ids = {str(user_id) for user_id in user_ids} - set(self.preferences)
+        if not user_ids:
+            return
+        for preference in UserNotificationPreference.objects.filter(
+            user_id__in=user_ids
+        ):
+            self.preferences.setdefault(str(preference.user_id), preference)
+
+
 # Adds mentions as subscribers
-def extract_mentions_as_subscribers(project_id, issue_id, mentions):
+def extract_mentions_as_subscribers(recipients, mentions):
     # mentions is an array of User IDs representing the FILTERED set of mentioned users
+    # Members who do not follow the issue yet must be sent the mentioned notification
+    return [
+        IssueSubscriber(
+            workspace_id=recipients.project.workspace_id,
+            project_id=recipients.project.id,
+            issue_id=recipients.issue_id,
+            subscriber_id=mention_id,
+        )
+        for mention_id in set(mentions)
+        if mention_id in recipients.members
+        and mention_id not in recipients.subscribers
+        and mention_id not in recipients.assignees
+        and mention_id != recipients.creator_id
+    ]
 
-    bulk_mention_subscribers = []
-
-    for mention_id in mentions:
-        # If the particular mention has not already been subscribed to the issue, he must be sent the mentioned notification
-        if (
-            not IssueSubscriber.objects.filter(
-                issue_id=issue_id, subscriber_id=mention_id, project_id=project_id
-            ).exists()
-            and not IssueAssignee.objects.filter(
-                project_id=project_id, issue_id=issue_id, assignee_id=mention_id
-            ).exists()
-            and not Issue.objects.filter(
-                project_id=project_id, pk=issue_id, created_by_id=mention_id
-            ).exists()
-            and ProjectMember.objects.filter(
-                project_id=project_id, member_id=mention_id, is_active=True
-            ).exists()
-        ):
-            project = Project.objects.get(pk=project_id)
 
-            bulk_mention_subscribers.append(
-                IssueSubscriber(
-                    workspace_id=project.workspace_id,
-                    project_id=project_id,
-                    issue_id=issue_id,
-                    subscriber_id=mention_id,
-                )
-            )
-    return bulk_mention_subscribers
+def should_send_email(preference, issue_activity, completed_states):
+    # Users without preferences never get emails
+    if preference is None:
+        return False
+    field = issue_activity.get("field")
+    if field == "state" and preference.state_change:
+        return True
+    if (
+        field == "state"
+        and preference.issue_completed
+        and str(issue_activity.get("new_identifier")) in completed_states
+    ):
+        return True
+    if field == "comment" and preference.comment:
+        return True
+    return preference.property_change
+
+
+def get_user_mentions(html):
+    return list(
+        {
+            component["entity_identifier"]
+            for component in extract_components(html, "mention-component")
+            if component.get("entity_name") == "user_mention"
+            and component.get("entity_identifier")
+        }
+    )
 
 
 # Parse Issue Description & extracts mentions
 def extract_mentions(issue_instance):
     try:
         # issue_instance has to be a dictionary passed, containing the description_html and other set of activity data.
-        mentions = []
         # Convert string to dictionary
         data = json.loads(issue_instance)
         html = data.get("description_html")
-        soup = BeautifulSoup(html, "html.parser")
-        mention_tags = soup.find_all(
-            "mention-component", attrs={"entity_name": "user_mention"}
-        )
-
-        mentions = [mention_tag["entity_identifier"] for mention_tag in mention_tags]
-
-        return list(set(mentions))
+        return get_user_mentions(html)
     except Exception:
         return []
 
@@ -138,14 +191,7 @@ def extract_mentions(issue_instance):
 # =========== Comment Parsing and notification Functions ======================
 def extract_comment_mentions(comment_value):
     try:
-        mentions = []
-        soup = BeautifulSoup(comment_value, "html.parser")
-        mentions_tags = soup.find_all(
-            "mention-component", attrs={"entity_name": "user_mention"}
-        )
-        for mention_tag in mentions_tags:
-            mentions.append(mention_tag["entity_identifier"])
-        return list(set(mentions))
+        return get_user_mentions(comment_value)
     except Exception:
         return []
 
@@ -249,18 +295,16 @@ def notifications(
             2. From the latest set of mentions, extract the users which are not a subscribers & make them subscribers
             """
 
-            # get the list of active project members
-            project_members = ProjectMember.objects.filter(
-                project_id=project_id, is_active=True
-            ).values_list("member_id", flat=True)
+            # Project members, subscribers and assignees of the issue
+            recipients = IssueNotificationRecipients(project_id, issue_id)
+            project = recipients.project
+            issue = recipients.issue
 
             # Get new mentions from the newer instance
             new_mentions = get_new_mentions(
                 requested_instance=requested_data, current_instance=current_instance
             )
-            new_mentions = list(
-                set(new_mentions) & {str(member) for member in project_members}
-            )
+            new_mentions = list(set(new_mentions) & recipients.members)
             removed_mention = get_removed_mentions(
                 requested_instance=requested_data, current_instance=current_instance
             )
@@ -271,7 +315,7 @@ def notifications(
             # Get New Subscribers from the mentions of the newer instance
             requested_mentions = extract_mentions(issue_instance=requested_data)
             mention_subscribers = extract_mentions_as_subscribers(
-                project_id=project_id, issue_id=issue_id, mentions=requested_mentions
+                recipients=recipients, mentions=requested_mentions
             )
 
             for issue_activity in issue_activities_created:
@@ -294,11 +338,11 @@ def notifications(
                     comment_mentions = [
                         mention
                         for mention in comment_mentions
-                        if UUID(mention) in set(project_members)
+                        if mention in recipients.members
                     ]
 
             comment_mention_subscribers = extract_mentions_as_subscribers(
-                project_id=project_id, issue_id=issue_id, mentions=all_comment_mentions
+                recipients=recipients, mentions=all_comment_mentions
             )
             """
             We will not send subscription activity notification to the below mentioned user sets
@@ -308,20 +352,13 @@ def notifications(
             """
 
             # ----------------------------------------------------------------------------------------------------------------------------------------------------------------------------- #
-            issue_subscribers = list(
-                IssueSubscriber.objects.filter(
-                    project_id=project_id,
-                    issue_id=issue_id,
-                    subscriber__in=Subquery(project_members),
-                )
-                .exclude(
-                    subscriber_id__in=list(new_mentions + comment_mentions + [actor_id])
-                )
-                .values_list("subscriber", flat=True)
+            issue_subscribers = (
+                (recipients.subscribers & recipients.members)
+                - set(new_mentions)
+                - set(comment_mentions)
+                - {str(actor_id)}
             )
 
-            issue = Issue.objects.filter(pk=issue_id).first()
-
             if subscriber:
                 # add the user to issue subscriber
                 try:
@@ -331,28 +368,55 @@ def notifications(
                 except Exception:
                     pass
 
-            project = Project.objects.get(pk=project_id)
+            issue_assignees = recipients.assignees & recipients.members
 
-            issue_assignees = IssueAssignee.objects.filter(
-                issue_id=issue_id,
-                project_id=project_id,
-                assignee__in=Subquery(project_members),
-            ).values_list("assignee", flat=True)
+            # Completed states the activities move the issue to
+            completed_states = {
+                str(state_id)
+                for state_id in State.objects.filter(
+                    project_id=project_id,
+                    pk__in=[
+                        issue_activity.get("new_identifier")
+                        for issue_activity in issue_activities_created
+                        if issue_activity.get("field") == "state"
+                        and issue_activity.get("new_identifier")
+                    ],
+                    group="completed",
+                ).values_list("id", flat=True)
+            }
+
+            # Comments of the activities
+            issue_comments = {
+                str(comment_id): comment_stripped
+                for comment_id, comment_stripped in IssueComment.objects.filter(
+                    id__in=[
+                        issue_activity.get("issue_comment")
+                        for issue_activity in issue_activities_created
+                        if issue_activity.get("issue_comment")
+                    ],
+                    issue_id=issue_id,
+                    project_id=project_id,
+                    workspace_id=project.workspace_id,
+                ).values_list("id", "comment_stripped")
+            }
 
-            issue_subscribers = list(set(issue_subscribers) - {uuid.UUID(actor_id)})
+            recipients.load_preferences(
+                issue_subscribers
+                | {mention_id for mention_id in new_mentions + comment_mentions}
+            )
 
             for subscriber in issue_subscribers:
-                if issue.created_by_id and issue.created_by_id == subscriber:
+                if recipients.creator_id == subscriber:
                     sender = "in_app:issue_activities:created"
                 elif (
                     subscriber in issue_assignees
-                    and issue.created_by_id not in issue_assignees
+                    and recipients.creator_id not in issue_assignees
                 ):
                     sender = "in_app:issue_activities:assigned"
                 else:
                     sender = "in_app:issue_activities:subscribed"
 
-                preference = UserNotificationPreference.objects.get(user_id=subscriber)
+                preference = recipients.preferences.get(subscriber)
 
                 for issue_activity in issue_activities_created:
                     # If activity done in blocking then blocked by email should not go
@@ -364,41 +428,13 @@ def notifications(
                         continue
 
                     # Check if the value should be sent or not
-                    send_email = False
-                    if (
-                        issue_activity.get("field") == "state"
-                        and preference.state_change
-                    ):
-                        send_email = True
-                    elif (
-                        issue_activity.get("field") == "state"
-                        and preference.issue_completed
-                        and State.objects.filter(
-                            project_id=project_id,
-                            pk=issue_activity.get("new_identifier"),
-                            group="completed",
-                        ).exists()
-                    ):
-                        send_email = True
-                    elif (
-                        issue_activity.get("field") == "comment" and preference.comment
-                    ):
-                        send_email = True
-                    elif preference.property_change:
-                        send_email = True
-                    else:
-                        send_email = False
+                    send_email = should_send_email(
+                        preference, issue_activity, completed_states
+                    )
 
                     # If activity is of issue comment fetch the comment
-                    issue_comment = (
-                        IssueComment.objects.filter(
-                            id=issue_activity.get("issue_comment"),
-                            issue_id=issue_id,
-                            project_id=project_id,
-                            workspace_id=project.workspace_id,
-                        ).first()
-                        if issue_activity.get("issue_comment")
-                        else None
+                    issue_comment = issue_comments.get(
+                        str(issue_activity.get("issue_comment"))
                     )
 
                     # Create in app notification
@@ -429,7 +465,7 @@ def notifications(
                                     "new_value": str(issue_activity.get("new_value")),
                                     "old_value": str(issue_activity.get("old_value")),
                                     "issue_comment": str(
-                                        issue_comment.comment_stripped
+                                        issue_comment
                                         if issue_comment is not None
                                         else ""
                                     ),
@@ -480,7 +516,7 @@ def notifications(
                                             issue_activity.get("old_value")
                                         ),
                                         "issue_comment": str(
-                                            issue_comment.comment_stripped
+                                            issue_comment
                                             if issue_comment is not None
                                             else ""
                                         ),
@@ -517,13 +553,12 @@ def notifications(
                 .first()
             )
 
-            actor = User.objects.get(pk=actor_id)
+            # The actor is only named in comment mentions
+            actor = User.objects.get(pk=actor_id) if comment_mentions else None
 
             for mention_id in comment_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = recipients.preferences.get(mention_id)
                     for issue_activity in issue_activities_created:
                         notification = create_mention_notification(
                             project=project,
@@ -536,7 +571,7 @@ def notifications(
                         )
 
                         # check for email notifications
-                        if preference.mention:
+                        if preference is not None and preference.mention:
                             bulk_email_logs.append(
                                 EmailNotificationLog(
                                     triggered_by_id=actor_id,
@@ -594,9 +629,7 @@ def notifications(
 
             for mention_id in new_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = recipients.preferences.get(mention_id)
                     if (
                         last_activity is not None
                         and last_activity.field == "description"
@@ -646,11 +679,11 @@ def notifications(
                                 },
                             )
                         )
-                        if preference.mention:
+                        if preference is not None and preference.mention:
                             bulk_email_logs.append(
                                 EmailNotificationLog(
                                     triggered_by_id=actor_id,
-                                    receiver_id=subscriber,
+                                    receiver_id=mention_id,
                                     entity_identifier=issue_id,
                                     entity_name="issue",
                                     data={
@@ -701,11 +734,11 @@ def notifications(
                                 issue_id=issue_id,
                                 activity=issue_activity,
                             )
-                            if preference.mention:
+                            if preference is not None and preference.mention:
                                 bulk_email_logs.append(
                                     EmailNotificationLog(
                                         triggered_by_id=actor_id,
-                                        receiver_id=subscriber,
+                                        receiver_id=mention_id,
                                         entity_identifier=issue_id,
                                         entity_name="issue",
                                         data={
@@ -779,3 +812,19 @@ def notifications(
     except Exception as e:
         print(e)
         return
+
+
+@shared_task
+def notifications_batch(type, project_id, actor_id, subscriber, issues):
+    """
+    Send the notifications of many issues in a single task, issues being the
+    issue specific arguments of notifications
+    """
+    for issue in issues:
+        notifications(
+            type=type,
+            project_id=project_id,
+            actor_id=actor_id,
+            subscriber=subscriber,
+            **issue,
+        )
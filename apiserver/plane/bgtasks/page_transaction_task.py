@@ -4,31 +4,23 @@ import json
 # Django imports
 from django.utils import timezone
 
-# Third-party imports
-from bs4 import BeautifulSoup
-
 # Module imports
 from plane.db.models import Page, PageLog
 from celery import shared_task
 from plane.utils.exception_logger import log_exception
+from plane.utils.html_processor import extract_components
 
 
-def extract_components(value, tag):
+def get_components(value, tag):
     try:
-        mentions = []
-        html = value.get("description_html")
-        soup = BeautifulSoup(html, "html.parser")
-        mention_tags = soup.find_all(tag)
-
-        for mention_tag in mention_tags:
-            mention = {
-                "id": mention_tag.get("id"),
-                "entity_identifier": mention_tag.get("entity_identifier"),
-                "entity_name": mention_tag.get("entity_name"),
+        return [
+            {
+                "id": component.get("id"),
+                "entity_identifier": component.get("entity_identifier"),
+                "entity_name": component.get("entity_name"),
             }
-            mentions.append(mention)
-
-        return mentions
+            for component in extract_components(value.get("description_html"), tag)
+        ]
     except Exception:
         return []
 
@@ -47,8 +39,8 @@ def page_transaction(new_value, old_value, page_id):
         # TODO - Add "issue-embed-component", "img", "todo" components
         components = ["mention-component"]
         for component in components:
-            old_mentions = extract_components(old_value, component)
-            new_mentions = extract_components(new_value, component)
+            old_mentions = get_components(old_value, component)
+            new_mentions = get_components(new_value, component)
 
             new_mentions_ids = {mention["id"] for mention in new_mentions}
             old_mention_ids = {mention["id"] for mention in old_mentions}
@@ -1,16 +1,14 @@
-import hashlib
-import hmac
+# Python imports
 import json
 import logging
-import uuid
-
-import requests
+from collections import defaultdict
 
 # Third party imports
 from celery import shared_task
 
 # Django imports
 from django.conf import settings
+from django.core.cache import cache
 from django.core.mail import EmailMultiAlternatives, get_connection
 from django.core.serializers.json import DjangoJSONEncoder
 from django.template.loader import render_to_string
@@ -39,11 +37,12 @@ from plane.db.models import (
     Project,
     User,
     Webhook,
-    WebhookLog,
     IntakeIssue,
 )
+from plane.db.models.webhook import get_webhook_cache_key
 from plane.license.utils.instance_value import get_email_configuration
 from plane.utils.exception_logger import log_exception
+from plane.utils.webhook_delivery import deliver_webhooks
 
 SERIALIZER_MAPPER = {
     "project": ProjectSerializer,
@@ -70,6 +69,18 @@ MODEL_MAPPER = {
 }
 
 
+# Webhook flag to check for every event
+EVENT_WEBHOOK_MAPPER = {
+    "project": "project",
+    "issue": "issue",
+    "module": "module",
+    "module_issue": "module",
+    "cycle": "cycle",
+    "cycle_issue": "cycle",
+    "issue_comment": "issue_comment",
+}
+
+
 def get_model_data(event, event_id, many=False):
     model = MODEL_MAPPER.get(event)
     if many:
@@ -80,103 +91,87 @@ def get_model_data(event, event_id, many=False):
     return serializer(queryset, many=many).data
 
 
-@shared_task(
-    bind=True,
-    autoretry_for=(requests.RequestException,),
-    retry_backoff=600,
-    max_retries=5,
-    retry_jitter=True,
-)
-def webhook_task(self, webhook, slug, event, event_data, action, current_site):
+def get_workspace_webhooks(slug):
+    """Return the active webhooks of the workspace with their event flags"""
+    key = get_webhook_cache_key(slug)
+    webhooks = cache.get(key)
+    if webhooks is None:
+        webhooks = list(
+            Webhook.objects.filter(workspace__slug=slug, is_active=True).values(
+                "id", *set(EVENT_WEBHOOK_MAPPER.values())
+            )
+        )
+        cache.set(key, webhooks, settings.WEBHOOK_CACHE_TIMEOUT)
+    return webhooks
+
+
+def invalidate_workspace_webhooks_many(slugs):
+    cache.delete_many([get_webhook_cache_key(slug) for slug in slugs])
+
+
+def get_event_webhook_ids(slug, event):
+    # Webhooks subscribed to the event, events without a flag go to all of them
+    flag = EVENT_WEBHOOK_MAPPER.get(event)
+    return [
+        webhook["id"]
+        for webhook in get_workspace_webhooks(slug)
+        if flag is None or webhook[flag]
+    ]
+
+
+@shared_task
+def webhook_task(webhook, slug, event, event_data, action, current_site):
+    webhook_deliver_batch(
+        deliveries=[
+            {
+                "webhook": str(webhook),
+                "slug": slug,
+                "event": event,
+                "event_data": event_data,
+                "action": action,
+                "current_site": current_site,
+                "attempt": 0,
+            }
+        ]
+    )
+
+
+@shared_task
+def webhook_deliver_batch(deliveries):
+    """
+    Deliver a batch of webhook events concurrently, failed deliveries are sent
+    again later in batches of the same backoff
+    """
     try:
-        webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
-
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
-
-        # # Your secret key
-        event_data = (
-            json.loads(json.dumps(event_data, cls=DjangoJSONEncoder))
-            if event_data is not None
-            else None
+        retries, deactivated = deliver_webhooks(
+            json.loads(json.dumps(deliveries, cls=DjangoJSONEncoder))
         )
 
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
-
-        payload = {
-            "event": event,
-            "action": action,
-            "webhook_id": str(webhook.id),
-            "workspace_id": str(webhook.workspace_id),
-            "data": event_data,
-        }
-
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
+        retry_batches = defaultdict(list)
+        for delivery, countdown in retries:
+            retry_batches[countdown].append(delivery)
+        for countdown, retry_deliveries in retry_batches.items():
+            webhook_deliver_batch.apply_async(
+                kwargs={"deliveries": retry_deliveries}, countdown=countdown
             )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
-
-        # Send the webhook event
-        response = requests.post(webhook.url, headers=headers, json=payload, timeout=30)
-
-        # Log the webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=str(response.status_code),
-            response_headers=str(response.headers),
-            response_body=str(response.text),
-            retry_count=str(self.request.retries),
-        )
 
-    except Webhook.DoesNotExist:
-        return
-    except requests.RequestException as e:
-        # Log the failed webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=500,
-            response_headers="",
-            response_body=str(e),
-            retry_count=str(self.request.retries),
-        )
-        # Retry logic
-        if self.request.retries >= self.max_retries:
-            Webhook.objects.filter(pk=webhook.id).update(is_active=False)
-            if webhook:
+        if deactivated:
+            invalidate_workspace_webhooks_many(
+                {webhook.workspace.slug for webhook in deactivated}
+            )
+            current_sites = {
+                str(delivery["webhook"]): delivery["current_site"]
+                for delivery in deliveries
+            }
+            for webhook in deactivated:
                 # send email for the deactivation of the webhook
-                send_webhook_deactivation_email(
-                    webhook_id=webhook.id,
-                    receiver_id=webhook.created_by_id,
-                    reason=str(e),
-                    current_site=current_site,
+                send_webhook_deactivation_email.delay(
+                    webhook_id=str(webhook.id),
+                    receiver_id=str(webhook.created_by_id),
+                    reason="Too many failed requests",
+                    current_site=current_sites.get(str(webhook.id)),
                 )
-            return
-        raise requests.RequestException()
-
+        return
     except Exception as e:
         if settings.DEBUG:
             print(e)
@@ -239,115 +234,22 @@ def send_webhook_deactivation_email(webhook_id, receiver_id, current_site, reaso
         return
 
 
-@shared_task(
-    bind=True,
-    autoretry_for=(requests.RequestException,),
-    retry_backoff=600,
-    max_retries=5,
-    retry_jitter=True,
-)
-def webhook_send_task(
-    self, webhook, slug, event, event_data, action, current_site, activity
-):
-    try:
-        webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
-
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
-
-        # # Your secret key
-        event_data = (
-            json.loads(json.dumps(event_data, cls=DjangoJSONEncoder))
-            if event_data is not None
-            else None
-        )
-
-        activity = (
-            json.loads(json.dumps(activity, cls=DjangoJSONEncoder))
-            if activity is not None
-            else None
-        )
-
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
-
-        payload = {
-            "event": event,
-            "action": action,
-            "webhook_id": str(webhook.id),
-            "workspace_id": str(webhook.workspace_id),
-            "data": event_data,
-            "activity": activity,
-        }
-
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
-            )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
-
-        # Send the webhook event
-        response = requests.post(webhook.url, headers=headers, json=payload, timeout=30)
-
-        # Log the webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=str(response.status_code),
-            response_headers=str(response.headers),
-            response_body=str(response.text),
-            retry_count=str(self.request.retries),
-        )
-
-    except requests.RequestException as e:
-        # Log the failed webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=500,
-            response_headers="",
-            response_body=str(e),
-            retry_count=str(self.request.retries),
-        )
-        # Retry logic
-        if self.request.retries >= self.max_retries:
-            Webhook.objects.filter(pk=webhook.id).update(is_active=False)
-            if webhook:
-                # send email for the deactivation of the webhook
-                send_webhook_deactivation_email(
-                    webhook_id=webhook.id,
-                    receiver_id=webhook.created_by_id,
-                    reason=str(e),
-                    current_site=current_site,
-                )
-            return
-        raise requests.RequestException()
-
-    except Exception as e:
-        if settings.DEBUG:
-            print(e)
-        log_exception(e)
-        return
+@shared_task
+def webhook_send_task(webhook, slug, event, event_data, action, current_site, activity):
+    webhook_deliver_batch(
+        deliveries=[
+            {
+                "webhook": str(webhook),
+                "slug": slug,
+                "event": event,
+                "event_data": event_data,
+                "action": action,
+                "current_site": current_site,
+                "activity": activity,
+                "attempt": 0,
+            }
+        ]
+    )
 
 
 @shared_task
@@ -364,40 +266,136 @@ def webhook_activity(
     old_identifier,
     new_identifier,
 ):
+    # Single activity, kept for the messages already queued
+    webhook_activity_batch(
+        activities=[
+            {
+                "event": event,
+                "event_id": event_id,
+                "verb": verb,
+                "field": field,
+                "old_value": old_value,
+                "new_value": new_value,
+                "actor_id": actor_id,
+                "old_identifier": old_identifier,
+                "new_identifier": new_identifier,
+            }
+        ],
+        slug=slug,
+        current_site=current_site,
+        coalesce=False,
+    )
+
+
+def coalesce_activities(activities):
+    """
+    Group the activities of the same event, object, verb and actor so that they
+    are delivered as one payload listing every changed field
+    """
+    grouped = defaultdict(list)
+    for activity in activities:
+        grouped[
+            (
+                activity["event"],
+                str(activity["event_id"]),
+                activity["verb"],
+                str(activity["actor_id"]),
+            )
+        ].append(activity)
+    return list(grouped.values())
+
+
+@shared_task
+def webhook_activity_batch(activities, slug, current_site, coalesce=None):
+    """
+    Deliver a batch of activities to the webhooks of the workspace, the event
+    data and actor of the batch are serialized once for all the webhooks
+    """
     try:
-        webhooks = Webhook.objects.filter(workspace__slug=slug, is_active=True)
-
-        if event == "project":
-            webhooks = webhooks.filter(project=True)
-
-        if event == "issue":
-            webhooks = webhooks.filter(issue=True)
-
-        if event == "module" or event == "module_issue":
-            webhooks = webhooks.filter(module=True)
-
-        if event == "cycle" or event == "cycle_issue":
-            webhooks = webhooks.filter(cycle=True)
-
-        if event == "issue_comment":
-            webhooks = webhooks.filter(issue_comment=True)
-
-        for webhook in webhooks:
-            webhook_send_task.delay(
-                webhook=webhook.id,
-                slug=slug,
-                event=event,
-                event_data=get_model_data(event=event, event_id=event_id),
-                action=verb,
-                current_site=current_site,
-                activity={
-                    "field": field,
-                    "new_value": new_value,
-                    "old_value": old_value,
-                    "actor": get_model_data(event="user", event_id=actor_id),
-                    "old_identifier": old_identifier,
-                    "new_identifier": new_identifier,
-                },
+        if coalesce is None:
+            coalesce = settings.WEBHOOK_COALESCE_ACTIVITIES
+
+        event_data_cache = {}
+        actor_cache = {}
+        deliveries = []
+
+        def get_event_data(event, event_id):
+            key = (event, str(event_id))
+            if key not in event_data_cache:
+                event_data_cache[key] = get_model_data(event=event, event_id=event_id)
+            return event_data_cache[key]
+
+        def get_actor(actor_id):
+            if str(actor_id) not in actor_cache:
+                actor_cache[str(actor_id)] = get_model_data(
+                    event="user", event_id=actor_id
+                )
+            return actor_cache[str(actor_id)]
+
+        groups = (
+            coalesce_activities(activities)
+            if coalesce
+            else [[activity] for activity in activities]
+        )
+
+        for group in groups:
+            first = group[0]
+            webhook_ids = get_event_webhook_ids(slug=slug, event=first["event"])
+            if not webhook_ids:
+                continue
+
+            try:
+                event_data = get_event_data(first["event"], first["event_id"])
+            except ObjectDoesNotExist:
+                continue
+
+            if coalesce:
+                activity = {
+                    "actor": get_actor(first["actor_id"]),
+                    "changes": [
+                        {
+                            "field": item["field"],
+                            "new_value": item["new_value"],
+                            "old_value": item["old_value"],
+                            "old_identifier": item["old_identifier"],
+                            "new_identifier": item["new_identifier"],
+                        }
+                        for item in group
+                    ],
+                }
+            else:
+                activity = {
+                    "field": first["field"],
+                    "new_value": first["new_value"],
+                    "old_value": first["old_value"],
+                    "actor": get_actor(first["actor_id"]),
+                    "old_identifier": first["old_identifier"],
+                    "new_identifier": first["new_identifier"],
+                }
+
+            for webhook_id in webhook_ids:
+                deliveries.append(
+                    {
+                        "webhook": str(webhook_id),
+                        "slug": slug,
+                        "event": first["event"],
+                        "event_data": event_data,
+                        "action": first["verb"],
+                        "current_site": current_site,
+                        "activity": activity,
+                        "attempt": 0,
+                    }
+                )
+
+        # Deliver in batches so a worker sends them concurrently
+        batch_size = settings.WEBHOOK_DELIVERY_BATCH_SIZE
+        for index in range(0, len(deliveries), batch_size):
+            webhook_deliver_batch.delay(
+                deliveries=json.loads(
+                    json.dumps(
+                        deliveries[index : index + batch_size], cls=DjangoJSONEncoder
+                    )
+                )
             )
         return
     except Exception as e:
@@ -416,18 +414,22 @@ def model_activity(
 ):
     """Function takes in two json and computes differences between keys of both the json"""
     if current_instance is None:
-        webhook_activity.delay(
-            event=model_name,
-            verb="created",
-            field=None,
-            old_value=None,
-            new_value=None,
-            actor_id=actor_id,
+        webhook_activity_batch.delay(
+            activities=[
+                {
+                    "event": model_name,
+                    "event_id": model_id,
+                    "verb": "created",
+                    "field": None,
+                    "old_value": None,
+                    "new_value": None,
+                    "actor_id": actor_id,
+                    "old_identifier": None,
+                    "new_identifier": None,
+                }
+            ],
             slug=slug,
             current_site=origin,
-            event_id=model_id,
-            old_identifier=None,
-            new_identifier=None,
         )
         return
 
@@ -437,24 +439,31 @@ def model_activity(
     )
 
     # Loop through all keys in requested data and check the current value and requested value
+    activities = []
     for key in requested_data:
         # Check if key is present in current instance or not
         if key in current_instance:
             current_value = current_instance.get(key, None)
             requested_value = requested_data.get(key, None)
             if current_value != requested_value:
-                webhook_activity.delay(
-                    event=model_name,
-                    verb="updated",
-                    field=key,
-                    old_value=current_value,
-                    new_value=requested_value,
-                    actor_id=actor_id,
-                    slug=slug,
-                    current_site=origin,
-                    event_id=model_id,
-                    old_identifier=None,
-                    new_identifier=None,
+                activities.append(
+                    {
+                        "event": model_name,
+                        "event_id": model_id,
+                        "verb": "updated",
+                        "field": key,
+                        "old_value": current_value,
+                        "new_value": requested_value,
+                        "actor_id": actor_id,
+                        "old_identifier": None,
+                        "new_identifier": None,
+                    }
                 )
 
+    # Send all the changed fields in one batch
+    if activities:
+        webhook_activity_batch.delay(
+            activities=activities, slug=slug, current_site=origin
+        )
+
     return
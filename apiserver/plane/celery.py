@@ -40,6 +40,18 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.api_logs_task.delete_api_logs",
         "schedule": crontab(hour=0, minute=0),
     },
+    "check-every-minute-to-flush-api-logs": {
+        "task": "plane.bgtasks.api_logs_task.flush_api_logs",
+        "schedule": crontab(minute="*"),
+    },
+    "check-every-minute-to-flush-api-token-last-used": {
+        "task": "plane.bgtasks.api_logs_task.flush_api_token_last_used",
+        "schedule": crontab(minute="*"),
+    },
+    "check-every-five-minutes-to-refresh-analytics-rollups": {
+        "task": "plane.bgtasks.analytics_rollup_task.refresh_analytics_rollups",
+        "schedule": crontab(minute="*/5"),
+    },
     "run-every-6-hours-for-instance-trace": {
         "task": "plane.license.bgtasks.tracer.instance_traces",
         "schedule": crontab(hour="*/6", minute=0),
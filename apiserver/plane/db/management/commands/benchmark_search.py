@@ -0,0 +1,103 @@
+# Python imports
+import time
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+from django.db.models import Q
+
+# Module imports
+from plane.bgtasks.deletion_task import purge
+from plane.bgtasks.dummy_data_task import create_issues, create_project, create_states
+from plane.db.models import Issue, User, Workspace
+from plane.utils.issue_search import search_issues
+
+
+class Command(BaseCommand):
+    help = "Benchmark the issue search against a seeded project of a workspace"
+
+    def add_arguments(self, parser):
+        parser.add_argument("workspace_slug", type=str, help="Workspace to seed")
+        parser.add_argument("email", type=str, help="Creator of the seeded issues")
+        parser.add_argument(
+            "--issues", type=int, default=1000000, help="Issues to seed"
+        )
+        parser.add_argument(
+            "--batch_size", type=int, default=10000, help="Issues seeded per batch"
+        )
+        parser.add_argument(
+            "--query",
+            type=str,
+            action="append",
+            help="Query to time, repeat for several queries",
+        )
+        parser.add_argument(
+            "--runs", type=int, default=5, help="Runs of every query, best is kept"
+        )
+        parser.add_argument(
+            "--keep", action="store_true", help="Keep the seeded project"
+        )
+
+    def seed(self, workspace, user, issue_count, batch_size):
+        project = create_project(workspace=workspace, user_id=user.id)
+        create_states(workspace=workspace, project=project, user_id=user.id)
+        for seeded in range(0, issue_count, batch_size):
+            issues = create_issues(
+                workspace=workspace,
+                project=project,
+                user_id=user.id,
+                issue_count=min(batch_size, issue_count - seeded),
+            )
+            # The dummy issues are bulk created without a search vector
+            Issue.update_search_vectors([issue.id for issue in issues])
+            self.stdout.write(f"Seeded {seeded + len(issues)} issues")
+        return project
+
+    def time_query(self, queryset, runs):
+        # Best of the runs, fetching the first page of results like the search
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            count = len(list(queryset[:100]))
+            timings.append(time.perf_counter() - start)
+        return min(timings) * 1000, count
+
+    def handle(self, *args, **options):
+        if options["issues"] <= 0 or options["batch_size"] <= 0:
+            raise CommandError("Issues and batch size should be greater than 0")
+
+        try:
+            workspace = Workspace.objects.get(slug=options["workspace_slug"])
+            user = User.objects.get(email=options["email"])
+        except (Workspace.DoesNotExist, User.DoesNotExist):
+            raise CommandError("Workspace and user should exist")
+
+        project = self.seed(workspace, user, options["issues"], options["batch_size"])
+        try:
+            issues = Issue.issue_objects.filter(workspace=workspace)
+            for query in options["query"] or [
+                "agent",
+                "management policy",
+                f"{project.identifier}-{options['issues'] // 2}",
+            ]:
+                ranked_ms, ranked_count = self.time_query(
+                    search_issues(query, issues), options["runs"]
+                )
+                # The previous search, substring matches without an index
+                scan_ms, scan_count = self.time_query(
+                    issues.filter(
+                        Q(name__icontains=query)
+                        | Q(sequence_id__icontains=query)
+                        | Q(project__identifier__icontains=query)
+                    ).distinct(),
+                    options["runs"],
+                )
+                self.stdout.write(
+                    f"{query!r}: full-text {ranked_ms:.1f}ms ({ranked_count} results),"
+                    f" substring {scan_ms:.1f}ms ({scan_count} results)"
+                )
+        finally:
+            if not options["keep"]:
+                purge(Issue.all_objects.filter(project=project), delay=0)
+                project.delete(soft=False)
+
+        self.stdout.write(self.style.SUCCESS("Search benchmark completed"))
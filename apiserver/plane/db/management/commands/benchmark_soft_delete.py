@@ -0,0 +1,110 @@
+# Python imports
+import time
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+
+# Module imports
+from plane.bgtasks.deletion_task import (
+    purge,
+    restore_related_objects,
+    soft_delete_related_objects,
+)
+from plane.bgtasks.dummy_data_task import (
+    create_issue_assignees,
+    create_issue_labels,
+    create_issues,
+    create_labels,
+    create_project,
+    create_states,
+)
+from plane.db.models import (
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueLabel,
+    User,
+    Workspace,
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark the soft delete and restore of a seeded project"
+
+    def add_arguments(self, parser):
+        parser.add_argument("workspace_slug", type=str, help="Workspace to seed")
+        parser.add_argument("email", type=str, help="Creator of the seeded issues")
+        parser.add_argument("--issues", type=int, default=100000, help="Issues to seed")
+        parser.add_argument(
+            "--batch_size", type=int, default=10000, help="Issues seeded per batch"
+        )
+        parser.add_argument(
+            "--keep", action="store_true", help="Keep the seeded project"
+        )
+
+    def seed(self, workspace, user, issue_count, batch_size):
+        project = create_project(workspace=workspace, user_id=user.id)
+        create_states(workspace=workspace, project=project, user_id=user.id)
+        create_labels(workspace=workspace, project=project, user_id=user.id)
+        for seeded in range(0, issue_count, batch_size):
+            issues = create_issues(
+                workspace=workspace,
+                project=project,
+                user_id=user.id,
+                issue_count=min(batch_size, issue_count - seeded),
+            )
+            self.stdout.write(f"Seeded {seeded + len(issues)} issues")
+        create_issue_assignees(
+            workspace=workspace,
+            project=project,
+            user_id=user.id,
+            issue_count=issue_count,
+        )
+        create_issue_labels(
+            workspace=workspace,
+            project=project,
+            user_id=user.id,
+            issue_count=issue_count,
+        )
+        return project
+
+    def count_deleted(self, project):
+        # Rows of the project soft deleted along with it
+        return {
+            str(model._meta.verbose_name_plural): model.all_objects.filter(
+                project=project, deleted_at__isnull=False
+            ).count()
+            for model in [Issue, IssueActivity, IssueAssignee, IssueLabel]
+        }
+
+    def handle(self, *args, **options):
+        if options["issues"] <= 0 or options["batch_size"] <= 0:
+            raise CommandError("Issues and batch size should be greater than 0")
+
+        try:
+            workspace = Workspace.objects.get(slug=options["workspace_slug"])
+            user = User.objects.get(email=options["email"])
+        except (Workspace.DoesNotExist, User.DoesNotExist):
+            raise CommandError("Workspace and user should exist")
+
+        project = self.seed(workspace, user, options["issues"], options["batch_size"])
+        try:
+            start = time.perf_counter()
+            soft_delete_related_objects("db", "project", project.id)
+            self.stdout.write(
+                f"Soft deleted in {time.perf_counter() - start:.2f}s:"
+                f" {self.count_deleted(project)}"
+            )
+
+            start = time.perf_counter()
+            restore_related_objects("db", "project", project.id)
+            self.stdout.write(
+                f"Restored in {time.perf_counter() - start:.2f}s:"
+                f" {self.count_deleted(project)} still deleted"
+            )
+        finally:
+            if not options["keep"]:
+                purge(Issue.all_objects.filter(project=project), delay=0)
+                project.delete(soft=False)
+
+        self.stdout.write(self.style.SUCCESS("Soft delete benchmark completed"))
@@ -10,6 +10,7 @@ from plane.db.models import (
     Project,
     IssueUserProperty,
 )
+from plane.db.models.workspace import invalidate_member_roles
 
 
 class Command(BaseCommand):
@@ -68,6 +69,7 @@ class Command(BaseCommand):
                 ProjectMember.objects.filter(project=project, member=user).update(
                     is_active=True, sort_order=sort_order, role=role
                 )
+                invalidate_member_roles([user.id])
             else:
                 # Create the project member
                 ProjectMember.objects.create(
@@ -0,0 +1,34 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.db.models import Project
+from plane.utils.analytics_rollup import rebuild_project_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild the analytics rollups of every project or of a workspace"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workspace_slug", type=str, nargs="?", help="Only rebuild this workspace"
+        )
+        parser.add_argument(
+            "--project_id", type=str, nargs="?", help="Only rebuild this project"
+        )
+
+    def handle(self, *args, **options):
+        projects = Project.objects.filter(archived_at__isnull=True)
+        if options["workspace_slug"]:
+            projects = projects.filter(workspace__slug=options["workspace_slug"])
+        if options["project_id"]:
+            projects = projects.filter(pk=options["project_id"])
+
+        rebuilt = 0
+        for project_id in projects.values_list("id", flat=True).iterator():
+            rebuild_project_rollups(project_id)
+            rebuilt += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt the analytics rollups of {rebuilt} projects")
+        )
@@ -0,0 +1,56 @@
+# Django imports
+from django.core.management import BaseCommand, CommandError
+
+# Module imports
+from plane.db.models import Issue, Page
+
+
+class Command(BaseCommand):
+    help = "Build or rebuild the full-text search vectors of issues and pages"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch_size", type=int, default=1000, help="Rows updated per query"
+        )
+        parser.add_argument(
+            "--workspace_id", type=str, nargs="?", help="Only rebuild this workspace"
+        )
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="Only build the rows that were never indexed",
+        )
+
+    def get_batches(self, queryset, batch_size):
+        # Walk the rows by primary key so every batch is an indexed range
+        last_id = None
+        while True:
+            batch = queryset.order_by("id")
+            if last_id is not None:
+                batch = batch.filter(id__gt=last_id)
+            ids = list(batch.values_list("id", flat=True)[:batch_size])
+            if not ids:
+                return
+            yield ids
+            last_id = ids[-1]
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size <= 0:
+            raise CommandError("Batch size should be greater than 0")
+
+        for model in [Issue, Page]:
+            queryset = model.all_objects.all()
+            if options["workspace_id"]:
+                queryset = queryset.filter(workspace_id=options["workspace_id"])
+            if options["missing"]:
+                queryset = queryset.filter(search_vector__isnull=True)
+
+            indexed = 0
+            for ids in self.get_batches(queryset, batch_size):
+                indexed += model.update_search_vectors(ids)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Indexed {indexed} {model._meta.verbose_name_plural.lower()}"
+                )
+            )
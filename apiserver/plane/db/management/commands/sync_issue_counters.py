@@ -0,0 +1,87 @@
+# Django imports
+from django.core.management import BaseCommand, CommandError
+from django.db.models import F, Q
+
+# Module imports
+from plane.db.models import Issue
+
+
+class Command(BaseCommand):
+    help = "Backfill or verify the denormalized counters and current cycle of issues"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch_size", type=int, default=1000, help="Issues updated per query"
+        )
+        parser.add_argument(
+            "--project_id", type=str, nargs="?", help="Only sync this project"
+        )
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only report the issues whose counters are out of sync",
+        )
+
+    def get_batches(self, queryset, batch_size):
+        # Walk the issues by primary key so every batch is an indexed range
+        last_id = None
+        while True:
+            batch = queryset.order_by("id")
+            if last_id is not None:
+                batch = batch.filter(id__gt=last_id)
+            issue_ids = list(batch.values_list("id", flat=True)[:batch_size])
+            if not issue_ids:
+                return
+            yield issue_ids
+            last_id = issue_ids[-1]
+
+    def get_out_of_sync(self, issue_ids):
+        # Compare the stored values with the freshly computed ones
+        expected = {
+            f"expected_{key}": value for key, value in Issue.counter_values().items()
+        }
+        mismatch = Q()
+        for key in expected:
+            field = key.replace("expected_", "", 1)
+            mismatch |= ~Q(**{field: F(key)})
+            if field == "current_cycle_id":
+                mismatch |= Q(
+                    current_cycle_id__isnull=True, **{f"{key}__isnull": False}
+                )
+                mismatch |= Q(
+                    current_cycle_id__isnull=False, **{f"{key}__isnull": True}
+                )
+        return list(
+            Issue.all_objects.filter(pk__in=issue_ids)
+            .annotate(**expected)
+            .filter(mismatch)
+            .values_list("id", flat=True)
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size <= 0:
+            raise CommandError("Batch size should be greater than 0")
+
+        queryset = Issue.all_objects.all()
+        if options["project_id"]:
+            queryset = queryset.filter(project_id=options["project_id"])
+
+        synced = 0
+        out_of_sync = []
+        for issue_ids in self.get_batches(queryset, batch_size):
+            if options["verify"]:
+                out_of_sync.extend(self.get_out_of_sync(issue_ids))
+            else:
+                synced += Issue.update_counters(issue_ids)
+
+        if not options["verify"]:
+            self.stdout.write(self.style.SUCCESS(f"Synced counters of {synced} issues"))
+            return
+
+        if out_of_sync:
+            for issue_id in out_of_sync[:100]:
+                self.stdout.write(str(issue_id))
+            raise CommandError(f"{len(out_of_sync)} issues have out of sync counters")
+
+        self.stdout.write(self.style.SUCCESS("All issue counters are in sync"))
@@ -0,0 +1,100 @@
+# Python imports
+import math
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+
+# Module imports
+from plane.db.models import CycleStats, ModuleStats
+
+
+class Command(BaseCommand):
+    help = "Backfill or verify the progress stats of cycles and modules"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch_size",
+            type=int,
+            default=500,
+            help="Cycles or modules computed per query",
+        )
+        parser.add_argument(
+            "--project_id", type=str, nargs="?", help="Only sync this project"
+        )
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only report the cycles and modules whose stats are out of sync",
+        )
+
+    def get_batches(self, queryset, batch_size):
+        # Walk the cycles or modules by primary key so every batch is an indexed range
+        last_id = None
+        while True:
+            batch = queryset.order_by("id")
+            if last_id is not None:
+                batch = batch.filter(id__gt=last_id)
+            parent_ids = list(batch.values_list("id", flat=True)[:batch_size])
+            if not parent_ids:
+                return
+            yield parent_ids
+            last_id = parent_ids[-1]
+
+    def get_out_of_sync(self, model, parent_ids):
+        # Compare the stored stats with the freshly computed ones
+        expected = model.compute(parent_ids)
+        fields = model.stat_fields()
+        stored = {
+            stats[f"{model.parent_field}_id"]: stats
+            for stats in model.all_objects.filter(
+                **{f"{model.parent_field}_id__in": parent_ids}
+            ).values(f"{model.parent_field}_id", *fields)
+        }
+        out_of_sync = []
+        for parent_id in parent_ids:
+            if parent_id not in stored and parent_id not in expected:
+                # Never computed and without issues, read as zero
+                continue
+            stats = stored.get(parent_id, {})
+            values = expected.get(parent_id, {})
+            if any(
+                not math.isclose(stats.get(field, 0), values.get(field, 0))
+                for field in fields
+            ):
+                out_of_sync.append(parent_id)
+        return out_of_sync
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size <= 0:
+            raise CommandError("Batch size should be greater than 0")
+
+        synced = 0
+        out_of_sync = []
+        for model in [CycleStats, ModuleStats]:
+            queryset = model._meta.get_field(model.parent_field).related_model.objects
+            if options["project_id"]:
+                queryset = queryset.filter(project_id=options["project_id"])
+            for parent_ids in self.get_batches(queryset, batch_size):
+                if options["verify"]:
+                    out_of_sync.extend(
+                        f"{model.parent_field} {parent_id}"
+                        for parent_id in self.get_out_of_sync(model, parent_ids)
+                    )
+                else:
+                    synced += model.refresh(parent_ids)
+
+        if not options["verify"]:
+            self.stdout.write(
+                self.style.SUCCESS(f"Synced stats of {synced} cycles and modules")
+            )
+            return
+
+        if out_of_sync:
+            for parent in out_of_sync[:100]:
+                self.stdout.write(parent)
+            raise CommandError(
+                f"{len(out_of_sync)} cycles and modules have out of sync stats"
+            )
+
+        self.stdout.write(self.style.SUCCESS("All cycle and module stats are in sync"))
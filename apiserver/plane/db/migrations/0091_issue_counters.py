@@ -0,0 +1,34 @@
+# Generated by Django 4.2.18 on 2026-10-17 10:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0090_rename_dashboard_deprecateddashboard_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='attachment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='current_cycle',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='current_cycle_issues', to='db.cycle'),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='link_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='sub_issues_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
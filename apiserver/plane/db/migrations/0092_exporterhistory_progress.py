@@ -0,0 +1,23 @@
+# Generated by Django 4.2.18 on 2026-10-17 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0091_issue_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exporterhistory',
+            name='processed_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='exporterhistory',
+            name='total_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
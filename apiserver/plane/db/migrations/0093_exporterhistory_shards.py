@@ -0,0 +1,18 @@
+# Generated by Django 4.2.18 on 2026-10-17 12:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0092_exporterhistory_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exporterhistory',
+            name='shards',
+            field=models.JSONField(default=dict),
+        ),
+    ]
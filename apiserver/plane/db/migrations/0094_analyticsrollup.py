@@ -0,0 +1,42 @@
+# Generated by Django 4.2.18 on 2026-10-17 13:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0093_exporterhistory_shards'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsRollup',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('x_axis', models.CharField(blank=True, max_length=64)),
+                ('x_value', models.CharField(max_length=255, null=True)),
+                ('segment', models.CharField(blank=True, max_length=64)),
+                ('segment_value', models.CharField(max_length=255, null=True)),
+                ('issue_count', models.PositiveIntegerField(default=0)),
+                ('estimate', models.FloatField(null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Analytics Rollup',
+                'verbose_name_plural': 'Analytics Rollups',
+                'db_table': 'analytics_rollups',
+                'ordering': ('-created_at',),
+                'indexes': [models.Index(fields=['workspace', 'x_axis', 'segment'], name='analytics_rollup_axis_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.18 on 2026-10-17 16:05
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # The indexes are built concurrently to keep the tables writable
+    atomic = False
+
+    dependencies = [
+        ('db', '0095_cyclestats_modulestats'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='issue',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='page',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='issue_search_vector_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='issue_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='page',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='page_search_vector_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='page',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='page_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
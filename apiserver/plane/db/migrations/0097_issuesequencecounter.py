@@ -0,0 +1,35 @@
+# Generated by Django 4.2.18 on 2026-10-17 16:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0096_issue_page_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueSequenceCounter',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('last_sequence', models.PositiveBigIntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='issue_sequence_counter', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+            ],
+            options={
+                'verbose_name': 'Issue Sequence Counter',
+                'verbose_name_plural': 'Issue Sequence Counters',
+                'db_table': 'issue_sequence_counters',
+                'ordering': ('-created_at',),
+            },
+        ),
+    ]
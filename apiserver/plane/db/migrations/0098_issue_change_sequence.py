@@ -0,0 +1,97 @@
+# Generated by Django 4.2.18 on 2026-10-17 17:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+# Every write of an issue takes the next value of the sequence, except the
+# writes changing nothing but the search vector. Values set explicitly above
+# the current one, as by the triggers of the related tables, are kept.
+ISSUE_CHANGE_SEQUENCE_SQL = """
+CREATE SEQUENCE IF NOT EXISTS issue_change_sequence;
+
+UPDATE issues SET change_sequence = nextval('issue_change_sequence');
+
+CREATE OR REPLACE FUNCTION set_issue_change_sequence() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        IF COALESCE(NEW.change_sequence, 0) > COALESCE(OLD.change_sequence, 0) THEN
+            RETURN NEW;
+        END IF;
+        IF to_jsonb(NEW) - 'search_vector' - 'change_sequence'
+            = to_jsonb(OLD) - 'search_vector' - 'change_sequence' THEN
+            NEW.change_sequence := OLD.change_sequence;
+            RETURN NEW;
+        END IF;
+    END IF;
+    NEW.change_sequence := nextval('issue_change_sequence');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER issue_change_sequence_trigger
+    BEFORE INSERT OR UPDATE ON issues
+    FOR EACH ROW EXECUTE FUNCTION set_issue_change_sequence();
+
+CREATE OR REPLACE FUNCTION touch_issue_change_sequence() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'DELETE' THEN
+        UPDATE issues SET change_sequence = nextval('issue_change_sequence')
+        WHERE id = NEW.issue_id;
+    END IF;
+    IF TG_OP = 'DELETE'
+        OR (TG_OP = 'UPDATE' AND OLD.issue_id IS DISTINCT FROM NEW.issue_id) THEN
+        UPDATE issues SET change_sequence = nextval('issue_change_sequence')
+        WHERE id = OLD.issue_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER issue_labels_change_sequence_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON issue_labels
+    FOR EACH ROW EXECUTE FUNCTION touch_issue_change_sequence();
+
+CREATE TRIGGER issue_assignees_change_sequence_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON issue_assignees
+    FOR EACH ROW EXECUTE FUNCTION touch_issue_change_sequence();
+
+CREATE TRIGGER module_issues_change_sequence_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON module_issues
+    FOR EACH ROW EXECUTE FUNCTION touch_issue_change_sequence();
+"""
+
+REVERSE_ISSUE_CHANGE_SEQUENCE_SQL = """
+DROP TRIGGER IF EXISTS module_issues_change_sequence_trigger ON module_issues;
+DROP TRIGGER IF EXISTS issue_assignees_change_sequence_trigger ON issue_assignees;
+DROP TRIGGER IF EXISTS issue_labels_change_sequence_trigger ON issue_labels;
+DROP FUNCTION IF EXISTS touch_issue_change_sequence();
+DROP TRIGGER IF EXISTS issue_change_sequence_trigger ON issues;
+DROP FUNCTION IF EXISTS set_issue_change_sequence();
+DROP SEQUENCE IF EXISTS issue_change_sequence;
+"""
+
+
+class Migration(migrations.Migration):
+    # The index is built concurrently to keep the issues writable
+    atomic = False
+
+    dependencies = [
+        ('db', '0097_issuesequencecounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='change_sequence',
+            field=models.BigIntegerField(editable=False, null=True),
+        ),
+        migrations.RunSQL(
+            ISSUE_CHANGE_SEQUENCE_SQL,
+            reverse_sql=REVERSE_ISSUE_CHANGE_SEQUENCE_SQL,
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=models.Index(fields=['project', 'change_sequence'], name='issue_change_sequence_idx'),
+        ),
+    ]
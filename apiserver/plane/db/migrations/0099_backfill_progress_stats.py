@@ -0,0 +1,113 @@
+# Generated by Django 4.2.18 on 2026-10-17 18:10
+
+from django.db import migrations, models
+from django.db.models.functions import Cast
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "completed", "cancelled"]
+
+STAT_FIELDS = [f"{group}_issues" for group in ["total"] + STATE_GROUPS] + [
+    f"{group}_estimate_points" for group in ["total"] + STATE_GROUPS
+]
+
+
+def get_issues(apps):
+    # The filters of Issue.issue_objects, custom managers are not available
+    # on the historical models
+    Issue = apps.get_model("db", "Issue")
+    return (
+        Issue.objects.filter(
+            models.Q(issue_intake__status__in=[1, -1, 2])
+            | models.Q(issue_intake__isnull=True)
+        )
+        .filter(deleted_at__isnull=True, state__is_triage=False)
+        .exclude(archived_at__isnull=False)
+        .exclude(project__archived_at__isnull=False)
+        .exclude(is_draft=True)
+    )
+
+
+def compute_stats(apps, relation, parent_field, parent_ids):
+    # Same grouped aggregate as ProgressStats.compute
+    lookup = f"{relation}__{parent_field}_id"
+    points = Cast("estimate_point__value", models.FloatField())
+    is_points = models.Q(estimate_point__estimate__type="points")
+    aggregates = {
+        "total_issues": models.Count("id"),
+        "total_estimate_points": models.Sum(points, filter=is_points),
+    }
+    for group in STATE_GROUPS:
+        aggregates[f"{group}_issues"] = models.Count(
+            "id", filter=models.Q(state__group=group)
+        )
+        aggregates[f"{group}_estimate_points"] = models.Sum(
+            points, filter=is_points & models.Q(state__group=group)
+        )
+
+    rows = (
+        get_issues(apps)
+        .filter(
+            **{
+                f"{lookup}__in": parent_ids,
+                f"{relation}__deleted_at__isnull": True,
+            }
+        )
+        .values(lookup)
+        .annotate(**aggregates)
+        .order_by()
+    )
+    stats = {}
+    for row in rows:
+        parent_id = row.pop(lookup)
+        stats[parent_id] = {field: value or 0 for field, value in row.items()}
+    return stats
+
+
+def backfill_stats(apps, stats_model, parent_model, relation, parent_field):
+    Stats = apps.get_model("db", stats_model)
+    Parent = apps.get_model("db", parent_model)
+    parents = list(
+        Parent.objects.filter(deleted_at__isnull=True)
+        .order_by("id")
+        .values("id", "project_id", "workspace_id")
+    )
+    for index in range(0, len(parents), 500):
+        batch = parents[index : index + 500]
+        stats = compute_stats(
+            apps, relation, parent_field, [parent["id"] for parent in batch]
+        )
+        Stats.objects.bulk_create(
+            [
+                Stats(
+                    **{f"{parent_field}_id": parent["id"]},
+                    project_id=parent["project_id"],
+                    workspace_id=parent["workspace_id"],
+                    deleted_at=None,
+                    **stats.get(parent["id"], {}),
+                )
+                for parent in batch
+            ],
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=[parent_field],
+            update_fields=STAT_FIELDS + ["deleted_at", "updated_at"],
+        )
+
+
+def backfill_progress_stats(apps, schema_editor):
+    backfill_stats(apps, "CycleStats", "Cycle", "issue_cycle", "cycle")
+    backfill_stats(apps, "ModuleStats", "Module", "issue_module", "module")
+
+
+class Migration(migrations.Migration):
+    # Every chunk of stats is committed on its own
+    atomic = False
+
+    dependencies = [
+        ('db', '0098_issue_change_sequence'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_progress_stats, reverse_code=migrations.RunPython.noop
+        ),
+    ]
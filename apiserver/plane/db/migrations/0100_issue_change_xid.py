@@ -0,0 +1,85 @@
+# Generated by Django 4.2.18 on 2026-10-17 18:40
+
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+# Every change of an issue is also stamped with the id of the writing
+# transaction, the change feed only reads the changes of transactions older
+# than any in progress
+ISSUE_CHANGE_XID_SQL = """
+ALTER TABLE issues DISABLE TRIGGER issue_change_sequence_trigger;
+UPDATE issues SET change_xid = 0;
+ALTER TABLE issues ENABLE TRIGGER issue_change_sequence_trigger;
+
+CREATE OR REPLACE FUNCTION set_issue_change_sequence() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        IF COALESCE(NEW.change_sequence, 0) > COALESCE(OLD.change_sequence, 0) THEN
+            NEW.change_xid := txid_current();
+            RETURN NEW;
+        END IF;
+        IF to_jsonb(NEW) - 'search_vector' - 'change_sequence' - 'change_xid'
+            = to_jsonb(OLD) - 'search_vector' - 'change_sequence' - 'change_xid' THEN
+            NEW.change_sequence := OLD.change_sequence;
+            NEW.change_xid := OLD.change_xid;
+            RETURN NEW;
+        END IF;
+    END IF;
+    NEW.change_sequence := nextval('issue_change_sequence');
+    NEW.change_xid := txid_current();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+REVERSE_ISSUE_CHANGE_XID_SQL = """
+CREATE OR REPLACE FUNCTION set_issue_change_sequence() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        IF COALESCE(NEW.change_sequence, 0) > COALESCE(OLD.change_sequence, 0) THEN
+            RETURN NEW;
+        END IF;
+        IF to_jsonb(NEW) - 'search_vector' - 'change_sequence'
+            = to_jsonb(OLD) - 'search_vector' - 'change_sequence' THEN
+            NEW.change_sequence := OLD.change_sequence;
+            RETURN NEW;
+        END IF;
+    END IF;
+    NEW.change_sequence := nextval('issue_change_sequence');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+    # The indexes are built and dropped concurrently to keep the issues writable
+    atomic = False
+
+    dependencies = [
+        ('db', '0099_backfill_progress_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='change_xid',
+            field=models.BigIntegerField(editable=False, null=True),
+        ),
+        migrations.RunSQL(
+            ISSUE_CHANGE_XID_SQL,
+            reverse_sql=REVERSE_ISSUE_CHANGE_XID_SQL,
+        ),
+        RemoveIndexConcurrently(
+            model_name='issue',
+            name='issue_change_sequence_idx',
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=models.Index(fields=['project', 'change_xid', 'change_sequence'], name='issue_change_xid_sequence_idx'),
+        ),
+    ]
@@ -1,4 +1,4 @@
-from .analytic import AnalyticView
+from .analytic import AnalyticView, AnalyticsRollup
 from .api import APIActivityLog, APIToken
 from .asset import FileAsset
 from .base import BaseModel
@@ -39,6 +39,7 @@ from .issue import (
     IssueReaction,
     IssueRelation,
     IssueSequence,
+    IssueSequenceCounter,
     IssueSubscriber,
     IssueVote,
     IssueVersion,
@@ -47,6 +48,7 @@ from .issue import (
 from .module import Module, ModuleIssue, ModuleLink, ModuleMember, ModuleUserProperties
 from .notification import EmailNotificationLog, Notification, UserNotificationPreference
 from .page import Page, PageLabel, PageLog, ProjectPage, PageVersion
+from .progress_stats import CycleStats, ModuleStats
 from .project import (
     Project,
     ProjectBaseModel,
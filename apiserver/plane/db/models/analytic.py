@@ -1,7 +1,24 @@
 # Django models
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
+# Module imports
+from plane.db.signals import post_bulk_soft_delete
+from plane.settings.redis import redis_instance
 from .base import BaseModel
+from .project import ProjectBaseModel
+
+ANALYTICS_ROLLUP_STALE_KEY = "analytics_rollup_stale"
+
+
+def mark_rollups_stale(project_ids):
+    """Queue the rollups of the projects to be rebuilt once the changes commit"""
+    project_ids = [str(project_id) for project_id in project_ids if project_id]
+    if project_ids:
+        transaction.on_commit(
+            lambda: redis_instance().sadd(ANALYTICS_ROLLUP_STALE_KEY, *project_ids)
+        )
 
 
 class AnalyticView(BaseModel):
@@ -22,3 +39,74 @@ class AnalyticView(BaseModel):
     def __str__(self):
         """Return name of the analytic view"""
         return f"{self.name} <{self.workspace.name}>"
+
+
+class AnalyticsRollup(ProjectBaseModel):
+    """
+    Issue count and estimate sum of the issues of a project for a value of an
+    analytics axis and, optionally, a value of a segment. The row with an empty
+    axis holds the total issue count of the project.
+    """
+
+    x_axis = models.CharField(max_length=64, blank=True)
+    x_value = models.CharField(max_length=255, null=True)
+    segment = models.CharField(max_length=64, blank=True)
+    segment_value = models.CharField(max_length=255, null=True)
+    issue_count = models.PositiveIntegerField(default=0)
+    estimate = models.FloatField(null=True)
+
+    class Meta:
+        verbose_name = "Analytics Rollup"
+        verbose_name_plural = "Analytics Rollups"
+        db_table = "analytics_rollups"
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["workspace", "x_axis", "segment"],
+                name="analytics_rollup_axis_idx",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.x_axis} {self.segment} <{self.project_id}>"
+
+
+@receiver(post_save, sender="db.Project")
+@receiver(post_save, sender="db.State")
+@receiver(post_save, sender="db.EstimatePoint")
+def mark_project_rollups_stale(sender, instance, created=False, **kwargs):
+    # Archiving a project, the group of a state and the value of a point apply
+    # to every issue of the project
+    if not created:
+        mark_rollups_stale([getattr(instance, "project_id", instance.pk)])
+
+
+@receiver(post_save, sender="db.Label")
+@receiver(post_save, sender="db.Cycle")
+@receiver(post_save, sender="db.Module")
+def mark_deleted_rollups_stale(sender, instance, created=False, **kwargs):
+    # Soft deletes are saves, the relations go with the cascade below
+    if instance.deleted_at is not None:
+        mark_rollups_stale([instance.project_id])
+
+
+@receiver(post_delete, sender="db.State")
+@receiver(post_delete, sender="db.EstimatePoint")
+@receiver(post_delete, sender="db.Label")
+@receiver(post_delete, sender="db.Cycle")
+@receiver(post_delete, sender="db.Module")
+def mark_removed_rollups_stale(sender, instance, **kwargs):
+    mark_rollups_stale([instance.project_id])
+
+
+@receiver(post_bulk_soft_delete, sender="db.IssueLabel")
+@receiver(post_bulk_soft_delete, sender="db.IssueAssignee")
+@receiver(post_bulk_soft_delete, sender="db.CycleIssue")
+@receiver(post_bulk_soft_delete, sender="db.ModuleIssue")
+def mark_rollups_stale_in_bulk(sender, pks, using=None, **kwargs):
+    mark_rollups_stale(
+        sender.all_objects.using(using)
+        .filter(pk__in=pks)
+        .values_list("project_id", flat=True)
+        .distinct()
+    )
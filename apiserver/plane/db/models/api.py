@@ -1,9 +1,13 @@
 # Python imports
+import hashlib
 from uuid import uuid4
 
 # Django imports
 from django.db import models
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from .base import BaseModel
 
@@ -16,6 +20,11 @@ def generate_token():
     return "plane_api_" + uuid4().hex
 
 
+def get_api_token_cache_key(token):
+    # Never keep the raw token in the cache keys
+    return "api_token:" + hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
 class APIToken(BaseModel):
     # Meta information
     label = models.CharField(max_length=255, default=generate_label_token)
@@ -51,6 +60,13 @@ class APIToken(BaseModel):
         return str(self.user.id)
 
 
+@receiver(post_save, sender=APIToken)
+@receiver(post_delete, sender=APIToken)
+def invalidate_api_token_cache(sender, instance, **kwargs):
+    # Revoked, expired or deleted tokens must stop authenticating
+    cache.delete(get_api_token_cache_key(instance.token))
+
+
 class APIActivityLog(BaseModel):
     token_identifier = models.CharField(max_length=255)
 
@@ -56,6 +56,11 @@ class ExporterHistory(BaseModel):
         related_name="workspace_exporters",
     )
     filters = models.JSONField(blank=True, null=True)
+    # Progress of the export
+    total_issues = models.PositiveIntegerField(default=0)
+    processed_issues = models.PositiveIntegerField(default=0)
+    # Status and file part of every shard of the export
+    shards = models.JSONField(default=dict)
 
     class Meta:
         verbose_name = "Exporter"
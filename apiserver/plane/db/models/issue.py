@@ -4,18 +4,28 @@ from uuid import uuid4
 # Django imports
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models, transaction
+from django.db import connection, models, transaction
+from django.db.models.functions import Cast, Coalesce, Concat
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.db.models import Q
 from django import apps
 
+# Third party imports
+from crum import get_current_user
+
 # Module imports
 from plane.utils.html_processor import strip_tags
 from plane.db.mixins import SoftDeletionManager
+from plane.db.signals import post_bulk_soft_delete
 from plane.utils.exception_logger import log_exception
 from .base import BaseModel
+from .progress_stats import get_progress_values
 from .project import ProjectBaseModel
 
 
@@ -170,14 +180,266 @@ class Issue(ProjectBaseModel):
         null=True,
         blank=True,
     )
+    # Denormalized counters, only written through Issue.update_counters
+    link_count = models.PositiveIntegerField(default=0, editable=False)
+    attachment_count = models.PositiveIntegerField(default=0, editable=False)
+    sub_issues_count = models.PositiveIntegerField(default=0, editable=False)
+    current_cycle = models.ForeignKey(
+        "db.Cycle",
+        on_delete=models.SET_NULL,
+        related_name="current_cycle_issues",
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    # Only written through Issue.update_search_vectors
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Set by the database on every change of the issue or of its labels,
+    # assignees and modules with the id of the writing transaction, together
+    # they order the change feed of the project
+    change_sequence = models.BigIntegerField(null=True, editable=False)
+    change_xid = models.BigIntegerField(null=True, editable=False)
 
     issue_objects = IssueManager()
 
+    # Fields maintained by update_counters and never written by save
+    COUNTER_FIELDS = (
+        "link_count",
+        "attachment_count",
+        "sub_issues_count",
+        "current_cycle",
+    )
+
+    # Fields the search vector is built from
+    SEARCH_FIELDS = ("name", "description_html", "description_stripped", "sequence_id")
+
     class Meta:
         verbose_name = "Issue"
         verbose_name_plural = "Issues"
         db_table = "issues"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(fields=["search_vector"], name="issue_search_vector_idx"),
+            GinIndex(
+                fields=["name"], name="issue_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+            models.Index(
+                fields=["project", "change_xid", "change_sequence"],
+                name="issue_change_xid_sequence_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Keep the loaded parent to refresh both parents when it changes
+        instance._loaded_parent_id = instance.__dict__.get("parent_id")
+        # Keep the loaded progress values to skip the saves not changing them
+        instance._loaded_progress = get_progress_values(instance)
+        return instance
+
+    @classmethod
+    def counter_values(cls):
+        """Expressions computing the counters from the related rows"""
+        from plane.db.models import CycleIssue, FileAsset
+
+        return {
+            "link_count": Coalesce(
+                models.Subquery(
+                    IssueLink.objects.filter(issue=models.OuterRef("id"))
+                    .order_by()
+                    .annotate(count=models.Func(models.F("id"), function="Count"))
+                    .values("count")
+                ),
+                0,
+            ),
+            "attachment_count": Coalesce(
+                models.Subquery(
+                    FileAsset.objects.filter(
+                        issue_id=models.OuterRef("id"),
+                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+                    )
+                    .order_by()
+                    .annotate(count=models.Func(models.F("id"), function="Count"))
+                    .values("count")
+                ),
+                0,
+            ),
+            "sub_issues_count": Coalesce(
+                models.Subquery(
+                    Issue.issue_objects.filter(parent=models.OuterRef("id"))
+                    .order_by()
+                    .annotate(count=models.Func(models.F("id"), function="Count"))
+                    .values("count")
+                ),
+                0,
+            ),
+            "current_cycle_id": models.Subquery(
+                CycleIssue.objects.filter(
+                    issue=models.OuterRef("id"), deleted_at__isnull=True
+                ).values("cycle_id")[:1]
+            ),
+        }
+
+    @classmethod
+    def update_counters(cls, issue_ids):
+        """Recompute the counters and current cycle of the given issues"""
+        issue_ids = [issue_id for issue_id in issue_ids if issue_id is not None]
+        if not issue_ids:
+            return 0
+        return cls.all_objects.filter(pk__in=issue_ids).update(
+            **cls.counter_values()
+        )
+
+    @classmethod
+    def search_vector_value(cls):
+        """
+        Expression of the weighted search vector over the identifier, name and
+        description of the issue
+        """
+        from plane.db.models import Project
+
+        identifier = Concat(
+            models.Subquery(
+                Project.all_objects.filter(pk=models.OuterRef("project_id")).values(
+                    "identifier"
+                )[:1]
+            ),
+            models.Value("-"),
+            Cast("sequence_id", models.CharField()),
+        )
+        return (
+            SearchVector(identifier, weight="A", config="simple")
+            + SearchVector("name", weight="A", config="simple")
+            + SearchVector(
+                Coalesce(
+                    "description_stripped",
+                    models.Value(""),
+                    output_field=models.TextField(),
+                ),
+                weight="C",
+                config="simple",
+            )
+        )
+
+    @classmethod
+    def update_search_vectors(cls, issue_ids):
+        """Recompute the search vectors of the given issues"""
+        issue_ids = [issue_id for issue_id in issue_ids if issue_id is not None]
+        if not issue_ids:
+            return 0
+        return cls.all_objects.filter(pk__in=issue_ids).update(
+            search_vector=cls.search_vector_value()
+        )
+
+    @classmethod
+    def create_in_bulk(
+        cls, project_id, workspace_id, issues, assignee_ids=None, label_ids=None
+    ):
+        """
+        Insert new issues of the project along with their sequences, assignees
+        and labels in a constant number of queries. assignee_ids and label_ids
+        hold the ids of every issue, in the order of the issues.
+        """
+        from plane.db.models import State
+
+        if not issues:
+            return []
+        user = get_current_user()
+        user_id = None if user is None or user.is_anonymous else user.id
+
+        states = State.objects.filter(~models.Q(is_triage=True), project_id=project_id)
+        default_state = None
+        if any(issue.state_id is None for issue in issues):
+            default_state = states.filter(default=True).first() or states.first()
+
+        # Same defaults as save, computed once for all the issues
+        first_sequence = IssueSequenceCounter.allocate(project_id, len(issues))
+        for index, issue in enumerate(issues):
+            issue.project_id = project_id
+            issue.workspace_id = workspace_id
+            issue.created_by_id = user_id
+            issue.updated_by_id = user_id
+            issue.sequence_id = first_sequence + index
+            if issue.state_id is None:
+                issue.state = default_state
+            else:
+                issue.completed_at = (
+                    timezone.now() if issue.state.group == "completed" else None
+                )
+            issue.description_stripped = (
+                None
+                if (issue.description_html == "" or issue.description_html is None)
+                else strip_tags(issue.description_html)
+            )
+
+        # Each issue goes after the previous ones of its state
+        largest_sort_orders = dict(
+            Issue.objects.filter(
+                project_id=project_id, state_id__in={issue.state_id for issue in issues}
+            )
+            .values("state_id")
+            .annotate(largest=models.Max("sort_order"))
+            .values_list("state_id", "largest")
+            .order_by()
+        )
+        for issue in issues:
+            largest_sort_order = largest_sort_orders.get(issue.state_id)
+            if largest_sort_order is not None:
+                issue.sort_order = largest_sort_order + 10000
+            largest_sort_orders[issue.state_id] = issue.sort_order
+
+        assignee_ids = assignee_ids or [[] for _ in issues]
+        label_ids = label_ids or [[] for _ in issues]
+        with transaction.atomic():
+            issues = cls.objects.bulk_create(issues, batch_size=500)
+            IssueSequence.objects.bulk_create(
+                [
+                    IssueSequence(
+                        issue=issue,
+                        sequence=issue.sequence_id,
+                        project_id=project_id,
+                        workspace_id=workspace_id,
+                    )
+                    for issue in issues
+                ],
+                batch_size=500,
+            )
+            IssueAssignee.objects.bulk_create(
+                [
+                    IssueAssignee(
+                        assignee_id=assignee_id,
+                        issue=issue,
+                        project_id=project_id,
+                        workspace_id=workspace_id,
+                        created_by_id=user_id,
+                        updated_by_id=user_id,
+                    )
+                    for issue, ids in zip(issues, assignee_ids)
+                    for assignee_id in ids
+                ],
+                batch_size=500,
+            )
+            IssueLabel.objects.bulk_create(
+                [
+                    IssueLabel(
+                        label_id=label_id,
+                        issue=issue,
+                        project_id=project_id,
+                        workspace_id=workspace_id,
+                        created_by_id=user_id,
+                        updated_by_id=user_id,
+                    )
+                    for issue, ids in zip(issues, label_ids)
+                    for label_id in ids
+                ],
+                batch_size=500,
+            )
+
+        # bulk_create skips the post_save receivers
+        cls.update_search_vectors([issue.id for issue in issues])
+        cls.update_counters({issue.parent_id for issue in issues})
+        return issues
 
     def save(self, *args, **kwargs):
         if self.state is None:
@@ -208,13 +470,9 @@ class Issue(ProjectBaseModel):
                 pass
 
         if self._state.adding:
+            # Reserved before the transaction, concurrent creates never wait on it
+            self.sequence_id = IssueSequenceCounter.allocate(self.project_id)
             with transaction.atomic():
-                last_sequence = (
-                    IssueSequence.objects.filter(project=self.project)
-                    .select_for_update()
-                    .aggregate(largest=models.Max("sequence"))["largest"]
-                )
-                self.sequence_id = last_sequence + 1 if last_sequence else 1
                 # Strip the html tags using html parser
                 self.description_stripped = (
                     None
@@ -239,6 +497,18 @@ class Issue(ProjectBaseModel):
                 if (self.description_html == "" or self.description_html is None)
                 else strip_tags(self.description_html)
             )
+            # Never overwrite the counters with the values loaded in memory
+            if kwargs.get("update_fields") is None:
+                deferred_fields = self.get_deferred_fields()
+                kwargs["update_fields"] = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key
+                    and field.name not in self.COUNTER_FIELDS
+                    and field.name
+                    not in ("search_vector", "change_sequence", "change_xid")
+                    and field.attname not in deferred_fields
+                ]
             super(Issue, self).save(*args, **kwargs)
 
     def __str__(self):
@@ -532,6 +802,53 @@ class IssueLabel(ProjectBaseModel):
         return f"{self.issue.name} {self.label.name}"
 
 
+class IssueSequenceCounter(BaseModel):
+    """Last sequence id handed out to the issues of a project"""
+
+    project = models.OneToOneField(
+        "db.Project", on_delete=models.CASCADE, related_name="issue_sequence_counter"
+    )
+    last_sequence = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Sequence Counter"
+        verbose_name_plural = "Issue Sequence Counters"
+        db_table = "issue_sequence_counters"
+        ordering = ("-created_at",)
+
+    @classmethod
+    def allocate(cls, project_id, count=1):
+        """
+        Reserve count consecutive sequence ids of the project in a single
+        statement and return the first one. The counter of a project starts
+        after the largest sequence it already used.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {cls._meta.db_table}
+                    (id, created_at, updated_at, project_id, last_sequence)
+                VALUES (
+                    %s, now(), now(), %s,
+                    COALESCE(
+                        (
+                            SELECT MAX(sequence) FROM {IssueSequence._meta.db_table}
+                            WHERE project_id = %s
+                        ),
+                        0
+                    ) + %s
+                )
+                ON CONFLICT (project_id) DO UPDATE
+                SET last_sequence = {cls._meta.db_table}.last_sequence + %s,
+                    updated_at = now()
+                RETURNING last_sequence
+                """,
+                [uuid4(), project_id, project_id, count, count],
+            )
+            last_sequence = cursor.fetchone()[0]
+        return last_sequence - count + 1
+
+
 class IssueSequence(ProjectBaseModel):
     issue = models.ForeignKey(
         Issue,
@@ -820,3 +1137,58 @@ class IssueDescriptionVersion(ProjectBaseModel):
         except Exception as e:
             log_exception(e)
             return False
+
+
+@receiver(post_save, sender=Issue)
+@receiver(post_delete, sender=Issue)
+def update_parent_issue_counters(sender, instance, **kwargs):
+    # The sub issue count of the parent depends on every field of the children
+    Issue.update_counters(
+        {instance.parent_id, getattr(instance, "_loaded_parent_id", None)}
+    )
+    instance._loaded_parent_id = instance.parent_id
+
+
+@receiver(post_save, sender=Issue)
+def update_issue_search_vector(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not set(Issue.SEARCH_FIELDS) & set(update_fields):
+        return
+    Issue.update_search_vectors([instance.id])
+
+
+@receiver(post_bulk_soft_delete, sender=Issue)
+def update_parent_issue_counters_in_bulk(sender, pks, **kwargs):
+    Issue.update_counters(
+        set(
+            Issue.all_objects.filter(pk__in=pks, parent__isnull=False).values_list(
+                "parent_id", flat=True
+            )
+        )
+    )
+
+
+@receiver(post_save, sender=IssueLink)
+@receiver(post_delete, sender=IssueLink)
+@receiver(post_save, sender="db.CycleIssue")
+@receiver(post_delete, sender="db.CycleIssue")
+def update_related_issue_counters(sender, instance, **kwargs):
+    # Links and cycle issues are created, soft deleted and restored through save
+    Issue.update_counters([instance.issue_id])
+
+
+@receiver(post_save, sender="db.FileAsset")
+@receiver(post_delete, sender="db.FileAsset")
+def update_attachment_issue_counters(sender, instance, **kwargs):
+    if instance.entity_type == "ISSUE_ATTACHMENT":
+        Issue.update_counters([instance.issue_id])
+
+
+@receiver(post_bulk_soft_delete, sender=IssueLink)
+@receiver(post_bulk_soft_delete, sender="db.CycleIssue")
+@receiver(post_bulk_soft_delete, sender="db.FileAsset")
+def update_related_issue_counters_in_bulk(sender, pks, **kwargs):
+    objects = sender.all_objects.filter(pk__in=pks)
+    if sender._meta.model_name == "fileasset":
+        objects = objects.filter(entity_type="ISSUE_ATTACHMENT")
+    Issue.update_counters(set(objects.values_list("issue_id", flat=True)))
@@ -4,7 +4,12 @@ from django.conf import settings
 from django.utils import timezone
 
 # Django imports
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 
 # Module imports
 from plane.utils.html_processor import strip_tags
@@ -50,12 +55,23 @@ class Page(BaseModel):
     projects = models.ManyToManyField(
         "db.Project", related_name="pages", through="db.ProjectPage"
     )
+    # Only written through Page.update_search_vectors
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Fields the search vector is built from
+    SEARCH_FIELDS = ("name", "description_html", "description_stripped")
 
     class Meta:
         verbose_name = "Page"
         verbose_name_plural = "Pages"
         db_table = "pages"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(fields=["search_vector"], name="page_search_vector_idx"),
+            GinIndex(
+                fields=["name"], name="page_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ]
 
     def __str__(self):
         """Return owner email and page name"""
@@ -70,6 +86,29 @@ class Page(BaseModel):
         )
         super(Page, self).save(*args, **kwargs)
 
+    @classmethod
+    def search_vector_value(cls):
+        """Expression of the weighted search vector over the name and content"""
+        return SearchVector("name", weight="A", config="simple") + SearchVector(
+            Coalesce(
+                "description_stripped",
+                models.Value(""),
+                output_field=models.TextField(),
+            ),
+            weight="C",
+            config="simple",
+        )
+
+    @classmethod
+    def update_search_vectors(cls, page_ids):
+        """Recompute the search vectors of the given pages"""
+        page_ids = [page_id for page_id in page_ids if page_id is not None]
+        if not page_ids:
+            return 0
+        return cls.all_objects.filter(pk__in=page_ids).update(
+            search_vector=cls.search_vector_value()
+        )
+
 
 class PageLog(BaseModel):
     TYPE_CHOICES = (
@@ -187,3 +226,11 @@ class PageVersion(BaseModel):
             else strip_tags(self.description_html)
         )
         super(PageVersion, self).save(*args, **kwargs)
+
+
+@receiver(post_save, sender=Page)
+def update_page_search_vector(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not set(Page.SEARCH_FIELDS) & set(update_fields):
+        return
+    Page.update_search_vectors([instance.id])
@@ -0,0 +1,256 @@
+# Django imports
+from django.db import models
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Module imports
+from plane.db.signals import post_bulk_soft_delete
+from .project import ProjectBaseModel
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "completed", "cancelled"]
+
+# Issue columns the progress of its cycles and modules depends on
+PROGRESS_FIELDS = (
+    "state_id",
+    "estimate_point_id",
+    "archived_at",
+    "is_draft",
+    "deleted_at",
+)
+
+
+def get_progress_values(issue):
+    return tuple(issue.__dict__.get(field) for field in PROGRESS_FIELDS)
+
+
+class ProgressStats(ProjectBaseModel):
+    """
+    Issue counts and estimate points per state group of the issues of a cycle
+    or a module, only written through refresh
+    """
+
+    total_issues = models.PositiveIntegerField(default=0)
+    backlog_issues = models.PositiveIntegerField(default=0)
+    unstarted_issues = models.PositiveIntegerField(default=0)
+    started_issues = models.PositiveIntegerField(default=0)
+    completed_issues = models.PositiveIntegerField(default=0)
+    cancelled_issues = models.PositiveIntegerField(default=0)
+    total_estimate_points = models.FloatField(default=0)
+    backlog_estimate_points = models.FloatField(default=0)
+    unstarted_estimate_points = models.FloatField(default=0)
+    started_estimate_points = models.FloatField(default=0)
+    completed_estimate_points = models.FloatField(default=0)
+    cancelled_estimate_points = models.FloatField(default=0)
+
+    # Name of the relation from the issue and of the field it is grouped by
+    relation = None
+    parent_field = None
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def stat_fields(cls):
+        return [f"{group}_issues" for group in ["total"] + STATE_GROUPS] + [
+            f"{group}_estimate_points" for group in ["total"] + STATE_GROUPS
+        ]
+
+    @classmethod
+    def annotations(cls, *fields):
+        """
+        Expressions reading the stats of a cycle or module queryset, zero for
+        the cycles and modules whose stats were never computed
+        """
+        return {
+            field: Coalesce(
+                models.F(f"stats__{field}"),
+                0,
+                output_field=cls._meta.get_field(field).__class__(),
+            )
+            for field in fields or cls.stat_fields()
+        }
+
+    @classmethod
+    def compute(cls, parent_ids):
+        """Return the stats of the given cycles or modules from their issues"""
+        from plane.db.models import Issue
+
+        lookup = f"{cls.relation}__{cls.parent_field}_id"
+        points = Cast("estimate_point__value", models.FloatField())
+        is_points = models.Q(estimate_point__estimate__type="points")
+        aggregates = {
+            "total_issues": models.Count("id"),
+            "total_estimate_points": models.Sum(points, filter=is_points),
+        }
+        for group in STATE_GROUPS:
+            aggregates[f"{group}_issues"] = models.Count(
+                "id", filter=models.Q(state__group=group)
+            )
+            aggregates[f"{group}_estimate_points"] = models.Sum(
+                points, filter=is_points & models.Q(state__group=group)
+            )
+
+        rows = (
+            Issue.issue_objects.filter(
+                **{
+                    f"{lookup}__in": parent_ids,
+                    f"{cls.relation}__deleted_at__isnull": True,
+                }
+            )
+            .values(lookup)
+            .annotate(**aggregates)
+            .order_by()
+        )
+        stats = {}
+        for row in rows:
+            parent_id = row.pop(lookup)
+            stats[parent_id] = {field: value or 0 for field, value in row.items()}
+        return stats
+
+    @classmethod
+    def refresh(cls, parent_ids):
+        """Recompute the stats of the given cycles or modules"""
+        parent_ids = {parent_id for parent_id in parent_ids if parent_id is not None}
+        if not parent_ids:
+            return 0
+
+        parent_model = cls._meta.get_field(cls.parent_field).related_model
+        parents = parent_model.all_objects.filter(pk__in=parent_ids).values(
+            "id", "project_id", "workspace_id"
+        )
+        stats = cls.compute(parent_ids)
+        rows = [
+            cls(
+                **{f"{cls.parent_field}_id": parent["id"]},
+                project_id=parent["project_id"],
+                workspace_id=parent["workspace_id"],
+                deleted_at=None,
+                **stats.get(parent["id"], {}),
+            )
+            for parent in parents
+        ]
+        cls.all_objects.bulk_create(
+            rows,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=[cls.parent_field],
+            update_fields=cls.stat_fields() + ["deleted_at", "updated_at"],
+        )
+        return len(rows)
+
+    @classmethod
+    def refresh_issues(cls, issue_ids):
+        """Recompute the stats of the cycles or modules of the given issues"""
+        parent_model = cls._meta.get_field(cls.parent_field).related_model
+        return cls.refresh(
+            parent_model.all_objects.filter(
+                **{
+                    f"{cls.relation}__issue_id__in": issue_ids,
+                    f"{cls.relation}__deleted_at__isnull": True,
+                }
+            ).values_list("id", flat=True)
+        )
+
+    @classmethod
+    def refresh_projects(cls, project_ids):
+        """Recompute the stats of every cycle or module of the given projects"""
+        parent_model = cls._meta.get_field(cls.parent_field).related_model
+        return cls.refresh(
+            parent_model.objects.filter(project_id__in=project_ids).values_list(
+                "id", flat=True
+            )
+        )
+
+
+class CycleStats(ProgressStats):
+    cycle = models.OneToOneField(
+        "db.Cycle", on_delete=models.CASCADE, related_name="stats"
+    )
+
+    relation = "issue_cycle"
+    parent_field = "cycle"
+
+    class Meta:
+        verbose_name = "Cycle Stats"
+        verbose_name_plural = "Cycle Stats"
+        db_table = "cycle_stats"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.cycle_id} <{self.project_id}>"
+
+
+class ModuleStats(ProgressStats):
+    module = models.OneToOneField(
+        "db.Module", on_delete=models.CASCADE, related_name="stats"
+    )
+
+    relation = "issue_module"
+    parent_field = "module"
+
+    class Meta:
+        verbose_name = "Module Stats"
+        verbose_name_plural = "Module Stats"
+        db_table = "module_stats"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.module_id} <{self.project_id}>"
+
+
+def refresh_issue_progress(issue_ids):
+    """Recompute the stats of every cycle and module of the given issues"""
+    CycleStats.refresh_issues(issue_ids)
+    ModuleStats.refresh_issues(issue_ids)
+
+
+@receiver(post_save, sender="db.Issue")
+@receiver(post_delete, sender="db.Issue")
+def update_issue_progress_stats(sender, instance, **kwargs):
+    if "created" in kwargs:
+        # Only saves changing the values loaded from the database count, new
+        # issues are added to cycles and modules afterwards
+        loaded = getattr(instance, "_loaded_progress", None)
+        instance._loaded_progress = get_progress_values(instance)
+        if kwargs["created"] or loaded == instance._loaded_progress:
+            return
+    refresh_issue_progress([instance.id])
+
+
+@receiver(post_save, sender="db.CycleIssue")
+@receiver(post_delete, sender="db.CycleIssue")
+def update_cycle_progress_stats(sender, instance, **kwargs):
+    CycleStats.refresh([instance.cycle_id])
+
+
+@receiver(post_save, sender="db.ModuleIssue")
+@receiver(post_delete, sender="db.ModuleIssue")
+def update_module_progress_stats(sender, instance, **kwargs):
+    ModuleStats.refresh([instance.module_id])
+
+
+@receiver(post_bulk_soft_delete, sender="db.Issue")
+def update_issue_progress_stats_in_bulk(sender, pks, **kwargs):
+    refresh_issue_progress(pks)
+
+
+@receiver(post_bulk_soft_delete, sender="db.CycleIssue")
+@receiver(post_bulk_soft_delete, sender="db.ModuleIssue")
+def update_progress_stats_in_bulk(sender, pks, **kwargs):
+    model = CycleStats if sender._meta.model_name == "cycleissue" else ModuleStats
+    model.refresh(
+        sender.all_objects.filter(pk__in=pks).values_list(
+            f"{model.parent_field}_id", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender="db.State")
+@receiver(post_save, sender="db.EstimatePoint")
+def update_project_progress_stats(sender, instance, **kwargs):
+    # The group of a state and the value of a point apply to the whole project
+    if kwargs.get("created"):
+        return
+    CycleStats.refresh_projects([instance.project_id])
+    ModuleStats.refresh_projects([instance.project_id])
@@ -7,12 +7,16 @@ from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from plane.db.mixins import AuditModel
+from plane.db.signals import post_bulk_soft_delete
 
 # Module imports
 from .base import BaseModel
+from .workspace import invalidate_member_roles
 
 ROLE_CHOICES = ((20, "Admin"), (15, "Member"), (5, "Guest"))
 
@@ -322,3 +326,18 @@ class ProjectPublicMember(ProjectBaseModel):
         verbose_name_plural = "Project Public Members"
         db_table = "project_public_members"
         ordering = ("-created_at",)
+
+
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def invalidate_project_member_roles(sender, instance, **kwargs):
+    invalidate_member_roles([instance.member_id])
+
+
+@receiver(post_bulk_soft_delete, sender=ProjectMember)
+def invalidate_project_member_roles_in_bulk(sender, pks, using=None, **kwargs):
+    invalidate_member_roles(
+        ProjectMember.all_objects.using(using)
+        .filter(pk__in=pks)
+        .values_list("member_id", flat=True)
+    )
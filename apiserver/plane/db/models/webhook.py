@@ -4,7 +4,10 @@ from urllib.parse import urlparse
 
 # Django imports
 from django.db import models
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from plane.db.models import BaseModel
@@ -14,6 +17,10 @@ def generate_token():
     return "plane_wh_" + uuid4().hex
 
 
+def get_webhook_cache_key(slug):
+    return f"workspace_webhooks:{slug}"
+
+
 def validate_schema(value):
     parsed_url = urlparse(value)
     if parsed_url.scheme not in ["http", "https"]:
@@ -61,6 +68,13 @@ class Webhook(BaseModel):
         ]
 
 
+@receiver(post_save, sender=Webhook)
+@receiver(post_delete, sender=Webhook)
+def invalidate_webhook_cache(sender, instance, **kwargs):
+    # Drop the cached active webhooks of the workspace used for the fan out
+    cache.delete(get_webhook_cache_key(instance.workspace.slug))
+
+
 class WebhookLog(BaseModel):
     workspace = models.ForeignKey(
         "db.Workspace", on_delete=models.CASCADE, related_name="webhook_logs"
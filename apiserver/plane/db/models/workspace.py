@@ -4,11 +4,15 @@ import pytz
 
 # Django imports
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from .base import BaseModel
+from plane.db.signals import post_bulk_soft_delete
 from plane.utils.constants import RESTRICTED_WORKSPACE_SLUGS
 
 ROLE_CHOICES = ((20, "Admin"), (15, "Member"), (5, "Guest"))
@@ -106,6 +110,19 @@ def get_issue_props():
     return {"subscribed": True, "assigned": True, "created": True, "all_issues": True}
 
 
+def get_member_roles_cache_key(member_id):
+    return f"member_roles:{member_id}"
+
+
+def invalidate_member_roles(member_ids):
+    """Drop the cached workspace and project roles of the members"""
+    keys = [
+        get_member_roles_cache_key(member_id) for member_id in member_ids if member_id
+    ]
+    if keys:
+        cache.delete_many(keys)
+
+
 def slug_validator(value):
     if value in RESTRICTED_WORKSPACE_SLUGS:
         raise ValidationError("Slug is not valid")
@@ -388,7 +405,6 @@ class WorkspaceHomePreference(BaseModel):
         return f"{self.workspace.name} {self.user.email} {self.key}"
 
 
-
 class WorkspaceUserPreference(BaseModel):
     """Preference for the workspace for a user"""
 
@@ -425,3 +441,18 @@ class WorkspaceUserPreference(BaseModel):
         verbose_name_plural = "Workspace User Preferences"
         db_table = "workspace_user_preferences"
         ordering = ("-created_at",)
+
+
+@receiver(post_save, sender=WorkspaceMember)
+@receiver(post_delete, sender=WorkspaceMember)
+def invalidate_workspace_member_roles(sender, instance, **kwargs):
+    invalidate_member_roles([instance.member_id])
+
+
+@receiver(post_bulk_soft_delete, sender=WorkspaceMember)
+def invalidate_workspace_member_roles_in_bulk(sender, pks, using=None, **kwargs):
+    invalidate_member_roles(
+        WorkspaceMember.all_objects.using(using)
+        .filter(pk__in=pks)
+        .values_list("member_id", flat=True)
+    )
@@ -0,0 +1,6 @@
+# Django imports
+from django.db.models.signals import ModelSignal
+
+# Sent with the primary keys of the objects soft deleted or restored by a
+# single UPDATE, instead of post_save for every object
+post_bulk_soft_delete = ModelSignal(use_caching=True)
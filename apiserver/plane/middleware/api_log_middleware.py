@@ -1,9 +1,43 @@
+# Python imports
+import json
+import random
+
+# Django imports
+from django.conf import settings
+
+# Module imports
+from plane.bgtasks.api_logs_task import API_LOG_BUFFER_KEY, flush_api_logs
 from plane.db.models import APIActivityLog
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+
+def truncate_body(body):
+    if not body:
+        return None
+    if isinstance(body, bytes):
+        body = body[: settings.API_LOG_MAX_BODY_SIZE].decode("utf-8", errors="replace")
+    return body[: settings.API_LOG_MAX_BODY_SIZE]
+
+
+def truncate_fields(record):
+    """Cut the values of the record to the max_length of their field"""
+    for field in APIActivityLog._meta.concrete_fields:
+        value = record.get(field.name)
+        if isinstance(value, str) and field.max_length:
+            record[field.name] = value[: field.max_length]
+    return record
 
 
 class APITokenLogMiddleware:
+    """
+    Buffer the requests made with an API key in redis, the buffer is written
+    to the database in bulk by the flush_api_logs task
+    """
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.redis = None
 
     def __call__(self, request):
         request_body = request.body
@@ -11,29 +45,43 @@ class APITokenLogMiddleware:
         self.process_request(request, response, request_body)
         return response
 
+    def should_log(self, response):
+        # Failed requests are always logged, the others are sampled
+        return (
+            response.status_code >= 400
+            or random.random() < settings.API_LOG_SAMPLE_RATE
+        )
+
     def process_request(self, request, response, request_body):
         api_key_header = "X-Api-Key"
         api_key = request.headers.get(api_key_header)
         # If the API key is present, log the request
-        if api_key:
+        if api_key and self.should_log(response):
             try:
-                APIActivityLog.objects.create(
-                    token_identifier=api_key,
-                    path=request.path,
-                    method=request.method,
-                    query_params=request.META.get("QUERY_STRING", ""),
-                    headers=str(request.headers),
-                    body=(request_body.decode("utf-8") if request_body else None),
-                    response_body=(
-                        response.content.decode("utf-8") if response.content else None
+                record = {
+                    "token_identifier": api_key,
+                    "path": request.path,
+                    "method": request.method,
+                    "query_params": request.META.get("QUERY_STRING", ""),
+                    "headers": str(request.headers),
+                    "body": truncate_body(request_body),
+                    "response_body": (
+                        None if response.streaming else truncate_body(response.content)
                     ),
-                    response_code=response.status_code,
-                    ip_address=request.META.get("REMOTE_ADDR", None),
-                    user_agent=request.META.get("HTTP_USER_AGENT", None),
-                )
-
+                    "response_code": response.status_code,
+                    "ip_address": request.META.get("REMOTE_ADDR", None),
+                    "user_agent": request.META.get("HTTP_USER_AGENT", None),
+                }
+                # A value too long for its column would fail the whole batch
+                truncate_fields(record)
+                if self.redis is None:
+                    self.redis = redis_instance()
+                buffered = self.redis.rpush(API_LOG_BUFFER_KEY, json.dumps(record))
+                # Flush early once a full batch is waiting
+                if buffered == settings.API_LOG_FLUSH_BATCH_SIZE:
+                    flush_api_logs.delay()
             except Exception as e:
-                print(e)
-                # If the token does not exist, you can decide whether to log this as an invalid attempt
+                # Logging must never fail the request
+                log_exception(e)
 
         return None
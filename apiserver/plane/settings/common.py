@@ -338,6 +338,87 @@ SPACE_BASE_URL = os.environ.get("SPACE_BASE_URL", None)
 APP_BASE_URL = os.environ.get("APP_BASE_URL")
 
 HARD_DELETE_AFTER_DAYS = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 60))
+# Rows purged per DELETE and seconds paused between batches by the purges
+HARD_DELETE_BATCH_SIZE = int(os.environ.get("HARD_DELETE_BATCH_SIZE", 1000))
+HARD_DELETE_BATCH_DELAY = float(os.environ.get("HARD_DELETE_BATCH_DELAY", 0.1))
+# Objects soft deleted or restored by a single UPDATE of a cascade
+SOFT_DELETE_BATCH_SIZE = int(os.environ.get("SOFT_DELETE_BATCH_SIZE", 1000))
+
+# Webhooks
+# Set to 1 to send the activities of one epoch as a single payload per webhook,
+# whose activity lists the changes, instead of one payload per changed field
+WEBHOOK_COALESCE_ACTIVITIES = os.environ.get("WEBHOOK_COALESCE_ACTIVITIES", "0") == "1"
+# Seconds the active webhooks of a workspace are cached
+WEBHOOK_CACHE_TIMEOUT = int(os.environ.get("WEBHOOK_CACHE_TIMEOUT", 300))
+# Deliveries sent at once by a worker and at once to a single webhook
+WEBHOOK_DELIVERY_CONCURRENCY = int(os.environ.get("WEBHOOK_DELIVERY_CONCURRENCY", 20))
+WEBHOOK_MAX_CONCURRENCY_PER_WEBHOOK = int(
+    os.environ.get("WEBHOOK_MAX_CONCURRENCY_PER_WEBHOOK", 4)
+)
+WEBHOOK_DELIVERY_BATCH_SIZE = int(os.environ.get("WEBHOOK_DELIVERY_BATCH_SIZE", 100))
+# Keep-alive pools, one per receiving host
+WEBHOOK_POOL_CONNECTIONS = int(os.environ.get("WEBHOOK_POOL_CONNECTIONS", 50))
+WEBHOOK_POOL_MAXSIZE = int(os.environ.get("WEBHOOK_POOL_MAXSIZE", 20))
+WEBHOOK_REQUEST_TIMEOUT = int(os.environ.get("WEBHOOK_REQUEST_TIMEOUT", 30))
+# Retries of failed deliveries, backoff in seconds
+WEBHOOK_MAX_RETRIES = int(os.environ.get("WEBHOOK_MAX_RETRIES", 5))
+WEBHOOK_RETRY_BACKOFF = int(os.environ.get("WEBHOOK_RETRY_BACKOFF", 60))
+WEBHOOK_RETRY_BACKOFF_MAX = int(os.environ.get("WEBHOOK_RETRY_BACKOFF_MAX", 600))
+# Circuit breaker, a webhook is deactivated once its circuit trips
+# WEBHOOK_CIRCUIT_MAX_TRIPS times without a successful delivery
+WEBHOOK_CIRCUIT_THRESHOLD = int(os.environ.get("WEBHOOK_CIRCUIT_THRESHOLD", 5))
+WEBHOOK_CIRCUIT_COOLDOWN = int(os.environ.get("WEBHOOK_CIRCUIT_COOLDOWN", 60))
+WEBHOOK_CIRCUIT_COOLDOWN_MAX = int(os.environ.get("WEBHOOK_CIRCUIT_COOLDOWN_MAX", 3600))
+WEBHOOK_CIRCUIT_MAX_TRIPS = int(os.environ.get("WEBHOOK_CIRCUIT_MAX_TRIPS", 6))
+
+# API logs
+# Share of successful API key requests logged, failed requests are always logged
+API_LOG_SAMPLE_RATE = float(os.environ.get("API_LOG_SAMPLE_RATE", 1))
+# Characters of the request and response bodies kept in a log
+API_LOG_MAX_BODY_SIZE = int(os.environ.get("API_LOG_MAX_BODY_SIZE", 10000))
+API_LOG_FLUSH_BATCH_SIZE = int(os.environ.get("API_LOG_FLUSH_BATCH_SIZE", 500))
+# Seconds an API token is cached in redis and in every process
+API_TOKEN_CACHE_TIMEOUT = int(os.environ.get("API_TOKEN_CACHE_TIMEOUT", 60))
+API_TOKEN_LOCAL_CACHE_TIMEOUT = int(os.environ.get("API_TOKEN_LOCAL_CACHE_TIMEOUT", 10))
+API_TOKEN_LOCAL_CACHE_SIZE = int(os.environ.get("API_TOKEN_LOCAL_CACHE_SIZE", 1024))
+# Seconds between two writes of the last use of a token
+API_TOKEN_LAST_USED_INTERVAL = int(os.environ.get("API_TOKEN_LAST_USED_INTERVAL", 60))
+
+# Seconds the workspace and project roles of a user are cached
+MEMBER_ROLES_CACHE_TIMEOUT = int(os.environ.get("MEMBER_ROLES_CACHE_TIMEOUT", 3600))
+
+# Response cache
+# Seconds an expired response is still served while a single request refreshes it
+RESPONSE_CACHE_STALE_TIMEOUT = int(os.environ.get("RESPONSE_CACHE_STALE_TIMEOUT", 300))
+# Responses smaller than this are stored uncompressed
+RESPONSE_CACHE_COMPRESS_MIN_SIZE = int(
+    os.environ.get("RESPONSE_CACHE_COMPRESS_MIN_SIZE", 1024)
+)
+# Count the hits, misses and stale responses of the response cache
+RESPONSE_CACHE_STATS = os.environ.get("RESPONSE_CACHE_STATS", "1") == "1"
+
+# Exports
+# Issues fetched from the database at a time while exporting
+EXPORT_CHUNK_SIZE = int(os.environ.get("EXPORT_CHUNK_SIZE", 2000))
+# Export files larger than this are spooled to disk
+EXPORT_SPOOL_MAX_SIZE = int(os.environ.get("EXPORT_SPOOL_MAX_SIZE", 32 * 1024 * 1024))
+# Size of the parts of the multipart upload of an export
+EXPORT_UPLOAD_CHUNK_SIZE = int(
+    os.environ.get("EXPORT_UPLOAD_CHUNK_SIZE", 8 * 1024 * 1024)
+)
+# Issues exported by a single shard of a csv or json export
+EXPORT_SHARD_SIZE = int(os.environ.get("EXPORT_SHARD_SIZE", 50000))
+# Retries of a failed export shard before the export fails
+EXPORT_SHARD_MAX_RETRIES = int(os.environ.get("EXPORT_SHARD_MAX_RETRIES", 3))
+
+# Projects whose analytics rollups are rebuilt by a single refresh
+ANALYTICS_ROLLUP_BATCH_SIZE = int(os.environ.get("ANALYTICS_ROLLUP_BATCH_SIZE", 50))
+# Seconds a cycle or module burndown is cached, it is recomputed every day anyway
+BURNDOWN_CACHE_TIMEOUT = int(os.environ.get("BURNDOWN_CACHE_TIMEOUT", 86400))
+# Pending email notification logs claimed by a single digest batch
+EMAIL_DIGEST_BATCH_SIZE = int(os.environ.get("EMAIL_DIGEST_BATCH_SIZE", 1000))
+# Issues accepted by a single bulk create request
+ISSUE_BULK_CREATE_MAX_SIZE = int(os.environ.get("ISSUE_BULK_CREATE_MAX_SIZE", 1000))
 
 # Instance Changelog URL
 INSTANCE_CHANGELOG_URL = os.environ.get("INSTANCE_CHANGELOG_URL", "")
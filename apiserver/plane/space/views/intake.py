@@ -3,7 +3,7 @@ import json
 
 # Django import
 from django.utils import timezone
-from django.db.models import Q, OuterRef, Func, F, Prefetch
+from django.db.models import Q, F, Prefetch
 from django.core.serializers.json import DjangoJSONEncoder
 
 # Third party imports
@@ -12,7 +12,7 @@ from rest_framework.response import Response
 
 # Module imports
 from .base import BaseViewSet
-from plane.db.models import IntakeIssue, Issue, State, IssueLink, FileAsset, DeployBoard
+from plane.db.models import IntakeIssue, Issue, DeployBoard
 from plane.app.serializers import (
     IssueSerializer,
     IntakeIssueSerializer,
@@ -70,27 +70,6 @@ class IntakeIssuePublicViewSet(BaseViewSet):
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels")
             .order_by("issue_intake__snoozed_till", "issue_intake__status")
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
             .prefetch_related(
                 Prefetch(
                     "issue_intake",
@@ -17,10 +17,7 @@ from django.db.models import (
     When,
     JSONField,
     Value,
-    OuterRef,
-    Func,
     CharField,
-    Subquery,
 )
 from django.db.models.functions import Concat
 
@@ -42,7 +39,11 @@ from plane.space.utils.grouper import (
 
 
 from plane.utils.order_queryset import order_issue_queryset
-from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
+from plane.utils.paginator import (
+    GroupedOffsetPaginator,
+    SubGroupedOffsetPaginator,
+    PAGINATOR_COUNT_CACHE_TIMEOUT,
+)
 from plane.app.serializers import (
     CommentReactionSerializer,
     IssueCommentSerializer,
@@ -52,15 +53,12 @@ from plane.app.serializers import (
 from plane.db.models import (
     Issue,
     IssueComment,
-    IssueLink,
     IssueReaction,
     ProjectMember,
     CommentReaction,
     DeployBoard,
     IssueVote,
     ProjectPublicMember,
-    FileAsset,
-    CycleIssue,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.issue_filters import issue_filters
@@ -97,34 +95,7 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
             .prefetch_related(
                 Prefetch("votes", queryset=IssueVote.objects.select_related("actor"))
             )
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
         ).distinct()
 
         issue_queryset = issue_queryset.filter(**filters)
@@ -218,6 +189,8 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
                 on_results=lambda issues: issue_on_results(
                     group_by=group_by, issues=issues, sub_group_by=sub_group_by
                 ),
+                keyset=True,
+                count_cache_timeout=PAGINATOR_COUNT_CACHE_TIMEOUT,
             )
 
 
@@ -645,13 +618,7 @@ class IssueRetrievePublicEndpoint(BaseAPIView):
             )
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
+            .annotate(cycle_id=F("current_cycle_id"))
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
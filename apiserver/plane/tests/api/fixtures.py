@@ -0,0 +1,35 @@
+# Module imports
+from plane.db.models import (
+    Issue,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+
+
+def create_user(email="user@plane.so"):
+    return User.objects.create(email=email, username=email.split("@")[0])
+
+
+def create_workspace(owner, slug="plane"):
+    workspace = Workspace.objects.create(name="Plane", slug=slug, owner=owner)
+    WorkspaceMember.objects.create(workspace=workspace, member=owner, role=20)
+    return workspace
+
+
+def create_project(workspace, member, identifier="PLN"):
+    project = Project.objects.create(
+        name=identifier, identifier=identifier, workspace=workspace
+    )
+    ProjectMember.objects.create(project=project, member=member, role=20)
+    State.objects.create(
+        name="Todo", color="#000000", group="unstarted", default=True, project=project
+    )
+    return project
+
+
+def create_issue(project, name="Issue", **kwargs):
+    return Issue.objects.create(project=project, name=name, **kwargs)
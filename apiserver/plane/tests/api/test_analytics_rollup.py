@@ -0,0 +1,105 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.test import TestCase
+from django.utils import timezone
+
+# Module imports
+from .fixtures import create_issue, create_project, create_user, create_workspace
+from plane.bgtasks.deletion_task import soft_delete_related_objects
+from plane.db.models import Cycle, Issue, IssueLabel, Label, State
+from plane.db.models.analytic import ANALYTICS_ROLLUP_STALE_KEY
+from plane.utils.analytics_rollup import get_rollup_plot, rebuild_project_rollups
+
+
+@mock.patch("plane.db.models.analytic.redis_instance")
+class RollupStalenessTest(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.workspace = create_workspace(self.user)
+        self.project = create_project(self.workspace, self.user)
+
+    def assertMarkedStale(self, redis_instance, project):
+        redis_instance.return_value.sadd.assert_called_with(
+            ANALYTICS_ROLLUP_STALE_KEY, str(project.id)
+        )
+
+    def test_project_archiving(self, redis_instance):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.archived_at = timezone.now()
+            self.project.save()
+        self.assertMarkedStale(redis_instance, self.project)
+
+    def test_state_group_change(self, redis_instance):
+        state = State.objects.get(project=self.project)
+        with self.captureOnCommitCallbacks(execute=True):
+            state.group = "started"
+            state.save()
+        self.assertMarkedStale(redis_instance, self.project)
+
+    def test_label_deletion(self, redis_instance):
+        label = Label.objects.create(
+            name="Bug", project=self.project, workspace=self.workspace
+        )
+        IssueLabel.objects.create(
+            issue=create_issue(self.project), label=label, project=self.project
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            label.deleted_at = timezone.now()
+            label.save()
+        self.assertMarkedStale(redis_instance, self.project)
+
+        # The issue labels soft deleted along with it
+        redis_instance.reset_mock()
+        with self.captureOnCommitCallbacks(execute=True):
+            soft_delete_related_objects("db", "label", label.id)
+        self.assertMarkedStale(redis_instance, self.project)
+
+    def test_cycle_deletion(self, redis_instance):
+        cycle = Cycle.objects.create(
+            name="Cycle", project=self.project, owned_by=self.user
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            cycle.delete(soft=False)
+        self.assertMarkedStale(redis_instance, self.project)
+
+    def test_new_rows_do_not_mark_projects_stale(self, redis_instance):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            create_project(self.workspace, self.user, identifier="NEW")
+        self.assertEqual(callbacks, [])
+
+
+@mock.patch("plane.db.models.analytic.redis_instance")
+class RollupProjectsTest(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.workspace = create_workspace(self.user)
+        self.project = create_project(self.workspace, self.user)
+        self.archived = create_project(self.workspace, self.user, identifier="ARC")
+        create_issue(self.project, priority="high")
+        create_issue(self.archived, priority="high")
+
+    def test_rollups_follow_the_live_query(self, redis_instance):
+        self.archived.archived_at = timezone.now()
+        self.archived.save()
+        for project in [self.project, self.archived]:
+            rebuild_project_rollups(project.id)
+
+        total, distribution = get_rollup_plot(
+            "plane", "priority", "issue_count", None, {}
+        )
+
+        live_total = Issue.issue_objects.filter(workspace__slug="plane").count()
+        self.assertEqual(total, live_total)
+        self.assertEqual(distribution["high"][0]["count"], live_total)
+
+    def test_missing_rollups_fall_back_to_the_live_query(self, redis_instance):
+        rebuild_project_rollups(self.project.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            rollup = get_rollup_plot("plane", "priority", "issue_count", None, {})
+
+        self.assertIsNone(rollup)
+        self.assertMarkedStale(redis_instance, self.archived)
@@ -0,0 +1,120 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+# Third party imports
+from rest_framework.test import APIClient
+
+# Module imports
+from .fixtures import create_user, create_workspace
+from plane.bgtasks import api_logs_task
+from plane.db.models import APIToken
+from plane.db.models.api import get_api_token_cache_key
+from plane.utils import api_token
+from plane.utils.api_token import LocalTokenCache, resolve_api_token
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class APITokenInvalidationTest(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.workspace = create_workspace(self.user)
+        self.api_token = APIToken.objects.create(
+            user=self.user, workspace=self.workspace
+        )
+        self.key = get_api_token_cache_key(self.api_token.token)
+        # The local cache of the other processes expires on its own, only the
+        # shared cache is invalidated
+        patcher = mock.patch.object(
+            api_token, "local_token_cache", LocalTokenCache(max_size=0)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cache.clear)
+
+    def assertInvalidated(self):
+        self.assertIsNone(cache.get(self.key))
+        self.assertIsNone(resolve_api_token(self.api_token.token))
+
+    def test_token_is_cached(self):
+        self.assertEqual(
+            resolve_api_token(self.api_token.token)["id"], str(self.api_token.id)
+        )
+        with self.assertNumQueries(0):
+            resolve_api_token(self.api_token.token)
+
+    def test_revoke(self):
+        resolve_api_token(self.api_token.token)
+
+        self.api_token.is_active = False
+        self.api_token.save()
+
+        self.assertInvalidated()
+
+    def test_expiry_update(self):
+        resolve_api_token(self.api_token.token)
+
+        self.api_token.expired_at = timezone.now()
+        self.api_token.save()
+
+        self.assertInvalidated()
+
+    @mock.patch("plane.db.mixins.soft_delete_related_objects")
+    def test_delete(self, soft_delete_related_objects):
+        resolve_api_token(self.api_token.token)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.delete(
+            f"/api/workspaces/plane/api-tokens/{self.api_token.id}/"
+        )
+
+        self.assertEqual(response.status_code, 204)
+        self.assertInvalidated()
+
+    def test_hard_delete(self):
+        resolve_api_token(self.api_token.token)
+
+        self.api_token.delete(soft=False)
+
+        self.assertInvalidated()
+
+
+class FlushAPITokenLastUsedTest(TestCase):
+    def setUp(self):
+        user = create_user()
+        workspace = create_workspace(user)
+        self.used = APIToken.objects.create(user=user, workspace=workspace)
+        self.unused = APIToken.objects.create(user=user, workspace=workspace)
+
+    @mock.patch.object(api_logs_task, "redis_instance")
+    def test_last_uses_are_written_in_bulk(self, redis_instance):
+        used_at = timezone.now()
+        pipe = redis_instance.return_value.pipeline.return_value
+        pipe.execute.return_value = (
+            {str(self.used.id).encode(): used_at.isoformat().encode()},
+            1,
+        )
+
+        with self.assertNumQueries(1):
+            api_logs_task.flush_api_token_last_used()
+
+        pipe.hgetall.assert_called_once_with(api_logs_task.API_TOKEN_LAST_USED_KEY)
+        pipe.delete.assert_called_once_with(api_logs_task.API_TOKEN_LAST_USED_KEY)
+        self.used.refresh_from_db()
+        self.unused.refresh_from_db()
+        self.assertEqual(self.used.last_used, used_at)
+        self.assertIsNone(self.unused.last_used)
+
+    @mock.patch.object(api_logs_task, "redis_instance")
+    def test_nothing_to_flush(self, redis_instance):
+        redis_instance.return_value.pipeline.return_value.execute.return_value = ({}, 0)
+
+        with self.assertNumQueries(0):
+            api_logs_task.flush_api_token_last_used()
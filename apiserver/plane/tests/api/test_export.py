@@ -0,0 +1,202 @@
+# Python imports
+import csv
+import io
+from unittest import mock
+
+# Django imports
+from django.test import TestCase, override_settings
+
+# Module imports
+from .fixtures import create_issue, create_project, create_user, create_workspace
+from plane.bgtasks import export_task
+from plane.bgtasks.export_task import (
+    EXPORT_HEADER,
+    export_shard_task,
+    get_export_issues,
+    get_shard_filter,
+    issue_export_task,
+    plan_export_shards,
+)
+from plane.db.models import (
+    ExporterHistory,
+    IssueAssignee,
+    IssueLabel,
+    Label,
+    ProjectMember,
+)
+
+
+class ExportTestCase(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.workspace = create_workspace(self.user)
+        self.project = create_project(self.workspace, self.user)
+
+    def create_exporter(self, provider="csv", shards=None):
+        return ExporterHistory.objects.create(
+            workspace=self.workspace,
+            project=[self.project.id],
+            provider=provider,
+            initiated_by=self.user,
+            shards=shards or {},
+        )
+
+
+@override_settings(EXPORT_SHARD_SIZE=2)
+class PlanExportShardsTest(ExportTestCase):
+    def setUp(self):
+        super().setUp()
+        for _ in range(5):
+            create_issue(self.project)
+
+    def get_shard_sequence_ids(self, shard):
+        return list(
+            get_export_issues(self.workspace.id, shard["projects"], self.user.id)
+            .filter(get_shard_filter(shard))
+            .order_by("sequence_id")
+            .values_list("sequence_id", flat=True)
+        )
+
+    def test_bounds(self):
+        shards, total = plan_export_shards(
+            self.create_exporter(), self.workspace.id, [self.project.id], False
+        )
+
+        self.assertEqual(total, 5)
+        self.assertEqual(
+            [(shard["start"], shard["end"]) for shard in shards.values()],
+            [(None, ["PLN", 3]), (["PLN", 3], ["PLN", 5]), (["PLN", 5], None)],
+        )
+        self.assertTrue(all(shard["status"] == "queued" for shard in shards.values()))
+
+    def test_shard_filters_include_the_start_and_exclude_the_end(self):
+        shards, _ = plan_export_shards(
+            self.create_exporter(), self.workspace.id, [self.project.id], False
+        )
+
+        self.assertEqual(
+            [self.get_shard_sequence_ids(shard) for shard in shards.values()],
+            [[1, 2], [3, 4], [5]],
+        )
+
+    def test_xlsx_is_never_split(self):
+        shards, _ = plan_export_shards(
+            self.create_exporter(provider="xlsx"),
+            self.workspace.id,
+            [self.project.id],
+            False,
+        )
+
+        self.assertEqual(len(shards), 1)
+        self.assertEqual(self.get_shard_sequence_ids(shards["0"]), [1, 2, 3, 4, 5])
+
+    def test_multiple_files(self):
+        other = create_project(self.workspace, self.user, identifier="OTH")
+        create_issue(other)
+
+        shards, total = plan_export_shards(
+            self.create_exporter(), self.workspace.id, [self.project.id, other.id], True
+        )
+
+        self.assertEqual(total, 6)
+        self.assertEqual(
+            [shard["file"] for shard in shards.values()],
+            [str(self.project.id)] * 3 + [str(other.id)],
+        )
+
+
+@mock.patch.object(export_task, "assemble_export_task")
+@mock.patch.object(export_task, "export_shard_task")
+class IssueExportResumeTest(ExportTestCase):
+    def run_export(self, exporter):
+        issue_export_task(
+            "csv",
+            self.workspace.id,
+            [str(self.project.id)],
+            exporter.token,
+            False,
+            "plane",
+        )
+        exporter.refresh_from_db()
+
+    def test_only_unfinished_shards_are_requeued(
+        self, export_shard_task, assemble_export_task
+    ):
+        exporter = self.create_exporter(
+            shards={
+                "0": {"status": "completed", "key": "0"},
+                "1": {"status": "failed", "reason": "timeout"},
+                "2": {"status": "queued"},
+            }
+        )
+
+        self.run_export(exporter)
+
+        self.assertEqual(
+            [call.args[1] for call in export_shard_task.delay.call_args_list],
+            ["1", "2"],
+        )
+        assemble_export_task.delay.assert_not_called()
+        self.assertEqual(exporter.shards["0"]["status"], "completed")
+        self.assertEqual(exporter.shards["1"]["status"], "queued")
+        self.assertEqual(exporter.status, "processing")
+
+    def test_completed_export_is_assembled_again(
+        self, export_shard_task, assemble_export_task
+    ):
+        exporter = self.create_exporter(
+            shards={"0": {"status": "completed", "key": "0"}}
+        )
+
+        self.run_export(exporter)
+
+        export_shard_task.delay.assert_not_called()
+        assemble_export_task.delay.assert_called_once_with(exporter.token, "plane")
+
+
+@mock.patch.object(export_task, "assemble_export_task")
+@mock.patch.object(export_task, "get_s3_client")
+class ExportShardTest(ExportTestCase):
+    def test_m2m_columns_are_not_duplicated(self, get_s3_client, assemble_export_task):
+        issue = create_issue(self.project)
+        for name in ["Bug", "UI"]:
+            label = Label.objects.create(
+                name=name, project=self.project, workspace=self.workspace
+            )
+            IssueLabel.objects.create(issue=issue, label=label, project=self.project)
+        for email in ["ada@plane.so", "alan@plane.so"]:
+            assignee = create_user(email=email)
+            assignee.first_name, assignee.last_name = email.split("@")[0], "Dev"
+            assignee.save()
+            ProjectMember.objects.create(project=self.project, member=assignee)
+            IssueAssignee.objects.create(
+                issue=issue, assignee=assignee, project=self.project
+            )
+
+        uploads = {}
+        get_s3_client.return_value.upload_fileobj.side_effect = (
+            lambda file, bucket, key, **kwargs: uploads.update({key: file.read()})
+        )
+        exporter = self.create_exporter(
+            shards={
+                "0": {
+                    "file": str(self.workspace.id),
+                    "projects": [str(self.project.id)],
+                    "start": None,
+                    "end": None,
+                    "status": "queued",
+                }
+            }
+        )
+
+        export_shard_task(exporter.token, "0", "plane")
+
+        exporter.refresh_from_db()
+        (part,) = uploads.values()
+        (row,) = list(csv.reader(io.StringIO(part.decode("utf-8"))))
+        row = dict(zip(EXPORT_HEADER, row))
+        self.assertEqual(sorted(row["Labels"].split(", ")), ["Bug", "UI"])
+        self.assertEqual(sorted(row["Assignee"].split(", ")), ["ada Dev", "alan Dev"])
+        self.assertEqual(exporter.shards["0"]["status"], "completed")
+        self.assertEqual(exporter.processed_issues, 1)
+        assemble_export_task.delay.assert_called_once_with(exporter.token, "plane")
@@ -0,0 +1,148 @@
+# Django imports
+from django.db.models import Count, F, Q
+from django.test import TestCase
+from django.utils import timezone
+
+# Module imports
+from .fixtures import create_issue, create_project, create_user, create_workspace
+from plane.db.models import Issue, IssueLabel, Label
+from plane.utils.grouper import (
+    issue_group_values,
+    issue_on_results,
+    issue_queryset_grouper,
+)
+from plane.utils.paginator import (
+    Cursor,
+    GroupedOffsetPaginator,
+    SubGroupedOffsetPaginator,
+)
+
+# The count filter the issue views pass to the grouped paginators
+COUNT_FILTER = Q(
+    Q(issue_intake__status=1)
+    | Q(issue_intake__status=-1)
+    | Q(issue_intake__status=2)
+    | Q(issue_intake__isnull=True),
+    archived_at__isnull=True,
+    is_draft=False,
+)
+
+
+class GroupedPaginatorTotalsTest(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.workspace = create_workspace(self.user)
+        self.project = create_project(self.workspace, self.user)
+        self.label_a = Label.objects.create(
+            name="A", project=self.project, workspace=self.workspace
+        )
+        self.label_b = Label.objects.create(
+            name="B", project=self.project, workspace=self.workspace
+        )
+        self.add_issue([self.label_a, self.label_b], priority="high")
+        self.add_issue([self.label_a], priority="high")
+        self.add_issue([], priority="low")
+        # Paged along with the others but left out of the totals
+        self.add_issue([self.label_a], priority="high", archived_at=timezone.now())
+
+    def add_issue(self, labels, **kwargs):
+        issue = create_issue(self.project, **kwargs)
+        for label in labels:
+            IssueLabel.objects.create(issue=issue, label=label, project=self.project)
+        return issue
+
+    def get_queryset(self, group_by, sub_group_by=None):
+        return issue_queryset_grouper(
+            queryset=Issue.objects.filter(project=self.project).annotate(
+                cycle_id=F("current_cycle_id")
+            ),
+            group_by=group_by,
+            sub_group_by=sub_group_by,
+        )
+
+    def get_expected_totals(self, *fields):
+        # The distinct filtered count of every group, as the totals were
+        # computed before they moved into the page window
+        return {
+            tuple(str(group[field]) for field in fields): group["count"]
+            for group in Issue.objects.filter(project=self.project)
+            .values(*fields)
+            .annotate(count=Count("id", filter=COUNT_FILTER, distinct=True))
+            .order_by()
+        }
+
+    def paginate(self, paginator, group_by, sub_group_by=None, limit=2):
+        cursor_result = paginator.get_result(limit=limit, cursor=Cursor(limit, 0, 0))
+        results = paginator.process_results(
+            issue_on_results(cursor_result.results, group_by, sub_group_by)
+        )
+        return cursor_result, results
+
+    def test_group_totals_match_the_distinct_count(self):
+        for group_by in ["labels__id", "state__group", "priority"]:
+            with self.subTest(group_by=group_by):
+                paginator = GroupedOffsetPaginator(
+                    queryset=self.get_queryset(group_by),
+                    group_by_field_name=group_by,
+                    group_by_fields=issue_group_values(
+                        field=group_by, slug="plane", project_id=self.project.id
+                    ),
+                    count_filter=COUNT_FILTER,
+                    order_by="-created_at",
+                )
+                with self.assertNumQueries(1):
+                    cursor_result, results = self.paginate(paginator, group_by)
+
+                expected = self.get_expected_totals(group_by)
+                self.assertEqual(
+                    {
+                        (group,): group_results["total_results"]
+                        for group, group_results in results.items()
+                        if group_results["results"]
+                    },
+                    expected,
+                )
+                self.assertEqual(cursor_result.hits, sum(expected.values()))
+
+    def test_next_page_counts_the_filtered_rows(self):
+        paginator = GroupedOffsetPaginator(
+            queryset=self.get_queryset("labels__id"),
+            group_by_field_name="labels__id",
+            group_by_fields=[],
+            count_filter=COUNT_FILTER,
+            order_by="-created_at",
+        )
+        cursor_result, results = self.paginate(paginator, "labels__id")
+
+        # Label A holds three rows, two of them counted
+        self.assertEqual(results[str(self.label_a.id)]["total_results"], 2)
+        self.assertEqual(len(results[str(self.label_a.id)]["results"]), 2)
+        self.assertTrue(cursor_result.next.has_results)
+
+    def test_sub_group_totals_match_the_distinct_count(self):
+        paginator = SubGroupedOffsetPaginator(
+            queryset=self.get_queryset("priority", "state__group"),
+            group_by_field_name="priority",
+            sub_group_by_field_name="state__group",
+            group_by_fields=issue_group_values(field="priority", slug="plane"),
+            sub_group_by_fields=issue_group_values(field="state__group", slug="plane"),
+            count_filter=COUNT_FILTER,
+            order_by="-created_at",
+        )
+        with self.assertNumQueries(1):
+            cursor_result, _ = self.paginate(paginator, "priority", "state__group")
+
+        self.assertEqual(
+            {(group,): total for group, total in paginator.total_group_dict.items()},
+            self.get_expected_totals("priority"),
+        )
+        self.assertEqual(
+            {
+                (group, sub_group): total
+                for group, sub_groups in paginator.total_sub_group_dict.items()
+                for sub_group, total in sub_groups.items()
+            },
+            self.get_expected_totals("priority", "state__group"),
+        )
+        # The high priority sub group holds three rows for a page of two
+        self.assertTrue(cursor_result.next.has_results)
@@ -0,0 +1,122 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+# Third party imports
+from rest_framework.test import APIClient
+
+# Module imports
+from .fixtures import create_issue, create_project, create_user, create_workspace
+from plane.bgtasks.deletion_task import update_deleted_at
+from plane.db.models import Cycle, CycleIssue, FileAsset, Issue, IssueLink
+
+
+class IssueCountersTest(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.workspace = create_workspace(self.user)
+        self.project = create_project(self.workspace, self.user)
+        self.issue = create_issue(self.project)
+
+    def get_counter(self, field, issue=None):
+        return Issue.all_objects.values_list(field, flat=True).get(
+            pk=(issue or self.issue).pk
+        )
+
+    def assertCounterFollowsSoftDelete(self, model, obj, field, value, empty=0):
+        # Created, soft deleted and restored through post_bulk_soft_delete
+        self.assertEqual(self.get_counter(field), value)
+        update_deleted_at(model, [obj.pk], timezone.now())
+        self.assertEqual(self.get_counter(field), empty)
+        update_deleted_at(model, [obj.pk], None)
+        self.assertEqual(self.get_counter(field), value)
+
+    def test_link_count(self):
+        link = IssueLink.objects.create(
+            issue=self.issue, project=self.project, url="https://plane.so"
+        )
+        self.assertCounterFollowsSoftDelete(IssueLink, link, "link_count", 1)
+
+    def test_attachment_count(self):
+        attachment = FileAsset.objects.create(
+            asset="attachment.png",
+            workspace=self.workspace,
+            project=self.project,
+            issue=self.issue,
+            entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+        )
+        # Images of the description are not attachments
+        FileAsset.objects.create(
+            asset="image.png",
+            workspace=self.workspace,
+            project=self.project,
+            issue=self.issue,
+            entity_type=FileAsset.EntityTypeContext.ISSUE_DESCRIPTION,
+        )
+        self.assertCounterFollowsSoftDelete(
+            FileAsset, attachment, "attachment_count", 1
+        )
+
+    def test_sub_issues_count(self):
+        child = create_issue(self.project, parent=self.issue)
+        self.assertCounterFollowsSoftDelete(Issue, child, "sub_issues_count", 1)
+
+    def test_current_cycle(self):
+        cycle = Cycle.objects.create(
+            name="Cycle", project=self.project, owned_by=self.user
+        )
+        cycle_issue = CycleIssue.objects.create(
+            cycle=cycle, issue=self.issue, project=self.project
+        )
+        self.assertCounterFollowsSoftDelete(
+            CycleIssue, cycle_issue, "current_cycle_id", cycle.id, empty=None
+        )
+
+    def test_sync_issue_counters_verify(self):
+        IssueLink.objects.create(
+            issue=self.issue, project=self.project, url="https://plane.so"
+        )
+        call_command("sync_issue_counters", "--verify")
+
+        Issue.all_objects.filter(pk=self.issue.pk).update(link_count=5)
+        with self.assertRaises(CommandError):
+            call_command("sync_issue_counters", "--verify")
+
+        call_command("sync_issue_counters", "--batch_size", "1")
+        self.assertEqual(self.get_counter("link_count"), 1)
+        call_command("sync_issue_counters", "--verify")
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class SubIssueReassignmentTest(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.workspace = create_workspace(self.user)
+        self.project = create_project(self.workspace, self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    @mock.patch("plane.app.views.issue.sub_issue.issue_activity")
+    def test_both_parents_are_updated(self, issue_activity):
+        old_parent = create_issue(self.project, name="Old parent")
+        new_parent = create_issue(self.project, name="New parent")
+        child = create_issue(self.project, parent=old_parent)
+
+        response = self.client.post(
+            f"/api/workspaces/plane/projects/{self.project.id}"
+            f"/issues/{new_parent.id}/sub-issues/",
+            {"sub_issue_ids": [str(child.id)]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        old_parent.refresh_from_db()
+        new_parent.refresh_from_db()
+        self.assertEqual(old_parent.sub_issues_count, 0)
+        self.assertEqual(new_parent.sub_issues_count, 1)
@@ -0,0 +1,162 @@
+# Python imports
+from datetime import date, timedelta
+
+# Django imports
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+# Module imports
+from .fixtures import create_issue, create_project, create_user, create_workspace
+from plane.db.models import Issue
+from plane.utils.paginator import Cursor, OffsetPaginator
+
+
+class KeysetPaginatorTest(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.workspace = create_workspace(self.user)
+        self.project = create_project(self.workspace, self.user)
+
+        # Ties on the order key, null order keys and ties on created_at so
+        # that the id has to break them
+        created_at = timezone.now()
+        target_dates = [
+            date(2024, 1, 1),
+            date(2024, 1, 1),
+            None,
+            date(2024, 2, 1),
+            None,
+            date(2024, 1, 1),
+            date(2024, 2, 1),
+            None,
+            date(2024, 3, 1),
+        ]
+        for index, target_date in enumerate(target_dates):
+            issue = create_issue(self.project, target_date=target_date)
+            Issue.objects.filter(pk=issue.pk).update(
+                created_at=created_at - timedelta(seconds=index % 2)
+            )
+        self.issues = list(Issue.issue_objects.filter(project=self.project))
+
+    def get_expected_ids(self, order_by):
+        # created_at and id descending break the ties, nulls are always last
+        rows = sorted(self.issues, key=lambda i: (i.created_at, i.id), reverse=True)
+        if order_by is None:
+            return [issue.id for issue in rows]
+        dated = sorted(
+            [issue for issue in rows if issue.target_date is not None],
+            key=lambda issue: issue.target_date,
+            reverse=order_by.startswith("-"),
+        )
+        undated = [issue for issue in rows if issue.target_date is None]
+        return [issue.id for issue in dated + undated]
+
+    def get_page(self, paginator, cursor=None, limit=2):
+        # Cursors go through their string form like the query params
+        if cursor is not None:
+            cursor = Cursor.from_string(str(cursor))
+        result = paginator.get_result(limit=limit, cursor=cursor)
+        return [issue.id for issue in result.results], result
+
+    def walk(self, order_by, limit=2):
+        paginator = OffsetPaginator(
+            Issue.issue_objects.filter(project=self.project),
+            order_by=order_by,
+            keyset=True,
+        )
+
+        ids, result = self.get_page(paginator, limit=limit)
+        pages = [ids]
+        while result.next.has_results:
+            ids, result = self.get_page(paginator, result.next, limit=limit)
+            pages.append(ids)
+
+        # And back from the last page
+        previous_pages = [pages[-1]]
+        while result.prev.has_results:
+            ids, result = self.get_page(paginator, result.prev, limit=limit)
+            previous_pages.insert(0, ids)
+
+        return pages, previous_pages
+
+    def assertWalksInOrder(self, order_by, limit=2):
+        pages, previous_pages = self.walk(order_by, limit=limit)
+
+        self.assertEqual(
+            [issue_id for page in pages for issue_id in page],
+            self.get_expected_ids(order_by),
+        )
+        self.assertTrue(all(len(page) == limit for page in pages[:-1]))
+        self.assertEqual(previous_pages, pages)
+
+    def test_ascending_key(self):
+        self.assertWalksInOrder("target_date")
+
+    def test_descending_key(self):
+        self.assertWalksInOrder("-target_date")
+
+    def test_created_at(self):
+        self.assertWalksInOrder(None)
+
+    def test_page_size_splitting_ties(self):
+        for limit in [1, 3, 4]:
+            with self.subTest(limit=limit):
+                self.assertWalksInOrder("target_date", limit=limit)
+
+    def test_exact_last_page(self):
+        pages, _ = self.walk("target_date", limit=len(self.issues))
+
+        self.assertEqual(len(pages), 1)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class KeysetPaginatorCountTest(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.workspace = create_workspace(self.user)
+        self.project = create_project(self.workspace, self.user)
+        for _ in range(3):
+            create_issue(self.project)
+
+    def get_paginator(self, **kwargs):
+        return OffsetPaginator(
+            Issue.issue_objects.filter(project=self.project),
+            order_by="-created_at",
+            keyset=True,
+            **kwargs,
+        )
+
+    def test_keyset_pages_reuse_the_cached_count(self):
+        paginator = self.get_paginator(count_cache_timeout=60)
+        first_page = paginator.get_result(limit=2)
+        self.assertEqual(first_page.hits, 3)
+        create_issue(self.project)
+
+        # Only the page positions are read
+        with self.assertNumQueries(1):
+            result = paginator.get_result(limit=2, cursor=first_page.next)
+        self.assertEqual(result.hits, 3)
+        self.assertEqual(result.max_hits, 2)
+
+        # The first page always recounts
+        self.assertEqual(paginator.get_result(limit=2).hits, 4)
+
+    def test_count_is_not_cached_without_a_timeout(self):
+        paginator = self.get_paginator()
+        first_page = paginator.get_result(limit=2)
+        create_issue(self.project)
+
+        with self.assertNumQueries(2):
+            result = paginator.get_result(limit=2, cursor=first_page.next)
+        self.assertEqual(result.hits, 4)
+
+    def test_count_can_be_disabled(self):
+        paginator = self.get_paginator(with_count=False)
+        first_page = paginator.get_result(limit=2)
+
+        with self.assertNumQueries(1):
+            result = paginator.get_result(limit=2, cursor=first_page.next)
+        self.assertIsNone(result.hits)
+        self.assertIsNone(result.max_hits)
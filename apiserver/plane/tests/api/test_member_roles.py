@@ -0,0 +1,195 @@
+# Python imports
+from types import SimpleNamespace
+from unittest import mock
+
+# Django imports
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+
+# Third party imports
+from crum import impersonate
+from rest_framework.test import APIClient
+
+# Module imports
+from .fixtures import create_issue, create_project, create_user, create_workspace
+from plane.app.permissions import WorkspaceOwnerPermission
+from plane.app.permissions.member_roles import (
+    get_guest_visibility_filter,
+    get_project_role,
+    get_workspace_role,
+    is_project_member_in_workspace,
+)
+from plane.bgtasks.deletion_task import soft_delete_related_objects
+from plane.db.models import Issue, ProjectMember, WorkspaceMember, WorkspaceMemberInvite
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class MemberRolesTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user()
+        self.workspace = create_workspace(self.owner)
+        self.project = create_project(self.workspace, self.owner)
+        self.user = create_user(email="member@plane.so")
+        self.workspace_member = WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=15
+        )
+        self.project_member = ProjectMember.objects.create(
+            project=self.project, member=self.user, role=15
+        )
+
+    def get_request(self, user=None):
+        # Every request memoizes the roles, a new one reads the cache again
+        request = RequestFactory().get("/")
+        request.user = user or self.user
+        return request
+
+    def test_roles(self):
+        request = self.get_request()
+        self.assertEqual(get_workspace_role(request, "plane"), 15)
+        self.assertEqual(get_project_role(request, "plane", self.project.id), 15)
+        self.assertIsNone(get_workspace_role(request, "other"))
+        self.assertIsNone(get_project_role(request, "other", self.project.id))
+        self.assertTrue(is_project_member_in_workspace(request, "plane"))
+        self.assertFalse(is_project_member_in_workspace(request, "other"))
+
+    def test_roles_are_cached(self):
+        get_workspace_role(self.get_request(), "plane")
+        with self.assertNumQueries(0):
+            self.assertEqual(get_workspace_role(self.get_request(), "plane"), 15)
+
+    def test_save_invalidates(self):
+        get_workspace_role(self.get_request(), "plane")
+        self.project_member.role = 5
+        self.project_member.save()
+        self.assertEqual(
+            get_project_role(self.get_request(), "plane", self.project.id), 5
+        )
+
+    def test_delete_invalidates(self):
+        get_workspace_role(self.get_request(), "plane")
+        self.project_member.delete(soft=False)
+        self.assertIsNone(
+            get_project_role(self.get_request(), "plane", self.project.id)
+        )
+
+    def test_deactivation_revokes_access(self):
+        view = SimpleNamespace(workspace_slug="plane")
+        self.workspace_member.role = 20
+        self.workspace_member.save()
+        permission = WorkspaceOwnerPermission()
+        self.assertTrue(permission.has_permission(self.get_request(), view))
+
+        self.workspace_member.is_active = False
+        self.workspace_member.save()
+        self.assertIsNone(get_workspace_role(self.get_request(), "plane"))
+        self.assertFalse(permission.has_permission(self.get_request(), view))
+
+    def test_soft_delete_cascade_invalidates(self):
+        get_workspace_role(self.get_request(), "plane")
+        soft_delete_related_objects("db", "project", self.project.id)
+        self.assertIsNone(
+            get_project_role(self.get_request(), "plane", self.project.id)
+        )
+        self.assertFalse(is_project_member_in_workspace(self.get_request(), "plane"))
+
+    def test_guest_visibility_filter(self):
+        guest_project = create_project(self.workspace, self.owner, identifier="GST")
+        open_project = create_project(self.workspace, self.owner, identifier="OPN")
+        open_project.guest_view_all_features = True
+        open_project.save()
+        for project in [guest_project, open_project]:
+            ProjectMember.objects.create(project=project, member=self.user, role=5)
+
+        with impersonate(self.owner):
+            visible = [create_issue(self.project), create_issue(open_project)]
+            hidden = create_issue(guest_project)
+        with impersonate(self.user):
+            visible.append(create_issue(guest_project))
+
+        issues = Issue.issue_objects.filter(
+            get_guest_visibility_filter(self.get_request(), "plane")
+        )
+        self.assertCountEqual(issues, visible)
+        self.assertNotIn(hidden, issues)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class MemberRolesBulkWriteTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user()
+        self.workspace = create_workspace(self.owner)
+        self.project = create_project(self.workspace, self.owner)
+        self.user = create_user(email="member@plane.so")
+        self.client = APIClient()
+
+    def get_request(self):
+        request = RequestFactory().get("/")
+        request.user = self.user
+        return request
+
+    def test_role_downgrade_reaches_project_roles(self):
+        workspace_member = WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=15
+        )
+        ProjectMember.objects.create(project=self.project, member=self.user, role=15)
+        self.assertEqual(
+            get_project_role(self.get_request(), "plane", self.project.id), 15
+        )
+
+        self.client.force_authenticate(self.owner)
+        response = self.client.patch(
+            f"/api/workspaces/plane/members/{workspace_member.id}/",
+            {"role": 5},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            get_project_role(self.get_request(), "plane", self.project.id), 5
+        )
+
+    def test_invite_join(self):
+        invite = WorkspaceMemberInvite.objects.create(
+            workspace=self.workspace, email=self.user.email, role=15, token="token"
+        )
+        self.assertIsNone(get_workspace_role(self.get_request(), "plane"))
+
+        self.client.force_authenticate(self.user)
+        response = self.client.post(
+            "/api/users/me/workspaces/invitations/",
+            {"invitations": [str(invite.id)]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(get_workspace_role(self.get_request(), "plane"), 15)
+
+    @mock.patch("plane.app.views.project.member.project_add_user_email")
+    def test_project_member_reactivation(self, project_add_user_email):
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=15
+        )
+        ProjectMember.objects.create(
+            project=self.project, member=self.user, role=5, is_active=False
+        )
+        self.assertIsNone(
+            get_project_role(self.get_request(), "plane", self.project.id)
+        )
+
+        self.client.force_authenticate(self.owner)
+        response = self.client.post(
+            f"/api/workspaces/plane/projects/{self.project.id}/members/",
+            {"members": [{"member_id": str(self.user.id), "role": 15}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            get_project_role(self.get_request(), "plane", self.project.id), 15
+        )
@@ -0,0 +1,104 @@
+# Python imports
+import json
+import uuid
+
+# Django imports
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from .fixtures import create_issue, create_project, create_user, create_workspace
+from plane.bgtasks.notification_task import notifications
+from plane.db.models import (
+    EmailNotificationLog,
+    IssueMention,
+    IssueSubscriber,
+    Notification,
+    ProjectMember,
+    UserNotificationPreference,
+)
+
+
+class NotificationQueriesTest(TestCase):
+    def setUp(self):
+        self.actor = create_user()
+        self.workspace = create_workspace(self.actor)
+        self.project = create_project(self.workspace, self.actor)
+        self.user_count = 0
+
+    def create_members(self, count):
+        members = []
+        for _ in range(count):
+            self.user_count += 1
+            user = create_user(email=f"member{self.user_count}@plane.so")
+            ProjectMember.objects.create(project=self.project, member=user)
+            UserNotificationPreference.objects.filter(user=user).update(
+                property_change=True
+            )
+            members.append(user)
+        return members
+
+    def notify(self, issue, description_html=None):
+        requested_data = {"priority": "high"}
+        if description_html is not None:
+            requested_data["description_html"] = description_html
+        with CaptureQueriesContext(connection) as context:
+            notifications(
+                type="issue.activity.updated",
+                issue_id=str(issue.id),
+                project_id=str(self.project.id),
+                actor_id=str(self.actor.id),
+                subscriber=False,
+                issue_activities_created=json.dumps(
+                    [
+                        {
+                            "id": str(uuid.uuid4()),
+                            "issue_detail": {"id": str(issue.id)},
+                            "verb": "updated",
+                            "field": "priority",
+                            "actor_id": str(self.actor.id),
+                            "old_value": "none",
+                            "new_value": "high",
+                        }
+                    ]
+                ),
+                requested_data=json.dumps(requested_data),
+                current_instance=json.dumps({"priority": "none"}),
+            )
+        return len(context.captured_queries)
+
+    def subscribe(self, issue, count):
+        for member in self.create_members(count):
+            IssueSubscriber.objects.create(
+                project=self.project, issue=issue, subscriber=member
+            )
+
+    def mention(self, count):
+        return "".join(
+            f'<mention-component entity_identifier="{member.id}" '
+            f'entity_name="user_mention"></mention-component>'
+            for member in self.create_members(count)
+        )
+
+    def test_queries_do_not_grow_with_subscribers(self):
+        one, many = create_issue(self.project), create_issue(self.project)
+        self.subscribe(one, 1)
+        self.subscribe(many, 10)
+
+        queries = self.notify(one)
+        self.assertEqual(self.notify(many), queries)
+        self.assertEqual(
+            Notification.objects.filter(entity_identifier=many.id).count(), 10
+        )
+        self.assertEqual(
+            EmailNotificationLog.objects.filter(entity_identifier=many.id).count(), 10
+        )
+
+    def test_queries_do_not_grow_with_mentions(self):
+        one, many = create_issue(self.project), create_issue(self.project)
+
+        queries = self.notify(one, self.mention(1))
+        self.assertEqual(self.notify(many, self.mention(10)), queries)
+        self.assertEqual(IssueMention.objects.filter(issue=many).count(), 10)
+        self.assertEqual(IssueSubscriber.objects.filter(issue=many).count(), 10)
@@ -0,0 +1,62 @@
+# Django imports
+from django.test import TestCase
+
+# Module imports
+from .fixtures import create_issue, create_project, create_user, create_workspace
+from plane.db.models import Issue, Page
+from plane.utils.issue_search import search_issues, search_ranked
+
+
+class SearchVectorTest(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.workspace = create_workspace(self.user)
+        self.project = create_project(self.workspace, self.user)
+
+    def test_issue_search_is_ranked(self):
+        in_description = create_issue(
+            self.project, name="Redirect", description_html="<p>after login</p>"
+        )
+        in_name = create_issue(self.project, name="Login page")
+        create_issue(self.project, name="Unrelated")
+
+        self.assertIsNotNone(
+            Issue.objects.values_list("search_vector", flat=True).get(
+                pk=in_description.pk
+            )
+        )
+        results = list(
+            search_issues("login", Issue.issue_objects.filter(project=self.project))
+        )
+        self.assertEqual(results, [in_name, in_description])
+
+    def test_issue_identifier_is_searchable(self):
+        issue = create_issue(self.project, name="Issue")
+        results = search_issues(
+            f"{self.project.identifier}-{issue.sequence_id}",
+            Issue.issue_objects.filter(project=self.project),
+        )
+        self.assertIn(issue, results)
+
+    def test_page_search_is_ranked(self):
+        in_content = Page.objects.create(
+            workspace=self.workspace,
+            owned_by=self.user,
+            name="Notes",
+            description_html="<p>release checklist</p>",
+        )
+        in_name = Page.objects.create(
+            workspace=self.workspace, owned_by=self.user, name="Release plan"
+        )
+
+        results = list(search_ranked("release", Page.objects.all()))
+        self.assertEqual(results, [in_name, in_content])
+
+    def test_updates_refresh_the_vector(self):
+        issue = create_issue(self.project, name="Draft")
+        issue.name = "Published"
+        issue.save()
+
+        queryset = Issue.issue_objects.filter(project=self.project)
+        self.assertEqual(list(search_issues("published", queryset)), [issue])
+        self.assertEqual(list(search_issues("draft", queryset)), [])
@@ -0,0 +1,39 @@
+# Python imports
+from datetime import date, timedelta
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.analytics_plot import build_burndown
+
+
+class BuildBurndownTest(SimpleTestCase):
+    def setUp(self):
+        self.start = date(2024, 1, 1)
+        self.date_range = [self.start + timedelta(days=day) for day in range(5)]
+
+    def test_pending_decreases_with_completions(self):
+        chart = build_burndown(
+            self.date_range,
+            10,
+            [(date(2024, 1, 2), 3), (date(2024, 1, 4), 2)],
+            date(2024, 1, 5),
+        )
+        self.assertEqual(list(chart.values()), [10, 7, 7, 5, 5])
+
+    def test_completions_before_the_range_are_counted(self):
+        chart = build_burndown(
+            self.date_range, 10, [(date(2023, 12, 20), 4)], date(2024, 1, 5)
+        )
+        self.assertEqual(chart["2024-01-01"], 6)
+
+    def test_future_dates_are_empty(self):
+        chart = build_burndown(self.date_range, 10, [], date(2024, 1, 2))
+        self.assertEqual(list(chart.values()), [10, 10, None, None, None])
+
+    def test_large_range_is_linear(self):
+        date_range = [self.start + timedelta(days=day) for day in range(3650)]
+        completed = [(day, 1) for day in date_range]
+        chart = build_burndown(date_range, 3650, completed, date_range[-1])
+        self.assertEqual(chart[str(date_range[-1])], 0)
@@ -0,0 +1,47 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.analytics_rollup import ROLLUP_AXES, count_rollups
+
+
+def build_issue_values(estimate=None, **values):
+    # Axes not given have no value, like an issue without labels
+    return {axis: values.get(axis, [None]) for axis in ROLLUP_AXES}, estimate
+
+
+class CountRollupsTest(SimpleTestCase):
+    def setUp(self):
+        self.issues = [
+            build_issue_values(
+                estimate=2.0,
+                priority=["high"],
+                labels__id=["bug", "ui"],
+                assignees__id=["alice"],
+            ),
+            build_issue_values(estimate=3.0, priority=["high"], labels__id=["bug"]),
+            build_issue_values(priority=["low"]),
+        ]
+
+    def test_total_counts_every_issue_once(self):
+        total, _ = count_rollups(self.issues)
+        self.assertEqual(total, 3)
+
+    def test_axis_without_segment(self):
+        _, rollups = count_rollups(self.issues)
+        self.assertEqual(rollups[("priority", "high", "", None)], [2, 5.0])
+        self.assertEqual(rollups[("priority", "low", "", None)], [1, None])
+        self.assertEqual(rollups[("labels__id", "bug", "", None)], [2, 5.0])
+
+    def test_many_to_many_segment_counts_each_value(self):
+        _, rollups = count_rollups(self.issues)
+        self.assertEqual(rollups[("priority", "high", "labels__id", "bug")], [2, 5.0])
+        self.assertEqual(rollups[("priority", "high", "labels__id", "ui")], [1, 2.0])
+        self.assertEqual(rollups[("priority", "low", "labels__id", None)], [1, None])
+
+    def test_missing_axis_value_is_not_plotted(self):
+        _, rollups = count_rollups(self.issues)
+        self.assertNotIn(("assignees__id", None, "", None), rollups)
+        self.assertEqual(
+            rollups[("assignees__id", "alice", "priority", "high")], [1, 2.0]
+        )
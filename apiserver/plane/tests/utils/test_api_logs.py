@@ -0,0 +1,67 @@
+# Python imports
+import json
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase, override_settings
+
+# Module imports
+from plane.bgtasks import api_logs_task
+from plane.middleware.api_log_middleware import truncate_fields
+
+
+class TruncateFieldsTest(SimpleTestCase):
+    def test_values_are_cut_to_their_max_length(self):
+        record = truncate_fields(
+            {
+                "token_identifier": "t" * 300,
+                "path": "/p" * 200,
+                "method": "M" * 20,
+                "user_agent": "a" * 1000,
+                "headers": "h" * 1000,
+                "ip_address": None,
+                "response_code": 200,
+            }
+        )
+        self.assertEqual(len(record["token_identifier"]), 255)
+        self.assertEqual(len(record["path"]), 255)
+        self.assertEqual(len(record["method"]), 10)
+        self.assertEqual(len(record["user_agent"]), 512)
+        # Text fields and other values are left alone
+        self.assertEqual(len(record["headers"]), 1000)
+        self.assertIsNone(record["ip_address"])
+        self.assertEqual(record["response_code"], 200)
+
+
+@override_settings(API_LOG_FLUSH_BATCH_SIZE=10)
+class FlushAPILogsTest(SimpleTestCase):
+    def flush(self, records, bulk_create):
+        ri = mock.Mock()
+        ri.pipeline.return_value.execute.return_value = (
+            [json.dumps(record).encode("utf-8") for record in records],
+            True,
+        )
+        with (
+            mock.patch.object(api_logs_task, "redis_instance", return_value=ri),
+            mock.patch.object(
+                api_logs_task.APIActivityLog.objects, "bulk_create", bulk_create
+            ),
+            mock.patch.object(api_logs_task, "log_exception"),
+        ):
+            api_logs_task.flush_api_logs()
+
+    def test_failed_batch_falls_back_to_single_inserts(self):
+        records = [
+            {"token_identifier": str(index), "path": "/", "method": "GET"}
+            for index in range(3)
+        ]
+        written = []
+
+        def bulk_create(logs, batch_size=None):
+            if len(logs) > 1 or logs[0].token_identifier == "1":
+                raise ValueError("bad row")
+            written.extend(log.token_identifier for log in logs)
+
+        self.flush(records, mock.Mock(side_effect=bulk_create))
+        # Only the bad row is lost
+        self.assertEqual(written, ["0", "2"])
@@ -0,0 +1,158 @@
+# Python imports
+from datetime import timedelta
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+
+# Module imports
+from plane.utils import api_token
+from plane.utils.api_token import (
+    API_TOKEN_LAST_USED_KEY,
+    LocalTokenCache,
+    record_api_token_usage,
+    resolve_api_token,
+)
+
+
+@mock.patch.object(api_token.time, "monotonic", return_value=100)
+class LocalTokenCacheTest(SimpleTestCase):
+    def test_entries_expire(self, monotonic):
+        local_cache = LocalTokenCache(max_size=2)
+        local_cache.set("a", 1, timeout=10)
+
+        monotonic.return_value = 109
+        self.assertEqual(local_cache.get("a"), 1)
+        monotonic.return_value = 110
+        self.assertIsNone(local_cache.get("a"))
+        self.assertEqual(len(local_cache.entries), 0)
+
+    def test_least_recently_used_entry_is_evicted(self, monotonic):
+        local_cache = LocalTokenCache(max_size=2)
+        local_cache.set("a", 1, timeout=10)
+        local_cache.set("b", 2, timeout=10)
+        # Reading a makes b the least recently used
+        local_cache.get("a")
+        local_cache.set("c", 3, timeout=10)
+
+        self.assertEqual(list(local_cache.entries), ["a", "c"])
+        self.assertIsNone(local_cache.get("b"))
+
+    def test_delete(self, monotonic):
+        local_cache = LocalTokenCache(max_size=2)
+        local_cache.set("a", 1, timeout=10)
+        local_cache.delete("a")
+        local_cache.delete("missing")
+
+        self.assertIsNone(local_cache.get("a"))
+
+
+@mock.patch.object(api_token, "load_api_token")
+@mock.patch.object(api_token, "cache")
+class ResolveAPITokenTest(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            api_token, "local_token_cache", LocalTokenCache(max_size=10)
+        )
+        self.local_token_cache = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def build_token(self, expired_at):
+        return {"id": "1", "user": None, "is_service": False, "expired_at": expired_at}
+
+    def test_token_is_cached_locally(self, cache, load_api_token):
+        token = self.build_token(None)
+        cache.get.return_value = None
+        load_api_token.return_value = token
+
+        self.assertEqual(resolve_api_token("plane_api_token"), token)
+        self.assertEqual(resolve_api_token("plane_api_token"), token)
+
+        load_api_token.assert_called_once_with("plane_api_token")
+        cache.get.assert_called_once()
+        cache.set.assert_called_once()
+
+    def test_expired_token_is_rejected_from_the_local_cache(
+        self, cache, load_api_token
+    ):
+        key = api_token.get_api_token_cache_key("plane_api_token")
+        self.local_token_cache.set(
+            key, self.build_token(timezone.now() - timedelta(seconds=1)), 60
+        )
+
+        self.assertIsNone(resolve_api_token("plane_api_token"))
+        self.assertIsNone(self.local_token_cache.get(key))
+        cache.get.assert_not_called()
+        load_api_token.assert_not_called()
+
+    def test_expired_token_is_rejected_from_redis(self, cache, load_api_token):
+        cache.get.return_value = self.build_token(timezone.now() - timedelta(seconds=1))
+
+        self.assertIsNone(resolve_api_token("plane_api_token"))
+        load_api_token.assert_not_called()
+        # Never cached locally past its expiry
+        self.assertEqual(len(self.local_token_cache.entries), 0)
+
+    def test_cache_timeout_stops_at_the_expiry(self, cache, load_api_token):
+        cache.get.return_value = None
+        load_api_token.return_value = self.build_token(
+            timezone.now() + timedelta(seconds=30)
+        )
+
+        with override_settings(API_TOKEN_CACHE_TIMEOUT=60):
+            resolve_api_token("plane_api_token")
+
+        timeout = cache.set.call_args.args[2]
+        self.assertLessEqual(timeout, 30)
+        self.assertGreater(timeout, 25)
+
+    def test_invalid_token(self, cache, load_api_token):
+        cache.get.return_value = None
+        load_api_token.return_value = None
+
+        self.assertIsNone(resolve_api_token("plane_api_token"))
+        cache.set.assert_not_called()
+
+
+@mock.patch.object(api_token, "redis_instance")
+class RecordAPITokenUsageTest(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            api_token, "last_used_recorded", LocalTokenCache(max_size=10)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_uses_are_coalesced_per_token(self, redis_instance):
+        hset = redis_instance.return_value.hset
+        for _ in range(3):
+            record_api_token_usage({"id": "1"})
+        record_api_token_usage({"id": "2"})
+
+        self.assertEqual(
+            [call.args[:2] for call in hset.call_args_list],
+            [(API_TOKEN_LAST_USED_KEY, "1"), (API_TOKEN_LAST_USED_KEY, "2")],
+        )
+
+    def test_use_is_recorded_again_after_the_interval(self, redis_instance):
+        hset = redis_instance.return_value.hset
+        with (
+            override_settings(API_TOKEN_LAST_USED_INTERVAL=60),
+            mock.patch.object(api_token.time, "monotonic", return_value=100) as now,
+        ):
+            record_api_token_usage({"id": "1"})
+            now.return_value = 159
+            record_api_token_usage({"id": "1"})
+            now.return_value = 160
+            record_api_token_usage({"id": "1"})
+
+        self.assertEqual(hset.call_count, 2)
+
+    @mock.patch.object(api_token, "log_exception")
+    def test_redis_errors_do_not_fail_the_request(self, log_exception, redis_instance):
+        redis_instance.return_value.hset.side_effect = ConnectionError
+
+        record_api_token_usage({"id": "1"})
+
+        log_exception.assert_called_once()
@@ -0,0 +1,94 @@
+# Python imports
+import json
+from types import SimpleNamespace
+from unittest import mock
+from uuid import uuid4
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.bgtasks import issue_activities_task
+from plane.bgtasks.issue_activities_task import bulk_issue_activity
+
+
+@mock.patch.object(issue_activities_task, "invalidate_burndown")
+@mock.patch.object(issue_activities_task, "mark_rollups_stale")
+@mock.patch.object(issue_activities_task, "notifications_batch")
+@mock.patch.object(issue_activities_task, "webhook_activity_batch")
+@mock.patch.object(issue_activities_task, "Issue")
+@mock.patch.object(issue_activities_task, "Project")
+@mock.patch.object(issue_activities_task, "IssueActivity")
+@mock.patch.object(issue_activities_task, "IssueActivitySerializer")
+class BulkIssueActivityTest(SimpleTestCase):
+    def setUp(self):
+        self.first, self.second = str(uuid4()), str(uuid4())
+        self.changes = [
+            (
+                self.first,
+                json.dumps({"start_date": "2026-10-18"}),
+                json.dumps({"start_date": "2026-10-17"}),
+            ),
+            (
+                self.first,
+                json.dumps({"target_date": "2026-10-20"}),
+                json.dumps({"target_date": "2026-10-20"}),
+            ),
+            (
+                self.second,
+                json.dumps({"target_date": "2026-10-20"}),
+                json.dumps({"target_date": "2026-10-19"}),
+            ),
+        ]
+
+    def run_task(self, serializer, issue_activity, project, notification=True):
+        issue_activity.objects.bulk_create.side_effect = lambda activities, batch_size: (
+            activities
+        )
+        serializer.side_effect = lambda activities, many: SimpleNamespace(
+            data=[{"index": index} for index, _ in enumerate(activities)]
+        )
+        project.objects.select_related.return_value.get.return_value = SimpleNamespace(
+            workspace_id=uuid4(), workspace=SimpleNamespace(slug="w")
+        )
+        bulk_issue_activity(
+            type="issue.activity.updated",
+            changes=self.changes,
+            actor_id=str(uuid4()),
+            project_id=str(uuid4()),
+            epoch=1,
+            notification=notification,
+        )
+
+    def test_activities_are_created_once(
+        self, serializer, issue_activity, project, issue, webhook, notify, *args
+    ):
+        self.run_task(serializer, issue_activity, project)
+
+        issue_activity.objects.bulk_create.assert_called_once()
+        self.assertEqual(len(issue_activity.objects.bulk_create.call_args.args[0]), 2)
+        issue.objects.filter.assert_called_once_with(pk__in={self.first, self.second})
+        webhook.delay.assert_called_once()
+        self.assertEqual(len(webhook.delay.call_args.kwargs["activities"]), 2)
+
+    def test_notifications_follow_their_change(
+        self, serializer, issue_activity, project, issue, webhook, notify, *args
+    ):
+        self.run_task(serializer, issue_activity, project)
+
+        notify.delay.assert_called_once()
+        issues = notify.delay.call_args.kwargs["issues"]
+        self.assertEqual(
+            [issue["issue_id"] for issue in issues],
+            [self.first, self.first, self.second],
+        )
+        self.assertEqual(
+            [json.loads(issue["issue_activities_created"]) for issue in issues],
+            [[{"index": 0}], [], [{"index": 1}]],
+        )
+
+    def test_without_notification(
+        self, serializer, issue_activity, project, issue, webhook, notify, *args
+    ):
+        self.run_task(serializer, issue_activity, project, notification=False)
+        notify.delay.assert_not_called()
@@ -0,0 +1,178 @@
+# Python imports
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+# Django imports
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+# Third party imports
+from rest_framework.response import Response
+
+# Module imports
+from plane.utils.cache import (
+    cache_response,
+    dump_entry,
+    get_cache_stats,
+    invalidate_cache_directly,
+    load_entry,
+)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    RESPONSE_CACHE_STATS=True,
+)
+class CacheResponseTest(SimpleTestCase):
+    def setUp(self):
+        self.addCleanup(cache.clear)
+        self.calls = 0
+
+    def build_request(self, path, user_id=1):
+        request = RequestFactory().get(path)
+        request.user = SimpleNamespace(is_anonymous=False, id=user_id)
+        return request
+
+    def build_view(self, **kwargs):
+        @cache_response(**kwargs)
+        def view(instance, request):
+            self.calls += 1
+            return Response({"calls": self.calls})
+
+        return view
+
+    def get(self, view, path="/api/workspaces/plane/states/", user_id=1):
+        return view(None, self.build_request(path, user_id)).data
+
+    def invalidate(self, path="/api/workspaces/plane/states/", user=True):
+        invalidate_cache_directly(
+            path=path, user=user, request=self.build_request(path)
+        )
+
+    def test_responses_are_cached_per_user(self):
+        view = self.build_view()
+
+        self.assertEqual(self.get(view), {"calls": 1})
+        self.assertEqual(self.get(view), {"calls": 1})
+        self.assertEqual(self.get(view, user_id=2), {"calls": 2})
+
+    def test_user_invalidation_only_reaches_the_user(self):
+        view = self.build_view()
+        self.get(view)
+        self.get(view, user_id=2)
+
+        self.invalidate()
+
+        self.assertEqual(self.get(view), {"calls": 3})
+        self.assertEqual(self.get(view, user_id=2), {"calls": 2})
+
+    def test_invalidation_without_user_reaches_every_user(self):
+        view = self.build_view()
+        self.get(view)
+        self.get(view, user_id=2)
+
+        self.invalidate(path="workspaces/plane/states/", user=False)
+
+        self.assertEqual(self.get(view), {"calls": 3})
+        self.assertEqual(self.get(view, user_id=2), {"calls": 4})
+
+    def test_query_string_variants_are_invalidated(self):
+        view = self.build_view()
+        self.get(view, path="/api/workspaces/plane/states/?group=backlog")
+        self.get(view, path="/api/workspaces/plane/states/?group=started")
+
+        self.invalidate()
+
+        self.assertEqual(
+            self.get(view, path="/api/workspaces/plane/states/?group=backlog"),
+            {"calls": 3},
+        )
+        self.assertEqual(
+            self.get(view, path="/api/workspaces/plane/states/?group=started"),
+            {"calls": 4},
+        )
+
+    def test_other_paths_are_kept(self):
+        view = self.build_view()
+        self.get(view, path="/api/workspaces/plane/labels/")
+
+        self.invalidate(user=False)
+
+        self.assertEqual(
+            self.get(view, path="/api/workspaces/plane/labels/"), {"calls": 1}
+        )
+
+    @mock.patch("plane.utils.cache.time")
+    def test_stale_entry_has_a_single_refresher(self, cache_time):
+        cache_time.time_ns.side_effect = time.time_ns
+        cache_time.time.return_value = 1000
+        stale = []
+
+        @cache_response(timeout=60, stale_timeout=300)
+        def view(instance, request):
+            self.calls += 1
+            if self.calls == 2:
+                # Requests arriving while the entry is refreshed
+                stale.append(view(None, self.build_request("/api/states/")).data)
+                stale.append(view(None, self.build_request("/api/states/")).data)
+            return Response({"calls": self.calls})
+
+        view(None, self.build_request("/api/states/"))
+        cache_time.time.return_value = 1061
+
+        self.assertEqual(
+            view(None, self.build_request("/api/states/")).data, {"calls": 2}
+        )
+        self.assertEqual(stale, [{"calls": 1}, {"calls": 1}])
+        self.assertEqual(self.calls, 2)
+        # The refreshed entry is fresh again
+        self.assertEqual(
+            view(None, self.build_request("/api/states/")).data, {"calls": 2}
+        )
+
+    @override_settings(RESPONSE_CACHE_COMPRESS_MIN_SIZE=10)
+    def test_compressed_responses(self):
+        view = self.build_view(compress=True)
+
+        self.assertEqual(self.get(view), {"calls": 1})
+        self.assertEqual(self.get(view), {"calls": 1})
+
+    def test_stats(self):
+        view = self.build_view()
+        self.get(view)
+        self.get(view)
+        self.get(view)
+
+        self.assertEqual(get_cache_stats(), {"hit": 2, "miss": 1, "stale": 0})
+
+    @override_settings(RESPONSE_CACHE_STATS=False)
+    def test_stats_can_be_disabled(self):
+        view = self.build_view()
+        self.get(view)
+        self.get(view)
+
+        self.assertEqual(get_cache_stats(), {"hit": 0, "miss": 0, "stale": 0})
+
+
+@override_settings(RESPONSE_CACHE_COMPRESS_MIN_SIZE=100)
+class CacheEntryTest(SimpleTestCase):
+    data = {"results": [{"id": index, "name": "Issue"} for index in range(20)]}
+
+    def test_compressed_round_trip(self):
+        entry = dump_entry(self.data, 200, 0, compress=True)
+
+        self.assertTrue(entry["compressed"])
+        self.assertEqual(load_entry(entry), self.data)
+
+    def test_small_payloads_are_not_compressed(self):
+        entry = dump_entry({"id": 1}, 200, 0, compress=True)
+
+        self.assertFalse(entry["compressed"])
+        self.assertEqual(load_entry(entry), {"id": 1})
+
+    def test_uncompressed_round_trip(self):
+        entry = dump_entry(self.data, 200, 0, compress=False)
+
+        self.assertFalse(entry["compressed"])
+        self.assertEqual(load_entry(entry), self.data)
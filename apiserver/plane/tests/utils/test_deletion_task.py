@@ -0,0 +1,40 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.bgtasks.deletion_task import (
+    get_cascade_relations,
+    get_chunks,
+    get_purge_order,
+)
+from plane.db.models import Issue, IssueLink, Project, Workspace
+
+
+class CascadeRelationsTest(SimpleTestCase):
+    def test_reverse_relations_are_followed(self):
+        relations = get_cascade_relations(Project)
+        self.assertIn((Issue, "project", "CASCADE"), relations)
+        self.assertIn((IssueLink, "issue", "CASCADE"), get_cascade_relations(Issue))
+
+    def test_do_nothing_relations_are_skipped(self):
+        for model in [Project, Issue]:
+            for _, _, on_delete_name in get_cascade_relations(model):
+                self.assertNotEqual(on_delete_name, "DO_NOTHING")
+
+    def test_relations_are_cached(self):
+        self.assertIs(get_cascade_relations(Issue), get_cascade_relations(Issue))
+
+
+class ChunksTest(SimpleTestCase):
+    def test_chunks(self):
+        self.assertEqual(list(get_chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(get_chunks([], 2)), [])
+
+
+class PurgeOrderTest(SimpleTestCase):
+    def test_children_come_first(self):
+        order = get_purge_order([Workspace, Project, Issue, IssueLink])
+        self.assertEqual(order, [IssueLink, Issue, Project, Workspace])
+
+    def test_only_given_models(self):
+        self.assertEqual(get_purge_order([Issue]), [Issue])
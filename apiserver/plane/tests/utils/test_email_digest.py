@@ -0,0 +1,54 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.bgtasks.email_notification_task import send_email_digest
+
+TASK = "plane.bgtasks.email_notification_task"
+
+
+@mock.patch(f"{TASK}.EmailNotificationLog")
+@mock.patch(f"{TASK}.release_lock")
+@mock.patch(f"{TASK}.acquire_lock", return_value=True)
+@mock.patch(f"{TASK}.get_issue_email")
+@mock.patch(f"{TASK}.get_connection")
+@mock.patch(
+    f"{TASK}.get_email_configuration", return_value=("", "", "", "25", "0", "0", "")
+)
+@mock.patch(f"{TASK}.User")
+class SendEmailDigestTest(SimpleTestCase):
+    digest = {
+        "issue-1": {"notification_data": {}, "email_notification_ids": ["2", "1"]},
+        "issue-2": {"notification_data": {}, "email_notification_ids": ["3"]},
+    }
+
+    def test_single_connection_for_the_digest(
+        self, user, configuration, get_connection, get_issue_email, *args
+    ):
+        send_email_digest(receiver_id="receiver", digest=self.digest)
+        get_connection.assert_called_once()
+        connection = get_connection.return_value
+        self.assertEqual(connection.send_messages.call_count, 2)
+        connection.close.assert_called_once()
+
+    def test_locks_per_issue(
+        self, user, configuration, get_connection, get_issue_email, acquire_lock, *args
+    ):
+        send_email_digest(receiver_id="receiver", digest=self.digest)
+        self.assertEqual(
+            [call.kwargs["lock_id"] for call in acquire_lock.call_args_list],
+            [
+                "send_email_notif_issue-1_receiver_1_2",
+                "send_email_notif_issue-2_receiver_3",
+            ],
+        )
+
+    def test_issues_without_email_are_skipped(
+        self, user, configuration, get_connection, get_issue_email, *args
+    ):
+        get_issue_email.return_value = None
+        send_email_digest(receiver_id="receiver", digest=self.digest)
+        get_connection.return_value.send_messages.assert_not_called()
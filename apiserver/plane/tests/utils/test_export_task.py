@@ -0,0 +1,71 @@
+# Python imports
+import csv
+import io
+import json
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.bgtasks.export_task import (
+    EXPORT_HEADER,
+    assemble_export_file,
+    write_csv_file,
+    write_json_rows,
+)
+
+
+class PartsClient:
+    # Serves the uploaded parts of an export like the S3 client
+    def __init__(self, parts):
+        self.parts = parts
+
+    def get_object(self, Bucket, Key):
+        body = self.parts[Key]
+        return {"ContentLength": len(body), "Body": io.BytesIO(body)}
+
+
+def build_part(writer, rows):
+    part = io.BytesIO()
+    writer(part, rows)
+    return part.getvalue()
+
+
+class AssembleExportFileTest(SimpleTestCase):
+    def assemble(self, provider, parts):
+        file = io.BytesIO()
+        assemble_export_file(
+            provider,
+            [str(index) for index in range(len(parts))],
+            file,
+            PartsClient({str(index): part for index, part in enumerate(parts)}),
+        )
+        return file.getvalue().decode("utf-8")
+
+    def test_csv_has_a_single_header(self):
+        parts = [
+            build_part(lambda file, rows: write_csv_file(file, None, rows), rows)
+            for rows in [[["PLN-1"], ["PLN-2"]], [], [["PLN-3"]]]
+        ]
+
+        rows = list(csv.reader(io.StringIO(self.assemble("csv", parts))))
+
+        self.assertEqual(rows, [EXPORT_HEADER, ["PLN-1"], ["PLN-2"], ["PLN-3"]])
+
+    def test_json_parts_are_comma_joined(self):
+        parts = [
+            build_part(write_json_rows, rows)
+            for rows in [[{"id": 1}, {"id": 2}], [], [{"id": 3}]]
+        ]
+
+        self.assertEqual(
+            json.loads(self.assemble("json", parts)), [{"id": 1}, {"id": 2}, {"id": 3}]
+        )
+
+    def test_empty_parts(self):
+        parts = [b"", b""]
+
+        self.assertEqual(json.loads(self.assemble("json", parts)), [])
+        self.assertEqual(
+            list(csv.reader(io.StringIO(self.assemble("csv", parts)))), [EXPORT_HEADER]
+        )
@@ -0,0 +1,72 @@
+# Python imports
+from unittest import mock
+from uuid import uuid4
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.global_paginator import ChangeCursor, paginate_changes
+
+
+def build_querysets(changes, found_ids):
+    base_queryset = mock.MagicMock()
+    base_queryset.filter.return_value.order_by.return_value.values_list.return_value.__getitem__.return_value = changes
+    queryset = mock.MagicMock()
+    queryset.filter.return_value.order_by.return_value = [
+        {"id": pk} for pk in found_ids
+    ]
+    return base_queryset, queryset
+
+
+@mock.patch("plane.utils.global_paginator.get_snapshot_xmin", return_value=100)
+class PaginateChangesTest(SimpleTestCase):
+    def test_missing_rows_are_deleted(self, get_snapshot_xmin):
+        live, removed = uuid4(), uuid4()
+        base_queryset, queryset = build_querysets(
+            [(removed, 90, 11), (live, 91, 12)], [live]
+        )
+
+        data = paginate_changes(base_queryset, queryset, "90:10", list)
+
+        self.assertEqual(data["results"], [{"id": live}])
+        self.assertEqual(data["deleted"], [str(removed)])
+        self.assertEqual(data["next_cursor"], "91:12")
+        self.assertFalse(data["next_page_results"])
+
+    def test_changes_of_running_transactions_are_not_read(self, get_snapshot_xmin):
+        base_queryset, queryset = build_querysets([], [])
+
+        paginate_changes(base_queryset, queryset, "90:10", list)
+
+        self.assertEqual(base_queryset.filter.call_args.kwargs, {"change_xid__lt": 100})
+
+    def test_results_follow_the_changes(self, get_snapshot_xmin):
+        first, second = uuid4(), uuid4()
+        base_queryset, queryset = build_querysets(
+            [(first, 90, 11), (second, 90, 12)], [second, first]
+        )
+
+        data = paginate_changes(base_queryset, queryset, "0", list)
+
+        self.assertEqual(data["results"], [{"id": first}, {"id": second}])
+
+    def test_no_changes_keep_the_cursor(self, get_snapshot_xmin):
+        base_queryset, queryset = build_querysets([], [])
+
+        data = paginate_changes(base_queryset, queryset, "90:10", list)
+
+        queryset.filter.assert_not_called()
+        self.assertEqual(data["next_cursor"], "90:10")
+        self.assertEqual(data["results"], [])
+
+
+class ChangeCursorTest(SimpleTestCase):
+    def test_start_of_the_feed(self):
+        cursor = ChangeCursor.from_string("0")
+        self.assertEqual((cursor.change_xid, cursor.change_sequence), (0, 0))
+
+    def test_invalid_cursor(self):
+        for value in ["abc", "12", "1:2:3", None]:
+            with self.assertRaises(ValueError):
+                ChangeCursor.from_string(value)
@@ -0,0 +1,38 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.html_processor import _components_cache, extract_components
+
+
+class ExtractComponentsTest(SimpleTestCase):
+    html = (
+        "<p>Hello <mention-component id='1' entity_identifier='user-1' "
+        'entity_name="user_mention"></mention-component> and '
+        '<MENTION-COMPONENT id="2" entity_identifier="user-2" entity_name="user_mention"/>'
+        "<b>unclosed</p>"
+    )
+
+    def setUp(self):
+        _components_cache.clear()
+
+    def test_components_in_document_order(self):
+        components = extract_components(self.html, "mention-component")
+        self.assertEqual(
+            [component["entity_identifier"] for component in components],
+            ["user-1", "user-2"],
+        )
+        self.assertEqual(components[0]["entity_name"], "user_mention")
+
+    def test_empty_html(self):
+        self.assertEqual(extract_components(None, "mention-component"), [])
+        self.assertEqual(extract_components("", "mention-component"), [])
+
+    def test_results_are_cached_by_content(self):
+        components = extract_components(self.html, "mention-component")
+        components[0]["id"] = "changed"
+        self.assertEqual(len(_components_cache), 1)
+        self.assertEqual(
+            extract_components(self.html, "mention-component")[0]["id"], "1"
+        )
+        self.assertEqual(len(_components_cache), 1)
@@ -0,0 +1,50 @@
+# Python imports
+from types import SimpleNamespace
+from unittest import mock
+from uuid import uuid4
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.app.serializers.issue import IssueBulkCreateSerializer
+from plane.db.models import Issue
+
+
+@mock.patch.object(Issue, "create_in_bulk")
+class IssueBulkCreateSerializerTest(SimpleTestCase):
+    def setUp(self):
+        self.context = {
+            "project_id": uuid4(),
+            "workspace_id": uuid4(),
+            "default_assignee_id": uuid4(),
+        }
+        self.serializer = IssueBulkCreateSerializer(
+            child=mock.Mock(), context=self.context
+        )
+
+    def test_relations_follow_the_issues(self, create_in_bulk):
+        assignee = SimpleNamespace(id=uuid4())
+        label = SimpleNamespace(id=uuid4())
+        self.serializer.create(
+            [
+                {"name": "first", "assignee_ids": [assignee], "label_ids": [label]},
+                {"name": "second"},
+            ]
+        )
+
+        kwargs = create_in_bulk.call_args.kwargs
+        self.assertEqual(
+            [issue.name for issue in kwargs["issues"]], ["first", "second"]
+        )
+        self.assertEqual(
+            kwargs["assignee_ids"],
+            [[assignee.id], [self.context["default_assignee_id"]]],
+        )
+        self.assertEqual(kwargs["label_ids"], [[label.id], []])
+        self.assertEqual(kwargs["project_id"], self.context["project_id"])
+
+    def test_without_default_assignee(self, create_in_bulk):
+        self.context["default_assignee_id"] = None
+        self.serializer.create([{"name": "first"}])
+        self.assertEqual(create_in_bulk.call_args.kwargs["assignee_ids"], [[]])
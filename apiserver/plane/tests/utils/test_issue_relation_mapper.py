@@ -0,0 +1,41 @@
+# Python imports
+from uuid import uuid4
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.issue_relation_mapper import RELATION_NAMES, get_relation_graph
+
+
+class RelationGraphTest(SimpleTestCase):
+    def setUp(self):
+        self.issue, self.other, self.third = (uuid4() for _ in range(3))
+
+    def test_relations_are_named_from_both_sides(self):
+        graph = get_relation_graph(
+            [self.issue, self.other],
+            [
+                (self.issue, self.other, "blocked_by"),
+                (self.third, self.issue, "start_before"),
+            ],
+        )
+        issue, other = graph[str(self.issue)], graph[str(self.other)]
+        self.assertEqual(issue["blocked_by"], [str(self.other)])
+        self.assertEqual(issue["start_after"], [str(self.third)])
+        self.assertEqual(other["blocking"], [str(self.issue)])
+        self.assertNotIn(str(self.third), graph)
+
+    def test_symmetric_relations_are_listed_once(self):
+        graph = get_relation_graph(
+            [self.issue],
+            [
+                (self.issue, self.other, "duplicate"),
+                (self.other, self.issue, "duplicate"),
+            ],
+        )
+        self.assertEqual(graph[str(self.issue)]["duplicate"], [str(self.other)])
+
+    def test_every_relation_name_is_listed(self):
+        graph = get_relation_graph([self.issue], [])
+        self.assertEqual(list(graph[str(self.issue)]), RELATION_NAMES)
@@ -0,0 +1,23 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.issue_search import MAX_SEARCH_TERMS, get_search_query
+
+
+class SearchQueryTest(SimpleTestCase):
+    def get_value(self, query):
+        return get_search_query(query).get_source_expressions()[-1].value
+
+    def test_words_are_prefix_matched(self):
+        self.assertEqual(self.get_value("Login Bug"), "login:* & bug:*")
+
+    def test_operators_are_dropped(self):
+        self.assertEqual(self.get_value("PROJ-12 & !(x:*)"), "proj:* & 12:* & x:*")
+
+    def test_no_words(self):
+        self.assertIsNone(get_search_query(" &|! "))
+
+    def test_long_queries_are_truncated(self):
+        value = self.get_value(" ".join(f"word{i}" for i in range(20)))
+        self.assertEqual(value.count(":*"), MAX_SEARCH_TERMS)
@@ -0,0 +1,74 @@
+# Python imports
+from types import SimpleNamespace
+from uuid import uuid4
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.bgtasks.notification_task import (
+    extract_mentions_as_subscribers,
+    should_send_email,
+)
+
+
+class MentionSubscribersTest(SimpleTestCase):
+    def setUp(self):
+        self.member, self.subscriber, self.assignee, self.creator = (
+            str(uuid4()) for _ in range(4)
+        )
+        self.recipients = SimpleNamespace(
+            project=SimpleNamespace(id=uuid4(), workspace_id=uuid4()),
+            issue_id=str(uuid4()),
+            members={self.member, self.subscriber, self.assignee, self.creator},
+            subscribers={self.subscriber},
+            assignees={self.assignee},
+            creator_id=self.creator,
+        )
+
+    def test_only_members_not_following_are_subscribed(self):
+        subscribers = extract_mentions_as_subscribers(
+            self.recipients,
+            [
+                self.member,
+                self.member,
+                self.subscriber,
+                self.assignee,
+                self.creator,
+                str(uuid4()),
+            ],
+        )
+        self.assertEqual(
+            [subscriber.subscriber_id for subscriber in subscribers], [self.member]
+        )
+
+
+class ShouldSendEmailTest(SimpleTestCase):
+    def get_preference(self, **kwargs):
+        flags = {
+            "state_change": False,
+            "issue_completed": False,
+            "comment": False,
+            "property_change": False,
+        }
+        flags.update(kwargs)
+        return SimpleNamespace(**flags)
+
+    def test_missing_preference(self):
+        self.assertFalse(should_send_email(None, {"field": "priority"}, set()))
+
+    def test_completed_state(self):
+        state_id = str(uuid4())
+        activity = {"field": "state", "new_identifier": state_id}
+        preference = self.get_preference(issue_completed=True)
+        self.assertTrue(should_send_email(preference, activity, {state_id}))
+        self.assertFalse(should_send_email(preference, activity, set()))
+
+    def test_property_change(self):
+        activity = {"field": "priority"}
+        self.assertTrue(
+            should_send_email(
+                self.get_preference(property_change=True), activity, set()
+            )
+        )
+        self.assertFalse(should_send_email(self.get_preference(), activity, set()))
@@ -0,0 +1,254 @@
+# Python imports
+import datetime
+import uuid
+
+# Django imports
+from django.db.models import Exists, Q
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.db.models import Issue
+from plane.utils.paginator import (
+    GROUP_TOTAL_FIELD,
+    PARTITION_ROWS_FIELD,
+    SUB_GROUP_TOTAL_FIELD,
+    Cursor,
+    GroupedOffsetPaginator,
+    SubGroupedOffsetPaginator,
+    bucket_multi_group_results,
+    map_result_group_ids,
+)
+
+
+def build_label_rows(issue_count, label_count, labels_per_issue=5):
+    # One row per issue and label, the shape of a labels__id grouped page
+    label_ids = [uuid.uuid4() for _ in range(label_count)]
+    rows = []
+    for index in range(issue_count):
+        issue_id = uuid.uuid4()
+        for offset in range(labels_per_issue):
+            rows.append(
+                {
+                    "id": issue_id,
+                    "name": f"Issue {index}",
+                    "labels__id": label_ids[(index + offset) % label_count],
+                }
+            )
+    return rows
+
+
+class CountingRow(dict):
+    # Counts the reads of the row
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return super().__getitem__(key)
+
+
+class GroupedPageQuerySet:
+    # Records the window annotations and the filters of a grouped page
+    model = Issue
+
+    def __init__(self):
+        self.annotations = {}
+        self.filters = []
+
+    def annotate(self, **kwargs):
+        self.annotations.update(kwargs)
+        return self
+
+    def filter(self, **kwargs):
+        self.filters.append(kwargs)
+        return self
+
+    def order_by(self, *args):
+        return self
+
+
+def build_group_row(group, group_total, partition_rows=None, **fields):
+    # A page row carrying the window totals of its group
+    return {
+        "id": uuid.uuid4(),
+        "state__group": group,
+        GROUP_TOTAL_FIELD: group_total,
+        PARTITION_ROWS_FIELD: (
+            group_total if partition_rows is None else partition_rows
+        ),
+        **fields,
+    }
+
+
+class MultiGroupBucketingTest(SimpleTestCase):
+    def test_result_added_once_per_group(self):
+        label_a, label_b = uuid.uuid4(), uuid.uuid4()
+        issue_id = uuid.uuid4()
+        rows = [
+            {"id": issue_id, "labels__id": label_a},
+            {"id": issue_id, "labels__id": label_b},
+            {"id": uuid.uuid4(), "labels__id": None},
+        ]
+
+        grouped = bucket_multi_group_results(rows, "labels__id", "label_ids")
+
+        self.assertEqual(len(grouped[str(label_a)]), 1)
+        self.assertEqual(len(grouped[str(label_b)]), 1)
+        self.assertIs(grouped[str(label_a)][0], grouped[str(label_b)][0])
+        self.assertEqual(
+            grouped[str(label_a)][0]["label_ids"], [str(label_a), str(label_b)]
+        )
+        self.assertEqual(grouped["None"][0]["label_ids"], [])
+
+    def test_map_result_group_ids(self):
+        rows = build_label_rows(issue_count=10, label_count=4, labels_per_issue=2)
+
+        mapping = map_result_group_ids(rows, "labels__id")
+
+        self.assertEqual(len(mapping), 10)
+        self.assertTrue(all(len(group_ids) == 2 for group_ids in mapping.values()))
+
+    def test_bucketing_reads_each_row_a_constant_number_of_times(self):
+        # 10k rows over 200 labels, a scan of the page per row would read
+        # every row thousands of times
+        rows = [
+            CountingRow(row)
+            for row in build_label_rows(issue_count=2000, label_count=200)
+        ]
+
+        grouped = bucket_multi_group_results(rows, "labels__id", "label_ids")
+
+        self.assertLessEqual(max(row.reads for row in rows), 3)
+        self.assertEqual(sum(len(results) for results in grouped.values()), len(rows))
+
+
+class CursorPositionTest(SimpleTestCase):
+    def test_datetimes_keep_their_microseconds(self):
+        created_at = datetime.datetime(
+            2026, 10, 17, 12, 0, 0, 123456, tzinfo=datetime.timezone.utc
+        )
+        issue_id = uuid.uuid4()
+        position = Cursor.decode_position(
+            Cursor.encode_position((created_at, created_at, issue_id))
+        )
+        self.assertEqual(datetime.datetime.fromisoformat(position[1]), created_at)
+        self.assertEqual(position[2], str(issue_id))
+
+
+class GroupedWindowTotalsTest(SimpleTestCase):
+    def get_paginator(self, queryset=None, count_filter=None):
+        return GroupedOffsetPaginator(
+            queryset=queryset or GroupedPageQuerySet(),
+            group_by_field_name="state__group",
+            group_by_fields=["backlog", "started", "completed"],
+            count_filter=count_filter,
+            order_by="-created_at",
+        )
+
+    def test_totals_are_read_from_the_page_rows(self):
+        queryset = GroupedPageQuerySet()
+        paginator = self.get_paginator(queryset)
+        cursor_result = paginator.get_result(limit=2, cursor=Cursor(2, 0, 0))
+
+        # The page is the only query, the totals are windows on its rows
+        self.assertEqual(queryset.filters, [{"row_number__gt": 0, "row_number__lt": 3}])
+        self.assertIn(GROUP_TOTAL_FIELD, queryset.annotations)
+
+        rows = [
+            build_group_row("backlog", 3),
+            build_group_row("backlog", 3),
+            build_group_row("started", 1),
+        ]
+        processed_results = paginator.process_results(rows)
+
+        self.assertEqual(cursor_result.hits, 4)
+        self.assertEqual(cursor_result.max_hits, 2)
+        self.assertTrue(cursor_result.next.has_results)
+        self.assertEqual(processed_results["backlog"]["total_results"], 3)
+        self.assertEqual(processed_results["started"]["total_results"], 1)
+        self.assertEqual(processed_results["completed"]["total_results"], 0)
+        self.assertNotIn(GROUP_TOTAL_FIELD, rows[0])
+        self.assertNotIn(PARTITION_ROWS_FIELD, rows[0])
+
+    def test_count_filter_is_applied_in_the_window(self):
+        queryset = GroupedPageQuerySet()
+        self.get_paginator(queryset, Q(archived_at__isnull=True)).get_result(
+            limit=2, cursor=Cursor(2, 0, 0)
+        )
+        group_total = queryset.annotations[GROUP_TOTAL_FIELD].source_expression
+        partition_rows = queryset.annotations[PARTITION_ROWS_FIELD].source_expression
+
+        self.assertIsInstance(group_total.filter, Exists)
+        self.assertIsNone(partition_rows.filter)
+
+    def test_next_page_follows_the_unfiltered_rows(self):
+        paginator = self.get_paginator(count_filter=Q(archived_at__isnull=True))
+        cursor_result = paginator.get_result(limit=2, cursor=Cursor(2, 0, 0))
+
+        # Archived rows are paged but not counted, an emptied group counts 1
+        processed_results = paginator.process_results(
+            [build_group_row("backlog", 0, partition_rows=3) for _ in range(2)]
+        )
+
+        self.assertTrue(cursor_result.next.has_results)
+        self.assertEqual(processed_results["backlog"]["total_results"], 1)
+
+    def test_last_page_has_no_next_results(self):
+        paginator = self.get_paginator()
+        cursor_result = paginator.get_result(limit=2, cursor=Cursor(2, 1, 0))
+        paginator.process_results([build_group_row("backlog", 3)])
+
+        self.assertFalse(cursor_result.next.has_results)
+        self.assertTrue(cursor_result.prev.has_results)
+        self.assertEqual(cursor_result.hits, 3)
+
+    def test_empty_page(self):
+        paginator = self.get_paginator()
+        cursor_result = paginator.get_result(limit=2, cursor=Cursor(2, 3, 0))
+
+        self.assertEqual(paginator.process_results([]), {})
+        self.assertFalse(cursor_result.next.has_results)
+        self.assertEqual(cursor_result.hits, 0)
+        self.assertEqual(cursor_result.max_hits, 0)
+
+    def test_sub_group_totals(self):
+        paginator = SubGroupedOffsetPaginator(
+            queryset=GroupedPageQuerySet(),
+            group_by_field_name="state__group",
+            sub_group_by_field_name="priority",
+            group_by_fields=["backlog", "started"],
+            sub_group_by_fields=["urgent", "low"],
+            count_filter=None,
+            order_by="-created_at",
+        )
+        cursor_result = paginator.get_result(limit=2, cursor=Cursor(2, 0, 0))
+
+        processed_results = paginator.process_results(
+            [
+                build_group_row(
+                    "backlog", 3, 2, priority="urgent", **{SUB_GROUP_TOTAL_FIELD: 2}
+                ),
+                build_group_row(
+                    "backlog", 3, 2, priority="urgent", **{SUB_GROUP_TOTAL_FIELD: 2}
+                ),
+                build_group_row(
+                    "backlog", 3, 1, priority="low", **{SUB_GROUP_TOTAL_FIELD: 1}
+                ),
+                build_group_row(
+                    "started", 1, 1, priority="low", **{SUB_GROUP_TOTAL_FIELD: 1}
+                ),
+            ]
+        )
+
+        self.assertEqual(cursor_result.hits, 4)
+        self.assertEqual(cursor_result.max_hits, 2)
+        self.assertFalse(cursor_result.next.has_results)
+        self.assertEqual(paginator.total_group_dict, {"backlog": 3, "started": 1})
+        self.assertEqual(
+            paginator.total_sub_group_dict,
+            {"backlog": {"urgent": 2, "low": 1}, "started": {"low": 1}},
+        )
+        self.assertEqual(
+            len(processed_results["backlog"]["results"]["urgent"]["results"]), 2
+        )
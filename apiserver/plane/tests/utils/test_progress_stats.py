@@ -0,0 +1,69 @@
+# Python imports
+from types import SimpleNamespace
+from unittest import mock
+from uuid import uuid4
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.db.models import CycleStats
+from plane.db.models.progress_stats import (
+    get_progress_values,
+    update_issue_progress_stats,
+)
+
+
+class ProgressStatsTest(SimpleTestCase):
+    def test_stat_fields_are_model_fields(self):
+        fields = {field.name for field in CycleStats._meta.get_fields()}
+        self.assertTrue(set(CycleStats.stat_fields()) <= fields)
+        self.assertEqual(len(CycleStats.stat_fields()), 12)
+
+    def test_annotations_read_the_stats(self):
+        annotations = CycleStats.annotations("total_issues")
+        self.assertEqual(list(annotations), ["total_issues"])
+        self.assertEqual(len(CycleStats.annotations()), 12)
+
+
+@mock.patch("plane.db.models.progress_stats.refresh_issue_progress")
+class IssueProgressReceiverTest(SimpleTestCase):
+    def setUp(self):
+        self.issue = SimpleNamespace(
+            id=uuid4(),
+            state_id=uuid4(),
+            estimate_point_id=None,
+            archived_at=None,
+            is_draft=False,
+            deleted_at=None,
+        )
+        self.issue._loaded_progress = get_progress_values(self.issue)
+
+    def test_created_issue_is_skipped(self, refresh):
+        update_issue_progress_stats(None, self.issue, created=True)
+        refresh.assert_not_called()
+
+    def test_unrelated_changes_are_skipped(self, refresh):
+        self.issue.name = "renamed"
+        update_issue_progress_stats(
+            None, self.issue, created=False, update_fields={"name", "state"}
+        )
+        refresh.assert_not_called()
+
+    def test_state_change_refreshes(self, refresh):
+        self.issue.state_id = uuid4()
+        update_issue_progress_stats(None, self.issue, created=False)
+        refresh.assert_called_once_with([self.issue.id])
+
+        # The saved values are the loaded ones of the next save
+        update_issue_progress_stats(None, self.issue, created=False)
+        refresh.assert_called_once()
+
+    def test_issue_not_loaded_refreshes(self, refresh):
+        del self.issue._loaded_progress
+        update_issue_progress_stats(None, self.issue, created=False)
+        refresh.assert_called_once_with([self.issue.id])
+
+    def test_delete_refreshes(self, refresh):
+        update_issue_progress_stats(None, self.issue)
+        refresh.assert_called_once_with([self.issue.id])
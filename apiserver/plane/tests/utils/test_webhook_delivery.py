@@ -0,0 +1,167 @@
+# Python imports
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Django imports
+from django.test import SimpleTestCase, override_settings
+
+# Module imports
+from plane.utils.webhook_delivery import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    WebhookDeliveryEngine,
+    get_circuit_state,
+    record_circuit_result,
+)
+
+RESPONSE_DELAY = 0.05
+
+
+class StubReceiver(BaseHTTPRequestHandler):
+    # Slow receiver tracking the requests in flight for every path
+    lock = threading.Lock()
+    in_flight = defaultdict(int)
+    max_in_flight = defaultdict(int)
+    connections = set()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.lock:
+            self.connections.add(self.client_address)
+            self.in_flight[self.path] += 1
+            self.max_in_flight[self.path] = max(
+                self.max_in_flight[self.path], self.in_flight[self.path]
+            )
+        time.sleep(RESPONSE_DELAY)
+        with self.lock:
+            self.in_flight[self.path] -= 1
+        status = 500 if self.path.startswith("/fail") else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        return
+
+
+@override_settings(WEBHOOK_POOL_CONNECTIONS=10, WEBHOOK_POOL_MAXSIZE=20)
+class WebhookDeliveryEngineTest(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        StubReceiver.protocol_version = "HTTP/1.1"
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubReceiver)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        StubReceiver.in_flight.clear()
+        StubReceiver.max_in_flight.clear()
+        StubReceiver.connections.clear()
+
+    def build_requests(self, count, webhooks=10, prefix="ok"):
+        return [
+            {
+                "webhook_id": f"{prefix}-{index % webhooks}",
+                "url": f"{self.base_url}/{prefix}/{index % webhooks}",
+                "headers": {"Content-Type": "application/json"},
+                "payload": {"event": "issue", "index": index},
+            }
+            for index in range(count)
+        ]
+
+    def test_results_in_request_order(self):
+        results = WebhookDeliveryEngine(max_workers=5, timeout=5).send(
+            self.build_requests(6, webhooks=2, prefix="ok")
+            + self.build_requests(2, webhooks=1, prefix="fail")
+        )
+        self.assertEqual(
+            [response.status_code for response, _ in results], [200] * 6 + [500] * 2
+        )
+
+    def test_connection_error_is_returned(self):
+        results = WebhookDeliveryEngine(max_workers=2, timeout=1).send(
+            [
+                {
+                    "webhook_id": "closed",
+                    "url": "http://127.0.0.1:1/closed",
+                    "headers": {},
+                    "payload": {},
+                }
+            ]
+        )
+        response, error = results[0]
+        self.assertIsNone(response)
+        self.assertIsNotNone(error)
+
+    def test_per_webhook_concurrency_limit(self):
+        WebhookDeliveryEngine(
+            max_workers=20, per_webhook_concurrency=2, timeout=5
+        ).send(self.build_requests(20, webhooks=1))
+        self.assertLessEqual(StubReceiver.max_in_flight["/ok/0"], 2)
+
+    def test_connections_are_reused(self):
+        WebhookDeliveryEngine(max_workers=1, timeout=5).send(
+            self.build_requests(10, webhooks=1)
+        )
+        self.assertEqual(len(StubReceiver.connections), 1)
+
+    def test_concurrent_throughput(self):
+        # Sequential delivery takes count * RESPONSE_DELAY seconds
+        count = 40
+        start = time.perf_counter()
+        results = WebhookDeliveryEngine(
+            max_workers=20, per_webhook_concurrency=4, timeout=5
+        ).send(self.build_requests(count, webhooks=10))
+        elapsed = time.perf_counter() - start
+
+        self.assertTrue(all(response.status_code == 200 for response, _ in results))
+        self.assertLess(elapsed, count * RESPONSE_DELAY / 4)
+
+
+@override_settings(
+    WEBHOOK_CIRCUIT_THRESHOLD=3,
+    WEBHOOK_CIRCUIT_COOLDOWN=60,
+    WEBHOOK_CIRCUIT_COOLDOWN_MAX=600,
+)
+class WebhookCircuitTest(SimpleTestCase):
+    def test_opens_after_consecutive_failures(self):
+        circuit = None
+        for _ in range(2):
+            circuit = record_circuit_result(circuit, False, 0)
+        self.assertEqual(get_circuit_state(circuit, 0), CIRCUIT_CLOSED)
+
+        circuit = record_circuit_result(circuit, False, 0)
+        self.assertEqual(get_circuit_state(circuit, 0), CIRCUIT_OPEN)
+        self.assertEqual(get_circuit_state(circuit, 61), CIRCUIT_HALF_OPEN)
+
+    def test_failures_while_open_do_not_trip_again(self):
+        circuit = None
+        for _ in range(10):
+            circuit = record_circuit_result(circuit, False, 0)
+        self.assertEqual(circuit["trips"], 1)
+        self.assertEqual(circuit["opened_until"], 60)
+
+    def test_cooldown_doubles_and_success_resets(self):
+        circuit = None
+        for _ in range(3):
+            circuit = record_circuit_result(circuit, False, 0)
+        # Failed probe once the cooldown is over
+        circuit = record_circuit_result(circuit, False, 61)
+        self.assertEqual(circuit["trips"], 2)
+        self.assertEqual(circuit["opened_until"], 61 + 120)
+
+        circuit = record_circuit_result(circuit, True, 200)
+        self.assertEqual(get_circuit_state(circuit, 200), CIRCUIT_CLOSED)
+        self.assertEqual(circuit["trips"], 0)
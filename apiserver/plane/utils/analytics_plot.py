@@ -3,6 +3,8 @@ from datetime import timedelta
 from itertools import groupby
 
 # Django import
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.db.models import Case, CharField, Count, F, Sum, Value, When, FloatField
 from django.db.models.functions import (
@@ -16,7 +18,8 @@ from django.db.models.functions import (
 from django.utils import timezone
 
 # Module imports
-from plane.db.models import Issue, Project
+from plane.db.models import Issue
+from plane.utils.cache import bump_generations, get_generations
 
 
 def annotate_with_monthly_dimension(queryset, field_name, attribute):
@@ -101,40 +104,69 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
     return sort_data(grouped_data, temp_axis)
 
 
-def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_id=None):
-    # Total Issues in Cycle or Module
-    total_issues = queryset.total_issues
-    # check whether the estimate is a point or not
-    estimate_type = Project.objects.filter(
-        workspace__slug=slug,
-        pk=project_id,
-        estimate__isnull=False,
-        estimate__type="points",
-    ).exists()
-    if estimate_type and plot_type == "points" and cycle_id:
-        issue_estimates = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
-
-    if estimate_type and plot_type == "points" and module_id:
-        issue_estimates = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_module__module_id=module_id,
-            issue_module__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
+def get_burndown_tag(project_id):
+    return f"burndown:{project_id}"
+
 
+def invalidate_burndown(project_id):
+    """Drop the cached burndowns of the cycles and modules of the project"""
+    bump_generations([get_burndown_tag(project_id)])
+
+
+def get_completion_distribution(slug, project_id, plot_type, cycle_id, module_id):
+    """
+    Return the total estimate points of the issues and the issues or points
+    completed per day, sorted by day, from a single grouped query
+    """
+    issues = Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id)
+    if cycle_id:
+        issues = issues.filter(
+            issue_cycle__cycle_id=cycle_id, issue_cycle__deleted_at__isnull=True
+        )
+    else:
+        issues = issues.filter(
+            issue_module__module_id=module_id, issue_module__deleted_at__isnull=True
+        )
+
+    if plot_type == "points":
+        issues = issues.filter(estimate_point__isnull=False)
+        completed = Sum(Cast("estimate_point__value", FloatField()))
+    else:
+        completed = Count("id")
+
+    distribution = (
+        issues.annotate(date=TruncDate("completed_at"))
+        .values("date")
+        .annotate(completed=completed)
+        .order_by("date")
+    )
+    total = 0
+    completed_per_day = []
+    for item in distribution:
+        total += item["completed"] or 0
+        if item["date"] is not None:
+            completed_per_day.append((item["date"], item["completed"] or 0))
+    return total, completed_per_day
+
+
+def build_burndown(date_range, total, completed_per_day, today):
+    """
+    Return the pending issues or points for every date of the range, walking
+    the dates and the sorted completions once
+    """
+    chart_data = {}
+    completed = 0
+    index = 0
+    for date in date_range:
+        # Completions up to the date, including those before the range starts
+        while index < len(completed_per_day) and completed_per_day[index][0] <= date:
+            completed += completed_per_day[index][1]
+            index += 1
+        chart_data[str(date)] = None if date > today else total - completed
+    return chart_data
+
+
+def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_id=None):
     if cycle_id:
         if queryset.end_date and queryset.start_date:
             # Get all dates between the two dates
@@ -144,103 +176,36 @@ def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_i
             ]
         else:
             date_range = []
-
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
-
-    if module_id:
+    else:
         # Get all dates between the two dates
         date_range = [
             (queryset.start_date + timedelta(days=x))
             for x in range((queryset.target_date - queryset.start_date).days + 1)
         ]
 
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
-
-    if plot_type == "points":
-        for date in date_range:
-            cumulative_pending_issues = total_estimate_points
-            total_completed = 0
-            total_completed = sum(
-                float(item["estimate_point__value"])
-                for item in completed_issues_estimate_point_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
-    else:
-        for date in date_range:
-            cumulative_pending_issues = total_issues
-            total_completed = 0
-            total_completed = sum(
-                item["total_completed"]
-                for item in completed_issues_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
-
+    # Total Issues in Cycle or Module
+    total_issues = queryset.total_issues
+    today = timezone.now().date()
+
+    # Cached for the day until an issue of the project changes
+    generation = get_generations([get_burndown_tag(project_id)])[0]
+    key = (
+        f"burndown:{generation}:{cycle_id or module_id}:{plot_type}:{today}:"
+        f"{date_range[0] if date_range else ''}:"
+        f"{date_range[-1] if date_range else ''}:{total_issues}"
+    )
+    chart_data = cache.get(key)
+    if chart_data is not None:
+        return chart_data
+
+    total_estimate_points, completed_per_day = get_completion_distribution(
+        slug, project_id, plot_type, cycle_id, module_id
+    )
+    chart_data = build_burndown(
+        date_range,
+        total_estimate_points if plot_type == "points" else total_issues,
+        completed_per_day,
+        today,
+    )
+    cache.set(key, chart_data, settings.BURNDOWN_CACHE_TIMEOUT)
     return chart_data
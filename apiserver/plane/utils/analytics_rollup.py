@@ -0,0 +1,330 @@
+# Python imports
+from collections import defaultdict
+from itertools import groupby
+
+# Django imports
+from django.db import models, transaction
+from django.db.models import Case, Q, Sum, Value, When
+from django.db.models.functions import Concat
+
+# Module imports
+from plane.db.models import (
+    AnalyticsRollup,
+    Cycle,
+    CycleIssue,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    Label,
+    Module,
+    ModuleIssue,
+    Project,
+    State,
+    User,
+)
+from plane.db.models.analytic import ANALYTICS_ROLLUP_STALE_KEY, mark_rollups_stale
+from plane.settings.redis import redis_instance
+from plane.utils.analytics_plot import sort_data
+
+ROLLUP_AXES = [
+    "state_id",
+    "state__group",
+    "labels__id",
+    "assignees__id",
+    "estimate_point__value",
+    "issue_cycle__cycle_id",
+    "issue_module__module_id",
+    "priority",
+    "start_date",
+    "target_date",
+    "created_at",
+    "completed_at",
+]
+
+MONTH_AXES = ["start_date", "target_date", "created_at", "completed_at"]
+
+# Filters the rollups can answer, any other filter is computed live
+ROLLUP_FILTERS = {"project__in"}
+
+
+def pop_stale_projects(count):
+    return [
+        project_id.decode("utf-8")
+        for project_id in redis_instance().spop(ANALYTICS_ROLLUP_STALE_KEY, count) or []
+    ]
+
+
+def get_month(value):
+    # Same format as annotate_with_monthly_dimension
+    return f"{value.year}-{value.month}" if value else None
+
+
+def get_estimate(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_issue_axis_values(project_id):
+    """
+    Yield the value of every axis for the issues of the project along with
+    their estimate. Many to many axes have one value per related object.
+    """
+    relations = {
+        "labels__id": IssueLabel.objects.filter(project_id=project_id).values_list(
+            "issue_id", "label_id"
+        ),
+        "assignees__id": IssueAssignee.objects.filter(
+            project_id=project_id
+        ).values_list("issue_id", "assignee_id"),
+        "issue_cycle__cycle_id": CycleIssue.objects.filter(
+            project_id=project_id
+        ).values_list("issue_id", "cycle_id"),
+        "issue_module__module_id": ModuleIssue.objects.filter(
+            project_id=project_id
+        ).values_list("issue_id", "module_id"),
+    }
+    related = {}
+    for axis, pairs in relations.items():
+        related[axis] = defaultdict(list)
+        for issue_id, value in pairs.iterator():
+            related[axis][issue_id].append(str(value))
+
+    issues = Issue.issue_objects.filter(project_id=project_id).values(
+        "id",
+        "state_id",
+        "state__group",
+        "priority",
+        "estimate_point__value",
+        "start_date",
+        "target_date",
+        "created_at",
+        "completed_at",
+    )
+    for issue in issues.iterator():
+        values = {
+            "state_id": [str(issue["state_id"]) if issue["state_id"] else None],
+            "state__group": [issue["state__group"]],
+            "priority": [issue["priority"]],
+            "estimate_point__value": [issue["estimate_point__value"]],
+        }
+        for axis in MONTH_AXES:
+            values[axis] = [get_month(issue[axis])]
+        for axis, issue_values in related.items():
+            values[axis] = issue_values.get(issue["id"]) or [None]
+        yield values, get_estimate(issue["estimate_point__value"])
+
+
+def count_rollups(issue_values):
+    """
+    Return the issue count and estimate sum of every axis value and of every
+    axis and segment value pair, keyed by (x_axis, x_value, segment,
+    segment_value). Issues are counted once per related object, like the
+    joins of build_graph_plot.
+    """
+    rollups = defaultdict(lambda: [0, None])
+
+    def add(key, estimate):
+        rollup = rollups[key]
+        rollup[0] += 1
+        if estimate is not None:
+            rollup[1] = (rollup[1] or 0) + estimate
+
+    total = 0
+    for values, estimate in issue_values:
+        total += 1
+        for x_axis in ROLLUP_AXES:
+            for x_value in values[x_axis]:
+                # Issues without a value are never plotted on the x axis
+                if x_value is None:
+                    continue
+                add((x_axis, x_value, "", None), estimate)
+                for segment in ROLLUP_AXES:
+                    if segment == x_axis:
+                        continue
+                    for segment_value in values[segment]:
+                        add((x_axis, x_value, segment, segment_value), estimate)
+    return total, rollups
+
+
+def rebuild_project_rollups(project_id):
+    """Recompute the rollups of a project from its issues"""
+    project = Project.objects.filter(pk=project_id).values("workspace_id").first()
+    if project is None:
+        AnalyticsRollup.all_objects.filter(project_id=project_id).delete()
+        return
+
+    total, rollups = count_rollups(get_issue_axis_values(project_id))
+    rows = [
+        AnalyticsRollup(
+            workspace_id=project["workspace_id"],
+            project_id=project_id,
+            x_axis="",
+            segment="",
+            issue_count=total,
+        )
+    ]
+    for (x_axis, x_value, segment, segment_value), (
+        issue_count,
+        estimate,
+    ) in rollups.items():
+        rows.append(
+            AnalyticsRollup(
+                workspace_id=project["workspace_id"],
+                project_id=project_id,
+                x_axis=x_axis,
+                x_value=x_value,
+                segment=segment,
+                segment_value=segment_value,
+                issue_count=issue_count,
+                estimate=estimate,
+            )
+        )
+
+    with transaction.atomic():
+        AnalyticsRollup.all_objects.filter(project_id=project_id).delete()
+        AnalyticsRollup.objects.bulk_create(rows, batch_size=1000)
+
+
+def get_rollup_plot(slug, x_axis, y_axis, segment, filters):
+    """
+    Return the total and the distribution of build_graph_plot from the rollups,
+    or None when the filters are not supported or a project was never rolled up
+    """
+    if not set(filters) <= ROLLUP_FILTERS:
+        return None
+    if x_axis not in ROLLUP_AXES or (segment and segment not in ROLLUP_AXES):
+        return None
+
+    # Every project of the workspace like the live query, the rollups of an
+    # archived project are rebuilt empty as its issues leave issue_objects
+    projects = Project.objects.filter(workspace__slug=slug)
+    if "project__in" in filters:
+        projects = projects.filter(pk__in=filters["project__in"])
+    project_ids = list(projects.values_list("id", flat=True))
+
+    rollups = AnalyticsRollup.objects.filter(project_id__in=project_ids)
+    totals = dict(
+        rollups.filter(x_axis="", segment="").values_list("project_id", "issue_count")
+    )
+    missing = [project_id for project_id in project_ids if project_id not in totals]
+    if missing:
+        mark_rollups_stale(missing)
+        return None
+
+    key = "count" if y_axis == "issue_count" else "estimate"
+    fields = ["x_value", "segment_value"] if segment else ["x_value"]
+    rows = (
+        rollups.filter(x_axis=x_axis, segment=segment or "")
+        .values(*fields)
+        .annotate(
+            value=Sum("issue_count") if y_axis == "issue_count" else Sum("estimate")
+        )
+        .order_by(*fields)
+    )
+
+    results = []
+    for row in rows:
+        result = {"dimension": row["x_value"]}
+        if segment:
+            result["segment"] = row["segment_value"]
+        result[key] = row["value"]
+        results.append(result)
+
+    distribution = {
+        str(dimension): list(items)
+        for dimension, items in groupby(results, key=lambda x: x["dimension"])
+    }
+    return sum(totals.values()), sort_data(distribution, x_axis)
+
+
+def get_rollup_details(distribution, x_axis, segment):
+    """
+    Return the state, label, assignee, cycle and module details of the values
+    plotted from the rollups, in the shape of the live queries
+    """
+    ids = defaultdict(set)
+    for items in distribution.values():
+        for item in items:
+            ids[x_axis].add(item["dimension"])
+            if segment and item.get("segment") is not None:
+                ids[segment].add(item["segment"])
+
+    details = {
+        "state_details": {},
+        "assignee_details": {},
+        "label_details": {},
+        "cycle_details": {},
+        "module_details": {},
+    }
+    if "state_id" in ids:
+        details["state_details"] = [
+            {"state_id": state_id, "state__name": name, "state__color": color}
+            for state_id, name, color in State.objects.filter(pk__in=ids["state_id"])
+            .order_by("id")
+            .values_list("id", "name", "color")
+        ]
+    if "labels__id" in ids:
+        details["label_details"] = [
+            {"labels__id": label_id, "labels__color": color, "labels__name": name}
+            for label_id, color, name in Label.objects.filter(pk__in=ids["labels__id"])
+            .order_by("id")
+            .values_list("id", "color", "name")
+        ]
+    if "assignees__id" in ids:
+        details["assignee_details"] = [
+            {
+                "assignees__avatar_url": avatar_url,
+                "assignees__display_name": display_name,
+                "assignees__first_name": first_name,
+                "assignees__last_name": last_name,
+                "assignees__id": user_id,
+            }
+            for avatar_url, display_name, first_name, last_name, user_id in (
+                User.objects.filter(
+                    Q(avatar__isnull=False) | Q(avatar_asset__isnull=False),
+                    pk__in=ids["assignees__id"],
+                )
+                .annotate(
+                    avatar_url=Case(
+                        # If `avatar_asset` exists, use it to generate the asset URL
+                        When(
+                            avatar_asset__isnull=False,
+                            then=Concat(
+                                Value("/api/assets/v2/static/"),
+                                "avatar_asset",
+                                Value("/"),
+                            ),
+                        ),
+                        # If `avatar_asset` is None, fall back to using `avatar`
+                        When(avatar_asset__isnull=True, then="avatar"),
+                        default=Value(None),
+                        output_field=models.CharField(),
+                    )
+                )
+                .order_by("id")
+                .values_list(
+                    "avatar_url", "display_name", "first_name", "last_name", "id"
+                )
+            )
+        ]
+    if "issue_cycle__cycle_id" in ids:
+        details["cycle_details"] = [
+            {"issue_cycle__cycle_id": cycle_id, "issue_cycle__cycle__name": name}
+            for cycle_id, name in Cycle.objects.filter(
+                pk__in=ids["issue_cycle__cycle_id"]
+            )
+            .order_by("id")
+            .values_list("id", "name")
+        ]
+    if "issue_module__module_id" in ids:
+        details["module_details"] = [
+            {"issue_module__module_id": module_id, "issue_module__module__name": name}
+            for module_id, name in Module.objects.filter(
+                pk__in=ids["issue_module__module_id"]
+            )
+            .order_by("id")
+            .values_list("id", "name")
+        ]
+    return details
@@ -0,0 +1,127 @@
+# Python imports
+import threading
+import time
+from collections import OrderedDict
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import APIToken
+from plane.db.models.api import get_api_token_cache_key
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+API_TOKEN_LAST_USED_KEY = "api_token_last_used"
+
+
+class LocalTokenCache:
+    """Small per process LRU in front of redis, entries expire on their own"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value, timeout):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + timeout)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+
+local_token_cache = LocalTokenCache(settings.API_TOKEN_LOCAL_CACHE_SIZE)
+# Last time the usage of a token was recorded by this process
+last_used_recorded = LocalTokenCache(settings.API_TOKEN_LOCAL_CACHE_SIZE)
+
+
+def load_api_token(token):
+    api_token = (
+        APIToken.objects.filter(
+            Q(Q(expired_at__gt=timezone.now()) | Q(expired_at__isnull=True)),
+            token=token,
+            is_active=True,
+        )
+        .select_related("user")
+        .first()
+    )
+    if api_token is None:
+        return None
+    return {
+        "id": str(api_token.id),
+        "user": api_token.user,
+        "is_service": api_token.is_service,
+        "expired_at": api_token.expired_at,
+    }
+
+
+def get_timeout(api_token, timeout):
+    # Never keep a token cached past its expiry
+    if api_token["expired_at"] is None:
+        return timeout
+    return min(timeout, (api_token["expired_at"] - timezone.now()).total_seconds())
+
+
+def resolve_api_token(token):
+    """
+    Return the active token with its user, from the local cache, then redis,
+    then the database. Returns None when the token is not valid.
+    """
+    key = get_api_token_cache_key(token)
+    api_token = local_token_cache.get(key)
+    if api_token is None:
+        api_token = cache.get(key)
+        if api_token is None:
+            api_token = load_api_token(token)
+            if api_token is None:
+                return None
+            timeout = get_timeout(api_token, settings.API_TOKEN_CACHE_TIMEOUT)
+            if timeout > 0:
+                cache.set(key, api_token, timeout)
+        timeout = get_timeout(api_token, settings.API_TOKEN_LOCAL_CACHE_TIMEOUT)
+        if timeout > 0:
+            local_token_cache.set(key, api_token, timeout)
+
+    if (
+        api_token["expired_at"] is not None
+        and api_token["expired_at"] <= timezone.now()
+    ):
+        local_token_cache.delete(key)
+        return None
+    return api_token
+
+
+def record_api_token_usage(api_token):
+    """
+    Record the last use of the token in redis at most once a minute per process,
+    flush_api_token_last_used writes them to the database in bulk
+    """
+    if last_used_recorded.get(api_token["id"]) is not None:
+        return
+    last_used_recorded.set(api_token["id"], True, settings.API_TOKEN_LAST_USED_INTERVAL)
+    try:
+        redis_instance().hset(
+            API_TOKEN_LAST_USED_KEY, api_token["id"], timezone.now().isoformat()
+        )
+    except Exception as e:
+        # Usage tracking must never fail the request
+        log_exception(e)
@@ -1,5 +1,9 @@
 # Python imports
+import pickle
+import time
+import zlib
 from functools import wraps
+from urllib.parse import urlsplit
 
 # Django imports
 from django.conf import settings
@@ -8,6 +12,20 @@ from django.core.cache import cache
 # Third party imports
 from rest_framework.response import Response
 
+CACHE_PREFIX = "response_cache"
+
+
+def normalize_tag(path):
+    """
+    Return the tag of a path, the path without query string, host or the /api/
+    prefix so that "workspaces/:slug/states/" and "/api/workspaces/:slug/states/"
+    tag the same responses
+    """
+    path = urlsplit(path).path.strip("/")
+    if path.startswith("api/"):
+        path = path[len("api/") :]
+    return path + "/"
+
 
 def generate_cache_key(custom_path, auth_header=None):
     """Generate a cache key with the given params"""
@@ -18,8 +36,97 @@ def generate_cache_key(custom_path, auth_header=None):
     return key_data
 
 
-def cache_response(timeout=60 * 60, path=None, user=True):
-    """decorator to create cache per user"""
+def get_generation_key(tag):
+    return f"{CACHE_PREFIX}:generation:{tag}"
+
+
+def get_generations(tags):
+    """
+    Return the current generation of every tag. A missing generation starts at
+    the current time so that entries written before it was evicted never match.
+    """
+    keys = [get_generation_key(tag) for tag in tags]
+    generations = cache.get_many(keys)
+    missing = [key for key in keys if key not in generations]
+    if missing:
+        for key in missing:
+            cache.add(key, time.time_ns(), timeout=None)
+        generations.update(cache.get_many(missing))
+    return [generations.get(key, 0) for key in keys]
+
+
+def bump_generations(tags):
+    """Invalidate every entry stored under the tags in O(1) per tag"""
+    for tag in tags:
+        key = get_generation_key(tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+
+
+def record_cache_stat(name):
+    """Count the hits, misses and stale responses of the response cache"""
+    if not settings.RESPONSE_CACHE_STATS:
+        return
+    key = f"{CACHE_PREFIX}:stats:{name}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_cache_stats():
+    names = ["hit", "miss", "stale"]
+    stats = cache.get_many([f"{CACHE_PREFIX}:stats:{name}" for name in names])
+    return {name: stats.get(f"{CACHE_PREFIX}:stats:{name}", 0) for name in names}
+
+
+def get_tags(path, auth_header):
+    tag = normalize_tag(path)
+    # Entries are tagged with the path for everyone and the path of the user
+    return [tag, generate_cache_key(tag, auth_header)] if auth_header else [tag]
+
+
+def get_entry_key(custom_path, auth_header):
+    tags = get_tags(custom_path, auth_header)
+    generations = ":".join(str(generation) for generation in get_generations(tags))
+    return (
+        f"{CACHE_PREFIX}:{generations}:{generate_cache_key(custom_path, auth_header)}"
+    )
+
+
+def dump_entry(data, status, expires_at, compress):
+    payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    compressed = compress and len(payload) >= settings.RESPONSE_CACHE_COMPRESS_MIN_SIZE
+    return {
+        "data": zlib.compress(payload) if compressed else payload,
+        "compressed": compressed,
+        "status": status,
+        "expires_at": expires_at,
+    }
+
+
+def load_entry(entry):
+    payload = zlib.decompress(entry["data"]) if entry["compressed"] else entry["data"]
+    return pickle.loads(payload)
+
+
+def cache_response(
+    timeout=60 * 60, path=None, user=True, compress=False, stale_timeout=None
+):
+    """
+    decorator to create cache per user
+
+    Entries live for `timeout` seconds and are then served stale for up to
+    `stale_timeout` seconds while a single request refreshes them.
+    """
+    stale_timeout = (
+        settings.RESPONSE_CACHE_STALE_TIMEOUT
+        if stale_timeout is None
+        else stale_timeout
+    )
 
     def decorator(view_func):
         @wraps(view_func)
@@ -33,18 +140,36 @@ def cache_response(timeout=60 * 60, path=None, user=True):
                 else None
             )
             custom_path = path if path is not None else request.get_full_path()
-            key = generate_cache_key(custom_path, auth_header)
+            key = get_entry_key(custom_path, auth_header)
             cached_result = cache.get(key)
 
             if cached_result is not None:
-                return Response(cached_result["data"], status=cached_result["status"])
+                if cached_result["expires_at"] > time.time():
+                    record_cache_stat("hit")
+                    return Response(
+                        load_entry(cached_result), status=cached_result["status"]
+                    )
+                # One request refreshes the entry, the others are served stale
+                if not cache.add(f"{key}:refresh", 1, timeout=30):
+                    record_cache_stat("stale")
+                    return Response(
+                        load_entry(cached_result), status=cached_result["status"]
+                    )
+
+            record_cache_stat("miss")
             response = view_func(instance, request, *args, **kwargs)
             if response.status_code == 200 and not settings.DEBUG:
                 cache.set(
                     key,
-                    {"data": response.data, "status": response.status_code},
-                    timeout,
+                    dump_entry(
+                        response.data,
+                        response.status_code,
+                        time.time() + timeout,
+                        compress,
+                    ),
+                    timeout + stale_timeout,
                 )
+                cache.delete(f"{key}:refresh")
 
             return response
 
@@ -56,6 +181,11 @@ def cache_response(timeout=60 * 60, path=None, user=True):
 def invalidate_cache_directly(
     path=None, url_params=False, user=True, request=None, multiple=False
 ):
+    """
+    Invalidate the cached responses of a path for the user, or for everyone
+    when user is False. Every query string of the path is invalidated, so
+    `multiple` is kept for compatibility only.
+    """
     if url_params and path:
         path_with_values = path
         # Assuming `kwargs` could be passed directly if needed, otherwise, skip this part
@@ -71,12 +201,7 @@ def invalidate_cache_directly(
         if user
         else None
     )
-    key = generate_cache_key(custom_path, auth_header)
-
-    if multiple:
-        cache.delete_many(keys=cache.keys(f"*{key}*"))
-    else:
-        cache.delete(key)
+    bump_generations(get_tags(custom_path, auth_header)[-1:])
 
 
 def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
@@ -1,6 +1,10 @@
 # python imports
 from math import ceil
 
+# Django imports
+from django.db import connections
+from django.db.models import Q
+
 # constants
 PAGINATOR_MAX_LIMIT = 1000
 
@@ -81,3 +85,91 @@ def paginate(base_queryset, queryset, cursor, on_result):
     }
 
     return paginated_data
+
+
+class ChangeCursor:
+    """
+    Position in a change feed, the transaction id and change sequence of the
+    last change read
+    """
+
+    def __init__(self, change_xid: int, change_sequence: int):
+        self.change_xid = change_xid
+        self.change_sequence = change_sequence
+
+    def __str__(self):
+        return f"{self.change_xid}:{self.change_sequence}"
+
+    @classmethod
+    def from_string(cls, value):
+        """Return the cursor from string format, 0 being the start of the feed"""
+        try:
+            if str(value) == "0":
+                return cls(0, 0)
+            bits = value.split(":")
+            if len(bits) != 2:
+                raise ValueError("Cursor must be in the format 'xid:sequence'")
+            return cls(int(bits[0]), int(bits[1]))
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor format: {e}")
+
+
+def get_snapshot_xmin(using):
+    """Oldest transaction id still in progress, every older one has finished"""
+    with connections[using].cursor() as cursor:
+        cursor.execute("SELECT txid_snapshot_xmin(txid_current_snapshot())")
+        return cursor.fetchone()[0]
+
+
+def paginate_changes(base_queryset, queryset, cursor, on_result):
+    """
+    Paginate the rows of base_queryset changed after the cursor, in the order
+    of their transactions and changes. Only the changes of the transactions
+    older than any in progress are read: no change can commit before them
+    anymore, so the cursor never passes a change still to be committed. The
+    rows of the page found in queryset are returned through on_result, the
+    others as deleted ids.
+    """
+    cursor = ChangeCursor.from_string(cursor)
+
+    # One more change tells whether a next page exists
+    changes = list(
+        base_queryset.filter(
+            Q(change_xid__gt=cursor.change_xid)
+            | Q(
+                change_xid=cursor.change_xid, change_sequence__gt=cursor.change_sequence
+            ),
+            change_xid__lt=get_snapshot_xmin(base_queryset.db),
+        )
+        .order_by("change_xid", "change_sequence")
+        .values_list("id", "change_xid", "change_sequence")[: PAGINATOR_MAX_LIMIT + 1]
+    )
+    next_page_results = len(changes) > PAGINATOR_MAX_LIMIT
+    changes = changes[:PAGINATOR_MAX_LIMIT]
+
+    # Only the changed rows are read with their annotations, in the order of
+    # their changes
+    changed_ids = [pk for pk, _, _ in changes]
+    positions = {str(pk): position for position, pk in enumerate(changed_ids)}
+    results = (
+        sorted(
+            on_result(queryset.filter(pk__in=changed_ids).order_by()),
+            key=lambda result: positions[str(result["id"])],
+        )
+        if changed_ids
+        else []
+    )
+    found_ids = {str(result["id"]) for result in results}
+
+    return {
+        "cursor": str(cursor),
+        "next_cursor": (
+            str(ChangeCursor(changes[-1][1], changes[-1][2]))
+            if changes
+            else str(cursor)
+        ),
+        "next_page_results": next_page_results,
+        "page_count": len(results),
+        "results": results,
+        "deleted": [str(pk) for pk in changed_ids if str(pk) not in found_ids],
+    }
@@ -15,6 +15,11 @@ from plane.db.models import (
     State,
     WorkspaceMember,
 )
+from plane.utils.paginator import (
+    GROUP_TOTAL_FIELD,
+    PARTITION_ROWS_FIELD,
+    SUB_GROUP_TOTAL_FIELD,
+)
 
 
 def issue_queryset_grouper(queryset, group_by, sub_group_by):
@@ -98,6 +103,12 @@ def issue_on_results(issues, group_by, sub_group_by):
         original_list.append(sub_group_by)
 
     required_fields.extend(original_list)
+    # Keep the totals the grouped paginators carry on the page rows
+    required_fields.extend(
+        field
+        for field in (GROUP_TOTAL_FIELD, SUB_GROUP_TOTAL_FIELD, PARTITION_ROWS_FIELD)
+        if field in issues.query.annotations
+    )
     return issues.values(*required_fields)
 
 
@@ -1,3 +1,5 @@
+import hashlib
+from collections import OrderedDict
 from io import StringIO
 from html.parser import HTMLParser
 
@@ -25,3 +27,46 @@ def strip_tags(html):
     s = MLStripper()
     s.feed(html)
     return s.get_data()
+
+
+class ComponentExtractor(HTMLParser):
+    """
+    Collects the attributes of every element with the given tag in a single
+    pass, without building a tree
+    """
+
+    def __init__(self, tag):
+        super().__init__()
+        self.tag = tag
+        self.components = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == self.tag:
+            self.components.append(dict(attrs))
+
+
+# Components of the latest descriptions, keyed by the hash of their html
+COMPONENTS_CACHE_SIZE = 256
+_components_cache = OrderedDict()
+
+
+def extract_components(html, tag):
+    """
+    Return the attributes of the `tag` elements of the html in document order,
+    reusing the result when the same html was already parsed
+    """
+    if not html:
+        return []
+    key = (tag, hashlib.blake2b(html.encode("utf-8"), digest_size=16).digest())
+    components = _components_cache.get(key)
+    if components is None:
+        parser = ComponentExtractor(tag)
+        parser.feed(html)
+        parser.close()
+        components = parser.components
+        _components_cache[key] = components
+        if len(_components_cache) > COMPONENTS_CACHE_SIZE:
+            _components_cache.popitem(last=False)
+    else:
+        _components_cache.move_to_end(key)
+    return [dict(component) for component in components]
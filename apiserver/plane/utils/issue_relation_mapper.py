@@ -22,3 +22,41 @@ def get_actual_relation(relation_type):
     }
 
     return actual_relation.get(relation_type, relation_type)
+
+
+# Relations of an issue, as named from the issue
+RELATION_NAMES = [
+    "blocking",
+    "blocked_by",
+    "duplicate",
+    "relates_to",
+    "start_after",
+    "start_before",
+    "finish_after",
+    "finish_before",
+]
+
+
+def get_relation_graph(issue_ids, relations):
+    """
+    Group the related issues of every given issue by relation name, from
+    (issue_id, related_issue_id, relation_type) rows of the stored relations
+    """
+    graph = {
+        str(issue_id): {name: [] for name in RELATION_NAMES} for issue_id in issue_ids
+    }
+    for issue_id, related_issue_id, relation_type in relations:
+        issue_id, related_issue_id = str(issue_id), str(related_issue_id)
+        # The stored type names the relation from the issue, its inverse from
+        # the related issue
+        if issue_id in graph:
+            related = graph[issue_id].setdefault(relation_type, [])
+            if related_issue_id not in related:
+                related.append(related_issue_id)
+        if related_issue_id in graph:
+            related = graph[related_issue_id].setdefault(
+                get_inverse_relation(relation_type), []
+            )
+            if issue_id not in related:
+                related.append(issue_id)
+    return graph
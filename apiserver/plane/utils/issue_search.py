@@ -2,19 +2,50 @@
 import re
 
 # Django imports
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Q
 
 # Module imports
 
+# Words of the query matched as prefixes, the rest of a long query is ignored
+MAX_SEARCH_TERMS = 8
+
+
+def get_search_query(query):
+    """
+    Return a prefix matching full-text query for the words of the query, None
+    when it has no words
+    """
+    terms = re.findall(r"\w+", query.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    return SearchQuery(
+        " & ".join(f"{term}:*" for term in terms), search_type="raw", config="simple"
+    )
+
+
+def search_ranked(query, queryset, q=None):
+    """
+    Filter the queryset on its search vector, on its name containing the query
+    or on the extra conditions, best matches first
+    """
+    q = (q or Q()) | Q(name__icontains=query)
+    search_query = get_search_query(query)
+    if search_query is None:
+        return queryset.filter(q)
+    return (
+        queryset.filter(q | Q(search_vector=search_query))
+        .annotate(rank=SearchRank(F("search_vector"), search_query))
+        .order_by(F("rank").desc(nulls_last=True), "-created_at")
+    )
+
 
 def search_issues(query, queryset):
-    fields = ["name", "sequence_id", "project__identifier"]
-    q = Q()
-    for field in fields:
-        if field == "sequence_id" and len(query) <= 20:
-            sequences = re.findall(r"\b\d+\b", query)
-            for sequence_id in sequences:
-                q |= Q(**{"sequence_id": sequence_id})
-        else:
-            q |= Q(**{f"{field}__icontains": query})
-    return queryset.filter(q).distinct()
+    q = Q(project__identifier__icontains=query)
+    if len(query) <= 20:
+        sequences = re.findall(r"\b\d+\b", query)
+        for sequence_id in sequences:
+            q |= Q(**{"sequence_id": sequence_id})
+    else:
+        q |= Q(**{"sequence_id__icontains": query})
+    return search_ranked(query, queryset, q).distinct()
@@ -1,10 +1,17 @@
 # Python imports
+import base64
+import datetime
+import hashlib
+import json
 import math
 from collections import defaultdict
 from collections.abc import Sequence
 
 # Django imports
-from django.db.models import Count, F, Window
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Exists, F, OuterRef, Q, Window
 from django.db.models.functions import RowNumber
 
 # Third party imports
@@ -14,43 +21,89 @@ from rest_framework.response import Response
 # Module imports
 
 
+class PositionEncoder(DjangoJSONEncoder):
+    """
+    Encode the datetimes and times of a keyset position at microsecond
+    precision, DjangoJSONEncoder truncates them to milliseconds
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
 class Cursor:
     # The cursor value
-    def __init__(self, value, offset=0, is_prev=False, has_results=None):
+    def __init__(
+        self, value, offset=0, is_prev=False, has_results=None, position=None
+    ):
         self.value = value
         self.offset = int(offset)
         self.is_prev = bool(is_prev)
         self.has_results = has_results
+        # Keyset position - the (order_key, created_at, id) of the boundary row
+        self.position = tuple(position) if position is not None else None
 
     # Return the cursor value in string format
     def __str__(self):
+        if self.position is not None:
+            return f"{self.value}:{self.offset}:{int(self.is_prev)}:{self.encode_position(self.position)}"
         return f"{self.value}:{self.offset}:{int(self.is_prev)}"
 
     # Return the cursor value
     def __eq__(self, other):
         return all(
             getattr(self, attr) == getattr(other, attr)
-            for attr in ("value", "offset", "is_prev", "has_results")
+            for attr in ("value", "offset", "is_prev", "has_results", "position")
         )
 
     # Return the representation of the cursor
     def __repr__(self):
-        return f"{type(self).__name__,}: value={self.value} offset={self.offset}, is_prev={int(self.is_prev)}"
+        return f"{type(self).__name__,}: value={self.value} offset={self.offset}, is_prev={int(self.is_prev)}, position={self.position}"
 
     # Return if the cursor is true
     def __bool__(self):
         return bool(self.has_results)
 
+    @staticmethod
+    def encode_position(position):
+        """Encode the keyset position into an url safe token"""
+        return (
+            base64.urlsafe_b64encode(
+                json.dumps(list(position), cls=PositionEncoder).encode()
+            )
+            .decode()
+            .rstrip("=")
+        )
+
+    @staticmethod
+    def decode_position(token):
+        """Decode the keyset position from the url safe token"""
+        try:
+            position = json.loads(
+                base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor position: {e}")
+
+        if not isinstance(position, list) or len(position) != 3:
+            raise ValueError("Cursor position must be (order_key, created_at, id)")
+        return tuple(position)
+
     @classmethod
     def from_string(cls, value):
         """Return the cursor value from string format"""
         try:
             bits = value.split(":")
-            if len(bits) != 3:
-                raise ValueError("Cursor must be in the format 'value:offset:is_prev'")
+            if len(bits) not in (3, 4):
+                raise ValueError(
+                    "Cursor must be in the format 'value:offset:is_prev[:position]'"
+                )
 
             value = float(bits[0]) if "." in bits[0] else int(bits[0])
-            return cls(value, int(bits[1]), bool(int(bits[2])))
+            position = cls.decode_position(bits[3]) if len(bits) == 4 else None
+            return cls(value, int(bits[1]), bool(int(bits[2])), position=position)
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid cursor format: {e}")
 
@@ -82,19 +135,89 @@ class CursorResult(Sequence):
 
 MAX_LIMIT = 1000
 
+# Window annotations carrying the per group totals on the rows of a grouped page
+GROUP_TOTAL_FIELD = "group_total"
+SUB_GROUP_TOTAL_FIELD = "sub_group_total"
+# Window annotation carrying the row count of the partition a page is cut from
+PARTITION_ROWS_FIELD = "partition_rows"
+
+# Seconds the total count of a keyset paginated queryset is reused across pages
+PAGINATOR_COUNT_CACHE_TIMEOUT = 60
+
 
 class BadPaginationError(Exception):
     pass
 
 
+def get_row_count_filter(queryset, count_filter):
+    """
+    Turn the count filter of a grouped page into a condition on the row itself.
+    The grouped issue querysets aggregate their m2m ids, so a window over them
+    can only reference grouped columns and the filter is checked by primary key
+    """
+    if count_filter is None:
+        return None
+    return Exists(
+        queryset.model._base_manager.filter(count_filter, pk=OuterRef("pk"))
+    )
+
+
+def map_result_group_ids(results, field_name):
+    """
+    Map every result id to the list of m2m group ids it belongs to, the rows of
+    a result grouped by an m2m field are repeated once per related group
+    """
+    result_group_mapping = defaultdict(dict)
+    for result in results:
+        # dict keys keep the order in which the groups were seen
+        result_group_mapping[str(result["id"])][str(result[field_name])] = None
+
+    return {
+        result_id: ([] if "None" in group_ids else list(group_ids))
+        for result_id, group_ids in result_group_mapping.items()
+    }
+
+
+def bucket_multi_group_results(results, group_by_field_name, mapped_field_name):
+    """
+    Bucket the results of an m2m grouping in a single pass, every result is
+    added once to each of its groups using per group id sets
+    """
+    result_group_ids = map_result_group_ids(results, group_by_field_name)
+    # Preparing a dict to group result by group ID
+    grouped_results = defaultdict(list)
+    # The ids already added to each group
+    grouped_result_ids = defaultdict(set)
+
+    for result in results:
+        result_id = str(result["id"])
+        group_ids = result_group_ids[result_id]
+        result[mapped_field_name] = group_ids
+        # If a result belongs to multiple groups, add it to each group
+        for group_id in group_ids or ["None"]:
+            if result_id not in grouped_result_ids[group_id]:
+                grouped_result_ids[group_id].add(result_id)
+                grouped_results[group_id].append(result)
+
+    return grouped_results
+
+
 class OffsetPaginator:
     """
     The Offset paginator using the offset and limit
     with cursor controls
     http://example.com/api/users/?cursor=10.0.0&per_page=10
     cursor=limit,offset=page,
+
+    When `keyset` is set the paginator seeks instead of using OFFSET: the
+    returned cursors carry the (order_key, created_at, id) of the boundary row
+    and the next page is fetched with an indexed WHERE clause on that tuple.
+    http://example.com/api/users/?cursor=10:1:0:<position>&per_page=10
     """
 
+    # Prefix for the cached total counts
+    COUNT_CACHE_PREFIX = "paginator_count"
+
     def __init__(
         self,
         queryset,
@@ -102,6 +225,9 @@ class OffsetPaginator:
         max_limit=MAX_LIMIT,
         max_offset=None,
         on_results=None,
+        keyset=False,
+        with_count=True,
+        count_cache_timeout=None,
     ):
         # Key tuple and remove `-` if descending order by
         self.key = (
@@ -115,6 +241,11 @@ class OffsetPaginator:
         self.max_limit = max_limit
         self.max_offset = max_offset
         self.on_results = on_results
+        # Seek based pagination
+        self.keyset = keyset
+        # Total count is optional and can be cached between pages
+        self.with_count = with_count
+        self.count_cache_timeout = count_cache_timeout
 
     def get_result(self, limit=1000, cursor=None):
         # offset is page #
@@ -125,17 +256,14 @@ class OffsetPaginator:
         # Get the min from limit and max limit
         limit = min(limit, self.max_limit)
 
+        # Seek when the cursor carries a position
+        if self.keyset and cursor.position is not None:
+            return self.get_keyset_result(limit=limit, cursor=cursor)
+
         # queryset
         queryset = self.queryset
-        if self.key:
-            queryset = queryset.order_by(
-                (
-                    F(*self.key).desc(nulls_last=True)
-                    if self.desc
-                    else F(*self.key).asc(nulls_last=True)
-                ),
-                "-created_at",
-            )
+        if self.key or self.keyset:
+            queryset = queryset.order_by(*self.get_ordering())
         # The current page
         page = cursor.offset
         # The offset
@@ -151,10 +279,31 @@ class OffsetPaginator:
         if cursor.value != limit:
             results = results[-(limit + 1) :]
 
-        # Adjust cursors based on the results for pagination
-        next_cursor = Cursor(limit, page + 1, False, results.count() > limit)
-        # If the page is greater than 0, then set the previous cursor
-        prev_cursor = Cursor(limit, page - 1, True, page > 0)
+        if self.keyset:
+            # Fetch the keyset columns of the page once, this gives both the
+            # next flag and the boundary positions without a COUNT
+            positions = list(results.values_list(*self.get_position_fields()))
+            has_next = len(positions) > limit
+            positions = positions[:limit]
+            next_cursor = Cursor(
+                limit,
+                page + 1,
+                False,
+                has_next,
+                position=positions[-1] if has_next else None,
+            )
+            prev_cursor = Cursor(
+                limit,
+                page - 1,
+                True,
+                page > 0,
+                position=positions[0] if page > 0 and positions else None,
+            )
+        else:
+            # Adjust cursors based on the results for pagination
+            next_cursor = Cursor(limit, page + 1, False, results.count() > limit)
+            # If the page is greater than 0, then set the previous cursor
+            prev_cursor = Cursor(limit, page - 1, True, page > 0)
 
         # Process the results
         results = results[:limit]
@@ -164,10 +313,10 @@ class OffsetPaginator:
             results = self.on_results(results)
 
         # Count the queryset
-        count = queryset.count()
+        count = self.get_count(queryset, use_cache=False)
 
         # Optionally, calculate the total count and max_hits if needed
-        max_hits = math.ceil(count / limit)
+        max_hits = math.ceil(count / limit) if count is not None else None
 
         # Return the cursor results
         return CursorResult(
@@ -178,6 +327,164 @@ class OffsetPaginator:
             max_hits=max_hits,
         )
 
+    def get_ordering(self, reverse=False):
+        # Order by the key with created_at (and id for keyset) as the tie breaker
+        nulls = {"nulls_first": True} if reverse else {"nulls_last": True}
+        ordering = []
+        if self.key:
+            ordering.append(
+                F(*self.key).desc(**nulls)
+                if self.desc != reverse
+                else F(*self.key).asc(**nulls)
+            )
+        ordering.append(F("created_at").asc() if reverse else F("created_at").desc())
+        # The id makes the ordering total for the keyset
+        if self.keyset:
+            ordering.append(F("id").asc() if reverse else F("id").desc())
+        return ordering
+
+    def get_position_fields(self):
+        # The columns encoded in the keyset cursor
+        return (self.key[0] if self.key else "created_at", "created_at", "id")
+
+    def get_seek_filter(self, position, reverse=False):
+        """
+        Build the WHERE clause returning the rows after the position in the
+        ordering (or before the position when reverse is set), keeping the
+        nulls last semantics of the key ordering
+        """
+        key, created_at, pk = position
+        key_field = self.get_position_fields()[0]
+
+        # created_at and id are always descending
+        tie = Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+        if not reverse:
+            tie = Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+
+        # Ordering on created_at only
+        if not self.key:
+            return tie
+
+        # Nulls are always at the end of the ordering
+        after = "lt" if self.desc else "gt"
+        before = "gt" if self.desc else "lt"
+        if key is None:
+            if reverse:
+                return Q(**{f"{key_field}__isnull": False}) | Q(
+                    Q(**{f"{key_field}__isnull": True}), tie
+                )
+            return Q(Q(**{f"{key_field}__isnull": True}), tie)
+
+        if reverse:
+            return Q(**{f"{key_field}__{before}": key}) | Q(
+                Q(**{key_field: key}), tie
+            )
+        return (
+            Q(**{f"{key_field}__{after}": key})
+            | Q(**{f"{key_field}__isnull": True})
+            | Q(Q(**{key_field: key}), tie)
+        )
+
+    def get_keyset_result(self, limit, cursor):
+        # The current page
+        page = cursor.offset
+
+        if cursor.is_prev:
+            # Walk backwards from the position and restore the ordering after
+            ids = list(
+                self.queryset.filter(
+                    self.get_seek_filter(cursor.position, reverse=True)
+                )
+                .order_by(*self.get_ordering(reverse=True))
+                .values_list("id", flat=True)[: limit + 1]
+            )
+            has_prev = len(ids) > limit
+            queryset = self.queryset.filter(pk__in=ids[:limit]).order_by(
+                *self.get_ordering()
+            )
+            positions = list(queryset.values_list(*self.get_position_fields()))
+            results = queryset
+            next_cursor = Cursor(
+                limit,
+                page + 1,
+                False,
+                bool(positions),
+                position=positions[-1] if positions else None,
+            )
+            prev_cursor = Cursor(
+                limit,
+                page - 1,
+                True,
+                has_prev,
+                position=positions[0] if has_prev else None,
+            )
+        else:
+            results = self.queryset.filter(
+                self.get_seek_filter(cursor.position)
+            ).order_by(*self.get_ordering())[: limit + 1]
+            positions = list(results.values_list(*self.get_position_fields()))
+            has_next = len(positions) > limit
+            positions = positions[:limit]
+            next_cursor = Cursor(
+                limit,
+                page + 1,
+                False,
+                has_next,
+                position=positions[-1] if has_next else None,
+            )
+            prev_cursor = Cursor(
+                limit,
+                page - 1,
+                True,
+                bool(positions),
+                position=positions[0] if positions else None,
+            )
+            results = results[:limit]
+
+        # Process the results
+        if self.on_results:
+            results = self.on_results(results)
+
+        # Deep pages reuse the count computed on the first page
+        count = self.get_count(self.queryset, use_cache=True)
+        max_hits = math.ceil(count / limit) if count is not None else None
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=count,
+            max_hits=max_hits,
+        )
+
+    def get_count(self, queryset, use_cache=False):
+        """
+        Count the queryset, the count is stored in the cache when a timeout is
+        configured and read back only for the keyset pages
+        """
+        if not self.with_count:
+            return None
+
+        if not self.count_cache_timeout:
+            return queryset.count()
+
+        try:
+            key = (
+                f"{self.COUNT_CACHE_PREFIX}:"
+                f"{hashlib.md5(str(queryset.order_by().query).encode()).hexdigest()}"
+            )
+        except EmptyResultSet:
+            return 0
+
+        if use_cache:
+            count = cache.get(key)
+            if count is not None:
+                return count
+
+        count = queryset.count()
+        cache.set(key, count, self.count_cache_timeout)
+        return count
+
     def process_results(self, results):
         raise NotImplementedError
 
@@ -232,13 +539,13 @@ class GroupedOffsetPaginator(OffsetPaginator):
         if offset < 0:
             raise BadPaginationError("Pagination offset cannot be negative")
 
-        # Compute the results
-        results = {}
-        # Create window for all the groups
+        # Create window for all the groups, the rows of the page carry the
+        # totals of their group
+        partition_by = [F(self.group_by_field_name)]
         queryset = queryset.annotate(
             row_number=Window(
                 expression=RowNumber(),
-                partition_by=[F(self.group_by_field_name)],
+                partition_by=partition_by,
                 order_by=(
                     (
                         F(*self.key).desc(
@@ -249,7 +556,18 @@ class GroupedOffsetPaginator(OffsetPaginator):
                     ),
                     F("created_at").desc(),
                 ),
-            )
+            ),
+            **{
+                GROUP_TOTAL_FIELD: Window(
+                    expression=Count(
+                        "id", filter=get_row_count_filter(queryset, self.count_filter)
+                    ),
+                    partition_by=partition_by,
+                ),
+                PARTITION_ROWS_FIELD: Window(
+                    expression=Count("id"), partition_by=partition_by
+                ),
+            },
         )
         # Filter the results by row number
         results = queryset.filter(row_number__gt=offset, row_number__lt=stop).order_by(
@@ -261,57 +579,48 @@ class GroupedOffsetPaginator(OffsetPaginator):
             F("created_at").desc(),
         )
 
-        # Adjust cursors based on the grouped results for pagination
-        next_cursor = Cursor(
-            limit, page + 1, False, queryset.filter(row_number__gte=stop).exists()
-        )
-
-        # Add previous cursors
-        prev_cursor = Cursor(limit, page - 1, True, page > 0)
-
-        # Count the queryset
-        count = queryset.count()
-
-        # Optionally, calculate the total count and max_hits if needed
-        # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
-                / limit
-            )
-        else:
-            max_hits = 0
-        return CursorResult(
+        self.limit = limit
+        self.stop = stop
+        # The next cursor and the hits are set from the page rows once they
+        # are processed
+        self.cursor_result = CursorResult(
             results=results,
-            next=next_cursor,
-            prev=prev_cursor,
-            hits=count,
-            max_hits=max_hits,
+            next=Cursor(limit, page + 1, False, False),
+            prev=Cursor(limit, page - 1, True, page > 0),
+            hits=0,
+            max_hits=0,
         )
+        return self.cursor_result
+
+    def __read_totals(self, results):
+        """
+        Read the group totals off the page rows. The grouped querysets hold one
+        row per issue and group, so the window count matches a distinct count.
+        A group whose rows all ended on an earlier page has no row here and
+        reports its total on those pages only
+        """
+        self.total_group_dict = {}
+        partition_rows = []
+        for result in results:
+            # Keep the baseline total of 1 for groups the count filter empties
+            self.total_group_dict[str(result.get(self.group_by_field_name))] = (
+                result.pop(GROUP_TOTAL_FIELD) or 1
+            )
+            partition_rows.append(result.pop(PARTITION_ROWS_FIELD))
 
-    def __get_total_queryset(self):
-        # Get total items for each group
-        return (
-            self.queryset.values(self.group_by_field_name)
-            .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-            .order_by()
+        # A group has more rows when its row count reaches the stop row number
+        self.cursor_result.next.has_results = any(
+            rows >= self.stop for rows in partition_rows
+        )
+        self.cursor_result.hits = sum(self.total_group_dict.values())
+        self.cursor_result.max_hits = (
+            math.ceil(max(self.total_group_dict.values()) / self.limit)
+            if self.total_group_dict
+            else 0
         )
 
-    def __get_total_dict(self):
-        # Convert the total into dictionary of keys as group name and value as the total
-        total_group_dict = {}
-        for group in self.__get_total_queryset():
-            total_group_dict[str(group.get(self.group_by_field_name))] = (
-                total_group_dict.get(str(group.get(self.group_by_field_name)), 0)
-                + (1 if group.get("count") == 0 else group.get("count"))
-            )
-        return total_group_dict
-
-    def __get_field_dict(self):
+    def __get_field_dict(self, total_group_dict):
         # Create a field dictionary
-        total_group_dict = self.__get_total_dict()
         return {
             str(field): {
                 "results": [],
@@ -320,41 +629,13 @@ class GroupedOffsetPaginator(OffsetPaginator):
             for field in self.group_by_fields
         }
 
-    def __result_already_added(self, result, group):
-        # Check if the result is already added then add it
-        for existing_issue in group:
-            if existing_issue["id"] == result["id"]:
-                return True
-        return False
-
-    def __query_multi_grouper(self, results):
+    def __query_multi_grouper(self, results, total_group_dict):
         # Grouping for m2m values
-        total_group_dict = self.__get_total_dict()
-
-        # Preparing a dict to keep track of group IDs associated with each entity ID
-        result_group_mapping = defaultdict(set)
-        # Preparing a dict to group result by group ID
-        grouped_by_field_name = defaultdict(list)
-
-        # Iterate over results to fill the above dictionaries
-        for result in results:
-            result_id = result["id"]
-            group_id = result[self.group_by_field_name]
-            result_group_mapping[str(result_id)].add(str(group_id))
-
-        # Adding group_ids key to each issue and grouping by group_name
-        for result in results:
-            result_id = result["id"]
-            group_ids = list(result_group_mapping[str(result_id)])
-            result[self.FIELD_MAPPER.get(self.group_by_field_name)] = (
-                [] if "None" in group_ids else group_ids
-            )
-            # If a result belongs to multiple groups, add it to each group
-            for group_id in group_ids:
-                if not self.__result_already_added(
-                    result, grouped_by_field_name[group_id]
-                ):
-                    grouped_by_field_name[group_id].append(result)
+        grouped_by_field_name = bucket_multi_group_results(
+            results=results,
+            group_by_field_name=self.group_by_field_name,
+            mapped_field_name=self.FIELD_MAPPER.get(self.group_by_field_name),
+        )
 
         # Convert grouped_by_field_name back to a list for each group
         processed_results = {
@@ -367,9 +648,9 @@ class GroupedOffsetPaginator(OffsetPaginator):
 
         return processed_results
 
-    def __query_grouper(self, results):
+    def __query_grouper(self, results, total_group_dict):
         # Grouping for values that are not m2m
-        processed_results = self.__get_field_dict()
+        processed_results = self.__get_field_dict(total_group_dict)
         for result in results:
             group_value = str(result.get(self.group_by_field_name))
             if group_value in processed_results:
@@ -378,11 +659,16 @@ class GroupedOffsetPaginator(OffsetPaginator):
 
     def process_results(self, results):
         # Process results
+        self.__read_totals(results)
         if results:
             if self.group_by_field_name in self.FIELD_MAPPER:
-                processed_results = self.__query_multi_grouper(results=results)
+                processed_results = self.__query_multi_grouper(
+                    results=results, total_group_dict=self.total_group_dict
+                )
             else:
-                processed_results = self.__query_grouper(results=results)
+                processed_results = self.__query_grouper(
+                    results=results, total_group_dict=self.total_group_dict
+                )
         else:
             processed_results = {}
         return processed_results
@@ -447,17 +733,30 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         if offset < 0:
             raise BadPaginationError("Pagination offset cannot be negative")
 
-        # Compute the results
-        results = {}
-
-        # Create windows for group and sub group field name
+        # Create windows for group and sub group field name, the rows of the
+        # page carry the totals of their group and sub group
+        partition_by = [F(self.group_by_field_name), F(self.sub_group_by_field_name)]
+        row_count_filter = get_row_count_filter(queryset, self.count_filter)
+        totals = {
+            SUB_GROUP_TOTAL_FIELD: Window(
+                expression=Count("id", filter=row_count_filter),
+                partition_by=partition_by,
+            ),
+            PARTITION_ROWS_FIELD: Window(
+                expression=Count("id"), partition_by=partition_by
+            ),
+        }
+        # An issue is repeated across m2m sub groups, so the group totals can
+        # only be read from the window for plain fields
+        if self.sub_group_by_field_name not in self.FIELD_MAPPER:
+            totals[GROUP_TOTAL_FIELD] = Window(
+                expression=Count("id", filter=row_count_filter),
+                partition_by=[F(self.group_by_field_name)],
+            )
         queryset = queryset.annotate(
             row_number=Window(
                 expression=RowNumber(),
-                partition_by=[
-                    F(self.group_by_field_name),
-                    F(self.sub_group_by_field_name),
-                ],
+                partition_by=partition_by,
                 order_by=(
                     (
                         F(*self.key).desc(nulls_last=True)
@@ -466,7 +765,8 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
                     ),
                     "-created_at",
                 ),
-            )
+            ),
+            **totals,
         )
 
         # Filter the results
@@ -479,34 +779,54 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             F("created_at").desc(),
         )
 
-        # Adjust cursors based on the grouped results for pagination
-        next_cursor = Cursor(
-            limit, page + 1, False, queryset.filter(row_number__gte=stop).exists()
+        self.limit = limit
+        self.stop = stop
+        # The next cursor and the hits are set from the page rows once they
+        # are processed
+        self.cursor_result = CursorResult(
+            results=results,
+            next=Cursor(limit, page + 1, False, False),
+            prev=Cursor(limit, page - 1, True, page > 0),
+            hits=0,
+            max_hits=0,
         )
+        return self.cursor_result
+
+    def __read_totals(self, results):
+        """
+        Read the group and sub group totals off the page rows, the same way as
+        GroupedOffsetPaginator does for its groups
+        """
+        self.total_group_dict = {}
+        self.total_sub_group_dict = defaultdict(dict)
+        partition_rows = []
+        for result in results:
+            group = str(result.get(self.group_by_field_name))
+            sub_group = str(result.get(self.sub_group_by_field_name))
+            if GROUP_TOTAL_FIELD in result:
+                self.total_group_dict[group] = result.pop(GROUP_TOTAL_FIELD) or 1
+            self.total_sub_group_dict[group][sub_group] = (
+                result.pop(SUB_GROUP_TOTAL_FIELD) or 1
+            )
+            partition_rows.append(result.pop(PARTITION_ROWS_FIELD))
+        self.total_sub_group_dict = dict(self.total_sub_group_dict)
 
-        # Add previous cursors
-        prev_cursor = Cursor(limit, page - 1, True, page > 0)
-
-        # Count the queryset
-        count = queryset.count()
+        if self.sub_group_by_field_name in self.FIELD_MAPPER:
+            self.total_group_dict = self.__get_group_total_dict()
 
-        # Optionally, calculate the total count and max_hits if needed
-        # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
-                / limit
-            )
-        else:
-            max_hits = 0
-        return CursorResult(
-            results=results,
-            next=next_cursor,
-            prev=prev_cursor,
-            hits=count,
-            max_hits=max_hits,
+        # A sub group has more rows when its row count reaches the stop row number
+        self.cursor_result.next.has_results = any(
+            rows >= self.stop for rows in partition_rows
+        )
+        self.cursor_result.hits = sum(
+            total
+            for sub_groups in self.total_sub_group_dict.values()
+            for total in sub_groups.values()
+        )
+        self.cursor_result.max_hits = (
+            math.ceil(max(self.total_group_dict.values()) / self.limit)
+            if self.total_group_dict
+            else 0
         )
 
     def __get_group_total_queryset(self):
@@ -518,48 +838,17 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             .distinct()
         )
 
-    def __get_subgroup_total_queryset(self):
-        # Get subgroup totals
-        return (
-            self.queryset.values(self.group_by_field_name, self.sub_group_by_field_name)
-            .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-            .order_by()
-            .values(self.group_by_field_name, self.sub_group_by_field_name, "count")
-        )
-
-    def __get_total_dict(self):
-        # Use the above to convert to dictionary of 2D objects
+    def __get_group_total_dict(self):
+        # Convert the group totals into a dictionary of group name and total
         total_group_dict = {}
-        total_sub_group_dict = {}
         for group in self.__get_group_total_queryset():
             total_group_dict[str(group.get(self.group_by_field_name))] = (
                 total_group_dict.get(str(group.get(self.group_by_field_name)), 0)
                 + (1 if group.get("count") == 0 else group.get("count"))
             )
+        return total_group_dict
 
-        # Sub group total values
-        for item in self.__get_subgroup_total_queryset():
-            group = str(item[self.group_by_field_name])
-            subgroup = str(item[self.sub_group_by_field_name])
-            count = item["count"]
-
-            # Create a dictionary of group and sub group
-            if group not in total_sub_group_dict:
-                total_sub_group_dict[str(group)] = {}
-
-            # Create a dictionary of sub group
-            if subgroup not in total_sub_group_dict[group]:
-                total_sub_group_dict[str(group)][str(subgroup)] = {}
-
-            # Create a nested dictionary of group and sub group
-            total_sub_group_dict[group][subgroup] = count
-
-        return total_group_dict, total_sub_group_dict
-
-    def __get_field_dict(self):
-        # Create a field dictionary
-        total_group_dict, total_sub_group_dict = self.__get_total_dict()
-
+    def __get_field_dict(self, total_group_dict, total_sub_group_dict):
         # Create a dictionary of group and sub group
         return {
             str(group): {
@@ -577,25 +866,22 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             for group in self.group_by_fields
         }
 
-    def __query_multi_grouper(self, results):
+    def __query_multi_grouper(self, results, total_group_dict, total_sub_group_dict):
         # Multi grouper
-        processed_results = self.__get_field_dict()
-        # Preparing a dict to keep track of group IDs associated with each label ID
-        result_group_mapping = defaultdict(set)
-        result_sub_group_mapping = defaultdict(set)
-
-        # Iterate over results to fill the above dictionaries
-        if self.group_by_field_name in self.FIELD_MAPPER:
-            for result in results:
-                result_id = result["id"]
-                group_id = result[self.group_by_field_name]
-                result_group_mapping[str(result_id)].add(str(group_id))
-        # Use the same calculation for the sub group
-        if self.sub_group_by_field_name in self.FIELD_MAPPER:
-            for result in results:
-                result_id = result["id"]
-                sub_group_id = result[self.sub_group_by_field_name]
-                result_sub_group_mapping[str(result_id)].add(str(sub_group_id))
+        processed_results = self.__get_field_dict(
+            total_group_dict, total_sub_group_dict
+        )
+        # Map the results to their m2m group and sub group ids once
+        result_group_mapping = (
+            map_result_group_ids(results, self.group_by_field_name)
+            if self.group_by_field_name in self.FIELD_MAPPER
+            else {}
+        )
+        result_sub_group_mapping = (
+            map_result_group_ids(results, self.sub_group_by_field_name)
+            if self.sub_group_by_field_name in self.FIELD_MAPPER
+            else {}
+        )
 
         # Iterate over results
         for result in results:
@@ -612,15 +898,13 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             ):
                 if self.group_by_field_name in self.FIELD_MAPPER:
                     # for multi grouper
-                    group_ids = list(result_group_mapping[str(result_id)])
                     result[self.FIELD_MAPPER.get(self.group_by_field_name)] = (
-                        [] if "None" in group_ids else group_ids
+                        result_group_mapping[str(result_id)]
                     )
                 if self.sub_group_by_field_name in self.FIELD_MAPPER:
-                    sub_group_ids = list(result_sub_group_mapping[str(result_id)])
                     # for multi groups
                     result[self.FIELD_MAPPER.get(self.sub_group_by_field_name)] = (
-                        [] if "None" in sub_group_ids else sub_group_ids
+                        result_sub_group_mapping[str(result_id)]
                     )
                 # If a result belongs to multiple groups, add it to each group
                 processed_results[str(group_value)]["results"][str(sub_group_value)][
@@ -629,9 +913,11 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
 
         return processed_results
 
-    def __query_grouper(self, results):
+    def __query_grouper(self, results, total_group_dict, total_sub_group_dict):
         # Single grouper
-        processed_results = self.__get_field_dict()
+        processed_results = self.__get_field_dict(
+            total_group_dict, total_sub_group_dict
+        )
         for result in results:
             group_value = str(result.get(self.group_by_field_name))
             sub_group_value = str(result.get(self.sub_group_by_field_name))
@@ -642,16 +928,25 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         return processed_results
 
     def process_results(self, results):
+        self.__read_totals(results)
         if results:
             if (
                 self.group_by_field_name in self.FIELD_MAPPER
                 or self.sub_group_by_field_name in self.FIELD_MAPPER
             ):
                 # if the grouping is done through m2m then
-                processed_results = self.__query_multi_grouper(results=results)
+                processed_results = self.__query_multi_grouper(
+                    results=results,
+                    total_group_dict=self.total_group_dict,
+                    total_sub_group_dict=self.total_sub_group_dict,
+                )
             else:
                 # group it directly
-                processed_results = self.__query_grouper(results=results)
+                processed_results = self.__query_grouper(
+                    results=results,
+                    total_group_dict=self.total_group_dict,
+                    total_sub_group_dict=self.total_sub_group_dict,
+                )
         else:
             processed_results = {}
         return processed_results
@@ -0,0 +1,335 @@
+# Python imports
+import hashlib
+import hmac
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# Third party imports
+import requests
+from requests.adapters import HTTPAdapter
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Module imports
+from plane.db.models import Webhook, WebhookLog
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Return the process wide session, urllib3 keeps a keep-alive pool per host
+    behind it. A new session is created after a fork so prefork workers never
+    share sockets with their parent.
+    """
+    global _session, _session_pid
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=settings.WEBHOOK_POOL_CONNECTIONS,
+                pool_maxsize=settings.WEBHOOK_POOL_MAXSIZE,
+                max_retries=0,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+            _session_pid = os.getpid()
+        return _session
+
+
+def get_circuit_cache_key(webhook_id):
+    return f"webhook_circuit:{webhook_id}"
+
+
+def get_circuit_state(circuit, now):
+    """Return the state of the circuit of a webhook at the given time"""
+    if not circuit or circuit["failures"] < settings.WEBHOOK_CIRCUIT_THRESHOLD:
+        return CIRCUIT_CLOSED
+    if circuit["opened_until"] > now:
+        return CIRCUIT_OPEN
+    return CIRCUIT_HALF_OPEN
+
+
+def record_circuit_result(circuit, success, now):
+    """
+    Return the circuit updated with the result of a delivery. The circuit opens
+    after WEBHOOK_CIRCUIT_THRESHOLD consecutive failures, the cooldown doubles
+    on every trip until a delivery succeeds again.
+    """
+    if success:
+        return {"failures": 0, "opened_until": 0, "trips": 0}
+
+    circuit = dict(circuit or {"failures": 0, "opened_until": 0, "trips": 0})
+    circuit["failures"] += 1
+    # Failures of deliveries already in flight when the circuit opened do not
+    # trip it again
+    if (
+        circuit["failures"] >= settings.WEBHOOK_CIRCUIT_THRESHOLD
+        and circuit["opened_until"] <= now
+    ):
+        cooldown = min(
+            settings.WEBHOOK_CIRCUIT_COOLDOWN * 2 ** circuit["trips"],
+            settings.WEBHOOK_CIRCUIT_COOLDOWN_MAX,
+        )
+        circuit["opened_until"] = now + cooldown
+        circuit["trips"] += 1
+    return circuit
+
+
+def get_retry_countdown(attempt):
+    # Exponential backoff with full jitter
+    return random.randint(
+        0,
+        min(
+            settings.WEBHOOK_RETRY_BACKOFF * 2**attempt,
+            settings.WEBHOOK_RETRY_BACKOFF_MAX,
+        ),
+    )
+
+
+def is_failed_response(response):
+    return response is None or response.status_code >= 500
+
+
+class WebhookDeliveryEngine:
+    """
+    Send prepared webhook requests concurrently over the pooled session, with
+    at most `per_webhook_concurrency` requests in flight for a single webhook
+    """
+
+    def __init__(self, max_workers=None, per_webhook_concurrency=None, timeout=None):
+        self.max_workers = max_workers or settings.WEBHOOK_DELIVERY_CONCURRENCY
+        self.per_webhook_concurrency = (
+            per_webhook_concurrency or settings.WEBHOOK_MAX_CONCURRENCY_PER_WEBHOOK
+        )
+        self.timeout = timeout or settings.WEBHOOK_REQUEST_TIMEOUT
+
+    def send(self, requests_data):
+        """
+        Send the requests, each one a dict with webhook_id, url, headers and
+        payload. Return a (response, error) tuple for every request in order.
+        """
+        if not requests_data:
+            return []
+
+        semaphores = defaultdict(
+            lambda: threading.BoundedSemaphore(self.per_webhook_concurrency)
+        )
+        for request_data in requests_data:
+            semaphores[request_data["webhook_id"]]
+        session = get_session()
+
+        def post(request_data):
+            with semaphores[request_data["webhook_id"]]:
+                try:
+                    response = session.post(
+                        request_data["url"],
+                        headers=request_data["headers"],
+                        json=request_data["payload"],
+                        timeout=self.timeout,
+                    )
+                    return response, None
+                except requests.RequestException as e:
+                    return None, e
+
+        workers = min(self.max_workers, len(requests_data))
+        if workers == 1:
+            return [post(request_data) for request_data in requests_data]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(post, requests_data))
+
+
+def build_request(webhook, delivery):
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "Autopilot",
+        "X-Plane-Delivery": str(uuid.uuid4()),
+        "X-Plane-Event": delivery["event"],
+    }
+
+    event_data = (
+        json.loads(json.dumps(delivery["event_data"], cls=DjangoJSONEncoder))
+        if delivery["event_data"] is not None
+        else None
+    )
+
+    action = {
+        "POST": "create",
+        "PATCH": "update",
+        "PUT": "update",
+        "DELETE": "delete",
+    }.get(delivery["action"], delivery["action"])
+
+    payload = {
+        "event": delivery["event"],
+        "action": action,
+        "webhook_id": str(webhook.id),
+        "workspace_id": str(webhook.workspace_id),
+        "data": event_data,
+    }
+
+    # Deliveries of activities carry what changed along with the data
+    if "activity" in delivery:
+        payload["activity"] = (
+            json.loads(json.dumps(delivery["activity"], cls=DjangoJSONEncoder))
+            if delivery["activity"] is not None
+            else None
+        )
+
+    # Use HMAC for generating signature
+    if webhook.secret_key:
+        hmac_signature = hmac.new(
+            webhook.secret_key.encode("utf-8"),
+            json.dumps(payload).encode("utf-8"),
+            hashlib.sha256,
+        )
+        headers["X-Plane-Signature"] = hmac_signature.hexdigest()
+
+    return {
+        "webhook_id": webhook.id,
+        "url": webhook.url,
+        "headers": headers,
+        "payload": payload,
+        "action": action,
+    }
+
+
+def deliver_webhooks(deliveries, engine=None):
+    """
+    Deliver a batch of webhook events and log them in bulk.
+
+    Every delivery is a dict with webhook, slug, event, event_data, action,
+    current_site, attempt and optionally activity. Returns the deliveries to
+    retry as (delivery, countdown) tuples and the webhooks deactivated because
+    their circuit kept tripping.
+    """
+    engine = engine or WebhookDeliveryEngine()
+    webhooks = {
+        str(webhook.id): webhook
+        for webhook in Webhook.objects.filter(
+            pk__in={delivery["webhook"] for delivery in deliveries}, is_active=True
+        ).select_related("workspace")
+    }
+
+    circuit_keys = {
+        webhook_id: get_circuit_cache_key(webhook_id) for webhook_id in webhooks
+    }
+    cached_circuits = cache.get_many(list(circuit_keys.values()))
+    circuits = {
+        webhook_id: cached_circuits.get(key) for webhook_id, key in circuit_keys.items()
+    }
+
+    now = time.time()
+    retries = []
+    sending = []
+    probing = set()
+    for delivery in deliveries:
+        webhook_id = str(delivery["webhook"])
+        webhook = webhooks.get(webhook_id)
+        # Deleted or deactivated webhooks are dropped
+        if webhook is None or webhook.workspace.slug != delivery["slug"]:
+            continue
+
+        state = get_circuit_state(circuits[webhook_id], now)
+        if state == CIRCUIT_OPEN:
+            # Wait for the cooldown without using up an attempt
+            retries.append(
+                (delivery, int(circuits[webhook_id]["opened_until"] - now) + 1)
+            )
+            continue
+        if state == CIRCUIT_HALF_OPEN:
+            # A single delivery probes the receiver, the others wait for it
+            if webhook_id in probing:
+                retries.append((delivery, settings.WEBHOOK_CIRCUIT_COOLDOWN))
+                continue
+            probing.add(webhook_id)
+        sending.append((delivery, build_request(webhook, delivery)))
+
+    results = engine.send([request_data for _, request_data in sending])
+
+    now = time.time()
+    logs = []
+    updated_circuits = {}
+    for (delivery, request_data), (response, error) in zip(sending, results):
+        webhook_id = str(delivery["webhook"])
+        webhook = webhooks[webhook_id]
+        logs.append(
+            WebhookLog(
+                workspace_id=webhook.workspace_id,
+                webhook_id=webhook.id,
+                event_type=str(delivery["event"]),
+                request_method=str(request_data["action"]),
+                request_headers=str(request_data["headers"]),
+                request_body=str(request_data["payload"]),
+                response_status=(
+                    str(response.status_code) if response is not None else 500
+                ),
+                response_headers=(
+                    str(response.headers) if response is not None else ""
+                ),
+                response_body=str(response.text)
+                if response is not None
+                else str(error),
+                retry_count=str(delivery.get("attempt", 0)),
+            )
+        )
+
+        failed = is_failed_response(response)
+        circuits[webhook_id] = record_circuit_result(
+            circuits[webhook_id], not failed, now
+        )
+        updated_circuits[webhook_id] = circuits[webhook_id]
+
+        attempt = delivery.get("attempt", 0)
+        if failed and attempt < settings.WEBHOOK_MAX_RETRIES:
+            retries.append(
+                ({**delivery, "attempt": attempt + 1}, get_retry_countdown(attempt))
+            )
+
+    WebhookLog.objects.bulk_create(logs, batch_size=100)
+
+    # Webhooks whose circuit tripped too many times in a row are deactivated
+    deactivated = [
+        webhooks[webhook_id]
+        for webhook_id, circuit in updated_circuits.items()
+        if circuit["trips"] >= settings.WEBHOOK_CIRCUIT_MAX_TRIPS
+    ]
+    if deactivated:
+        Webhook.objects.filter(pk__in=[webhook.id for webhook in deactivated]).update(
+            is_active=False
+        )
+        deactivated_ids = {str(webhook.id) for webhook in deactivated}
+        for webhook_id in deactivated_ids:
+            updated_circuits.pop(webhook_id)
+            cache.delete(get_circuit_cache_key(webhook_id))
+        retries = [
+            (delivery, countdown)
+            for delivery, countdown in retries
+            if str(delivery["webhook"]) not in deactivated_ids
+        ]
+
+    cache.set_many(
+        {
+            get_circuit_cache_key(webhook_id): circuit
+            for webhook_id, circuit in updated_circuits.items()
+        },
+        settings.WEBHOOK_CIRCUIT_COOLDOWN_MAX * 2,
+    )
+
+    return retries, deactivated